@@ -0,0 +1,63 @@
+"""Benchmark the memory and time of loading a large CoNLL file.
+
+Usage:
+    python benchmarks/conll_loader.py [--num-sentences N]
+
+The file imitates an NER corpus, where a few tags are repeated throughout the data.
+The reported memory is the size of the loaded samples, and the peak while loading
+them, measured by tracemalloc.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from explainaboard.constants import FileType, Source
+from explainaboard.loaders.sequence_labeling import SeqLabLoader
+
+_TAGS = ["O"] * 8 + ["B-PER", "I-PER", "B-LOC", "I-LOC", "B-ORG", "I-ORG", "B-MISC"]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark CoNLL loading")
+    parser.add_argument(
+        "--num-sentences", type=int, default=200_000, help="the number of sentences"
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    words = [f"word{i}" for i in range(20_000)]
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "dataset.conll")
+        with open(path, "w", encoding="utf8") as f:
+            for _ in range(args.num_sentences):
+                for _ in range(rng.randint(5, 25)):
+                    f.write(f"{rng.choice(words)}\t{rng.choice(_TAGS)}\n")
+                f.write("\n")
+
+        loader = SeqLabLoader.default_dataset_file_loaders()[FileType.conll]
+        start = time.perf_counter()
+        samples = loader.load(path, Source.local_filesystem).samples
+        elapsed = time.perf_counter() - start
+        del samples
+
+        # tracemalloc slows down loading, so memory is measured separately.
+        tracemalloc.start()
+        samples = loader.load(path, Source.local_filesystem).samples
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        num_tokens = sum(len(x["tokens"]) for x in samples)
+        print(
+            f"{len(samples)} sentences, {num_tokens} tokens: {elapsed:.2f} s, "
+            f"{size / 1e6:.1f} MB loaded, {peak / 1e6:.1f} MB peak"
+        )
+
+
+if __name__ == "__main__":
+    main()
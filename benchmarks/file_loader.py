@@ -0,0 +1,58 @@
+"""Benchmark loading a large TSV file compared to only reading it with csv.
+
+The file is loaded row by row, and column by column with `load_columns()`, which
+uses pyarrow if it is installed.
+
+Usage:
+    python benchmarks/file_loader.py [--num-rows N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+from explainaboard.constants import FileType, Source
+from explainaboard.loaders.text_classification import TextClassificationLoader
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark TSV loading")
+    parser.add_argument(
+        "--num-rows", type=int, default=2_000_000, help="the number of rows"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "dataset.tsv")
+        with open(path, "w", encoding="utf8") as f:
+            for i in range(args.num_rows):
+                f.write(f"this is the sentence number {i}\tpositive\n")
+
+        start = time.perf_counter()
+        with open(path, "r", encoding="utf8") as f:
+            num_rows = sum(1 for _ in csv.reader(f, delimiter="\t"))
+        print(f"csv.reader: {time.perf_counter() - start:.2f} s ({num_rows} rows)")
+
+        loader = TextClassificationLoader.default_dataset_file_loaders()[FileType.tsv]
+        start = time.perf_counter()
+        num_rows = sum(
+            1 for _ in loader.load_iter(path, Source.local_filesystem).samples
+        )
+        print(f"load_iter:  {time.perf_counter() - start:.2f} s ({num_rows} rows)")
+
+        start = time.perf_counter()
+        num_rows = len(loader.load(path, Source.local_filesystem))
+        print(f"load:       {time.perf_counter() - start:.2f} s ({num_rows} rows)")
+
+        start = time.perf_counter()
+        num_rows = len(loader.load_columns(path, Source.local_filesystem))
+        print(f"columns:    {time.perf_counter() - start:.2f} s ({num_rows} rows)")
+
+
+if __name__ == "__main__":
+    main()
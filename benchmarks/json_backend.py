@@ -0,0 +1,80 @@
+"""Benchmark the JSON backends on the system outputs in data/system_outputs.
+
+Usage:
+    python benchmarks/json_backend.py [--data-dir DIR] [--repeat N]
+
+For each available backend, this reports the throughput of loading all the JSON
+files, and of dumping them back with and without indentation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import time
+from typing import Any, Callable
+
+from explainaboard.utils import json_utils
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best time of `repeat` calls of `func` in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON backends")
+    parser.add_argument(
+        "--data-dir",
+        type=str,
+        default=os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "data",
+            "system_outputs",
+        ),
+        help="the directory to search json files in",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="the number of repetitions"
+    )
+    args = parser.parse_args()
+
+    paths = sorted(
+        glob.glob(os.path.join(args.data_dir, "**", "*.json"), recursive=True)
+    )
+    contents = []
+    for path in paths:
+        with open(path, "rb") as f:
+            contents.append(f.read())
+    total_mb = sum(len(x) for x in contents) / 1e6
+    print(f"{len(contents)} files, {total_mb:.1f} MB")
+
+    backends = ["json"] + (["orjson"] if json_utils.orjson is not None else [])
+    print(f"{'backend':<8} {'load MB/s':>10} {'dump MB/s':>10} {'compact MB/s':>13}")
+    for backend in backends:
+        json_utils.set_json_backend(backend)
+        objects = [json_utils.loads(x) for x in contents]
+        load_time = _measure(
+            lambda: [json_utils.loads(x) for x in contents], args.repeat
+        )
+        dump_time = _measure(
+            lambda: [json_utils.dumps(x) for x in objects], args.repeat
+        )
+        compact_time = _measure(
+            lambda: [json_utils.dumps(x, compact=True) for x in objects], args.repeat
+        )
+        print(
+            f"{backend:<8} {total_mb / load_time:>10.1f} "
+            f"{total_mb / dump_time:>10.1f} {total_mb / compact_time:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark evaluating many systems on the same dataset.
+
+Each system is processed on its own, and with the features calculated from the
+dataset once by `precompute_dataset_features()`, as `--parallel-systems` of the CLI
+does.
+
+Usage:
+    python benchmarks/multi_system.py [--num-samples N] [--num-systems N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from explainaboard.constants import TaskType
+from explainaboard.processors.text_classification import TextClassificationProcessor
+from explainaboard.utils.logging import get_logger
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark multi-system evaluation")
+    parser.add_argument(
+        "--num-samples", type=int, default=20_000, help="the number of samples"
+    )
+    parser.add_argument(
+        "--num-systems", type=int, default=10, help="the number of systems"
+    )
+    args = parser.parse_args()
+    get_logger().setLevel("ERROR")
+
+    rng = random.Random(0)
+    words = [f"word{i}" for i in range(5_000)]
+    labels = ["positive", "negative"]
+    dataset = [
+        {
+            "text": " ".join(rng.choices(words, k=rng.randint(5, 40))),
+            "true_label": rng.choice(labels),
+            "id": str(i),
+        }
+        for i in range(args.num_samples)
+    ]
+    outputs = [
+        [{"predicted_label": rng.choice(labels)} for _ in dataset]
+        for _ in range(args.num_systems)
+    ]
+
+    def get_metadata() -> dict:
+        return {"task_name": TaskType.text_classification, "metric_names": ["F1"]}
+
+    start = time.perf_counter()
+    for output in outputs:
+        TextClassificationProcessor().process(
+            get_metadata(),
+            [{**x, **y} for x, y in zip(dataset, output)],
+            skip_failed_analyses=True,
+        )
+    print(f"separately: {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    dataset_features = TextClassificationProcessor().precompute_dataset_features(
+        get_metadata(), dataset, {"predicted_label"}
+    )
+    for output in outputs:
+        TextClassificationProcessor().process(
+            get_metadata(),
+            [{**x, **y} for x, y in zip(dataset, output)],
+            skip_failed_analyses=True,
+            dataset_features=dataset_features,
+        )
+    print(f"shared dataset features: {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
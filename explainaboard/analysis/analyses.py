@@ -12,7 +12,7 @@ from typing import ClassVar, final
 import numpy as np
 
 from explainaboard.analysis.bucketing import get_bucketing_method
-from explainaboard.analysis.case import AnalysisCase
+from explainaboard.analysis.case import AnalysisCaseTable
 from explainaboard.analysis.feature import FeatureType
 from explainaboard.analysis.performance import BucketPerformance
 from explainaboard.metrics.metric import (
@@ -20,6 +20,7 @@ from explainaboard.metrics.metric import (
     MetricConfig,
     MetricResult,
     MetricStats,
+    ResamplePlan,
     Score,
     SimpleMetricStats,
 )
@@ -130,20 +131,23 @@ class Analysis(Serializable, metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def perform(
         self,
-        cases: list[AnalysisCase],
+        cases: AnalysisCaseTable,
         metrics: dict[str, Metric],
         stats: dict[str, MetricStats],
         confidence_alpha: float,
+        resample_plan: ResamplePlan | None = None,
     ) -> AnalysisResult:
         """Perform the analysis.
 
         Args:
-            cases: The list of analysis cases over which to perform the analysis.
+            cases: The table of analysis cases over which to perform the analysis.
               These could be examples, spans, tokens, etc.
             metrics: The metrics used to evaluate the cases.
             stats: The statistics calculated by each metric.
             confidence_alpha: In the case that any significance analysis is performed,
                       the inverse confidence level.
+            resample_plan: Bootstrap resamples shared by all metrics and buckets of
+                      the analysis level.
 
         Returns:
             The result of the analysis.
@@ -287,26 +291,48 @@ class BucketAnalysis(Analysis):
 
     def perform(
         self,
-        cases: list[AnalysisCase],
+        cases: AnalysisCaseTable,
         metrics: dict[str, Metric],
         stats: dict[str, MetricStats],
         confidence_alpha: float,
+        resample_plan: ResamplePlan | None = None,
     ) -> AnalysisResult:
         """See Analysis.perform."""
         # Preparation for bucketing
         bucket_func = get_bucketing_method(self.method)
 
-        if len(cases) == 0 or self.feature not in cases[0].features:
+        if len(cases) == 0 or not cases.has_feature(self.feature):
             raise RuntimeError(f"bucket analysis: feature {self.feature} not found.")
 
         samples_over_bucket = bucket_func(
-            sample_features=[(x, x.features[self.feature]) for x in cases],
+            feature_values=cases.get_feature(self.feature),
             bucket_number=self.num_buckets,
             bucket_setting=self.setting,
         )
 
+        # Assigns every case to the non-empty bucket it belongs to, so that all
+        # buckets are evaluated at once. Samples may be empty when user defined a
+        # bucket interval that has no samples.
+        group_ids = np.full(len(cases), -1, dtype=np.intp)
+        group_map: dict[int, int] = {}
+        for bucket_id, bucket_collection in enumerate(samples_over_bucket):
+            if len(bucket_collection.samples) > 0:
+                group_map[bucket_id] = len(group_map)
+                group_ids[bucket_collection.samples] = group_map[bucket_id]
+
+        group_results = {
+            metric_name: metric_func.evaluate_groups_from_stats(
+                stats[metric_name],
+                group_ids,
+                len(group_map),
+                confidence_alpha=confidence_alpha,
+                resample_plan=resample_plan,
+            )
+            for metric_name, metric_func in metrics.items()
+        }
+
         bucket_performances: list[BucketPerformance] = []
-        for bucket_collection in samples_over_bucket:
+        for bucket_id, bucket_collection in enumerate(samples_over_bucket):
             # Subsample examples to save
             subsampled_ids = _subsample_analysis_cases(
                 self.sample_limit, bucket_collection.samples
@@ -314,21 +340,13 @@ class BucketAnalysis(Analysis):
 
             n_samples = len(bucket_collection.samples)
 
-            results: dict[str, MetricResult] = {}
-
-            for metric_name, metric_func in metrics.items():
-                metric_stat = stats[metric_name]
-
-                # Samples may be empty when user defined a bucket interval that
-                # has no samples
-                if n_samples == 0.0:
-                    results[metric_name] = MetricResult({})
-                else:
-                    bucket_stats = metric_stat.filter(bucket_collection.samples)
-                    results[metric_name] = metric_func.evaluate_from_stats(
-                        bucket_stats,
-                        confidence_alpha=confidence_alpha,
-                    )
+            group_id = group_map.get(bucket_id)
+            results: dict[str, MetricResult] = {
+                metric_name: MetricResult({})
+                if group_id is None
+                else group_results[metric_name][group_id]
+                for metric_name in metrics
+            }
 
             bucket_performances.append(
                 BucketPerformance(
@@ -521,13 +539,14 @@ class CalibrationAnalysis(Analysis):
 
     def perform(
         self,
-        cases: list[AnalysisCase],
+        cases: AnalysisCaseTable,
         metrics: dict[str, Metric],
         stats: dict[str, MetricStats],
         confidence_alpha: float,
+        resample_plan: ResamplePlan | None = None,
     ) -> AnalysisResult:
         """See Analysis.perform."""
-        if len(cases) == 0 or self.feature not in cases[0].features:
+        if len(cases) == 0 or not cases.has_feature(self.feature):
             raise RuntimeError(
                 f"calibration analysis: feature {self.feature} not found."
             )
@@ -539,9 +558,8 @@ class CalibrationAnalysis(Analysis):
 
         # Get confidence metric stats
         acc_data = metric_stat.get_data()
-        conf_data = np.expand_dims(
-            np.array([float(case.features.get(self.feature, 0.0)) for case in cases]), 1
-        )
+        conf_values = cases.get_feature(self.feature, default=0.0)
+        conf_data = np.expand_dims(conf_values.astype(np.float64), 1)
         assert acc_data.shape == conf_data.shape
         conf_metric_stat = SimpleMetricStats(conf_data)
 
@@ -558,7 +576,7 @@ class CalibrationAnalysis(Analysis):
         ]
 
         samples_over_bucket = bucket_func(
-            sample_features=[(x, x.features[self.feature]) for x in cases],
+            feature_values=conf_values,
             bucket_number=self.num_buckets,
             bucket_setting=bucket_setting,
         )
@@ -583,6 +601,7 @@ class CalibrationAnalysis(Analysis):
                     bucket_stats,
                     confidence_alpha=confidence_alpha,
                     auxiliary_stats=bucket_conf_stats,
+                    resample_plan=resample_plan,
                 )
 
             bucket_performances.append(
@@ -763,20 +782,21 @@ class ComboCountAnalysis(Analysis):
 
     def perform(
         self,
-        cases: list[AnalysisCase],
+        cases: AnalysisCaseTable,
         metrics: dict[str, Metric],
         stats: dict[str, MetricStats],
         confidence_alpha: float,
+        resample_plan: ResamplePlan | None = None,
     ) -> AnalysisResult:
         """See Analysis.perform."""
         for x in self.features:
-            if x not in cases[0].features:
+            if not cases.has_feature(x):
                 raise RuntimeError(f"combo analysis: feature {x} not found.")
 
         combo_map: defaultdict[tuple[str, ...], list[int]] = defaultdict(list)
-        for case in cases:
-            feat_vals = tuple([case.features[x] for x in self.features])
-            combo_map[feat_vals].append(case.sample_id)
+        feature_columns = [cases.get_feature(x).tolist() for x in self.features]
+        for sample_id, *feat_vals in zip(cases.sample_ids.tolist(), *feature_columns):
+            combo_map[tuple(feat_vals)].append(sample_id)
 
         combo_list = [
             ComboOccurence(k, len(v), _subsample_analysis_cases(self.sample_limit, v))
@@ -7,6 +7,8 @@ import textwrap
 from typing import final
 import unittest
 
+import numpy as np
+
 from explainaboard.analysis.analyses import (
     _subsample_analysis_cases,
     AnalysisDetails,
@@ -20,10 +22,18 @@ from explainaboard.analysis.analyses import (
     ComboCountAnalysisDetails,
     ComboOccurence,
 )
+from explainaboard.analysis.case import AnalysisCase, AnalysisCaseTable
 from explainaboard.analysis.feature import DataType, FeatureType, Value
 from explainaboard.analysis.performance import BucketPerformance
 from explainaboard.metrics.accuracy import AccuracyConfig
-from explainaboard.metrics.metric import MetricConfig, MetricResult, Score
+from explainaboard.metrics.metric import (
+    ConfidenceInterval,
+    MetricConfig,
+    MetricResult,
+    ResamplePlan,
+    Score,
+    SimpleMetricStats,
+)
 from explainaboard.serialization import common_registry
 from explainaboard.serialization.serializers import PrimitiveSerializer
 from explainaboard.serialization.types import Serializable, SerializableData
@@ -265,6 +275,49 @@ class BucketAnalysisTest(unittest.TestCase):
         self.assertEqual(serializer.serialize(analysis), analysis_serialized)
         self.assertEqual(serializer.deserialize(analysis_serialized), analysis)
 
+    def test_perform(self) -> None:
+        analysis = BucketAnalysis(
+            description="foo",
+            level="example",
+            feature="label",
+            method="fixed",
+            num_buckets=3,
+            setting=["a", "b", "c"],
+        )
+        labels = ["a", "b", "a", "d", "b", "a"]
+        cases = AnalysisCaseTable.from_cases(
+            AnalysisCase(i, {"label": x}) for i, x in enumerate(labels)
+        )
+        metric_stats = SimpleMetricStats(np.array([1.0, 0.0, 0.0, 1.0, 1.0, 1.0]))
+        # Fixes the resamples so that confidence intervals are comparable.
+        resample_plan = ResamplePlan(np.random.SeedSequence(12345))
+        result = analysis.perform(
+            cases=cases,
+            metrics={"Accuracy": AccuracyConfig().to_metric()},
+            stats={"Accuracy": metric_stats},
+            confidence_alpha=0.05,
+            resample_plan=resample_plan,
+        )
+        performances = narrow(BucketAnalysisDetails, result.details).bucket_performances
+        self.assertEqual([x.bucket_name for x in performances], ["a", "b", "c"])
+        self.assertEqual([x.n_samples for x in performances], [3, 2, 0])
+        for performance, samples in zip(performances, [[0, 2, 5], [1, 4]]):
+            expected = AccuracyConfig().to_metric().evaluate_from_stats(
+                metric_stats.filter(samples),
+                confidence_alpha=0.05,
+                resample_plan=resample_plan,
+            )
+            metric_result = performance.results["Accuracy"]
+            self.assertAlmostEqual(
+                metric_result.get_value(Score, "score").value,
+                expected.get_value(Score, "score").value,
+            )
+            self.assertEqual(
+                metric_result.get_value_or_none(ConfidenceInterval, "score_ci"),
+                expected.get_value_or_none(ConfidenceInterval, "score_ci"),
+            )
+        self.assertEqual(performances[2].results["Accuracy"], MetricResult({}))
+
 
 class ComboOccurrenceTest(unittest.TestCase):
     def test_serialization(self) -> None:
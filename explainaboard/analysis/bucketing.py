@@ -9,7 +9,7 @@ from typing import Any, cast, Protocol
 
 import numpy as np
 
-from explainaboard.analysis.case import AnalysisCase, AnalysisCaseCollection
+from explainaboard.analysis.case import AnalysisCaseCollection
 from explainaboard.serialization.types import SerializableData
 
 _INFINITE_INTERVAL = (-1e10, 1e10)
@@ -32,7 +32,7 @@ def _find_range(
 
 
 def continuous(
-    sample_features: list[tuple[AnalysisCase, Any]],
+    feature_values: Sequence[Any] | np.ndarray[tuple[int], Any],
     bucket_number: int | None = None,
     bucket_setting: SerializableData = None,
 ) -> list[AnalysisCaseCollection]:
@@ -42,8 +42,7 @@ def continuous(
     equal-sized buckets.
 
     Args:
-        sample_features: A list of tuples including an analysis case, and a feature
-          value.
+        feature_values: The feature value of each analysis case.
         bucket_number: The number of buckets to generate.
         bucket_setting: Not used by this bucketing method, so it will fail if this is
           set to anything other than none.
@@ -54,13 +53,12 @@ def continuous(
     if bucket_number is None:
         bucket_number = 4
 
-    if len(sample_features) == 0:
+    if len(feature_values) == 0:
         return [AnalysisCaseCollection(samples=[], interval=_INFINITE_INTERVAL)]
     if isinstance(bucket_setting, Sequence) and len(bucket_setting) > 0:
         raise NotImplementedError("bucket_setting incompatible with continuous")
     # Bucketing different Attributes
-    cases = [x1 for x1, x2 in sample_features]
-    vals = np.array([x2 for x1, x2 in sample_features])
+    vals = np.asarray(feature_values)
     # Function to convert numpy datatypes to Python native types
     conv = int if np.issubdtype(type(vals[0]), int) else float
     # Special case of one bucket
@@ -68,7 +66,7 @@ def continuous(
         max_val, min_val = conv(np.max(vals)), conv(np.min(vals))
         return [
             AnalysisCaseCollection(
-                samples=list(range(len(cases))),
+                samples=list(range(len(vals))),
                 interval=(min_val, max_val),
             )
         ]
@@ -109,7 +107,7 @@ def continuous(
 
 
 def discrete(
-    sample_features: list[tuple[AnalysisCase, Any]],
+    feature_values: Sequence[Any] | np.ndarray[tuple[int], Any],
     bucket_number: int | None = None,
     bucket_setting: SerializableData = None,
 ) -> list[AnalysisCaseCollection]:
@@ -118,7 +116,7 @@ def discrete(
     It will return buckets for the `bucket_number` most frequent discrete values.
 
     Args:
-        sample_features: Pairs of a analysis case and feature value.
+        feature_values: The feature value of each analysis case.
         bucket_number: Maximum number of buckets
         bucket_setting: Minimum number of examples per bucket
 
@@ -132,8 +130,12 @@ def discrete(
     if not isinstance(bucket_setting, int):
         raise ValueError(f"Incompatible {bucket_setting=}, expected int.")
 
+    if isinstance(feature_values, np.ndarray):
+        # Converts numpy scalars to Python built-in types.
+        feature_values = feature_values.tolist()
+
     feat2idx = {}
-    for idx, (case, feat) in enumerate(sample_features):
+    for idx, feat in enumerate(feature_values):
         if feat not in feat2idx:
             feat2idx[feat] = [idx]
         else:
@@ -150,15 +152,14 @@ def discrete(
 
 
 def fixed(
-    sample_features: list[tuple[AnalysisCase, Any]],
+    feature_values: Sequence[Any] | np.ndarray[tuple[int], Any],
     bucket_number: int | None = None,
     bucket_setting: SerializableData = None,
 ) -> list[AnalysisCaseCollection]:
     """Bucketing based on pre-determined buckets.
 
     Args:
-        sample_features: A list of tuples including an analysis case, and a feature
-          value.
+        feature_values: The feature value of each analysis case.
         bucket_number: Ignored by this function.
         bucket_setting: A list of bucket names or intervals, depending on the type.
 
@@ -172,7 +173,11 @@ def fixed(
     if len(interval_or_names) == 0:
         raise ValueError("Can not determine bucket keys.")
 
-    features = [x[1] for x in sample_features]
+    features = (
+        feature_values.tolist()
+        if isinstance(feature_values, np.ndarray)
+        else list(feature_values)
+    )
 
     if isinstance(interval_or_names[0], str):
         names = cast(list[str], interval_or_names)
@@ -205,14 +210,14 @@ class BucketingFn(Protocol):
 
     @staticmethod
     def __call__(
-        sample_features: list[tuple[AnalysisCase, Any]],
+        feature_values: Sequence[Any] | np.ndarray[tuple[int], Any],
         bucket_number: int | None = None,
         bucket_setting: SerializableData = None,
     ) -> list[AnalysisCaseCollection]:
         """Applies bucketing.
 
         Args:
-            sample_features: List of samples to process.
+            feature_values: The feature value of each sample to process.
             bucket_number: Number of buckets.
             bucket_setting: Method-specific settings to configure the behavior.
 
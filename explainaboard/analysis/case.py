@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Sequence
 import dataclasses
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, final, Optional, overload
+
+import numpy as np
 
 
 @dataclass
@@ -146,3 +149,305 @@ class AnalysisCaseCollection:
     def __len__(self) -> int:
         """Return the size of the samples in the bucket."""
         return len(self.samples)
+
+
+# Placeholder of feature values that are not set in some cases.
+_MISSING = object()
+
+
+def _to_column(values: list[Any]) -> np.ndarray[tuple[int], Any]:
+    """Converts a list of values into a column of AnalysisCaseTable.
+
+    Args:
+        values: Values of every case.
+
+    Returns:
+        A numeric ndarray if every value is a number, an ndarray of objects otherwise.
+    """
+    if values:
+        if all(isinstance(x, (bool, np.bool_)) for x in values):
+            return np.array(values, dtype=np.bool_)
+        if all(
+            isinstance(x, (int, np.integer)) and not isinstance(x, bool) for x in values
+        ):
+            return np.array(values, dtype=np.int64)
+        if all(
+            isinstance(x, (int, float, np.integer, np.floating))
+            and not isinstance(x, bool)
+            for x in values
+        ):
+            return np.array(values, dtype=np.float64)
+
+    # Filling elements one by one prevents numpy from unpacking nested sequences.
+    column = np.empty(len(values), dtype=object)
+    for i, x in enumerate(values):
+        column[i] = x
+    return column
+
+
+def _get_item(column: np.ndarray[tuple[int], Any], index: int) -> Any:
+    """Obtains a value in a column as a Python object.
+
+    Args:
+        column: A column of AnalysisCaseTable.
+        index: Index of the value.
+
+    Returns:
+        The value. Numbers are converted to Python built-in types.
+    """
+    value = column[index]
+    return value if column.dtype == object else value.item()
+
+
+@final
+class AnalysisCaseTable(Sequence[AnalysisCase]):
+    """Columnar storage of the analysis cases of an analysis level.
+
+    Every feature is stored as a single ndarray rather than a dict in each case, so
+    analyses can read feature values without touching individual cases. Numeric
+    features are held in numeric ndarrays, and other values in ndarrays of objects.
+    AnalysisCase objects are materialized on demand when an element is accessed.
+    """
+
+    def __init__(
+        self,
+        case_types: list[type[AnalysisCase]],
+        type_ids: np.ndarray[tuple[int], Any],
+        sample_ids: np.ndarray[tuple[int], Any],
+        attributes: dict[str, np.ndarray[tuple[int], Any]],
+        features: dict[str, np.ndarray[tuple[int], Any]],
+        missing_features: dict[str, np.ndarray[tuple[int], Any]] | None = None,
+    ) -> None:
+        """Initializes AnalysisCaseTable.
+
+        Args:
+            case_types: Subclasses of AnalysisCase that appear in the table.
+            type_ids: Index of `case_types` for each case.
+            sample_ids: Sample ID of each case.
+            attributes: Mapping from the name of every other member of the case
+                classes to its values for each case.
+            features: Mapping from the feature name to its values for each case.
+            missing_features: Mapping from the feature name to a boolean mask of cases
+                that do not have the feature. Features not listed here are set in
+                every case.
+        """
+        num_cases = len(sample_ids)
+        for name, column in [
+            ("type_ids", type_ids),
+            *attributes.items(),
+            *features.items(),
+            *(missing_features or {}).items(),
+        ]:
+            if column.shape != (num_cases,):
+                raise ValueError(
+                    f"Column {name} has invalid shape {column.shape}, "
+                    f"expected ({num_cases},)."
+                )
+
+        self._case_types = case_types
+        self._type_ids = type_ids
+        self._sample_ids = sample_ids
+        self._attributes = attributes
+        self._features = features
+        self._missing_features = missing_features or {}
+
+    @staticmethod
+    def from_cases(cases: Iterable[AnalysisCase]) -> AnalysisCaseTable:
+        """Generates an AnalysisCaseTable from analysis cases.
+
+        `cases` is consumed one by one, so cases generated lazily are not retained
+        after their values are stored in the table.
+
+        Args:
+            cases: Analysis cases to store.
+
+        Returns:
+            A table holding the same information as `cases`.
+        """
+        case_types: list[type[AnalysisCase]] = []
+        attribute_names: list[list[str]] = []
+        type_ids: list[int] = []
+        sample_ids: list[int] = []
+        attributes: dict[str, list[Any]] = {}
+        features: dict[str, list[Any]] = {}
+
+        num_cases = 0
+        for case in cases:
+            case_type = type(case)
+            if case_type not in case_types:
+                case_types.append(case_type)
+                attribute_names.append(
+                    [
+                        f.name
+                        for f in dataclasses.fields(case_type)
+                        if f.name not in ("sample_id", "features")
+                    ]
+                )
+            type_id = case_types.index(case_type)
+            type_ids.append(type_id)
+            sample_ids.append(case.sample_id)
+
+            for name in attribute_names[type_id]:
+                if name not in attributes:
+                    attributes[name] = [None] * num_cases
+                attributes[name].append(getattr(case, name))
+            for name, value in case.features.items():
+                if name not in features:
+                    features[name] = [_MISSING] * num_cases
+                features[name].append(value)
+
+            num_cases += 1
+            for column in attributes.values():
+                if len(column) < num_cases:
+                    column.append(None)
+            for column in features.values():
+                if len(column) < num_cases:
+                    column.append(_MISSING)
+
+        missing_features: dict[str, np.ndarray[tuple[int], Any]] = {}
+        for name, column in features.items():
+            missing = np.array([x is _MISSING for x in column], dtype=np.bool_)
+            if missing.any():
+                missing_features[name] = missing
+                features[name] = [None if x is _MISSING else x for x in column]
+
+        return AnalysisCaseTable(
+            case_types=case_types,
+            type_ids=np.array(type_ids, dtype=np.int32),
+            sample_ids=np.array(sample_ids, dtype=np.int64),
+            attributes={k: _to_column(v) for k, v in attributes.items()},
+            features={k: _to_column(v) for k, v in features.items()},
+            missing_features=missing_features,
+        )
+
+    @staticmethod
+    def from_columns(
+        num_cases: int, features: dict[str, list[Any]]
+    ) -> AnalysisCaseTable:
+        """Generates an AnalysisCaseTable of AnalysisCase from feature columns.
+
+        The result is the same as `from_cases` applied to an AnalysisCase for each
+        sample, but no case is created.
+
+        Args:
+            num_cases: The number of cases.
+            features: Mapping from the feature name to its values for each case.
+                None means that the case does not have the feature.
+
+        Returns:
+            A table holding a case for each sample, whose sample ID is its index.
+        """
+        columns: dict[str, np.ndarray[tuple[int], Any]] = {}
+        missing_features: dict[str, np.ndarray[tuple[int], Any]] = {}
+        for name, values in features.items():
+            if len(values) != num_cases:
+                raise ValueError(
+                    f"Feature {name} has {len(values)} values, expected {num_cases}."
+                )
+            missing = np.array([x is None for x in values], dtype=np.bool_)
+            if missing.all():
+                continue
+            if missing.any():
+                missing_features[name] = missing
+            columns[name] = _to_column(values)
+
+        return AnalysisCaseTable(
+            case_types=[AnalysisCase] if num_cases else [],
+            type_ids=np.zeros(num_cases, dtype=np.int32),
+            sample_ids=np.arange(num_cases, dtype=np.int64),
+            attributes={},
+            features=columns,
+            missing_features=missing_features,
+        )
+
+    @property
+    def sample_ids(self) -> np.ndarray[tuple[int], Any]:
+        """Returns the sample IDs of every case."""
+        return self._sample_ids
+
+    @property
+    def feature_names(self) -> list[str]:
+        """Returns the names of features set in at least one case."""
+        return list(self._features)
+
+    def has_feature(self, name: str) -> bool:
+        """Returns whether the feature is set in at least one case.
+
+        Args:
+            name: The feature name.
+        """
+        return name in self._features
+
+    def get_feature(
+        self, name: str, default: Any = _MISSING
+    ) -> np.ndarray[tuple[int], Any]:
+        """Obtains the values of a feature for every case.
+
+        This function may return the underlying ndarray. Changing the return value
+        in-place may cause unintended changes of the behavior.
+
+        Args:
+            name: The feature name.
+            default: The value used for cases without the feature. If not given, every
+                case must have the feature.
+
+        Returns:
+            The feature values with shape `[len(self)]`.
+
+        Raises:
+            KeyError: Some cases do not have the feature and `default` is not given.
+        """
+        column = self._features.get(name)
+        if column is None:
+            if default is _MISSING:
+                raise KeyError(name)
+            return _to_column([default] * len(self))
+
+        missing = self._missing_features.get(name)
+        if missing is None:
+            return column
+        if default is _MISSING:
+            raise KeyError(name)
+        values = [default if m else x for x, m in zip(column.tolist(), missing)]
+        return _to_column(values)
+
+    def __len__(self) -> int:
+        """Returns the number of cases."""
+        return len(self._sample_ids)
+
+    @overload
+    def __getitem__(self, index: int) -> AnalysisCase:  # noqa: D105: suppress bug
+        ...
+
+    @overload
+    def __getitem__(  # noqa: D105: suppress bug
+        self, index: slice
+    ) -> list[AnalysisCase]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> AnalysisCase | list[AnalysisCase]:
+        """Materializes an AnalysisCase or a list of them."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        type_id = int(self._type_ids[index])
+        case_type = self._case_types[type_id]
+        features = {
+            name: _get_item(column, index)
+            for name, column in self._features.items()
+            if name not in self._missing_features
+            or not self._missing_features[name][index]
+        }
+        attributes = {
+            f.name: _get_item(self._attributes[f.name], index)
+            for f in dataclasses.fields(case_type)
+            if f.name not in ("sample_id", "features")
+        }
+        return case_type(
+            sample_id=int(self._sample_ids[index]), features=features, **attributes
+        )
+
+    def __iter__(self) -> Iterator[AnalysisCase]:
+        """Iterates over materialized AnalysisCase objects."""
+        for i in range(len(self)):
+            yield self[i]
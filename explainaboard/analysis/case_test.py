@@ -4,7 +4,14 @@ from __future__ import annotations
 
 import unittest
 
-from explainaboard.analysis.case import AnalysisCaseCollection
+import numpy as np
+
+from explainaboard.analysis.case import (
+    AnalysisCase,
+    AnalysisCaseCollection,
+    AnalysisCaseSpan,
+    AnalysisCaseTable,
+)
 
 
 class AnalysisCaseCollectionTest(unittest.TestCase):
@@ -25,3 +32,82 @@ class AnalysisCaseCollectionTest(unittest.TestCase):
 
         with self.assertRaisesRegex(ValueError, r"^Both"):
             AnalysisCaseCollection(samples=[1], interval=[1.0, 2.0], name="test")
+
+
+class AnalysisCaseTableTest(unittest.TestCase):
+    def test_from_cases(self) -> None:
+        cases = [
+            AnalysisCase(sample_id=0, features={"length": 3, "label": "a"}),
+            AnalysisCaseSpan(
+                sample_id=0,
+                features={"length": 1, "label": "b"},
+                token_span=(1, 2),
+                char_span=(3, 5),
+                text="xy",
+                orig_str="source",
+            ),
+            AnalysisCase(sample_id=2, features={"length": 4}),
+        ]
+        table = AnalysisCaseTable.from_cases(iter(cases))
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.feature_names, ["length", "label"])
+        self.assertTrue(table.has_feature("label"))
+        self.assertFalse(table.has_feature("foo"))
+        np.testing.assert_array_equal(table.sample_ids, np.array([0, 0, 2]))
+        self.assertEqual(table.get_feature("length").dtype, np.int64)
+        np.testing.assert_array_equal(table.get_feature("length"), [3, 1, 4])
+        self.assertEqual(table.get_feature("label", "c").tolist(), ["a", "b", "c"])
+        with self.assertRaises(KeyError):
+            table.get_feature("label")
+        with self.assertRaises(KeyError):
+            table.get_feature("foo")
+        self.assertEqual(list(table), cases)
+        self.assertEqual(table[1], cases[1])
+        self.assertEqual(table[-1], cases[2])
+        self.assertEqual(table[1:], cases[1:])
+        self.assertIs(type(table[0].features["length"]), int)
+
+    def test_from_cases_empty(self) -> None:
+        table = AnalysisCaseTable.from_cases([])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.feature_names, [])
+        with self.assertRaises(IndexError):
+            table[0]
+
+    def test_from_columns(self) -> None:
+        table = AnalysisCaseTable.from_columns(
+            3,
+            {
+                "length": [3, 1, 4],
+                "label": ["a", None, "b"],
+                "score": [None, None, None],
+            },
+        )
+        cases = [
+            AnalysisCase(sample_id=0, features={"length": 3, "label": "a"}),
+            AnalysisCase(sample_id=1, features={"length": 1}),
+            AnalysisCase(sample_id=2, features={"length": 4, "label": "b"}),
+        ]
+        self.assertEqual(table.feature_names, ["length", "label"])
+        self.assertEqual(table.get_feature("length").dtype, np.int64)
+        self.assertEqual(list(table), cases)
+        self.assertEqual(list(AnalysisCaseTable.from_cases(cases)), list(table))
+
+    def test_from_columns_empty(self) -> None:
+        table = AnalysisCaseTable.from_columns(0, {"length": []})
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.feature_names, [])
+
+    def test_from_columns_invalid_length(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"^Feature length has 2 values"):
+            AnalysisCaseTable.from_columns(3, {"length": [1, 2]})
+
+    def test_invalid_shape(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"^Column length has invalid shape"):
+            AnalysisCaseTable(
+                case_types=[AnalysisCase],
+                type_ids=np.zeros(2, dtype=np.int32),
+                sample_ids=np.arange(2),
+                attributes={},
+                features={"length": np.arange(3)},
+            )
@@ -38,6 +38,7 @@ class FeatureType(Serializable, metaclass=ABCMeta):
         *,
         description: str | None = None,
         func: Callable[..., Any] | None = None,
+        func_batch: Callable[..., Any] | None = None,
         require_training_set: bool | None = None,
         optional: bool = False,
     ) -> None:
@@ -45,12 +46,20 @@ class FeatureType(Serializable, metaclass=ABCMeta):
 
         Args:
             description: Description of this feature.
-            func: Function to calculate this feature from other features.
+            func: Function to calculate this feature from other features. It takes
+                `(sys_info, output, case)`, plus the training set statistics if
+                `require_training_set` is True, and returns the feature value.
+            func_batch: Function to calculate this feature for multiple cases at once.
+                It takes `(sys_info, outputs, cases)`, plus the training set statistics
+                if `require_training_set` is True, and returns a sequence of feature
+                values with the same length as `cases`. If given, this is preferred
+                over `func`.
             require_training_set: Whether this feature relies on the training samples.
             optional: set it to True if this feature is optional.
         """
         self._description = description
         self._func = func
+        self._func_batch = func_batch
         self._require_training_set = (
             require_training_set if require_training_set is not None else False
         )
@@ -82,6 +91,7 @@ class FeatureType(Serializable, metaclass=ABCMeta):
         return (
             self._description == other._description
             and self._func is other._func
+            and self._func_batch is other._func_batch
             and self._require_training_set == other._require_training_set
         )
 
@@ -97,6 +107,12 @@ class FeatureType(Serializable, metaclass=ABCMeta):
         """Returns the callable to calculate this feature."""
         return self._func
 
+    @final
+    @property
+    def func_batch(self) -> Callable[..., Any] | None:
+        """Returns the callable to calculate this feature for multiple cases."""
+        return self._func_batch
+
     @final
     @property
     def require_training_set(self) -> bool:
@@ -116,7 +132,7 @@ class FeatureType(Serializable, metaclass=ABCMeta):
         Returns:
             Serialized object containing base members.
         """
-        if self.func is not None:
+        if self.func is not None or self.func_batch is not None:
             # TODO(odashi): FeatureTypes with `func` can't be restored correctly from
             # the serialized data. If you met this warning, it seems there could be
             # potential bugs.
@@ -140,6 +156,7 @@ class Sequence(FeatureType):
         *,
         description: str | None = None,
         func: Callable[..., Any] | None = None,
+        func_batch: Callable[..., Any] | None = None,
         require_training_set: bool | None = None,
         feature: FeatureType,
     ) -> None:
@@ -148,12 +165,14 @@ class Sequence(FeatureType):
         Args:
             description: See FeatureType.__init__.
             func: See FeatureType.__init__.
+            func_batch: See FeatureType.__init__.
             require_training_set: See FeatureType.__init__.
             feature: Feature type of elements.
         """
         super().__init__(
             description=description,
             func=func,
+            func_batch=func_batch,
             require_training_set=require_training_set,
         )
         self._feature = feature
@@ -199,6 +218,7 @@ class Dict(FeatureType):
         *,
         description: str | None = None,
         func: Callable[..., Any] | None = None,
+        func_batch: Callable[..., Any] | None = None,
         require_training_set: bool | None = None,
         feature: dict[str, FeatureType],
         optional: bool = False,
@@ -208,6 +228,7 @@ class Dict(FeatureType):
         Args:
             description: See FeatureType.__init__.
             func: See FeatureType.__init__.
+            func_batch: See FeatureType.__init__.
             require_training_set: See FeatureType.__init__.
             feature: Definitions of member types.
             optional: See FeatureType.__init__.
@@ -215,6 +236,7 @@ class Dict(FeatureType):
         super().__init__(
             description=description,
             func=func,
+            func_batch=func_batch,
             require_training_set=require_training_set,
             optional=optional,
         )
@@ -281,6 +303,7 @@ class Value(FeatureType):
         dtype: DataType,
         description: str | None = None,
         func: Callable[..., Any] | None = None,
+        func_batch: Callable[..., Any] | None = None,
         require_training_set: bool | None = None,
         max_value: int | float | None = None,
         min_value: int | float | None = None,
@@ -292,6 +315,7 @@ class Value(FeatureType):
             dtype: Data type of this value.
             description: See FeatureType.__init__.
             func: See FeatureType.__init__.
+            func_batch: See FeatureType.__init__.
             require_training_set: See FeatureType.__init__.
             max_value: The maximum value (inclusive) of values with int/float dtype.
             min_value: The minimum value (inclusive) of values with int/float dtype.
@@ -300,6 +324,7 @@ class Value(FeatureType):
         super().__init__(
             description=description,
             func=func,
+            func_batch=func_batch,
             require_training_set=require_training_set,
             optional=optional,
         )
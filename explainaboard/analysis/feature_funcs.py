@@ -2,28 +2,97 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping, Sequence
+import itertools
 from typing import Any
 
 from lexicalrichness import LexicalRichness
+import numpy as np
 import sacrebleu
 
 from explainaboard.info import SysOutputInfo
 from explainaboard.utils import basic_words
 from explainaboard.utils.logging import progress
-from explainaboard.utils.tokenizer import SingleSpaceTokenizer, Tokenizer
+from explainaboard.utils.statistics_store import as_dict, MappedStrDict
+from explainaboard.utils.tokenizer import (
+    SingleSpaceTokenizer,
+    tokenize_stream,
+    Tokenizer,
+)
 from explainaboard.utils.typing_utils import unwrap
 
+# Set of basic words for constant-time lookup.
+_BASIC_WORDS = frozenset(basic_words.BASIC_WORDS)
+
 
 def _get_tokens(sys_info: SysOutputInfo, text: str | list[str], side: str) -> list[str]:
     if isinstance(text, list):
         return text
     elif side == "source":
-        return unwrap(sys_info.source_tokenizer)(text).strs
+        tokenizer = unwrap(sys_info.source_tokenizer)
     elif side == "target":
-        return unwrap(sys_info.target_tokenizer)(text).strs
+        tokenizer = unwrap(sys_info.target_tokenizer)
     else:
         raise ValueError(f"Bad side {side}")
+    return sys_info.tokenization_cache.tokenize(tokenizer, text).strs
+
+
+def _get_tokens_batch(
+    sys_info: SysOutputInfo, texts: Sequence[str | list[str]], side: str
+) -> list[list[str]]:
+    """Tokenizes multiple texts.
+
+    Args:
+        sys_info: system output information
+        texts: the texts to tokenize
+        side: whether to tokenize using the source or target side tokenizer.
+
+    Returns:
+        The tokens of each text.
+    """
+    return [_get_tokens(sys_info, text, side) for text in texts]
+
+
+def _flatten_tokens(
+    tokens: list[list[str]],
+) -> tuple[list[str], np.ndarray[tuple[int], Any], np.ndarray[tuple[int], Any]]:
+    """Concatenates token lists so that per-text values can be reduced at once.
+
+    Args:
+        tokens: The tokens of each text.
+
+    Returns:
+        Tuple of following values:
+            - All tokens concatenated.
+            - The index of the text that each token belongs to.
+            - The number of tokens in each text.
+    """
+    lengths = np.fromiter((len(x) for x in tokens), dtype=np.int64, count=len(tokens))
+    owners = np.repeat(np.arange(len(tokens)), lengths)
+    return list(itertools.chain.from_iterable(tokens)), owners, lengths
+
+
+def _lookup_batch(
+    mapping: Mapping[str, int | float], keys: Sequence[str], default: float
+) -> np.ndarray[tuple[int], Any]:
+    """Looks up multiple keys at once.
+
+    Args:
+        mapping: The mapping, which may be a `MappedStrDict`.
+        keys: The keys to look up.
+        default: The value of the missing keys.
+
+    Returns:
+        The value of each key as float.
+    """
+    if isinstance(mapping, MappedStrDict):
+        indices = mapping.find(keys)
+        values = mapping.values_array[indices].astype(np.float64)
+        values[indices < 0] = default
+        return values
+    return np.fromiter(
+        (mapping.get(k, default) for k in keys), dtype=np.float64, count=len(keys)
+    )
 
 
 def count_tokens(sys_info: SysOutputInfo, text: str, side: str = "source") -> float:
@@ -42,6 +111,23 @@ def count_tokens(sys_info: SysOutputInfo, text: str, side: str = "source") -> fl
     return len(_get_tokens(sys_info, text, side))
 
 
+def count_tokens_batch(
+    sys_info: SysOutputInfo, texts: Sequence[str], side: str = "source"
+) -> np.ndarray[tuple[int], Any]:
+    """Batch version of `count_tokens`.
+
+    Args:
+        sys_info: system output information
+        texts: the texts where the tokens should be counted
+        side: whether to tokenize using the source or target side tokenizer.
+
+    Returns:
+        the number of tokens in each text
+    """
+    tokens = _get_tokens_batch(sys_info, texts, side)
+    return np.fromiter((len(x) for x in tokens), dtype=np.int64, count=len(tokens))
+
+
 def get_similarity_by_sacrebleu(text1: str, text2: str) -> float:
     """Return the similarity between two texts according to sentence BLEU.
 
@@ -70,10 +156,31 @@ def get_basic_words(text: str) -> float:
     """
     tokens = SingleSpaceTokenizer()(text)
     assert len(tokens) > 0, f"BUG: no tokens obtained from the text: '{text}'"
-    n_basic_words = sum(1 for t in tokens if t.lower() in basic_words.BASIC_WORDS)
+    n_basic_words = sum(1 for t in tokens if t.lower() in _BASIC_WORDS)
     return n_basic_words / len(tokens)
 
 
+def get_basic_words_batch(texts: Sequence[str]) -> np.ndarray[tuple[int], Any]:
+    """Batch version of `get_basic_words`.
+
+    Args:
+        texts: The texts from which the basic words will be calculated.
+
+    Returns:
+        The ratio of basic words in each text.
+    """
+    tokenizer = SingleSpaceTokenizer()
+    all_tokens, owners, lengths = _flatten_tokens([tokenizer(x).strs for x in texts])
+    assert np.all(lengths > 0), "BUG: no tokens obtained from some texts."
+    is_basic = np.fromiter(
+        (t.lower() in _BASIC_WORDS for t in all_tokens),
+        dtype=np.bool_,
+        count=len(all_tokens),
+    )
+    n_basic_words = np.bincount(owners, weights=is_basic, minlength=len(texts))
+    return n_basic_words / lengths
+
+
 def get_lexical_richness(text: str) -> float:
     """Return a lexical richness value according to the lexical richness library.
 
@@ -96,7 +203,10 @@ def get_lexical_richness(text: str) -> float:
 
 
 def accumulate_vocab_from_samples(
-    samples: Iterable[Any], text_from_sample: Callable[..., str], tokenizer: Tokenizer
+    samples: Iterable[Any],
+    text_from_sample: Callable[..., str],
+    tokenizer: Tokenizer,
+    num_workers: int = 1,
 ):
     """From many samples, find the vocabulary+counts and frequency rank.
 
@@ -104,6 +214,7 @@ def accumulate_vocab_from_samples(
         samples: An iterable of sample that are used in calculating a vocabulary.
         text_from_sample: A function that takes in each sample and outputs the text.
         tokenizer: The tokenizer to be applied to get tokens from the text.
+        num_workers: The number of processes that the tokenizer may use.
 
     Returns:
         Two dictionaries:
@@ -111,8 +222,9 @@ def accumulate_vocab_from_samples(
             A dictionary of vocabulary item -> frequency rank
     """
     vocab: dict[str, int] = {}
-    for sample in progress(samples):
-        for w in tokenizer(text_from_sample(sample)):
+    texts = (text_from_sample(sample) for sample in progress(samples))
+    for tokens in tokenize_stream(tokenizer, texts, num_workers=num_workers):
+        for w in tokens:
             vocab[w] = vocab.get(w, 0) + 1
     # the rank of each word based on its frequency
     sorted_dict = {
@@ -126,7 +238,7 @@ def accumulate_vocab_from_samples(
 def feat_freq_rank(
     sys_info: SysOutputInfo,
     text: str | list[str],
-    vocab_rank: dict[str, int],
+    vocab_rank: Mapping[str, int],
     side: str = "source",
 ) -> float:
     """Return the average frequency rank of the tokens in the text.
@@ -145,16 +257,44 @@ def feat_freq_rank(
 
     tokens = _get_tokens(sys_info, text, side)
     max_rank = len(vocab_rank)
+    vocab_rank = as_dict(vocab_rank)
     for w in tokens:
         fre_rank += vocab_rank.get(w, max_rank)
 
     return fre_rank * 1.0 / len(tokens)
 
 
+def feat_freq_rank_batch(
+    sys_info: SysOutputInfo,
+    texts: Sequence[str | list[str]],
+    vocab_rank: Mapping[str, int],
+    side: str = "source",
+) -> np.ndarray[tuple[int], Any]:
+    """Batch version of `feat_freq_rank`.
+
+    Args:
+        sys_info: The system info (for tokenization)
+        texts: The texts to assess
+        vocab_rank: The vocabulary mapping from strings to frequency rank in the
+          training corpus
+        side: Whether the text is from the source or target side (for tokenization)
+
+    Returns:
+        The average frequency rank of the words in each text
+    """
+    all_tokens, owners, lengths = _flatten_tokens(
+        _get_tokens_batch(sys_info, texts, side)
+    )
+    if np.any(lengths == 0):
+        raise ZeroDivisionError("Some texts have no tokens.")
+    ranks = _lookup_batch(vocab_rank, all_tokens, len(vocab_rank))
+    return np.bincount(owners, weights=ranks, minlength=len(texts)) / lengths
+
+
 def feat_num_oov(
     sys_info: SysOutputInfo,
     text: str | list[str],
-    vocab: dict[str, int],
+    vocab: Mapping[str, int],
     side: str = "source",
 ) -> int:
     """Return the number of out-of-vocabulary words in a text.
@@ -169,12 +309,40 @@ def feat_num_oov(
         The number of OOVs in the text
     """
     num_oov = 0
+    vocab = as_dict(vocab)
     for w in _get_tokens(sys_info, text, side):
         if w not in vocab:
             num_oov += 1
     return num_oov
 
 
+def feat_num_oov_batch(
+    sys_info: SysOutputInfo,
+    texts: Sequence[str | list[str]],
+    vocab: Mapping[str, int],
+    side: str = "source",
+) -> np.ndarray[tuple[int], Any]:
+    """Batch version of `feat_num_oov`.
+
+    Args:
+        sys_info: The system info (for tokenization)
+        texts: The texts to assess
+        vocab: The vocabulary mapping from strings to counts in the tarining corpus
+        side: Whether the text is from the source or target side (for tokenization)
+
+    Returns:
+        The number of OOVs in each text
+    """
+    all_tokens, owners, _ = _flatten_tokens(_get_tokens_batch(sys_info, texts, side))
+    if isinstance(vocab, MappedStrDict):
+        is_oov = vocab.find(all_tokens) < 0
+    else:
+        is_oov = np.fromiter(
+            (w not in vocab for w in all_tokens), dtype=np.bool_, count=len(all_tokens)
+        )
+    return np.bincount(owners[is_oov], minlength=len(texts))
+
+
 def feat_length_freq(
     sys_info: SysOutputInfo,
     text: str,
@@ -196,6 +364,32 @@ def feat_length_freq(
     return length_freq.get(length, 0.0)
 
 
+def feat_length_freq_batch(
+    sys_info: SysOutputInfo,
+    texts: Sequence[str],
+    length_freq: dict[int, float],
+    side: str = "source",
+) -> np.ndarray[tuple[int], Any]:
+    """Batch version of `feat_length_freq`.
+
+    Args:
+        sys_info: Information about they system (for tokenizers).
+        texts: The texts to measure the length of.
+        length_freq: A dictionary of length -> frequency mappings.
+        side: Whether this is the "source" or "target" (for tokenization)
+
+    Returns:
+        The frequency of the length of each text.
+    """
+    lengths = count_tokens_batch(sys_info, texts, side)
+    # Looks up each distinct length only once.
+    unique_lengths, inverse = np.unique(lengths, return_inverse=True)
+    freqs = np.array(
+        [length_freq.get(x, 0.0) for x in unique_lengths.tolist()], dtype=np.float64
+    )
+    return freqs[inverse]
+
+
 def cap_feature(text: str) -> str:
     """Return a feature regarding capitalization.
 
@@ -4,7 +4,33 @@ from __future__ import annotations
 
 import unittest
 
-from explainaboard.analysis.feature_funcs import get_basic_words
+import numpy as np
+
+from explainaboard.analysis.feature_funcs import (
+    count_tokens,
+    count_tokens_batch,
+    feat_freq_rank,
+    feat_freq_rank_batch,
+    feat_length_freq,
+    feat_length_freq_batch,
+    feat_num_oov,
+    feat_num_oov_batch,
+    get_basic_words,
+    get_basic_words_batch,
+)
+from explainaboard.info import SysOutputInfo
+from explainaboard.utils.statistics_store import MappedStrDict
+from explainaboard.utils.tokenizer import SingleSpaceTokenizer
+
+_TEXTS = ["", "the", "The USA", "It , is", "the cat sat", "the"]
+
+
+def _mapped(content: dict[str, int]) -> MappedStrDict:
+    items = sorted((k.encode("utf-8"), v) for k, v in content.items())
+    return MappedStrDict(
+        np.array([k for k, _ in items], dtype=np.bytes_),
+        np.array([v for _, v in items], dtype=np.int64),
+    )
 
 
 class FeatureFuncsTest(unittest.TestCase):
@@ -34,3 +60,69 @@ class FeatureFuncsTest(unittest.TestCase):
         self.assertEqual(get_basic_words("It is ."), 2 / 3)
         self.assertEqual(get_basic_words("It, is"), 0.5)
         self.assertEqual(get_basic_words("It , is"), 2 / 3)
+
+    def test_get_basic_words_batch(self) -> None:
+        np.testing.assert_array_equal(
+            get_basic_words_batch(_TEXTS), [get_basic_words(x) for x in _TEXTS]
+        )
+
+    def test_count_tokens_batch(self) -> None:
+        sys_info = SysOutputInfo(source_tokenizer=SingleSpaceTokenizer())
+        np.testing.assert_array_equal(
+            count_tokens_batch(sys_info, _TEXTS),
+            [count_tokens(sys_info, x) for x in _TEXTS],
+        )
+
+    def test_count_tokens_uses_cache(self) -> None:
+        sys_info = SysOutputInfo(source_tokenizer=SingleSpaceTokenizer())
+        cache = sys_info.tokenization_cache
+        self.assertEqual(count_tokens(sys_info, "the cat"), 2)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertEqual(count_tokens(sys_info, "the cat"), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        count_tokens_batch(sys_info, ["the cat", "the dog", "the dog"])
+        self.assertEqual((cache.hits, cache.misses), (3, 2))
+
+    def test_feat_num_oov_batch(self) -> None:
+        sys_info = SysOutputInfo(source_tokenizer=SingleSpaceTokenizer())
+        vocab = {"the": 3, "cat": 1, "is": 1}
+        expected = [feat_num_oov(sys_info, x, vocab) for x in _TEXTS]
+        np.testing.assert_array_equal(
+            feat_num_oov_batch(sys_info, _TEXTS, vocab), expected
+        )
+        np.testing.assert_array_equal(
+            feat_num_oov_batch(sys_info, _TEXTS, _mapped(vocab)), expected
+        )
+        self.assertEqual(
+            [feat_num_oov(sys_info, x, _mapped(vocab)) for x in _TEXTS], expected
+        )
+
+    def test_feat_freq_rank_batch(self) -> None:
+        sys_info = SysOutputInfo(source_tokenizer=SingleSpaceTokenizer())
+        vocab_rank = {"the": 1, "cat": 2, "is": 2}
+        expected = [feat_freq_rank(sys_info, x, vocab_rank) for x in _TEXTS]
+        np.testing.assert_allclose(
+            feat_freq_rank_batch(sys_info, _TEXTS, vocab_rank), expected
+        )
+        np.testing.assert_allclose(
+            feat_freq_rank_batch(sys_info, _TEXTS, _mapped(vocab_rank)), expected
+        )
+        self.assertEqual(
+            [feat_freq_rank(sys_info, x, _mapped(vocab_rank)) for x in _TEXTS],
+            expected,
+        )
+
+    def test_feat_length_freq_batch(self) -> None:
+        sys_info = SysOutputInfo(source_tokenizer=SingleSpaceTokenizer())
+        length_freq = {1: 0.5, 3: 0.25}
+        np.testing.assert_array_equal(
+            feat_length_freq_batch(sys_info, _TEXTS, length_freq),
+            [feat_length_freq(sys_info, x, length_freq) for x in _TEXTS],
+        )
+
+    def test_batch_empty(self) -> None:
+        sys_info = SysOutputInfo(source_tokenizer=SingleSpaceTokenizer())
+        self.assertEqual(count_tokens_batch(sys_info, []).shape, (0,))
+        self.assertEqual(feat_num_oov_batch(sys_info, [], {}).shape, (0,))
+        self.assertEqual(feat_freq_rank_batch(sys_info, [], {}).shape, (0,))
+        self.assertEqual(feat_length_freq_batch(sys_info, [], {}).shape, (0,))
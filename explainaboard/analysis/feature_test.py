@@ -139,10 +139,14 @@ class ValueTest(unittest.TestCase):
         def dummy_fn():
             return 123
 
+        def dummy_batch_fn():
+            return [123]
+
         feature = Value(
             dtype=DataType.INT,
             description="test",
             func=dummy_fn,
+            func_batch=dummy_batch_fn,
             require_training_set=True,
             max_value=123,
             min_value=45,
@@ -150,6 +154,7 @@ class ValueTest(unittest.TestCase):
         self.assertEqual(feature.dtype, DataType.INT)
         self.assertEqual(feature.description, "test")
         self.assertIs(feature.func, dummy_fn)
+        self.assertIs(feature.func_batch, dummy_batch_fn)
         self.assertEqual(feature.require_training_set, True)
         self.assertEqual(feature.max_value, 123)
         self.assertEqual(feature.min_value, 45)
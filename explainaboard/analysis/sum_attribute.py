@@ -2,19 +2,114 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import Counter, namedtuple
+from collections.abc import Iterable
+from dataclasses import dataclass
 from functools import lru_cache
 
-import nltk
-from nltk import sent_tokenize, word_tokenize
-from nltk.util import ngrams
+from nltk.tokenize import NLTKWordTokenizer, sent_tokenize
 
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    # TODO(odashi): Avoid programatic download: it requires unnecessary outbound
-    # connection and won't work in offline systems.
-    nltk.download("punkt")
+_word_tokenizer = NLTKWordTokenizer()
+
+
+def _sent_tokenize(text: str) -> list[str]:
+    """Split a text into sentences with the pretrained punkt model of NLTK.
+
+    Args:
+        text: The text.
+
+    Returns:
+        The sentences.
+
+    Raises:
+        LookupError: The punkt model is not installed.
+    """
+    try:
+        return sent_tokenize(text)
+    except LookupError as ex:
+        raise LookupError(
+            "SUMAttribute requires the punkt model of NLTK to split sentences. "
+            "Install it with `python -m nltk.downloader punkt punkt_tab`."
+        ) from ex
+
+
+def _word_tokenize(text: str) -> tuple[str, ...]:
+    """Split a text into word tokens as `nltk.word_tokenize` does.
+
+    Args:
+        text: The text.
+
+    Returns:
+        The tokens.
+    """
+    return tuple(
+        token
+        for sent in _sent_tokenize(text)
+        for token in _word_tokenizer.tokenize(sent)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _tokenize(text: str) -> tuple[str, ...]:
+    """Split a text into word tokens, keeping the results for repeated texts.
+
+    Args:
+        text: The text.
+
+    Returns:
+        The tokens.
+    """
+    return _word_tokenize(text)
+
+
+@lru_cache(maxsize=1024)
+def _tokenize_lowercased(text: str) -> tuple[tuple[str, ...], ...]:
+    """Split a lowercased text into sentences of word tokens to count n-grams.
+
+    Args:
+        text: The text.
+
+    Returns:
+        The tokens of each sentence.
+    """
+    return tuple(_word_tokenize(sent) for sent in _sent_tokenize(text.lower()))
+
+
+def _count_ngrams(
+    sentences: Iterable[tuple[str, ...]], orders: Iterable[int]
+) -> dict[int, Counter]:
+    """Count the n-grams within each sentence for several orders at once.
+
+    Args:
+        sentences: The tokens of each sentence.
+        orders: The orders of n-grams to count.
+
+    Returns:
+        Mapping from each order to the counts of the n-grams.
+    """
+    counters: dict[int, Counter] = {n: Counter() for n in orders}
+    for tokens in sentences:
+        for n, counter in counters.items():
+            counter.update(zip(*(tokens[i:] for i in range(n))))
+    return counters
+
+
+@dataclass(frozen=True)
+class _SourceText:
+    """Information of a source text shared by all summaries of it.
+
+    Attributes:
+        num_tokens: The number of tokens in the text.
+        normalized: The lowercased tokens.
+        positions: Mapping from each normalized token to its positions in the text.
+        bigram_counts: The number of each bigram in the text.
+    """
+
+    num_tokens: int
+    normalized: list[str]
+    positions: dict[str, list[int]]
+    bigram_counts: Counter
 
 
 class SUMAttribute:
@@ -37,6 +132,9 @@ class SUMAttribute:
     def __call__(self, texts: list[str], summaries: list[str]) -> list[dict]:
         """Calculate attributes of each pair of text and summary.
 
+        Each distinct text is tokenized and indexed only once, however many
+        summaries are paired with it.
+
         Args:
             texts: a list of source documents.
             summaries: a list of generated summaries.
@@ -44,9 +142,13 @@ class SUMAttribute:
         Returns:
             A list of dicts with attributes.
         """
+        sources: dict[str, _SourceText] = {}
         out = []
         for text, summary in zip(texts, summaries):
-            out.append(self.cal_attributes_each(text, summary))
+            source = sources.get(text)
+            if source is None:
+                source = sources[text] = self._analyze_source(text)
+            out.append(self._cal_attributes(source, summary))
         return out
 
     @lru_cache(maxsize=10)
@@ -60,15 +162,32 @@ class SUMAttribute:
         Returns:
             Returns the summary.
         """
+        return self._cal_attributes(self._analyze_source(text), summary)
+
+    def _analyze_source(self, text: str) -> _SourceText:
+        normalized = [t.lower() for t in _tokenize(text)]
+        positions: dict[str, list[int]] = {}
+        for i, token in enumerate(normalized):
+            positions.setdefault(token, []).append(i)
+        return _SourceText(
+            num_tokens=len(normalized),
+            normalized=normalized,
+            positions=positions,
+            bigram_counts=_count_ngrams(_tokenize_lowercased(text), (2,))[2],
+        )
+
+    def _cal_attributes(
+        self, source: _SourceText, summary: str
+    ) -> dict[str, int | float]:
         # Normalize text
-        tokenized_text = word_tokenize(text)
-        tokenized_summary = word_tokenize(summary)
-        normalized_text = [str(t).lower() for t in tokenized_text]
-        normalized_summary = [str(t).lower() for t in tokenized_summary]
+        normalized_summary = [t.lower() for t in _tokenize(summary)]
+        ngram_counts = _count_ngrams(_tokenize_lowercased(summary), (2, 3))
 
         # Calculate matches
-        matches = self.overlap(normalized_summary, normalized_text)
-        summary_len = len(tokenized_summary)
+        matches = self._find_fragments(
+            normalized_summary, source.normalized, source.positions
+        )
+        summary_len = len(normalized_summary)
 
         if summary_len == 0:
             density, coverage, compression = 0.0, 0.0, 0.0
@@ -78,12 +197,12 @@ class SUMAttribute:
             # Coverage
             coverage = sum(float(o.length) for o in matches) / summary_len
             # Compression
-            compression = float(len(tokenized_text)) / summary_len
+            compression = float(source.num_tokens) / summary_len
 
         # Repetition
-        repetition = self.cal_repetition(summary)
+        repetition = self._cal_repetition(ngram_counts[3])
         # Novelty
-        novelty = self.cal_novelty(text, summary)
+        novelty = self._cal_novelty(source.bigram_counts, ngram_counts[2])
 
         # Copy length
         copy_lens = [o.length for o in matches]
@@ -98,19 +217,10 @@ class SUMAttribute:
             "attr_repetition": repetition,
             "attr_novelty": novelty,
             "attr_copy_len": copy_len,
-            "attr_source_len": len(normalized_text),
-            "attr_hypothesis_len": len(normalized_summary),
+            "attr_source_len": source.num_tokens,
+            "attr_hypothesis_len": summary_len,
         }
 
-    def _get_ngrams(self, doc, n):
-        doc = doc.lower()
-        doc_sents = sent_tokenize(doc)
-        _ngrams = []
-        for sent in doc_sents:
-            sent = word_tokenize(sent)
-            _ngrams.extend(list(ngrams(sent, n=n)))
-        return _ngrams
-
     def cal_novelty(self, text: str, summary: str, n: int = 2) -> float:
         """Returns the novelty score.
 
@@ -125,12 +235,15 @@ class SUMAttribute:
         Returns:
             The ratio of novel n-grams in the summary.
         """
+        return self._cal_novelty(
+            _count_ngrams(_tokenize_lowercased(text), (n,))[n],
+            _count_ngrams(_tokenize_lowercased(summary), (n,))[n],
+        )
+
+    @staticmethod
+    def _cal_novelty(counter_text: Counter, counter_summary: Counter) -> float:
         cnt_all = 0
         cnt_nov = 0
-        _ngrams_text = self._get_ngrams(text, n=n)
-        _ngrams_summary = self._get_ngrams(summary, n=n)
-        counter_text: Counter = Counter(_ngrams_text)
-        counter_summary: Counter = Counter(_ngrams_summary)
         for k, v in counter_summary.items():
             cnt_all += v
             if k not in counter_text:
@@ -150,10 +263,14 @@ class SUMAttribute:
         Returns:
             The number of n-grams that are repeated in the summary.
         """
+        return self._cal_repetition(
+            _count_ngrams(_tokenize_lowercased(summary), (n,))[n]
+        )
+
+    @staticmethod
+    def _cal_repetition(counter: Counter) -> float:
         cnt_all = 0
         cnt_rep = 0
-        _ngrams = self._get_ngrams(summary, n=n)
-        counter: Counter = Counter(_ngrams)
         for k, v in counter.items():
             cnt_all += v
             if v >= 2:
@@ -175,39 +292,58 @@ class SUMAttribute:
             summary: the summary
             text: the text
 
+        Returns:
+            A list of Match objects indicating matches between the summary and text.
+        """
+        positions: dict[str, list[int]] = {}
+        for i, token in enumerate(text):
+            positions.setdefault(token, []).append(i)
+        return self._find_fragments(summary, text, positions)
+
+    @staticmethod
+    def _find_fragments(
+        summary: list[str], text: list[str], positions: dict[str, list[int]]
+    ) -> list[Match]:
+        """Find the extractive fragments as `overlap` does.
+
+        From each start in the summary, the text is scanned for the longest match,
+        resuming after the end of each match found. Instead of comparing every
+        token of the text, only the positions of the first token of the summary
+        are visited, which are looked up in `positions`.
+
+        Args:
+            summary: the summary
+            text: the text
+            positions: mapping from each token to its positions in the text
+
         Returns:
             A list of Match objects indicating matches between the summary and text.
         """
         matches = []
+        summary_len = len(summary)
+        text_len = len(text)
         summary_start = 0
-        text_start = 0
-        while summary_start < len(summary):
+        while summary_start < summary_len:
+            starts = positions.get(summary[summary_start], [])
             best_match = None
             best_match_length = 0
-            while text_start < len(text):
-                if summary[summary_start] == text[text_start]:
-                    summary_end = summary_start
-                    text_end = text_start
-                    while (
-                        summary_end < len(summary)
-                        and text_end < len(text)
-                        and text[text_end] == summary[summary_end]
-                    ):
-                        text_end += 1
-                        summary_end += 1
-                    length = summary_end - summary_start
-                    if length > best_match_length:
-                        best_match = SUMAttribute.Match(
-                            summary_start, text_start, length
-                        )
-                        best_match_length = length
-                    text_start = text_end
-                else:
-                    text_start += 1
-            text_start = 0
+            i = 0
+            while i < len(starts):
+                text_start = starts[i]
+                # The first tokens match by the definition of `starts`.
+                length = 1
+                while (
+                    summary_start + length < summary_len
+                    and text_start + length < text_len
+                    and text[text_start + length] == summary[summary_start + length]
+                ):
+                    length += 1
+                if length > best_match_length:
+                    best_match = SUMAttribute.Match(summary_start, text_start, length)
+                    best_match_length = length
+                i = bisect_left(starts, text_start + length, i + 1)
             if best_match:
-                if best_match_length > 0:
-                    matches.append(best_match)
+                matches.append(best_match)
                 summary_start += best_match_length
             else:
                 summary_start += 1
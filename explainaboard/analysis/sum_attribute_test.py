@@ -0,0 +1,113 @@
+"""Tests for explainaboard.analysis.sum_attribute"""
+
+from __future__ import annotations
+
+import random
+import unittest
+from unittest import mock
+
+from nltk.tokenize import sent_tokenize
+
+from explainaboard.analysis.sum_attribute import SUMAttribute
+
+
+def _is_punkt_available() -> bool:
+    try:
+        sent_tokenize("")
+    except LookupError:
+        return False
+    return True
+
+
+def _scan_overlap(summary: list[str], text: list[str]) -> list[SUMAttribute.Match]:
+    """Find the fragments by scanning the whole text from each summary start."""
+    matches = []
+    summary_start = 0
+    while summary_start < len(summary):
+        best_match = None
+        text_start = 0
+        while text_start < len(text):
+            length = 0
+            while (
+                summary_start + length < len(summary)
+                and text_start + length < len(text)
+                and text[text_start + length] == summary[summary_start + length]
+            ):
+                length += 1
+            if length == 0:
+                text_start += 1
+                continue
+            if best_match is None or length > best_match.length:
+                best_match = SUMAttribute.Match(summary_start, text_start, length)
+            text_start += length
+        if best_match is None:
+            summary_start += 1
+        else:
+            matches.append(best_match)
+            summary_start += best_match.length
+    return matches
+
+
+class SUMAttributeTest(unittest.TestCase):
+    def test_overlap(self) -> None:
+        self.assertEqual(
+            SUMAttribute().overlap(["a", "b", "x", "c"], ["c", "a", "b", "c"]),
+            [SUMAttribute.Match(0, 1, 2), SUMAttribute.Match(3, 0, 1)],
+        )
+
+    def test_overlap_skips_inside_match(self) -> None:
+        # The scan resumes after "a a", so the match starting at 1 is not found.
+        self.assertEqual(
+            SUMAttribute().overlap(["a", "a", "b"], ["a", "a", "a", "b"]),
+            [SUMAttribute.Match(0, 0, 2), SUMAttribute.Match(2, 3, 1)],
+        )
+
+    def test_overlap_same_as_scan(self) -> None:
+        rng = random.Random(0)
+        sum_attr = SUMAttribute()
+        for _ in range(300):
+            vocab = ["a", "b", "c", "d"][: rng.randint(1, 4)]
+            summary = rng.choices(vocab, k=rng.randint(0, 20))
+            text = rng.choices(vocab, k=rng.randint(0, 40))
+            self.assertEqual(
+                sum_attr.overlap(summary, text), _scan_overlap(summary, text)
+            )
+
+    @unittest.skipUnless(_is_punkt_available(), "punkt is not installed")
+    def test_cal_repetition(self) -> None:
+        sum_attr = SUMAttribute()
+        self.assertEqual(sum_attr.cal_repetition("the cat sat the cat sat"), 0.25)
+        self.assertEqual(sum_attr.cal_repetition("a b"), 0)
+
+    @unittest.skipUnless(_is_punkt_available(), "punkt is not installed")
+    def test_cal_novelty(self) -> None:
+        sum_attr = SUMAttribute()
+        self.assertEqual(
+            sum_attr.cal_novelty("The cat sat. A dog ran.", "the cat ran"), 0.5
+        )
+        self.assertEqual(sum_attr.cal_novelty("a b", "c"), 0)
+
+    @unittest.skipUnless(_is_punkt_available(), "punkt is not installed")
+    def test_call(self) -> None:
+        sum_attr = SUMAttribute()
+        texts = ["The cat sat on the mat.", "A dog ran.", "The cat sat on the mat."]
+        summaries = ["The cat sat.", "A dog ran.", "A mat."]
+        attributes = sum_attr(texts, summaries)
+        self.assertEqual(
+            attributes,
+            [sum_attr.cal_attributes_each(x, y) for x, y in zip(texts, summaries)],
+        )
+        self.assertEqual(attributes[0]["attr_density"], 2.5)
+        self.assertEqual(attributes[1]["attr_coverage"], 1.0)
+        self.assertEqual(attributes[1]["attr_novelty"], 0.0)
+        self.assertEqual(attributes[2]["attr_source_len"], 7)
+        self.assertEqual(attributes[2]["attr_hypothesis_len"], 3)
+        self.assertEqual(attributes[2]["attr_compression"], 7 / 3)
+
+    def test_punkt_not_installed(self) -> None:
+        with mock.patch(
+            "explainaboard.analysis.sum_attribute.sent_tokenize",
+            side_effect=LookupError("Resource punkt_tab not found."),
+        ):
+            with self.assertRaisesRegex(LookupError, r"nltk\.downloader punkt"):
+                SUMAttribute()(["Not cached text."], ["Not cached summary."])
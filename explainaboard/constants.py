@@ -57,6 +57,7 @@ class FileType(str, Enum):
     """Types of file formats."""
 
     json = "json"
+    jsonl = "jsonl"  # JSON Lines, one sample per line
     tsv = "tsv"
     csv = "csv"
     conll = "conll"  # for tagging task such as named entity recognition
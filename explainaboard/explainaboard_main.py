@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import argparse
 import copy
-import json
 import os
 
 import eaas.endpoint
@@ -12,22 +11,33 @@ import eaas.endpoint
 from explainaboard import get_loader_class, get_processor_class, TaskType
 from explainaboard.constants import Source
 from explainaboard.info import SysOutputInfo
+from explainaboard.loaders.columnar import ColumnarSamples
 from explainaboard.loaders.file_loader import (
     DatalabLoaderOption,
     FileLoaderField,
     FileLoaderMetadata,
+    FileLoaderReturn,
 )
-from explainaboard.metrics.eaas import EaaSMetricConfig
+from explainaboard.loaders.loader import Loader
+from explainaboard.metrics.eaas import (
+    create_remote_eaas_client,
+    EaaSMetricConfig,
+    set_eaas_client,
+)
+from explainaboard.metrics.local_eaas import LocalEaaSClient
 from explainaboard.metrics.metric import MetricConfig, Score
 from explainaboard.serialization import common_registry
+from explainaboard.serialization.serializers import PrimitiveSerializer
+from explainaboard.utils import json_utils
 from explainaboard.utils.io_utils import text_writer
 from explainaboard.utils.logging import get_logger
+from explainaboard.utils.parallel import fork_imap
 from explainaboard.utils.tensor_analysis import (
     aggregate_score_tensor,
     filter_score_tensor,
     print_score_tensor,
 )
-from explainaboard.utils.typing_utils import unwrap
+from explainaboard.utils.typing_utils import narrow, unwrap
 from explainaboard.visualizers import get_pairwise_performance_gap
 from explainaboard.visualizers.draw_charts import draw_charts_from_reports
 
@@ -72,6 +82,24 @@ def get_tasks(task: TaskType, system_outputs: list[str]) -> list[TaskType]:
     return real_tasks
 
 
+def _get_field_names(samples: list[dict] | ColumnarSamples) -> set[str]:
+    """Get the names of the fields which appear in any of the samples.
+
+    Args:
+        samples: The samples.
+
+    Returns:
+        The names of the fields.
+    """
+    if isinstance(samples, ColumnarSamples):
+        return {
+            name
+            for name, column in samples.columns.items()
+            if any(x is not None for x in column)
+        }
+    return set().union(*samples)
+
+
 def analyze_reports(args):
     """Analyze reports based on the input arguments.
 
@@ -94,9 +122,9 @@ def analyze_reports(args):
     languages_aggregation: str | None = args.languages_aggregation
     score_tensor = {}
     for report in reports:
-        with open(report) as fin:
+        with open(report, "rb") as fin:
 
-            report_dict = json.load(fin)
+            report_dict = json_utils.load(fin)
 
             system_name = report_dict["system_name"]
             dataset_name = report_dict["dataset_name"]
@@ -264,7 +292,7 @@ def create_parser():
         type=str,
         required=False,
         default=None,
-        help="the file type: json, tsv, conll",
+        help="the file type: json, jsonl, tsv, conll",
     )
 
     parser.add_argument(
@@ -302,6 +330,39 @@ def create_parser():
         help="the place to write the report json file",
     )
 
+    parser.add_argument(
+        "--compact-report",
+        action="store_true",
+        help="write report json files without indentation",
+    )
+
+    parser.add_argument(
+        "--json-backend",
+        type=str,
+        required=False,
+        default=None,
+        choices=["orjson", "json"],
+        help="the library to read and write json files. orjson is used by default "
+        "if it is installed.",
+    )
+
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="load the dataset and system outputs column by column, which is faster "
+        "and takes less memory for large tsv and text files",
+    )
+
+    parser.add_argument(
+        "--parallel-systems",
+        type=int,
+        required=False,
+        default=None,
+        help="evaluate the systems sharing a dataset with the given number of "
+        "processes, loading the dataset and calculating the features which don't "
+        "depend on the system outputs only once",
+    )
+
     parser.add_argument(
         "--system-details",
         type=str,
@@ -327,6 +388,25 @@ def create_parser():
         action="store_true",
         help="whether to skip failed analyses or report errors.",
     )
+
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        required=False,
+        default=1,
+        help="the number of processes to calculate features with",
+    )
+
+    parser.add_argument(
+        "--eaas-backend",
+        type=str,
+        required=False,
+        default=None,
+        choices=["remote", "local"],
+        help="whether to calculate EaaS metrics on the EaaS server or locally. "
+        "Only bleu, chrf, rouge1, rouge2, rougeL, length and length_ratio can be "
+        "calculated locally.",
+    )
     return parser
 
 
@@ -370,6 +450,14 @@ def main():
     output_file_type: str | None = args.output_file_type
     output_dir: str = args.output_dir
 
+    if args.json_backend is not None:
+        json_utils.set_json_backend(args.json_backend)
+
+    if args.eaas_backend == "local":
+        set_eaas_client(LocalEaaSClient(num_workers=args.num_workers))
+    elif args.eaas_backend == "remote":
+        set_eaas_client(create_remote_eaas_client())
+
     # If reports have been specified, ExplainaBoard cli will perform analysis
     # over report files.
     if args.reports:
@@ -380,7 +468,7 @@ def main():
             if args.system_details:
                 try:
                     with open(args.system_details) as fin:
-                        return json.load(fin)
+                        return json_utils.load(fin)
                 except ValueError as e:
                     raise ValueError(f"invalid json: {e} for system details")
 
@@ -447,7 +535,31 @@ def main():
                     tasks, system_outputs, output_file_types
                 )
             ]
-        system_datasets = [loader.load() for loader in loaders]
+        shared_dataset: FileLoaderReturn | None = None
+        if args.parallel_systems is None:
+            system_datasets = [
+                loader.load_columns() if args.columnar else loader.load()
+                for loader in loaders
+            ]
+        else:
+            if len(set(tasks)) > 1 or len(set(custom_dataset_paths or [])) > 1:
+                raise ValueError(
+                    "--parallel-systems requires all systems to share the task and "
+                    "the dataset"
+                )
+            # The dataset is loaded once, and merged with each output when the
+            # system is evaluated.
+            shared_dataset = loaders[0].load_dataset(columnar=args.columnar)
+            system_datasets = [
+                loader.load_output(columnar=args.columnar) for loader in loaders
+            ]
+            for system_output in system_datasets:
+                if len(system_output) != len(shared_dataset):
+                    raise ValueError(
+                        "the number of examples in the system output "
+                        f"({len(system_output)}) does not match the number of "
+                        f"examples in the dataset ({len(shared_dataset)})"
+                    )
 
         # validation
         if len(system_datasets) == 2:
@@ -460,15 +572,16 @@ def main():
                     f"{system_datasets[0]} ({num0}) != {system_datasets[1]} ({num1})"
                 )
 
+        first_metadata = system_datasets[0].metadata
+        if shared_dataset is not None:
+            first_metadata = copy.deepcopy(shared_dataset.metadata)
+            first_metadata.merge(system_datasets[0].metadata)
+
         # TODO(gneubig): This gets metadata from the first system and assumes it's the
         #  same for other systems
-        target_language = (
-            target_language or system_datasets[0].metadata.target_language or "en"
-        )
+        target_language = target_language or first_metadata.target_language or "en"
         source_language = (
-            source_language
-            or system_datasets[0].metadata.source_language
-            or target_language
+            source_language or first_metadata.source_language or target_language
         )
 
         # Setup metadata
@@ -480,38 +593,36 @@ def main():
             "target_language": target_language,
             "confidence_alpha": args.confidence_alpha,
             "system_details": system_details,
-            "custom_features": system_datasets[0].metadata.custom_features,
-            "custom_analyses": system_datasets[0].metadata.custom_analyses,
+            "custom_features": first_metadata.custom_features,
+            "custom_analyses": first_metadata.custom_analyses,
+            "num_workers": args.num_workers,
         }
         if metric_names is not None:
             if "metric_configs" in metadata:
                 raise ValueError("Cannot specify both metric names and metric configs")
-            metric_configs = {
-                name: get_metric_config_or_eaas(name)(
-                    source_language=source_language,
-                    target_language=target_language,
+            metric_configs: dict[str, MetricConfig] = {}
+            for name in metric_names:
+                config_cls = get_metric_config_or_eaas(name)
+                metric_configs[name] = (
+                    EaaSMetricConfig(
+                        name=name,
+                        source_language=source_language,
+                        target_language=target_language,
+                    )
+                    if config_cls is EaaSMetricConfig
+                    else config_cls(
+                        source_language=source_language,
+                        target_language=target_language,
+                    )
                 )
-                for name in metric_names
-            }
             metadata["metric_configs"] = metric_configs
 
-        # Run analysis
-        reports: list[SysOutputInfo] = []
-        for loader, system_dataset, system_full_path, task in zip(
-            loaders, system_datasets, system_outputs, tasks
-        ):
+        def get_system_metadata(task: TaskType) -> dict:
             metadata_copied = copy.deepcopy(metadata)
             metadata_copied["task_name"] = task
+            return metadata_copied
 
-            processor = get_processor_class(task=task)()
-            report = processor.process(
-                metadata=metadata_copied,
-                sys_output=system_dataset.samples,
-                skip_failed_analyses=args.skip_failed_analyses,
-                use_cache=use_cache,
-            )
-            reports.append(report)
-
+        def log_report(report: SysOutputInfo) -> None:
             # print to the console
             logger = get_logger("report")
 
@@ -526,11 +637,16 @@ def main():
                 if analysis is not None:
                     logger.info(analysis.generate_report())
 
+        def write_report(report: SysOutputInfo, system_full_path: str) -> None:
             if output_dir:
 
                 # save report to `output_dir_reports`
                 x_file_name = os.path.basename(system_full_path).split(".")[0]
-                report.write_to_directory(output_dir_reports, f"{x_file_name}.json")
+                report.write_to_directory(
+                    output_dir_reports,
+                    f"{x_file_name}.json",
+                    compact=args.compact_report,
+                )
 
                 # generate figures and save them into  `output_dir_figures`
                 if not os.path.exists(f"{output_dir_figures}/{x_file_name}"):
@@ -540,12 +656,70 @@ def main():
                     f"{output_dir_figures}/{x_file_name}",
                 )
 
+        # Run analysis
+        reports: list[SysOutputInfo] = []
+        if shared_dataset is None:
+            for system_dataset, system_full_path, task in zip(
+                system_datasets, system_outputs, tasks
+            ):
+                processor = get_processor_class(task=task)()
+                report = processor.process(
+                    metadata=get_system_metadata(task),
+                    sys_output=system_dataset.samples,
+                    skip_failed_analyses=args.skip_failed_analyses,
+                    use_cache=use_cache,
+                )
+                reports.append(report)
+                log_report(report)
+                write_report(report, system_full_path)
+        else:
+            # The features only depending on the dataset are calculated once.
+            output_fields: set[str] = set()
+            for system_output in system_datasets:
+                output_fields.update(_get_field_names(system_output.samples))
+            dataset_features = get_processor_class(
+                task=tasks[0]
+            )().precompute_dataset_features(
+                metadata=get_system_metadata(tasks[0]),
+                dataset=unwrap(shared_dataset).samples,
+                output_fields=output_fields,
+                use_cache=use_cache,
+            )
+
+            def process_system(system_id: int) -> dict:
+                system_dataset = Loader.merge(
+                    unwrap(shared_dataset), system_datasets[system_id]
+                )
+                report = get_processor_class(task=tasks[system_id])().process(
+                    metadata=get_system_metadata(tasks[system_id]),
+                    sys_output=system_dataset.samples,
+                    skip_failed_analyses=args.skip_failed_analyses,
+                    use_cache=use_cache,
+                    dataset_features=dataset_features,
+                )
+                write_report(report, system_outputs[system_id])
+                # Reports hold the feature functions, so they are sent back to the
+                # main process in the serialized form.
+                return PrimitiveSerializer().serialize(report)
+
+            # Each worker writes the report of its system as soon as it finishes.
+            for serialized in fork_imap(
+                process_system, range(num_systems), args.parallel_systems
+            ):
+                report = narrow(
+                    SysOutputInfo, PrimitiveSerializer().deserialize(serialized)
+                )
+                reports.append(report)
+                log_report(report)
+
         with text_writer(args.report_json) as report_file:
             if len(system_outputs) == 1:  # individual system analysis
-                reports[0].print_as_json(file=report_file)
+                reports[0].print_as_json(file=report_file, compact=args.compact_report)
             elif len(system_outputs) == 2:  # pairwise analysis
                 compare_analysis = get_pairwise_performance_gap(reports[0], reports[1])
-                compare_analysis.print_as_json(file=report_file)
+                compare_analysis.print_as_json(
+                    file=report_file, compact=args.compact_report
+                )
 
 
 if __name__ == "__main__":
@@ -4,21 +4,21 @@ from __future__ import annotations
 
 import dataclasses
 from dataclasses import dataclass, field
-import json
 import os
 import sys
 from typing import Any, cast, ClassVar, final, Optional, TextIO, TypeVar
 
 from explainaboard import config
 from explainaboard.analysis.analyses import Analysis, AnalysisLevel
-from explainaboard.analysis.case import AnalysisCase
+from explainaboard.analysis.case import AnalysisCaseTable
 from explainaboard.analysis.result import Result
-from explainaboard.metrics.metric import MetricStats
+from explainaboard.metrics.metric import MetricStats, ResamplePlan
 from explainaboard.serialization import common_registry
 from explainaboard.serialization.serializers import PrimitiveSerializer
 from explainaboard.serialization.types import Serializable, SerializableData
+from explainaboard.utils import json_utils
 from explainaboard.utils.logging import get_logger
-from explainaboard.utils.tokenizer import Tokenizer
+from explainaboard.utils.tokenizer import TokenizationCache, Tokenizer
 from explainaboard.utils.typing_utils import narrow, unwrap_or
 
 logger = get_logger(__name__)
@@ -85,6 +85,8 @@ class SysOutputInfo(Serializable):
         source_tokenizer (Tokenizer): the tokenizer for source sentences
         target_tokenizer (Tokenizer): the tokenizer for target sentences
         analysis_levels: the levels of analysis to perform
+        tokenization_cache: the tokenization results shared by the features. This
+            is not serialized.
     """
 
     DEFAULT_CONFIDENCE_ALPHA: ClassVar[float] = 0.05
@@ -108,6 +110,10 @@ class SysOutputInfo(Serializable):
     # set later
     results: Result = field(default_factory=lambda: Result(overall={}, analyses=[]))
 
+    tokenization_cache: TokenizationCache = field(
+        default_factory=TokenizationCache, compare=False, repr=False
+    )
+
     # TODO(odashi): This function does many out-of-scope work. It should be enough to
     # provide a functionality to dump the serialized data into a dict, and let users
     # save the dumped data under their responsibility.
@@ -116,6 +122,7 @@ class SysOutputInfo(Serializable):
         dataset_info_dir: str,
         file_name: str | None = None,
         overwrite: bool = False,
+        compact: bool = False,
     ) -> None:
         """Write `SysOutputInfo` as JSON to `dataset_info_dir`.
 
@@ -129,6 +136,7 @@ class SysOutputInfo(Serializable):
                 name is used.
             overwrite: If True, this function overwrites the existing file. If Fasle, it
                 raises an Exception if the file already exists.
+            compact: Whether to write the JSON without indentation.
 
         Raises:
             RuntimeError: File already exists.
@@ -154,19 +162,20 @@ class SysOutputInfo(Serializable):
                     f"Attempted to overwrite the existing file: {file_path}"
                 )
 
-        with open(file_path, "w") as f:
-            self.print_as_json(file=f)
+        with open(file_path, "w", encoding="utf-8") as f:
+            self.print_as_json(file=f, compact=compact)
 
-    def print_as_json(self, file: TextIO | None = None) -> None:
+    def print_as_json(self, file: TextIO | None = None, compact: bool = False) -> None:
         """Print as json to the specified file.
 
         Args:
             file: The file stream to print to, or None for stdout.
+            compact: Whether to print without indentation and line breaks.
         """
-        json.dump(
+        json_utils.dump(
             PrimitiveSerializer().serialize(self),
             file if file is not None else sys.stdout,
-            indent=2,
+            compact=compact,
         )
 
     def serialize(self) -> dict[str, SerializableData]:
@@ -269,8 +278,30 @@ class OverallStatistics:
         sys_info: The system info
         analysis_cases: The extracted analysis cases
         metric_stats: The statistics needed to calculate each metric
+        resample_plans: The bootstrap resamples shared within each analysis level
     """
 
     sys_info: SysOutputInfo
-    analysis_cases: list[list[AnalysisCase]]
+    analysis_cases: list[AnalysisCaseTable]
     metric_stats: list[dict[str, MetricStats]]
+    resample_plans: list[ResamplePlan] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class DatasetFeatures:
+    """Features calculated by the processor only from a dataset.
+
+    They are shared by the outputs of all systems evaluated on the dataset, so that
+    they are not calculated again for each system.
+
+    Attributes:
+        statistics: The statistics of the training set, or None if unavailable
+        example_feature_names: The names of the example-level features which don't
+            depend on the system outputs
+        example_features: The values of those features for each example. Features
+            which are not available for an example are omitted.
+    """
+
+    statistics: Any
+    example_feature_names: frozenset[str]
+    example_features: list[dict[str, Any]]
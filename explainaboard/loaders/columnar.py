@@ -0,0 +1,97 @@
+"""Samples stored column by column."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any, final, overload
+
+
+@final
+class ColumnarSamples(Sequence[dict]):
+    """Samples stored column by column.
+
+    It behaves as a sequence of samples, but holds a list of values for each field
+    instead of a dict for each sample, which takes much less memory for large
+    outputs. A dict is created only when a sample is accessed. A None value means
+    that the field is missing in the sample, so it is not included in the dict, in
+    the same way as file loaders skip fields that are not found.
+    """
+
+    def __init__(self, columns: dict[str, list]) -> None:
+        """Initializes ColumnarSamples.
+
+        Args:
+            columns: Mapping from the field name to its value in each sample.
+
+        Raises:
+            ValueError: if the columns have different lengths.
+        """
+        lengths = {len(x) for x in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        self._columns = columns
+        self._length = lengths.pop() if lengths else 0
+
+    @property
+    def columns(self) -> dict[str, list]:
+        """Returns the mapping from the field name to its value in each sample."""
+        return self._columns
+
+    def get_column(self, name: str) -> list:
+        """Get the values of a field.
+
+        Args:
+            name: The name of the field.
+
+        Returns:
+            The value in each sample, or None if it is missing in the sample.
+        """
+        column = self._columns.get(name)
+        return column if column is not None else [None] * self._length
+
+    def __len__(self) -> int:
+        """Returns the number of samples."""
+        return self._length
+
+    def _get_sample(self, index: int) -> dict:
+        """Creates a dict of a sample."""
+        sample = {}
+        for name, column in self._columns.items():
+            value = column[index]
+            if value is not None:
+                sample[name] = value
+        return sample
+
+    @overload
+    def __getitem__(self, index: int) -> dict:  # noqa: D105: suppress bug
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict]:  # noqa: D105: suppress bug
+        ...
+
+    def __getitem__(self, index: int | slice) -> dict | list[dict]:
+        """Returns a sample or a list of samples as dicts."""
+        if isinstance(index, slice):
+            return [self._get_sample(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Index {index} out of range")
+        return self._get_sample(index)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterates over the samples as dicts."""
+        names = list(self._columns)
+        for values in zip(*self._columns.values()):
+            yield {
+                name: value for name, value in zip(names, values) if value is not None
+            }
+
+    def __eq__(self, other: Any) -> bool:
+        """Checks if the samples are the same."""
+        if isinstance(other, ColumnarSamples):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
@@ -0,0 +1,41 @@
+"""Tests for explainaboard.loaders.columnar."""
+
+from __future__ import annotations
+
+import unittest
+
+from explainaboard.loaders.columnar import ColumnarSamples
+
+
+class ColumnarSamplesTest(unittest.TestCase):
+    def test_samples(self) -> None:
+        samples = ColumnarSamples(
+            {"text": ["a", "b", "c"], "label": [1, None, 3], "id": ["0", "1", "2"]}
+        )
+        expected = [
+            {"text": "a", "label": 1, "id": "0"},
+            {"text": "b", "id": "1"},
+            {"text": "c", "label": 3, "id": "2"},
+        ]
+        self.assertEqual(len(samples), 3)
+        self.assertEqual(list(samples), expected)
+        self.assertEqual(samples[1], expected[1])
+        self.assertEqual(samples[-1], expected[-1])
+        self.assertEqual(samples[1:], expected[1:])
+        self.assertEqual(samples, expected)
+        with self.assertRaises(IndexError):
+            samples[3]
+
+    def test_get_column(self) -> None:
+        samples = ColumnarSamples({"text": ["a", "b"]})
+        self.assertEqual(samples.get_column("text"), ["a", "b"])
+        self.assertEqual(samples.get_column("label"), [None, None])
+
+    def test_empty(self) -> None:
+        samples = ColumnarSamples({})
+        self.assertEqual(len(samples), 0)
+        self.assertEqual(list(samples), [])
+
+    def test_different_lengths(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"^Columns have different lengths"):
+            ColumnarSamples({"text": ["a", "b"], "label": [1]})
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 import copy
 import csv
 import dataclasses
 from dataclasses import dataclass, field
 from io import StringIO
 import itertools
-import json
+import operator
 from typing import Any, cast, ClassVar, final, Optional, Sized, TypeVar, Union
 
 from datalabs import DatasetDict, IterableDatasetDict, load_dataset
@@ -18,9 +18,18 @@ from datalabs.features.features import ClassLabel, Sequence
 from explainaboard.analysis.analyses import Analysis
 from explainaboard.analysis.feature import FeatureType
 from explainaboard.constants import Source
+from explainaboard.loaders.columnar import ColumnarSamples
 from explainaboard.serialization.serializers import PrimitiveSerializer
+from explainaboard.utils import json_utils
 from explainaboard.utils.load_resources import get_customized_features
-from explainaboard.utils.typing_utils import narrow
+from explainaboard.utils.typing_utils import narrow, unwrap
+
+try:
+    import pyarrow
+    from pyarrow import csv as pyarrow_csv
+except ImportError:
+    pyarrow = None  # type: ignore
+    pyarrow_csv = None  # type: ignore
 
 DType = Union[type[int], type[float], type[str], type[dict], type[list]]
 T = TypeVar("T")
@@ -173,12 +182,12 @@ class FileLoaderMetadata:
         Returns:
             A file loader metadata class.
         """
-        with open(file_name, "r") as file_in:
-            my_data = json.load(file_in)
+        with open(file_name, "rb") as file_in:
+            my_data = json_utils.load(file_in)
             if not isinstance(my_data, dict) or "metadata" not in my_data:
                 raise ValueError(f"Could not find metadata in {file_name}")
             else:
-                return FileLoaderMetadata.from_file(my_data["metadata"])
+                return FileLoaderMetadata.from_dict(my_data["metadata"])
 
 
 @dataclass
@@ -186,11 +195,12 @@ class FileLoaderReturn(Sized):
     """Data returned by a FileLoader.
 
     Attributes:
-        samples: A list of samples from the dataset
+        samples: A list of samples from the dataset, or the samples stored column by
+          column
         metadata: Metadata regarding the samples or the dataset
     """
 
-    samples: list
+    samples: list | ColumnarSamples
     metadata: FileLoaderMetadata = dataclasses.field(
         default_factory=lambda: FileLoaderMetadata()
     )
@@ -204,6 +214,309 @@ class FileLoaderReturn(Sized):
         return self.samples[item]
 
 
+@dataclass
+class FileLoaderStream:
+    """Data returned by a FileLoader one sample at a time.
+
+    Samples are read from the source lazily, so the whole data is never held in
+    memory unless the caller collects it.
+
+    Attributes:
+        samples: An iterator over the samples from the dataset
+        metadata: Metadata regarding the samples or the dataset
+    """
+
+    samples: Iterator[Any]
+    metadata: FileLoaderMetadata = dataclasses.field(
+        default_factory=lambda: FileLoaderMetadata()
+    )
+
+    def collect(self) -> FileLoaderReturn:
+        """Read all the remaining samples into memory.
+
+        Returns:
+            A FileLoaderReturn object with the samples and metadata.
+        """
+        return FileLoaderReturn(list(self.samples), self.metadata)
+
+    def collect_columns(self) -> dict[str, list]:
+        """Read all the remaining samples into memory column by column.
+
+        Returns:
+            A mapping from each field name to the list of its values in all the
+            samples. Values missing in a sample are None.
+        """
+        columns: dict[str, list] = {}
+        num_samples = 0
+        for sample in self.samples:
+            for name, value in sample.items():
+                column = columns.get(name)
+                if column is None:
+                    column = columns[name] = [None] * num_samples
+                column.append(value)
+            num_samples += 1
+            for column in columns.values():
+                if len(column) < num_samples:
+                    column.append(None)
+        return columns
+
+
+# A sentinel of values that are not found in a data point.
+_MISSING = object()
+
+
+def _compile_converter(
+    field: FileLoaderField, str_input: bool = False
+) -> Callable[[Any], Any]:
+    """Compile the conversion of FileLoader.parse_data for a field.
+
+    Args:
+        field: Information about the field.
+        str_input: Whether the data is always str, which allows simpler conversions.
+
+    Returns:
+        A function to convert data loaded in from a file to the required data type.
+    """
+    if field.parser:
+        return field.parser
+    dtype = field.dtype
+    if dtype in (list, dict, None):
+        convert: Callable[[Any], Any] | None = None
+    elif dtype in (int, float, str):
+        convert = dtype
+    else:
+        raise NotImplementedError(f"dtype {dtype} is not supported")
+
+    if str_input:
+        if dtype == str:
+            return str.strip if field.strip_before_parsing else str
+        if field.strip_before_parsing and convert is None:
+            return str.strip
+        # int() and float() ignore surrounding white spaces.
+        return convert if convert is not None else lambda data: data
+    if field.strip_before_parsing:
+        # some time data could be a nested json object
+        if convert is None:
+            return lambda data: data.strip() if isinstance(data, str) else data
+        if dtype == str:
+            return lambda data: data.strip() if isinstance(data, str) else str(data)
+        return lambda data: convert(data.strip() if isinstance(data, str) else data)
+    if convert is None:
+        return lambda data: data
+    return convert
+
+
+def _make_getter(path: tuple, optional: bool) -> Callable[[Any], Any]:
+    """Make a function to look up a value by its path in a data point.
+
+    Args:
+        path: The keys or indices to look up in order.
+        optional: Whether to look up a single key with `get`, returning None if the
+          key is missing.
+
+    Returns:
+        The function.
+    """
+    if optional and len(path) == 1:
+        return operator.methodcaller("get", path[0])
+    if len(path) == 1:
+        return operator.itemgetter(path[0])
+    getters = tuple(operator.itemgetter(key) for key in path)
+
+    def get(data_point: Any) -> Any:
+        for getter in getters:
+            data_point = getter(data_point)
+        return data_point
+
+    return get
+
+
+@final
+@dataclass(frozen=True)
+class _FieldExtractor:
+    """A field compiled for extraction from data points.
+
+    Attributes:
+        field: The field with the mapped src_name.
+        index: The index of the field in a list data point, or None if src_name is
+          not an int.
+        keys: The path to the field in a dict data point, or None if src_name is an
+          int.
+        convert: The conversion of the data to the type of the field.
+    """
+
+    field: FileLoaderField
+    index: int | None
+    keys: tuple[str, ...] | None
+    convert: Callable[[Any], Any]
+
+
+@final
+class _ExtractionPlan:
+    """Fields compiled once to be extracted from every data point.
+
+    Data points whose fields are all present are handled by a fast path: a function
+    made for the fields, which looks up and converts all of them without checking
+    each of them. The others are handled field by field, in the same way as
+    `FileLoader.find_field` and `FileLoader.parse_data`.
+    """
+
+    def __init__(self, extractors: list[_FieldExtractor], loader_name: str) -> None:
+        """Initializes _ExtractionPlan.
+
+        Args:
+            extractors: The compiled fields.
+            loader_name: The name of the loader, used in error messages.
+        """
+        self._extractors = extractors
+        self._loader_name = loader_name
+
+        self._extract_list: Callable[[list], dict] | None = None
+        if all(x.index is not None for x in extractors):
+            self._extract_list = self._make_extract(
+                [(x.index,) for x in extractors], optional=False
+            )
+        self._extract_dict: Callable[[dict], dict] | None = None
+        if all(x.keys for x in extractors):
+            self._extract_dict = self._make_extract(
+                [cast(tuple, x.keys) for x in extractors], optional=True
+            )
+
+    @property
+    def extractors(self) -> list[_FieldExtractor]:
+        """Returns the compiled fields."""
+        return self._extractors
+
+    def _make_extract(
+        self, paths: list[tuple], optional: bool
+    ) -> Callable[[Any], dict]:
+        """Make a function to extract the fields from a data point.
+
+        The function looks up each field by its path, and raises KeyError,
+        IndexError or TypeError if a field is missing.
+
+        Args:
+            paths: The path to each field.
+            optional: Whether optional fields with a single key are looked up with
+              `get`, since a missing optional field is skipped as a None value.
+
+        Returns:
+            The function.
+        """
+        fields = [
+            (
+                x.field.target_name,
+                _make_getter(path, optional and x.field.optional),
+                x.convert,
+            )
+            for x, path in zip(self._extractors, paths)
+        ]
+        filter_none = self._filter_none
+
+        def get_each_value(data_point: Any) -> tuple:
+            return tuple([getter(data_point) for _, getter, _ in fields])
+
+        get_values: Callable[[Any], tuple] = get_each_value
+        if len(paths) >= 2 and all(
+            len(path) == 1 and not (optional and x.field.optional)
+            for x, path in zip(self._extractors, paths)
+        ):
+            # All the values are looked up by a single call.
+            get_values = operator.itemgetter(*[path[0] for path in paths])
+
+        def extract(data_point: Any) -> dict:
+            values = get_values(data_point)
+            for value in values:
+                if value is None:
+                    return filter_none(values)
+            # A plain loop avoids the frame of a comprehension on every data point.
+            parsed_data_point = {}
+            for (name, _, convert), value in zip(fields, values):
+                parsed_data_point[name] = convert(value)
+            return parsed_data_point
+
+        return extract
+
+    def _filter_none(self, values: tuple) -> dict:
+        """Convert the values of the fields, skipping None."""
+        return {
+            extractor.field.target_name: extractor.convert(value)
+            for extractor, value in zip(self._extractors, values)
+            if value is not None
+        }
+
+    def extract(self, data_point: Any) -> dict:
+        """Extract and parse the fields from a data point.
+
+        Args:
+            data_point: The data loaded in from the file.
+
+        Returns:
+            The parsed fields, except the ones not found.
+        """
+        if isinstance(data_point, list):
+            if self._extract_list is None:
+                return self._extract_from_list(data_point)
+            try:
+                return self._extract_list(data_point)
+            except IndexError:
+                # Missing fields are reported by the slow path.
+                return self._extract_from_list(data_point)
+        elif isinstance(data_point, dict):
+            if self._extract_dict is None:
+                return self._extract_from_dict(data_point)
+            try:
+                return self._extract_dict(data_point)
+            except (KeyError, IndexError, TypeError):
+                return self._extract_from_dict(data_point)
+        return {}
+
+    def _extract_from_list(self, data_point: list) -> dict:
+        """Extract the fields from a list field by field."""
+        parsed_data_point: dict = {}
+        for extractor in self._extractors:
+            index = extractor.index
+            if index is None:
+                index = int(narrow(str, extractor.field.src_name))
+            if index >= len(data_point):
+                raise ValueError(
+                    f"{self._loader_name}: Could not find "
+                    f'field "{extractor.field.src_name}" in datapoint {data_point}'
+                )
+            value = data_point[index]
+            if value is not None:
+                parsed_data_point[extractor.field.target_name] = extractor.convert(
+                    value
+                )
+        return parsed_data_point
+
+    def _extract_from_dict(self, data_point: dict) -> dict:
+        """Extract the fields from a dict field by field."""
+        parsed_data_point: dict = {}
+        for extractor in self._extractors:
+            if extractor.keys is None:
+                raise ValueError(
+                    f"unexpected int index for dict data_point in {extractor.field}"
+                )
+            value: Any = data_point
+            for key in extractor.keys:
+                if key not in value:
+                    if extractor.field.optional:
+                        value = _MISSING
+                        break
+                    raise ValueError(
+                        f"{self._loader_name}: Could not find "
+                        f'field "{extractor.field.src_name}" in datapoint '
+                        f"{data_point}"
+                    )
+                value = value[key]
+            if value is not None and value is not _MISSING:
+                parsed_data_point[extractor.field.target_name] = extractor.convert(
+                    value
+                )
+        return parsed_data_point
+
+
 class FileLoader:
     """A class that loads raw data from a file."""
 
@@ -240,6 +553,17 @@ class FileLoader:
         if len(target_names) != len(set(target_names)):
             raise ValueError("target_name must be unique")
 
+    @classmethod
+    def str_input(cls) -> bool:
+        """Whether the loaded data of all the fields is always str.
+
+        This allows the fields to be parsed with simpler conversions.
+
+        Returns:
+            False by default.
+        """
+        return False
+
     @final
     def add_fields(self, fields: list[FileLoaderField]) -> None:
         """Add more more fields to the FileLoader.
@@ -319,15 +643,52 @@ class FileLoader:
             "load_raw() is not implemented for the base FileLoader"
         )
 
-    def _map_fields(self, fields: list, field_mapping: dict[str, str] | None = None):
-        new_fields = copy.deepcopy(fields)
-        if field_mapping is not None:
-            for f in new_fields:
-                if isinstance(f.src_name, str):
-                    f.src_name = field_mapping.get(f.src_name, f.src_name)
-                elif isinstance(f.src_name, Iterable):
-                    f.src_name = [field_mapping.get(x, x) for x in f.src_name]
-        return new_fields
+    def _compile_fields(
+        self,
+        fields: list[FileLoaderField],
+        actual_mapping: dict[str, str],
+        field_mapping: dict[str, str] | None = None,
+    ) -> _ExtractionPlan:
+        """Compile fields into an extraction plan applied to each data point.
+
+        Args:
+            fields: The fields to extract.
+            actual_mapping: The mapping applied to the src_name of the fields.
+            field_mapping: The mapping applied to each key when searching a dict,
+              as `find_field` does.
+
+        Returns:
+            The extraction plan.
+        """
+        lookup_mapping = field_mapping or {}
+        extractors: list[_FieldExtractor] = []
+        for f in fields:
+            src_name = f.src_name
+            if isinstance(src_name, str):
+                src_name = actual_mapping.get(src_name, src_name)
+            elif isinstance(src_name, Iterable):
+                src_name = [actual_mapping.get(x, x) for x in src_name]
+            mapped = dataclasses.replace(f, src_name=src_name)
+
+            try:
+                index: int | None = int(narrow(Union[int, str], src_name))
+            except (TypeError, ValueError):
+                index = None
+            keys: tuple[str, ...] | None = None
+            if not isinstance(src_name, int):
+                keys = tuple(
+                    lookup_mapping.get(x, x)
+                    for x in ([src_name] if isinstance(src_name, str) else src_name)
+                )
+            extractors.append(
+                _FieldExtractor(
+                    mapped,
+                    index,
+                    keys,
+                    _compile_converter(mapped, str_input=self.str_input()),
+                )
+            )
+        return _ExtractionPlan(extractors, self.__class__.__name__)
 
     @classmethod
     def find_field(
@@ -382,13 +743,31 @@ class FileLoader:
                 ret_dict = ret_dict[sub_field]
             return ret_dict
 
-    def load(
+    def load_raw_iter(
+        self, data: str | DatalabLoaderOption, source: Source
+    ) -> FileLoaderStream:
+        """Load data from source and return an iterator of data points.
+
+        By default this reads all the data with `load_raw()`. File loaders that can
+        read one data point at a time override it.
+
+        Args:
+            data: if str, it's either base64 encoded system output or a path
+            source: source of data
+
+        Returns:
+            The data loaded from the file.
+        """
+        raw_data = self.load_raw(data, source)
+        return FileLoaderStream(iter(raw_data.samples), raw_data.metadata)
+
+    def load_iter(
         self,
         data: str | DatalabLoaderOption,
         source: Source,
         field_mapping: dict[str, str] | None = None,
-    ) -> FileLoaderReturn:
-        """Load data from source, parse data points with fields information.
+    ) -> FileLoaderStream:
+        """Load data from source, parse data points with fields information lazily.
 
         Args:
             data: An indication of the data to be loading
@@ -397,10 +776,9 @@ class FileLoader:
               in the actual input
 
         Returns:
-             an iterable of data points.
+             an iterator of parsed data points.
         """
-        raw_data = self.load_raw(data, source)
-        parsed_data_points: list[dict] = []
+        raw_data = self.load_raw_iter(data, source)
 
         # Get language information from meta-data if it doesn't exist already
         actual_mapping = field_mapping or {}
@@ -412,9 +790,7 @@ class FileLoader:
             if temp is not None:
                 actual_mapping[lang] = temp
 
-        # map the field names
-        before_fields = copy.deepcopy(self._fields)
-        fields = self._map_fields(self._fields, actual_mapping)
+        fields = list(self._fields)
         if raw_data.metadata.custom_features is not None:
             for level_name, feats in raw_data.metadata.custom_features.items():
                 if level_name == "example":
@@ -425,20 +801,63 @@ class FileLoader:
                         "cannot currently load custom features other "
                         f"than on the example level (got {level_name})"
                     )
-        assert [x.src_name for x in before_fields] == [x.src_name for x in self._fields]
+        # map the field names and compile the fields once for all data points
+        plan = self._compile_fields(fields, actual_mapping, field_mapping)
+
+        def parse_samples() -> Iterator[dict]:
+            for idx, data_point in enumerate(raw_data.samples):
+                parsed_data_point = plan.extract(data_point)
+                if self._use_idx_as_id:
+                    parsed_data_point["id"] = str(idx)
+                else:
+                    self.generate_id(parsed_data_point, idx)
+                yield parsed_data_point
 
-        # process the actual data
-        for idx, data_point in enumerate(raw_data.samples):
-            parsed_data_point = {}
-            for f in fields:  # parse data point according to fields
-                find_field_result = self.find_field(data_point, f, field_mapping)
-                if find_field_result is not None:
-                    parsed_data_point[f.target_name] = self.parse_data(
-                        find_field_result, f
-                    )
-            self.generate_id(parsed_data_point, idx)
-            parsed_data_points.append(parsed_data_point)
-        return FileLoaderReturn(parsed_data_points, raw_data.metadata)
+        return FileLoaderStream(parse_samples(), raw_data.metadata)
+
+    def load(
+        self,
+        data: str | DatalabLoaderOption,
+        source: Source,
+        field_mapping: dict[str, str] | None = None,
+    ) -> FileLoaderReturn:
+        """Load data from source, parse data points with fields information.
+
+        Args:
+            data: An indication of the data to be loading
+            source: The source from which it should be loaded
+            field_mapping: A mapping from field name in the loader spec to field name
+              in the actual input
+
+        Returns:
+             an iterable of data points.
+        """
+        return self.load_iter(data, source, field_mapping).collect()
+
+    def load_columns(
+        self,
+        data: str | DatalabLoaderOption,
+        source: Source,
+        field_mapping: dict[str, str] | None = None,
+    ) -> FileLoaderReturn:
+        """Load data from source, parse data points and store them column by column.
+
+        By default this parses the data points one by one with `load_iter()`. File
+        loaders that can read whole columns at once override it.
+
+        Args:
+            data: An indication of the data to be loading
+            source: The source from which it should be loaded
+            field_mapping: A mapping from field name in the loader spec to field name
+              in the actual input
+
+        Returns:
+             the data points stored in ColumnarSamples.
+        """
+        stream = self.load_iter(data, source, field_mapping)
+        return FileLoaderReturn(
+            ColumnarSamples(stream.collect_columns()), stream.metadata
+        )
 
 
 class TSVFileLoader(FileLoader):
@@ -451,22 +870,126 @@ class TSVFileLoader(FileLoader):
             if not isinstance(f.src_name, int):
                 raise ValueError("field src_name for TSVFileLoader must be an int")
 
+    @classmethod
+    def str_input(cls) -> bool:
+        """See FileLoader.str_input."""
+        return True
+
     def load_raw(
         self, data: str | DatalabLoaderOption, source: Source
     ) -> FileLoaderReturn:
         """See FileLoader.load_raw."""
+        return self.load_raw_iter(data, source).collect()
+
+    def load_raw_iter(
+        self, data: str | DatalabLoaderOption, source: Source
+    ) -> FileLoaderStream:
+        """See FileLoader.load_raw_iter."""
         data = narrow(str, data)
+        if source not in (Source.in_memory, Source.local_filesystem):
+            raise NotImplementedError
+
+        def read_lines() -> Iterator[list[str]]:
+            if source == Source.in_memory:
+                file = StringIO(data)
+            else:
+                file = open(data, "r", encoding="utf8")
+            with file:
+                reader = csv.reader(file, delimiter="\t", quoting=csv.QUOTE_NONE)
+                yield from filter(None, reader)  # remove empty lines
+
+        return FileLoaderStream(read_lines())
+
+    def _read_columns(
+        self, data: str, source: Source, indices: list[int]
+    ) -> list[list[str]] | None:
+        """Read columns of a TSV file with pyarrow.
+
+        Args:
+            data: The TSV data or the path to the file.
+            source: The source of the data.
+            indices: The indices of the columns to read.
+
+        Returns:
+            The values of each column, or None if the data can't be read in the same
+            way as `load_raw_iter()`, e.g., pyarrow is not installed or rows have
+            different numbers of columns.
+        """
+        if pyarrow_csv is None or not indices:
+            return None
         if source == Source.in_memory:
-            file = StringIO(data)
-            lines = list(csv.reader(file, delimiter="\t", quoting=csv.QUOTE_NONE))
+            content = data.encode("utf8")
         elif source == Source.local_filesystem:
-            with open(data, "r", encoding="utf8") as fin:
-                lines = list(csv.reader(fin, delimiter="\t", quoting=csv.QUOTE_NONE))
+            with open(data, "rb") as f:
+                content = f.read()
         else:
-            raise NotImplementedError
-        return FileLoaderReturn(
-            list(filter(lambda line: line, lines))
-        )  # remove empty lines
+            return None
+        # pyarrow skips a byte order mark, which csv.reader keeps in the first field.
+        if content.startswith(b"\xef\xbb\xbf"):
+            return None
+
+        names = [f"f{i}" for i in dict.fromkeys(indices)]
+        try:
+            table = pyarrow_csv.read_csv(
+                pyarrow.py_buffer(content),
+                read_options=pyarrow_csv.ReadOptions(autogenerate_column_names=True),
+                parse_options=pyarrow_csv.ParseOptions(
+                    delimiter="\t", quote_char=False
+                ),
+                convert_options=pyarrow_csv.ConvertOptions(
+                    include_columns=names,
+                    column_types={name: pyarrow.string() for name in names},
+                    strings_can_be_null=False,
+                ),
+            )
+        except pyarrow.ArrowException:
+            return None
+        # to_numpy() creates Python strings much faster than to_pylist().
+        columns = {name: table.column(name).to_numpy().tolist() for name in names}
+        return [columns[f"f{i}"] for i in indices]
+
+    def load_columns(
+        self,
+        data: str | DatalabLoaderOption,
+        source: Source,
+        field_mapping: dict[str, str] | None = None,
+    ) -> FileLoaderReturn:
+        """See FileLoader.load_columns.
+
+        The columns are read with pyarrow if it is installed. Otherwise, or if the
+        data can't be read in the same way as row by row, e.g., some of the rows have
+        different numbers of columns, the data is parsed row by row so that it is
+        loaded or reported in the usual way.
+        """
+        data = narrow(str, data)
+        plan = self._compile_fields(self._fields, {}, field_mapping)
+        extractors = plan.extractors
+        raw_columns = self._read_columns(
+            data, source, [unwrap(x.index) for x in extractors]
+        )
+        if raw_columns is None:
+            return super().load_columns(data, source, field_mapping)
+
+        columns: dict[str, list] = {}
+        try:
+            for extractor, raw_column in zip(extractors, raw_columns):
+                convert = extractor.convert
+                columns[extractor.field.target_name] = (
+                    raw_column if convert is str else list(map(convert, raw_column))
+                )
+        except Exception:
+            # Invalid values are reported by the row-by-row path.
+            return super().load_columns(data, source, field_mapping)
+
+        num_samples = len(raw_columns[0])
+        if self._use_idx_as_id:
+            columns["id"] = list(map(str, range(num_samples)))
+        elif self._id_field_name:
+            id_column = columns.get(self._id_field_name)
+            if id_column is None:
+                return super().load_columns(data, source, field_mapping)
+            columns["id"] = [str(x) for x in id_column]
+        return FileLoaderReturn(ColumnarSamples(columns))
 
 
 class CoNLLFileLoader(FileLoader):
@@ -493,48 +1016,71 @@ class CoNLLFileLoader(FileLoader):
         self, data: str | DatalabLoaderOption, source: Source
     ) -> FileLoaderReturn:
         """See FileLoader.load_raw."""
+        return self.load_raw_iter(data, source).collect()
+
+    def load_raw_iter(
+        self, data: str | DatalabLoaderOption, source: Source
+    ) -> FileLoaderStream:
+        """See FileLoader.load_raw_iter."""
         data = narrow(str, data)
         if source == Source.in_memory:
-            return FileLoaderReturn(data.splitlines())
+            return FileLoaderStream(iter(data.splitlines()))
         elif source == Source.local_filesystem:
-            with open(data, "r", encoding="utf8") as fin:
-                return FileLoaderReturn([line.strip() for line in fin])
+
+            def read_lines() -> Iterator[str]:
+                with open(data, "r", encoding="utf8") as fin:
+                    for line in fin:
+                        yield line.strip()
+
+            return FileLoaderStream(read_lines())
         raise NotImplementedError
 
-    def load(
+    def load_iter(
         self,
         data: str | DatalabLoaderOption,
         source: Source,
         field_mapping: dict[str, str] | None = None,
-    ) -> FileLoaderReturn:
-        """See FileLoader.load."""
-        raw_data = self.load_raw(data, source)
-        parsed_samples: list[dict] = []
-        guid = 0
-        curr_sentence_fields: dict[str | int | Iterable[str], list[str]] = {
-            field.src_name: [] for field in self._fields
-        }
+    ) -> FileLoaderStream:
+        """See FileLoader.load_iter.
+
+        Sentences are parsed lazily from the lines. Values of the fields are
+        interned while loading, so a tag or token repeated throughout the data is
+        stored and converted only once.
+        """
+        raw_data = self.load_raw_iter(data, source)
+        fields = self._fields
+        max_field: int = max([narrow(int, x.src_name) for x in fields])
+        # Values returned by custom parsers may be mutable, so they aren't shared.
+        converters = [
+            (
+                f.src_name,
+                narrow(int, f.src_name),
+                _compile_converter(f, True),
+                {} if f.parser is None else None,
+            )
+            for f in fields
+        ]
+
+        def new_sentence_fields() -> dict[str | int | Iterable[str], list[Any]]:
+            return {field.src_name: [] for field in fields}
+
+        def parse_samples() -> Iterator[dict]:
+            guid = 0
+            curr_sentence_fields = new_sentence_fields()
+            for line in itertools.chain(raw_data.samples, [""]):
+                # at sentence boundary, or after the last line
+                if line.startswith("-DOCSTART-") or line == "" or line == "\n":
+                    # uses the first field to check if data is empty
+                    if curr_sentence_fields.get(fields[0].src_name):
+                        new_sample: dict = {}
+                        for f in fields:  # parse data point according to fields
+                            new_sample[f.target_name] = curr_sentence_fields[f.src_name]
+                        new_sample["id"] = str(guid)
+                        yield new_sample
+                        guid += 1
+                        curr_sentence_fields = new_sentence_fields()  # reset
+                    continue
 
-        def add_sample():
-            nonlocal guid, curr_sentence_fields
-            # uses the first field to check if data is empty
-            if curr_sentence_fields.get(self._fields[0].src_name):
-                new_sample: dict = {}
-                for f in self._fields:  # parse data point according to fields
-                    new_sample[f.target_name] = curr_sentence_fields[f.src_name]
-                new_sample["id"] = str(guid)
-                parsed_samples.append(new_sample)
-                guid += 1
-                curr_sentence_fields = {
-                    field.src_name: [] for field in self._fields
-                }  # reset
-
-        max_field: int = max([narrow(int, x.src_name) for x in self._fields])
-        for line in raw_data.samples:
-            # at sentence boundary
-            if line.startswith("-DOCSTART-") or line == "" or line == "\n":
-                add_sample()
-            else:
                 splits = line.split("\t")
                 if len(splits) <= max_field:  # not separated by tabs
                     splits = line.split(" ")
@@ -543,13 +1089,17 @@ class CoNLLFileLoader(FileLoader):
                         f"not enough fields for {line} (sentence index: {guid})"
                     )
 
-                for f in self._fields:
-                    curr_sentence_fields[f.src_name].append(
-                        self.parse_data(splits[narrow(int, f.src_name)], f)
-                    )
+                for src_name, index, convert, interned in converters:
+                    raw_value = splits[index]
+                    if interned is None:
+                        value = convert(raw_value)
+                    else:
+                        value = interned.get(raw_value)
+                        if value is None:
+                            value = interned[raw_value] = convert(raw_value)
+                    curr_sentence_fields[src_name].append(value)
 
-        add_sample()  # add last example
-        return FileLoaderReturn(parsed_samples, metadata=raw_data.metadata)
+        return FileLoaderStream(parse_samples(), raw_data.metadata)
 
 
 class JSONFileLoader(FileLoader):
@@ -561,10 +1111,10 @@ class JSONFileLoader(FileLoader):
         """See FileLoader.load_raw."""
         data = narrow(str, data)
         if source == Source.in_memory:
-            loaded = json.loads(data)
+            loaded = json_utils.loads(data)
         elif source == Source.local_filesystem:
-            with open(data, "r", encoding="utf8") as json_file:
-                loaded = json.load(json_file)
+            with open(data, "rb") as json_file:
+                loaded = json_utils.load(json_file)
         else:
             raise NotImplementedError
         if isinstance(loaded, list):
@@ -586,6 +1136,63 @@ class JSONFileLoader(FileLoader):
             return FileLoaderReturn(raw_data, metadata=metadata)
 
 
+class JSONLFileLoader(FileLoader):
+    """A loader from JSON Lines files, where each line is a JSON sample.
+
+    Lines are parsed one at a time, so large files can be read with `load_iter()`
+    without holding the whole file in memory. Empty lines are ignored.
+    """
+
+    @classmethod
+    def from_json_loader(cls, json_loader: JSONFileLoader) -> JSONLFileLoader:
+        """Create a loader reading the same fields as a JSONFileLoader.
+
+        Args:
+            json_loader: The loader of the JSON files.
+
+        Returns:
+            The loader of the JSON Lines files.
+        """
+        return cls(
+            copy.deepcopy(json_loader._fields),
+            json_loader._use_idx_as_id,
+            json_loader._id_field_name,
+        )
+
+    def load_raw(
+        self, data: str | DatalabLoaderOption, source: Source
+    ) -> FileLoaderReturn:
+        """See FileLoader.load_raw."""
+        return self.load_raw_iter(data, source).collect()
+
+    def load_raw_iter(
+        self, data: str | DatalabLoaderOption, source: Source
+    ) -> FileLoaderStream:
+        """See FileLoader.load_raw_iter."""
+        data = narrow(str, data)
+        if source not in (Source.in_memory, Source.local_filesystem):
+            raise NotImplementedError
+
+        def read_lines() -> Iterator[Any]:
+            if source == Source.in_memory:
+                file = StringIO(data)
+            else:
+                file = open(data, "r", encoding="utf8")
+            with file:
+                for line_idx, line in enumerate(file):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json_utils.loads(line)
+                    except ValueError as e:
+                        raise ValueError(
+                            f"Error loading line {line_idx + 1} of JSON Lines "
+                            f"input: {e}"
+                        ) from e
+
+        return FileLoaderStream(read_lines())
+
+
 @dataclass
 class DatalabLoaderOption:
     """A class representing the options when using DataLabLoader.
@@ -769,27 +1376,59 @@ class TextFileLoader(FileLoader):
                 return FileLoaderReturn(f.readlines())
         raise NotImplementedError
 
+    def load_raw_iter(
+        self, data: str | DatalabLoaderOption, source: Source
+    ) -> FileLoaderStream:
+        """See FileLoader.load_raw_iter."""
+        data = narrow(str, data)
+        if source != Source.local_filesystem:
+            return super().load_raw_iter(data, source)
+
+        def read_lines() -> Iterator[str]:
+            with open(data, "r", encoding="utf8") as f:
+                yield from f
+
+        return FileLoaderStream(read_lines())
+
     def validate(self) -> None:
         """See FileLoader.validate."""
         super().validate()
         if len(self._fields) != 1:
             raise ValueError("Text File Loader only takes one field")
 
-    def load(
+    def load_iter(
         self,
         data: str | DatalabLoaderOption,
         source: Source,
         field_mapping: dict[str, str] | None = None,
-    ) -> FileLoaderReturn:
-        """See FileLoader.load."""
-        raw_data = self.load_raw(data, source)
-        data_list: list[str] = raw_data.samples
-        parsed_data_points: list[dict] = []
+    ) -> FileLoaderStream:
+        """See FileLoader.load_iter."""
+        raw_data = self.load_raw_iter(data, source)
+        target_name = self._fields[0].target_name
+        convert = _compile_converter(self._fields[0], str_input=True)
 
-        for idx, data_point in enumerate(data_list):
-            parsed_data_point = {}
-            field = self._fields[0]
-            parsed_data_point[field.target_name] = self.parse_data(data_point, field)
-            self.generate_id(parsed_data_point, idx)
-            parsed_data_points.append(parsed_data_point)
-        return FileLoaderReturn(parsed_data_points)
+        def parse_samples() -> Iterator[dict]:
+            for idx, data_point in enumerate(raw_data.samples):
+                parsed_data_point = {target_name: convert(data_point)}
+                self.generate_id(parsed_data_point, idx)
+                yield parsed_data_point
+
+        return FileLoaderStream(parse_samples())
+
+    def load_columns(
+        self,
+        data: str | DatalabLoaderOption,
+        source: Source,
+        field_mapping: dict[str, str] | None = None,
+    ) -> FileLoaderReturn:
+        """See FileLoader.load_columns."""
+        lines = self.load_raw(data, source).samples
+        convert = _compile_converter(self._fields[0], str_input=True)
+        return FileLoaderReturn(
+            ColumnarSamples(
+                {
+                    self._fields[0].target_name: list(map(convert, lines)),
+                    "id": list(map(str, range(len(lines)))),
+                }
+            )
+        )
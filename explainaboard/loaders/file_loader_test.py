@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import json
+import os
+import re
+import tempfile
 from unittest import TestCase
 
 from explainaboard import Source
+from explainaboard.loaders.columnar import ColumnarSamples
 from explainaboard.loaders.file_loader import (
+    CoNLLFileLoader,
     FileLoaderField,
+    JSONFileLoader,
+    JSONLFileLoader,
     TextFileLoader,
     TSVFileLoader,
 )
@@ -51,3 +59,219 @@ class FileLoaderTest(TestCase):
             ValueError,
             lambda: loader.add_fields([FileLoaderField("test", "test", str)]),
         )
+
+    def test_text_file_loader_iter(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "output.txt")
+            with open(path, "w") as f:
+                f.write("1\n2\n")
+            stream = TextFileLoader(target_name="prediction", dtype=int).load_iter(
+                path, Source.local_filesystem
+            )
+            self.assertEqual(next(stream.samples), {"prediction": 1, "id": "0"})
+            self.assertEqual(list(stream.samples), [{"prediction": 2, "id": "1"}])
+
+    def test_jsonl_file_loader(self):
+        content = '{"text": "a", "label": 1}\n\n{"text": "b", "label": 2}\n'
+        loader = JSONLFileLoader(
+            [FileLoaderField("text", "text", str), FileLoaderField("label", "label")]
+        )
+        self.assertEqual(
+            [
+                {"text": "a", "label": 1, "id": "0"},
+                {"text": "b", "label": 2, "id": "1"},
+            ],
+            loader.load(content, Source.in_memory).samples,
+        )
+
+    def test_jsonl_file_loader_iter(self):
+        loader = JSONLFileLoader([FileLoaderField("text", "text", str)])
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "output.jsonl")
+            with open(path, "w") as f:
+                f.write('{"text": "a"}\n{"text": "b"}\nbroken\n')
+            stream = loader.load_iter(path, Source.local_filesystem)
+            # Samples are parsed one at a time, before the broken line is read.
+            self.assertEqual(next(stream.samples), {"text": "a", "id": "0"})
+            self.assertEqual(next(stream.samples), {"text": "b", "id": "1"})
+            with self.assertRaisesRegex(ValueError, "line 3"):
+                next(stream.samples)
+
+    def test_tsv_file_loader_dtypes(self):
+        loader = TSVFileLoader(
+            [
+                FileLoaderField(0, "text", str),
+                FileLoaderField(1, "label", int),
+                FileLoaderField(2, "score", float),
+                FileLoaderField(0, "raw", None),
+            ]
+        )
+        content = " a b \t 1 \t0.5\n\nc\t2\t-1\n"
+        self.assertEqual(
+            loader.load(content, Source.in_memory).samples,
+            [
+                {"text": "a b", "label": 1, "score": 0.5, "raw": " a b ", "id": "0"},
+                {"text": "c", "label": 2, "score": -1.0, "raw": "c", "id": "1"},
+            ],
+        )
+        with self.assertRaisesRegex(ValueError, 'Could not find field "2"'):
+            loader.load("a\t1", Source.in_memory)
+
+    def test_json_file_loader_fields(self):
+        loader = JSONFileLoader(
+            [
+                FileLoaderField("text", "text", str),
+                FileLoaderField(("meta", "label"), "label", int),
+                FileLoaderField("extra", "extra", optional=True),
+                FileLoaderField(("meta", "info"), "info", optional=True),
+            ]
+        )
+        data_points = [
+            {"text": " a ", "meta": {"label": "1", "info": [1]}, "extra": {"x": 1}},
+            {"text": "b", "meta": {"label": 2}},
+            {"text": None, "meta": {"label": 3, "info": None}, "extra": None},
+            {"text": 4, "meta": {"label": " 5 "}},
+        ]
+        expected = [
+            {"text": "a", "label": 1, "extra": {"x": 1}, "info": [1], "id": "0"},
+            {"text": "b", "label": 2, "id": "1"},
+            {"label": 3, "id": "2"},
+            {"text": "4", "label": 5, "id": "3"},
+        ]
+        self.assertEqual(
+            loader.load(json.dumps(data_points), Source.in_memory).samples, expected
+        )
+        # The compiled fields behave as find_field and parse_data.
+        for data_point, expected_point in zip(data_points, expected):
+            parsed = {}
+            for f in loader._fields:
+                found = loader.find_field(data_point, f)
+                if found is not None:
+                    parsed[f.target_name] = loader.parse_data(found, f)
+            self.assertEqual({**parsed, "id": expected_point["id"]}, expected_point)
+
+        with self.assertRaisesRegex(ValueError, 'Could not find field "text"'):
+            loader.load(json.dumps([{"meta": {"label": 1}}]), Source.in_memory)
+        with self.assertRaisesRegex(ValueError, "Could not find field"):
+            loader.load(json.dumps([{"text": "a", "meta": {}}]), Source.in_memory)
+
+    def test_json_file_loader_field_mapping(self):
+        loader = JSONFileLoader(
+            [
+                FileLoaderField("text", "text", str),
+                FileLoaderField(("meta", "label"), "label", str),
+            ]
+        )
+        content = json.dumps([{"sentence": "a", "info": {"gold": "x"}}])
+        self.assertEqual(
+            loader.load(
+                content,
+                Source.in_memory,
+                field_mapping={"text": "sentence", "meta": "info", "label": "gold"},
+            ).samples,
+            [{"text": "a", "label": "x", "id": "0"}],
+        )
+
+    def test_collect_columns(self):
+        loader = JSONLFileLoader(
+            [
+                FileLoaderField("text", "text", str),
+                FileLoaderField("label", "label", optional=True),
+            ]
+        )
+        stream = loader.load_iter(
+            '{"text": "a"}\n{"text": "b", "label": 1}\n{"text": "c"}',
+            Source.in_memory,
+        )
+        self.assertEqual(
+            stream.collect_columns(),
+            {"text": ["a", "b", "c"], "id": ["0", "1", "2"], "label": [None, 1, None]},
+        )
+
+    def test_tsv_file_loader_columns(self):
+        loader = TSVFileLoader(
+            [
+                FileLoaderField(0, "text", str),
+                FileLoaderField(1, "label", int),
+                FileLoaderField(2, "score", float),
+                FileLoaderField(0, "raw", None),
+            ]
+        )
+        for content in [
+            " a b \t 1 \t0.5\n\nc\t2\t-1\n",
+            # Rows with different numbers of columns are read row by row.
+            " a b \t 1 \t0.5\textra\n\nc\t2\t-1\n",
+            # pyarrow skips the byte order mark, which is a part of the first field.
+            "﻿a\t1\t0.5\n",
+            # Invalid values are reported row by row.
+            "a\tx\t0.5\n",
+            # Missing columns are reported row by row.
+            "a\t1\n",
+            "",
+        ]:
+            with self.subTest(content=content):
+                try:
+                    expected = loader.load(content, Source.in_memory).samples
+                except ValueError as e:
+                    with self.assertRaisesRegex(ValueError, re.escape(str(e))):
+                        loader.load_columns(content, Source.in_memory)
+                    continue
+                samples = loader.load_columns(content, Source.in_memory).samples
+                self.assertIsInstance(samples, ColumnarSamples)
+                self.assertEqual(list(samples), expected)
+
+    def test_tsv_file_loader_columns_from_file(self):
+        loader = TSVFileLoader([FileLoaderField(1, "label", str)], use_idx_as_id=False)
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "data.tsv")
+            with open(path, "w", encoding="utf8") as f:
+                f.write("a\tx\nb\ty\n")
+            samples = loader.load_columns(path, Source.local_filesystem).samples
+        self.assertEqual(samples.columns, {"label": ["x", "y"]})
+
+    def test_text_file_loader_columns(self):
+        loader = TextFileLoader("score", int)
+        samples = loader.load_columns("1\n 2\n", Source.in_memory).samples
+        self.assertEqual(samples.columns, {"score": [1, 2], "id": ["0", "1"]})
+
+    def test_conll_file_loader_iter(self):
+        loader = CoNLLFileLoader(
+            [FileLoaderField(0, "tokens", str), FileLoaderField(1, "tags", str)]
+        )
+        content = "-DOCSTART- O\n\nJohn B-PER\nsmiles O\n\n\nMary\tB-PER\n"
+        stream = loader.load_iter(content, Source.in_memory)
+        first = next(stream.samples)
+        self.assertEqual(
+            first, {"tokens": ["John", "smiles"], "tags": ["B-PER", "O"], "id": "0"}
+        )
+        second = next(stream.samples)
+        self.assertEqual(second, {"tokens": ["Mary"], "tags": ["B-PER"], "id": "1"})
+        self.assertEqual(list(stream.samples), [])
+        # Repeated values are shared.
+        self.assertIs(first["tags"][0], second["tags"][0])
+        self.assertEqual(
+            loader.load(content, Source.in_memory).samples, [first, second]
+        )
+
+    def test_conll_file_loader_from_file(self):
+        loader = CoNLLFileLoader([FileLoaderField(1, "tags", str)])
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "data.conll")
+            with open(path, "w", encoding="utf8") as f:
+                f.write("a O \n b B-X\n \nc I-X\n")
+            samples = loader.load(path, Source.local_filesystem).samples
+        self.assertEqual(
+            samples,
+            [{"tags": ["O", "B-X"], "id": "0"}, {"tags": ["I-X"], "id": "1"}],
+        )
+        with self.assertRaisesRegex(ValueError, "not enough fields for a"):
+            loader.load("a", Source.in_memory)
+
+    def test_conll_file_loader_parser(self):
+        loader = CoNLLFileLoader(
+            [FileLoaderField(0, "chars", parser=lambda x: list(x))]
+        )
+        samples = loader.load("ab\nab\n", Source.in_memory).samples
+        self.assertEqual(samples, [{"chars": [["a", "b"], ["a", "b"]], "id": "0"}])
+        # Values returned by parsers are not shared.
+        self.assertIsNot(samples[0]["chars"][0], samples[0]["chars"][1])
@@ -2,18 +2,42 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+import copy
 from dataclasses import dataclass, field
+import itertools
 
 from explainaboard.constants import FileType, Source
+from explainaboard.loaders.columnar import ColumnarSamples
 from explainaboard.loaders.file_loader import (
     DatalabLoaderOption,
     FileLoader,
     FileLoaderReturn,
+    FileLoaderStream,
+    JSONFileLoader,
+    JSONLFileLoader,
     TextFileLoader,
 )
 from explainaboard.utils.typing_utils import unwrap, unwrap_or_else
 
 
+def _add_jsonl_file_loader(
+    file_loaders: dict[FileType, FileLoader]
+) -> dict[FileType, FileLoader]:
+    """Add a JSON Lines file loader reading the same fields as the JSON one.
+
+    Args:
+        file_loaders: A mapping from FileType to FileLoader.
+
+    Returns:
+        The mapping, with a loader for FileType.jsonl if it can be derived.
+    """
+    json_loader = file_loaders.get(FileType.json)
+    if FileType.jsonl not in file_loaders and isinstance(json_loader, JSONFileLoader):
+        file_loaders[FileType.jsonl] = JSONLFileLoader.from_json_loader(json_loader)
+    return file_loaders
+
+
 @dataclass
 class SupportedFileTypes:
     """List of dataset/output file types supported by the loader."""
@@ -96,8 +120,8 @@ class Loader:
     def supported_file_types(cls) -> SupportedFileTypes:
         """Return the file types supported by this loader."""
         return SupportedFileTypes(
-            list(cls.default_dataset_file_loaders().keys()),
-            list(cls.default_output_file_loaders().keys()),
+            list(_add_jsonl_file_loader(cls.default_dataset_file_loaders()).keys()),
+            list(_add_jsonl_file_loader(cls.default_output_file_loaders()).keys()),
         )
 
     def __init__(
@@ -146,7 +170,9 @@ class Loader:
         try:
             self._dataset_file_loader = unwrap_or_else(
                 dataset_file_loader,
-                lambda: self.default_dataset_file_loaders()[unwrap(dataset_file_type)],
+                lambda: _add_jsonl_file_loader(self.default_dataset_file_loaders())[
+                    unwrap(dataset_file_type)
+                ],
             )
         except KeyError:
             raise ValueError(
@@ -156,7 +182,9 @@ class Loader:
         try:
             self._output_file_loader = unwrap_or_else(
                 output_file_loader,
-                lambda: self.default_output_file_loaders()[unwrap(output_file_type)],
+                lambda: _add_jsonl_file_loader(self.default_output_file_loaders())[
+                    unwrap(output_file_type)
+                ],
             )
         except KeyError:
             raise ValueError(
@@ -167,6 +195,62 @@ class Loader:
         self._dataset_data = dataset_data  # base64, filepath or datalab options
         self._output_data = output_data
 
+    def load_iter(self) -> FileLoaderStream:
+        """Load data from the dataset and output one sample at a time.
+
+        Each dataset sample is parsed together with the corresponding output sample
+        and merged with it, so only a single sample of each is held in memory.
+        If `output_data` is `None`, then data will only be returned from the dataset.
+
+        Returns:
+            A FileLoaderStream object with samples and metadata.
+
+        Raises:
+            ValueError: while iterating, if the numbers of samples in the dataset
+              and the output differ.
+        """
+        dataset_stream = self._dataset_file_loader.load_iter(
+            self._dataset_data, self._dataset_source, field_mapping=self._field_mapping
+        )
+        if not self._output_data:
+            return dataset_stream
+        output_stream = self._output_file_loader.load_iter(
+            self._output_data,
+            self._output_source,
+            field_mapping=self._field_mapping,
+        )
+        dataset_stream.metadata.merge(output_stream.metadata)
+
+        def merge_samples() -> Iterator[dict]:
+            num_samples = 0
+            missing = object()
+            for dataset_sample, output in itertools.zip_longest(
+                dataset_stream.samples, output_stream.samples, fillvalue=missing
+            ):
+                if dataset_sample is missing or output is missing:
+                    # Count the remaining samples to report the total numbers.
+                    num_rest = 1 + sum(
+                        1
+                        for _ in itertools.chain(
+                            dataset_stream.samples, output_stream.samples
+                        )
+                    )
+                    num_dataset, num_output = (
+                        (num_samples, num_samples + num_rest)
+                        if dataset_sample is missing
+                        else (num_samples + num_rest, num_samples)
+                    )
+                    raise ValueError(
+                        "the number of examples in the system output "
+                        f"({num_output}) does not match the number of "
+                        f"examples in the dataset ({num_dataset})"
+                    )
+                dataset_sample.update(output)
+                num_samples += 1
+                yield dataset_sample
+
+        return FileLoaderStream(merge_samples(), dataset_stream.metadata)
+
     def load(self) -> FileLoaderReturn:
         """Load data from the dataset and output.
 
@@ -175,23 +259,105 @@ class Loader:
         Returns:
             A FileLoaderReturn object with samples and metadata.
         """
-        dataset_loaded_data = self._dataset_file_loader.load(
+        return self.load_iter().collect()
+
+    def load_columns(self) -> FileLoaderReturn:
+        """Load data from the dataset and output column by column.
+
+        Reading whole columns avoids creating a dict for each sample, which is
+        faster and takes much less memory for large inputs. If `output_data` is
+        `None`, then data will only be returned from the dataset.
+
+        Returns:
+            A FileLoaderReturn object with ColumnarSamples and metadata.
+
+        Raises:
+            ValueError: if the numbers of samples in the dataset and the output
+              differ.
+        """
+        dataset = self.load_dataset(columnar=True)
+        if not self._output_data:
+            return dataset
+        return self.merge(dataset, self.load_output(columnar=True))
+
+    def load_dataset(self, columnar: bool = False) -> FileLoaderReturn:
+        """Load data only from the dataset.
+
+        Together with `load_output` and `merge`, this lets outputs of multiple
+        systems share a dataset loaded only once.
+
+        Args:
+            columnar: Whether to load the samples column by column.
+
+        Returns:
+            A FileLoaderReturn object with samples and metadata of the dataset.
+        """
+        file_loader = self._dataset_file_loader
+        load = file_loader.load_columns if columnar else file_loader.load
+        return load(
             self._dataset_data, self._dataset_source, field_mapping=self._field_mapping
         )
-        if self._output_data:
-            output_loaded_data = self._output_file_loader.load(
-                self._output_data,
-                self._output_source,
-                field_mapping=self._field_mapping,
+
+    def load_output(self, columnar: bool = False) -> FileLoaderReturn:
+        """Load data only from the output.
+
+        Args:
+            columnar: Whether to load the samples column by column.
+
+        Returns:
+            A FileLoaderReturn object with samples and metadata of the output.
+
+        Raises:
+            ValueError: if `output_data` is `None`.
+        """
+        if not self._output_data:
+            raise ValueError("output_data is not given to the loader.")
+        file_loader = self._output_file_loader
+        load = file_loader.load_columns if columnar else file_loader.load
+        return load(
+            self._output_data, self._output_source, field_mapping=self._field_mapping
+        )
+
+    @staticmethod
+    def merge(dataset: FileLoaderReturn, output: FileLoaderReturn) -> FileLoaderReturn:
+        """Merge the samples of a dataset with the corresponding output.
+
+        `dataset` is left unchanged, so it can be merged with outputs of any number
+        of systems.
+
+        Args:
+            dataset: Data loaded by `load_dataset`.
+            output: Data loaded by `load_output`.
+
+        Returns:
+            A FileLoaderReturn object with the merged samples and metadata. The
+            samples are stored column by column if both of the inputs are.
+
+        Raises:
+            ValueError: if the numbers of samples in the dataset and the output
+              differ.
+        """
+        if len(dataset) != len(output):
+            raise ValueError(
+                "the number of examples in the system output "
+                f"({len(output)}) does not match the number of "
+                f"examples in the dataset ({len(dataset)})"
             )
-            dataset_loaded_data.metadata.merge(output_loaded_data.metadata)
-            if len(dataset_loaded_data) != len(output_loaded_data):
-                raise ValueError(
-                    "the number of examples in the system output "
-                    f"({len(output_loaded_data)}) does not match the number of "
-                    f"examples in the dataset ({len(dataset_loaded_data)})"
-                )
-            data_list: list[dict] = output_loaded_data.samples
-            for i, output in enumerate(data_list):
-                dataset_loaded_data[i].update(output)
-        return dataset_loaded_data
+        metadata = copy.deepcopy(dataset.metadata)
+        metadata.merge(output.metadata)
+
+        if not (
+            isinstance(dataset.samples, ColumnarSamples)
+            and isinstance(output.samples, ColumnarSamples)
+        ):
+            samples = [{**x, **y} for x, y in zip(dataset.samples, output.samples)]
+            return FileLoaderReturn(samples, metadata)
+
+        columns = dict(dataset.samples.columns)
+        for name, column in output.samples.columns.items():
+            dataset_column = columns.get(name)
+            if dataset_column is not None and any(x is None for x in column):
+                # Values missing in the output don't override the dataset.
+                column = [y if x is None else x for x, y in zip(column, dataset_column)]
+            columns[name] = column
+        return FileLoaderReturn(ColumnarSamples(columns), metadata)
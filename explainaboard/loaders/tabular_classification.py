@@ -9,6 +9,7 @@ from explainaboard.loaders.file_loader import (
     FileLoaderField,
     JSONFileLoader,
     TextFileLoader,
+    TSVFileLoader,
 )
 from explainaboard.loaders.loader import Loader
 
@@ -35,6 +36,11 @@ class TabularClassificationLoader(Loader):
                     FileLoaderField("true_label", target_field_names[0], str),
                 ]
             ),
+            FileType.tsv: TSVFileLoader(
+                [
+                    FileLoaderField(0, target_field_names[0], str),
+                ]
+            ),
             FileType.datalab: DatalabFileLoader(
                 [
                     FileLoaderField("label_column", target_field_names[0], str),
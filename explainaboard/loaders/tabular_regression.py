@@ -9,6 +9,7 @@ from explainaboard.loaders.file_loader import (
     FileLoaderField,
     JSONFileLoader,
     TextFileLoader,
+    TSVFileLoader,
 )
 from explainaboard.loaders.loader import Loader
 
@@ -35,6 +36,11 @@ class TabularRegressionLoader(Loader):
                     FileLoaderField("true_value", target_field_names[0], float),
                 ]
             ),
+            FileType.tsv: TSVFileLoader(
+                [
+                    FileLoaderField(0, target_field_names[0], float),
+                ]
+            ),
             FileType.datalab: DatalabFileLoader(
                 [
                     FileLoaderField("value_column", target_field_names[0], float),
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
 import unittest
 
-from explainaboard.constants import TaskType
+from explainaboard.constants import FileType, Source, TaskType
+from explainaboard.loaders.columnar import ColumnarSamples
+from explainaboard.loaders.file_loader import FileLoaderField, JSONLFileLoader
 from explainaboard.loaders.loader_factory import get_loader_class
 from explainaboard.loaders.text_classification import TextClassificationLoader
 
@@ -14,3 +17,111 @@ class TextClassificationLoaderTest(unittest.TestCase):
         self.assertIs(
             get_loader_class(TaskType.text_classification), TextClassificationLoader
         )
+
+    def test_load_jsonl_output(self) -> None:
+        dataset = "\n".join(["I love it.\tpositive", "I hate it.\tnegative"])
+        output = "\n".join(
+            json.dumps({"predicted_label": x}) for x in ["positive", "positive"]
+        )
+        loader = TextClassificationLoader(
+            dataset,
+            output,
+            dataset_source=Source.in_memory,
+            output_source=Source.in_memory,
+            output_file_type=FileType.jsonl,
+        )
+        self.assertIn(
+            FileType.jsonl,
+            TextClassificationLoader.supported_file_types().system_output,
+        )
+        stream = loader.load_iter()
+        self.assertEqual(
+            next(stream.samples),
+            {
+                "text": "I love it.",
+                "true_label": "positive",
+                "id": "0",
+                "predicted_label": "positive",
+            },
+        )
+        self.assertEqual(len(list(stream.samples)), 1)
+
+    def test_load_mismatched_output(self) -> None:
+        loader = TextClassificationLoader(
+            "I love it.\tpositive",
+            "positive\nnegative\npositive",
+            dataset_source=Source.in_memory,
+            output_source=Source.in_memory,
+            output_file_type=FileType.text,
+        )
+        with self.assertRaisesRegex(ValueError, r"output \(3\).*dataset \(1\)"):
+            loader.load()
+
+    def test_load_columns(self) -> None:
+        dataset = "\n".join(["I love it.\tpositive", "I hate it.\tnegative"])
+        output = "\n".join(
+            json.dumps(x)
+            for x in [{"predicted_label": "positive", "text": "I like it."}, {}]
+        )
+        loader = TextClassificationLoader(
+            dataset,
+            output,
+            dataset_source=Source.in_memory,
+            output_source=Source.in_memory,
+            output_file_type=FileType.jsonl,
+            output_file_loader=JSONLFileLoader(
+                [
+                    FileLoaderField(
+                        "predicted_label", "predicted_label", optional=True
+                    ),
+                    FileLoaderField("text", "text", str, optional=True),
+                ]
+            ),
+        )
+        samples = loader.load_columns().samples
+        self.assertIsInstance(samples, ColumnarSamples)
+        self.assertEqual(samples, loader.load().samples)
+        self.assertEqual(samples.columns["text"], ["I like it.", "I hate it."])
+
+    def test_load_columns_mismatched_output(self) -> None:
+        loader = TextClassificationLoader(
+            "I love it.\tpositive",
+            "positive\nnegative\npositive",
+            dataset_source=Source.in_memory,
+            output_source=Source.in_memory,
+            output_file_type=FileType.text,
+        )
+        with self.assertRaisesRegex(ValueError, r"output \(3\).*dataset \(1\)"):
+            loader.load_columns()
+
+    def test_merge_shared_dataset(self) -> None:
+        dataset = "\n".join(["I love it.\tpositive", "I hate it.\tnegative"])
+        loaders = [
+            TextClassificationLoader(
+                dataset,
+                output,
+                dataset_source=Source.in_memory,
+                output_source=Source.in_memory,
+                output_file_type=FileType.text,
+            )
+            for output in ["positive\nnegative", "negative\nnegative"]
+        ]
+        for columnar in [False, True]:
+            shared = loaders[0].load_dataset(columnar=columnar)
+            expected_dataset = list(shared.samples)
+            for loader in loaders:
+                merged = loader.merge(shared, loader.load_output(columnar=columnar))
+                self.assertIsInstance(merged.samples, type(shared.samples))
+                self.assertEqual(merged.samples, loader.load().samples)
+            self.assertEqual(list(shared.samples), expected_dataset)
+
+    def test_merge_mismatched_output(self) -> None:
+        loader = TextClassificationLoader(
+            "I love it.\tpositive",
+            "positive\nnegative\npositive",
+            dataset_source=Source.in_memory,
+            output_source=Source.in_memory,
+            output_file_type=FileType.text,
+        )
+        with self.assertRaisesRegex(ValueError, r"output \(3\).*dataset \(1\)"):
+            loader.merge(loader.load_dataset(), loader.load_output())
@@ -8,12 +8,14 @@ from typing import Any, Optional
 import numpy as np
 
 from explainaboard.metrics.metric import (
+    AggregateType,
     ConfidenceInterval,
     Metric,
     MetricConfig,
     MetricResult,
     MetricStats,
     MetricValue,
+    ResamplePlan,
     Score,
     SimpleMetricStats,
 )
@@ -65,6 +67,7 @@ class Accuracy(Metric):
         stats: MetricStats,
         confidence_alpha: Optional[float] = None,
         auxiliary_stats: Optional[MetricStats] = None,
+        resample_plan: Optional[ResamplePlan] = None,
     ) -> MetricResult:
         """Return an evaluation result over stats.
 
@@ -72,6 +75,7 @@ class Accuracy(Metric):
             stats: pre-computed metric stats
             confidence_alpha: if set to not None, must be a number between 0 and 1,
                 indicating the inverse confidence level of confidence intervals
+            resample_plan: resamples shared with other metrics for bootstrapping
 
         Returns:
             a resulting metric value
@@ -89,7 +93,9 @@ class Accuracy(Metric):
         }
 
         if confidence_alpha is not None:
-            ci = self.calc_confidence_interval(stats, confidence_alpha)
+            ci = self.calc_confidence_interval(
+                stats, confidence_alpha, resample_plan=resample_plan
+            )
             if ci is not None:
                 metric_values["score_ci"] = ConfidenceInterval(
                     ci[0], ci[1], confidence_alpha
@@ -133,6 +139,10 @@ class CorrectCount(Accuracy):
             )
         )
 
+    def aggregate_type(self) -> AggregateType:
+        """See Metric.aggregate_type."""
+        return AggregateType.SUM
+
     def _aggregate_stats(self, stats: MetricStats) -> np.ndarray:
         """See Metric.aggregate_stats."""
         data = stats.get_batch_data() if stats.is_batched() else stats.get_data()
@@ -2,33 +2,104 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import copy
 from dataclasses import dataclass
-from typing import Any, cast, final
+import os
+from typing import Any, cast, final, Protocol
 
-from eaas.async_client import AsyncClient, AsyncRequest
 from eaas.config import Config
 import numpy as np
-import sacrebleu
-import sacrebleu.metrics.base
 
-from explainaboard.metrics.metric import Metric, MetricConfig, MetricStats
+from explainaboard.metrics.local_eaas import LocalEaaSClient
+from explainaboard.metrics.metric import (
+    AggregateType,
+    Metric,
+    MetricConfig,
+    MetricStats,
+    Score,
+    SimpleMetricStats,
+)
 from explainaboard.serialization import common_registry
+from explainaboard.utils.async_eaas import AsyncEaaSClient
+from explainaboard.utils.eaas_stats_cache import EaaSStatsCache
+from explainaboard.utils.logging import get_logger
 from explainaboard.utils.typing_utils import narrow, unwrap
 
-_eaas_config = None
-_eaas_client = None
 
+class EaaSRequest(Protocol):
+    """A request to an EaaS client."""
 
-def get_eaas_client():
-    """Get a global client for EaaS."""
-    global _eaas_config, _eaas_client
+    def get_result(self) -> Any:
+        """Returns the result in the format of the EaaS server."""
+        ...
+
+
+class EaaSClient(Protocol):
+    """A client to calculate EaaS metrics.
+
+    `AsyncEaaSClient` sends requests to the EaaS server, `ChunkedEaaSClient` splits
+    requests into chunks, `CachedEaaSClient` reuses cached statistics, and
+    `LocalEaaSClient` calculates some metrics in the local machine.
+    """
+
+    def async_score(
+        self, inputs: list[dict], metrics: list[str], calculate: list[str]
+    ) -> EaaSRequest:
+        """Scores generated texts asynchronously."""
+        ...
+
+
+_eaas_client: EaaSClient | None = None
+
+
+def create_remote_eaas_client(cache_path: str | None = None) -> EaaSClient:
+    """Create a client that calculates metrics on the EaaS server.
+
+    Statistics of samples are reused from the on-disk cache, and only those not
+    cached yet are sent to the server in chunks.
+
+    Args:
+        cache_path: The path to the cache of statistics. If not given, the cache is
+            created in the cache directory.
+
+    Returns:
+        The client.
+    """
+    return CachedEaaSClient(
+        ChunkedEaaSClient(AsyncEaaSClient(Config())), EaaSStatsCache(cache_path)
+    )
+
+
+def get_eaas_client() -> EaaSClient:
+    """Get a global client for EaaS.
+
+    Unless `set_eaas_client` is called, the client sends requests for statistics
+    that are not cached yet to the EaaS server in chunks, or calculates metrics
+    locally if the environment variable `EXPLAINABOARD_EAAS_BACKEND` is "local".
+    """
+    global _eaas_client
     if not _eaas_client:
-        _eaas_config = Config()
-        _eaas_client = AsyncClient(_eaas_config)
+        backend = os.environ.get("EXPLAINABOARD_EAAS_BACKEND", "remote")
+        if backend == "remote":
+            _eaas_client = create_remote_eaas_client()
+        elif backend == "local":
+            _eaas_client = LocalEaaSClient(num_workers=os.cpu_count() or 1)
+        else:
+            raise ValueError(f"Unknown EaaS backend: {backend}")
     return _eaas_client
 
 
+def set_eaas_client(client: EaaSClient | None) -> None:
+    """Set the global client for EaaS.
+
+    Args:
+        client: The client, or None to choose it by `get_eaas_client` again.
+    """
+    global _eaas_client
+    _eaas_client = client
+
+
 @final
 class EaaSMetricStats(MetricStats):
     """MetricStats with EaaS invocations.
@@ -36,13 +107,13 @@ class EaaSMetricStats(MetricStats):
     Obtaining the data from EaaS is deferred until it is wanted.
     """
 
-    def __init__(self, name: str, pos: int, eaas_request: AsyncRequest) -> None:
+    def __init__(self, name: str, pos: int, eaas_request: EaaSRequest) -> None:
         """Initializes the EaaSMetricStats.
 
         Args:
             name: Name of this metric.
             pos: Position of the statistics in the returned array.
-            eaas_request: Request object to the EaaS service.
+            eaas_request: Request object to the EaaS client.
         """
         self._name = name  # TODO(odashi): Remove this member.
         self._pos = pos
@@ -99,13 +170,91 @@ class EaaSMetricConfig(MetricConfig):
         return EaaSMetric(self)
 
 
+def _calc_bleu_from_stats(stats: np.ndarray) -> np.ndarray:
+    """Calculates BLEU scores from sufficient statistics.
+
+    This is a vectorized version of `sacrebleu.BLEU()._compute_score_from_stats`,
+    with the default exponential smoothing and the maximum n-gram order of 4.
+
+    Args:
+        stats: Statistics of shape [num_rows, 10], with columns of the hypothesis
+            length, the reference length, the numbers of correct n-grams and the
+            numbers of n-grams in the hypothesis.
+
+    Returns:
+        BLEU scores in [0, 1] of shape [num_rows].
+    """
+    max_order = (stats.shape[1] - 2) // 2
+    sys_len = stats[:, 0]
+    ref_len = stats[:, 1]
+    correct = stats[:, 2 : 2 + max_order]
+    total = stats[:, 2 + max_order :]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        brevity_penalty = np.where(
+            sys_len < ref_len,
+            np.where(sys_len > 0, np.exp(1 - ref_len / sys_len), 0.0),
+            1.0,
+        )
+        # Each order without correct n-grams halves the precision further.
+        no_correct = correct == 0
+        smoothing = np.power(2.0, np.cumsum(no_correct, axis=1))
+        precisions = np.where(
+            no_correct, 100.0 / (smoothing * total), 100.0 * correct / total
+        )
+        scores = brevity_penalty * np.exp(np.mean(np.log(precisions), axis=1))
+
+    # sacrebleu gives 0 if nothing matches or some order has no n-grams.
+    is_zero = np.all(no_correct, axis=1) | np.any(total == 0, axis=1)
+    return np.where(is_zero, 0.0, scores) / 100.0
+
+
+def _calc_chrf_from_stats(stats: np.ndarray) -> np.ndarray:
+    """Calculates chrF scores from sufficient statistics.
+
+    This is a vectorized version of `sacrebleu.CHRF()._compute_score_from_stats`,
+    with the default beta of 2 and effective order smoothing.
+
+    Args:
+        stats: Statistics of shape [num_rows, 3 * num_orders], with the numbers of
+            n-grams in the hypothesis, in the reference and matched for each order.
+
+    Returns:
+        chrF scores in [0, 1] of shape [num_rows].
+    """
+    eps = 1e-16
+    factor = 2.0**2
+    n_hyp = stats[:, 0::3]
+    n_ref = stats[:, 1::3]
+    n_match = stats[:, 2::3]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precisions = np.where(n_hyp > 0, n_match / n_hyp, eps)
+        recalls = np.where(n_ref > 0, n_match / n_ref, eps)
+        is_effective = (n_hyp > 0) & (n_ref > 0)
+        effective_order = np.sum(is_effective, axis=1)
+        avg_prec = np.where(
+            effective_order > 0,
+            np.sum(np.where(is_effective, precisions, 0.0), axis=1) / effective_order,
+            0.0,
+        )
+        avg_rec = np.where(
+            effective_order > 0,
+            np.sum(np.where(is_effective, recalls, 0.0), axis=1) / effective_order,
+            0.0,
+        )
+        scores = (1 + factor) * avg_prec * avg_rec / (factor * avg_prec + avg_rec)
+
+    return np.where(avg_prec + avg_rec > 0, scores, 0.0)
+
+
 class EaaSMetric(Metric):
     """A metric that calculates evaluation scores using EaaS."""
 
     _NOT_SIMPLE_METRICS = {"bleu", "chrf", "length_ratio", "length"}
-    _SACREBLEU_METRICS: dict[str, sacrebleu.metrics.base.Metric] = {
-        "bleu": sacrebleu.BLEU,
-        "chrf": sacrebleu.CHRF,
+    _SACREBLEU_METRICS: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+        "bleu": _calc_bleu_from_stats,
+        "chrf": _calc_chrf_from_stats,
     }
 
     def _calc_metric_from_aggregate(self, agg_stats: np.ndarray) -> np.ndarray:
@@ -115,17 +264,11 @@ class EaaSMetric(Metric):
         is_batched = agg_stats.ndim != 1
         if not is_batched:
             agg_stats = agg_stats.reshape((1, agg_stats.shape[0]))
-        n_samples = agg_stats.shape[0]
 
         if config.name in self._SACREBLEU_METRICS:
-            ret_metric = np.zeros(n_samples)
-            sacrebleu_metric = self._SACREBLEU_METRICS[config.name]()
-            for i, single_stat in enumerate(agg_stats):
-                ret_metric[i] = (
-                    sacrebleu_metric._compute_score_from_stats(list(single_stat)).score
-                    / 100.0
-                )
-            calc_result = ret_metric
+            calc_result = self._SACREBLEU_METRICS[config.name](
+                agg_stats.astype(np.float64)
+            )
         elif config.name == "length_ratio":
             calc_result = agg_stats[:, 0] / agg_stats[:, 1]
         else:
@@ -140,6 +283,13 @@ class EaaSMetric(Metric):
             narrow(EaaSMetricConfig, self.config).name not in self._NOT_SIMPLE_METRICS
         )
 
+    def aggregate_type(self) -> AggregateType:
+        """See Metric.aggregate_type."""
+        if narrow(EaaSMetricConfig, self.config).name in {"bleu", "chrf"}:
+            return AggregateType.SUM
+        else:
+            return AggregateType.MEAN
+
     def _aggregate_stats(self, stats: MetricStats) -> np.ndarray:
         """See: Metric.aggregate_stats."""
         data = stats.get_batch_data() if stats.is_batched() else stats.get_data()
@@ -170,3 +320,358 @@ class EaaSMetric(Metric):
             pos=0,
             eaas_request=async_request,
         )
+
+
+# The configurations of metrics for which sample scores are calculated from the
+# statistics in the same way as the EaaS server.
+_SAMPLE_SCORE_CONFIGS: dict[str, dict[str, Any]] = {
+    "bleu": {"smooth_method": "exp", "use_effective_order": False},
+    "chrf": {"beta": 2, "eps_smoothing": False},
+}
+
+
+def _stats_to_array(stats: list) -> np.ndarray:
+    """Converts the statistics of samples from the EaaS server to an array."""
+    return np.array([x if isinstance(x, list) else [x] for x in stats])
+
+
+def _calc_corpus_score(metric_name: str, stats: list) -> float:
+    """Calculates the corpus-level score of an EaaS metric from sample statistics.
+
+    Args:
+        metric_name: The name of the metric.
+        stats: The statistics of each sample, in the format of the EaaS server.
+
+    Returns:
+        The corpus-level score.
+    """
+    if len(stats) == 0:
+        return 0.0
+    metric = EaaSMetricConfig(name=metric_name).to_metric()
+    data = _stats_to_array(stats)
+    return (
+        metric.evaluate_from_stats(SimpleMetricStats(data))
+        .get_value(Score, "score")
+        .value
+    )
+
+
+def _calc_sample_scores(metric_name: str, stats: list) -> list[float]:
+    """Calculates the score of each sample of an EaaS metric from its statistics.
+
+    All the samples are calculated at once. BLEU and chrF are the same as the
+    `sentence_score` of sacrebleu with `_SAMPLE_SCORE_CONFIGS`, which the EaaS server
+    returns as sample scores.
+
+    Args:
+        metric_name: The name of the metric.
+        stats: The statistics of each sample, in the format of the EaaS server.
+
+    Returns:
+        The score of each sample.
+    """
+    if len(stats) == 0:
+        return []
+    metric = EaaSMetricConfig(name=metric_name).to_metric()
+    # A row of statistics is also the aggregate of a single sample.
+    data = _stats_to_array(stats).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return metric.calc_metric_from_aggregate(data).tolist()
+
+
+@final
+class DeferredEaaSRequest:
+    """A request that is queued only when its result is wanted for the first time.
+
+    This keeps the client from starting threads to send the request until then,
+    e.g., while features are calculated by processes forked by `fork_imap`.
+    """
+
+    def __init__(self, queue: Callable[[], EaaSRequest]) -> None:
+        """Initializes DeferredEaaSRequest.
+
+        Args:
+            queue: The function to queue the request to a client.
+        """
+        self._queue = queue
+        self._request: EaaSRequest | None = None
+
+    def get_result(self) -> Any:
+        """Queues the request if not yet, and waits for the result."""
+        if self._request is None:
+            self._request = self._queue()
+        return self._request.get_result()
+
+
+@final
+class ChunkedEaaSRequest:
+    """A request to `ChunkedEaaSClient`, consisting of requests for chunks."""
+
+    def __init__(
+        self, requests: list[EaaSRequest], metrics: list[str], calculate: list[str]
+    ) -> None:
+        """Initializes ChunkedEaaSRequest.
+
+        Args:
+            requests: The requests for each chunk of inputs, in order.
+            metrics: The metrics that were requested.
+            calculate: What were requested to calculate.
+        """
+        self._requests = requests
+        self._metrics = metrics
+        self._calculate = calculate
+        self._result: dict[str, Any] | None = None
+
+    def _merge_results(self, chunk_results: list[dict[str, Any]]) -> dict[str, Any]:
+        """Merges the results of chunks into the result of the whole inputs."""
+        if len(chunk_results) == 1:
+            return chunk_results[0]
+
+        scores = []
+        for i, metric in enumerate(self._metrics):
+            chunk_scores = [result["scores"][i] for result in chunk_results]
+            stats = [x for score in chunk_scores for x in score["stats"]]
+            merged: dict[str, Any] = {}
+            if "corpus" in self._calculate:
+                merged["corpus"] = _calc_corpus_score(metric, stats)
+            if "sample" in self._calculate:
+                merged["sample"] = [
+                    x for score in chunk_scores for x in score["sample"]
+                ]
+            if "stats" in self._calculate:
+                merged["stats"] = stats
+            scores.append(merged)
+        return {"scores": scores}
+
+    def get_result(self) -> dict[str, Any]:
+        """Waits for all the chunks and returns the merged result."""
+        if self._result is None:
+            self._result = self._merge_results(
+                [request.get_result() for request in self._requests]
+            )
+        return self._result
+
+
+@final
+class ChunkedEaaSClient:
+    """A client that splits requests into chunks of inputs.
+
+    All the chunks are queued to the underlying client at once, which is expected
+    to send them concurrently, e.g., `AsyncEaaSClient`. The statistics of the chunks
+    are concatenated in order, from which the corpus-level scores are recalculated.
+    """
+
+    def __init__(self, client: EaaSClient, chunk_size: int = 1000) -> None:
+        """Initializes ChunkedEaaSClient.
+
+        Args:
+            client: The client to send the chunks with.
+            chunk_size: The maximum number of inputs in each chunk.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, but got {chunk_size}")
+        self._client = client
+        self._chunk_size = chunk_size
+
+    def async_score(
+        self, inputs: list[dict], metrics: list[str], calculate: list[str]
+    ) -> ChunkedEaaSRequest:
+        """Scores generated texts asynchronously.
+
+        Args:
+            inputs: The texts to score in the dictionary form
+              {"source": ..., "hypothesis": ..., "references": [..., ...]}
+            metrics: The metrics to be used in scoring
+            calculate: Whether to calculate on the "corpus", "stats", "sample" level
+
+        Returns:
+            A request to obtain the merged result from.
+        """
+        chunk_calculate = list(calculate)
+        if len(inputs) > self._chunk_size and "stats" not in chunk_calculate:
+            # Corpus-level scores are recalculated from the statistics.
+            chunk_calculate.append("stats")
+        requests = [
+            self._client.async_score(
+                inputs[begin : begin + self._chunk_size], metrics, chunk_calculate
+            )
+            for begin in range(0, max(len(inputs), 1), self._chunk_size)
+        ]
+        return ChunkedEaaSRequest(requests, list(metrics), list(calculate))
+
+
+def _make_scores(
+    metrics: list[str], stats_lists: list[list], calculate: list[str]
+) -> dict[str, Any]:
+    """Makes a result in the format of the EaaS server from sample statistics.
+
+    Args:
+        metrics: The names of the metrics.
+        stats_lists: The statistics of each sample for each metric.
+        calculate: What to calculate.
+
+    Returns:
+        The result.
+    """
+    scores = []
+    for metric, stats in zip(metrics, stats_lists):
+        score: dict[str, Any] = {}
+        if "corpus" in calculate:
+            score["corpus"] = _calc_corpus_score(metric, stats)
+        if "sample" in calculate:
+            score["sample"] = _calc_sample_scores(metric, stats)
+        if "stats" in calculate:
+            score["stats"] = stats
+        scores.append(score)
+    return {"scores": scores}
+
+
+@final
+class CachedEaaSRequest:
+    """A request to `CachedEaaSClient`."""
+
+    def __init__(
+        self,
+        cache: EaaSStatsCache,
+        metrics: list[str],
+        calculate: list[str],
+        keys: list[list[str]],
+        cached_stats: dict[str, Any],
+        requests: list[tuple[list[int], list[int], EaaSRequest]],
+    ) -> None:
+        """Initializes CachedEaaSRequest.
+
+        Args:
+            cache: The cache to store the new statistics in.
+            metrics: The metrics that were requested.
+            calculate: What were requested to calculate.
+            keys: The cache keys of each sample for each metric.
+            cached_stats: The statistics found in the cache.
+            requests: Tuples of the indices of the samples, the positions of the
+                metrics and the request for them.
+        """
+        self._cache = cache
+        self._metrics = metrics
+        self._calculate = calculate
+        self._keys = keys
+        self._cached_stats = cached_stats
+        self._requests = requests
+        self._result: dict[str, Any] | None = None
+
+    def get_result(self) -> dict[str, Any]:
+        """Waits for the statistics not in the cache and returns the result."""
+        if self._result is None:
+            stats_lists = [
+                [self._cached_stats.get(key) for key in keys] for keys in self._keys
+            ]
+            for sample_ids, metric_ids, request in self._requests:
+                result = request.get_result()
+                new_stats = {}
+                for score, metric_id in zip(result["scores"], metric_ids):
+                    for sample_id, stats in zip(sample_ids, score["stats"]):
+                        stats_lists[metric_id][sample_id] = stats
+                        new_stats[self._keys[metric_id][sample_id]] = stats
+                self._cache.put_many(new_stats)
+            self._result = _make_scores(self._metrics, stats_lists, self._calculate)
+        return self._result
+
+
+@final
+class CachedEaaSClient:
+    """A client that reuses cached statistics of samples.
+
+    Only the statistics of samples that are not in the cache are requested to the
+    underlying client. Samples missing the same metrics are requested together.
+    Corpus-level scores are recalculated from the statistics.
+    """
+
+    def __init__(
+        self, client: EaaSClient, cache: EaaSStatsCache, config: Config | None = None
+    ) -> None:
+        """Initializes CachedEaaSClient.
+
+        Args:
+            client: The client to request statistics not in the cache with.
+            cache: The cache of statistics.
+            config: The configuration of the metrics, which is a part of the keys of
+                the cache.
+        """
+        self._client = client
+        self._cache = cache
+        self._metric_configs = (config or Config()).to_dict()
+
+    def async_score(
+        self, inputs: list[dict], metrics: list[str], calculate: list[str]
+    ) -> CachedEaaSRequest:
+        """Scores generated texts asynchronously.
+
+        Args:
+            inputs: The texts to score in the dictionary form
+              {"source": ..., "hypothesis": ..., "references": [..., ...]}
+            metrics: The metrics to be used in scoring
+            calculate: Whether to calculate on the "corpus", "stats", "sample" level
+
+        Returns:
+            A request to obtain the result from.
+
+        Raises:
+            ValueError: Sample scores are requested for a metric whose configuration
+                is not supported by `_calc_sample_scores`.
+        """
+        if "sample" in calculate:
+            for metric in metrics:
+                config = self._metric_configs.get(metric, {})
+                for name, value in _SAMPLE_SCORE_CONFIGS.get(metric, {}).items():
+                    if config.get(name, value) != value:
+                        raise ValueError(
+                            f"Sample scores of {metric} with {name}={config[name]!r} "
+                            "are not supported by CachedEaaSClient."
+                        )
+        keys = [
+            [
+                EaaSStatsCache.make_key(
+                    metric,
+                    self._metric_configs.get(metric, {}),
+                    x.get("source"),
+                    x["references"],
+                    x["hypothesis"],
+                )
+                for x in inputs
+            ]
+            for metric in metrics
+        ]
+        cached_stats = self._cache.get_many([key for ks in keys for key in ks])
+
+        # Groups metrics by the samples missing their statistics.
+        missing_metrics: dict[tuple[int, ...], list[int]] = {}
+        for metric_id, metric_keys in enumerate(keys):
+            sample_ids = tuple(
+                i for i, key in enumerate(metric_keys) if key not in cached_stats
+            )
+            if sample_ids:
+                missing_metrics.setdefault(sample_ids, []).append(metric_id)
+        requests = [
+            (
+                list(sample_ids),
+                metric_ids,
+                self._client.async_score(
+                    [inputs[i] for i in sample_ids],
+                    [metrics[i] for i in metric_ids],
+                    ["stats"],
+                ),
+            )
+            for sample_ids, metric_ids in missing_metrics.items()
+        ]
+
+        num_stats = len(metrics) * len(inputs)
+        num_missing = sum(
+            len(sample_ids) * len(metric_ids)
+            for sample_ids, metric_ids in missing_metrics.items()
+        )
+        get_logger().info(
+            f"EaaS statistics cache: {num_stats - num_missing} hits, "
+            f"{num_missing} misses"
+        )
+        return CachedEaaSRequest(
+            self._cache, list(metrics), list(calculate), keys, cached_stats, requests
+        )
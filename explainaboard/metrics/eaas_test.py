@@ -0,0 +1,232 @@
+"""Tests for explainaboard.metrics.eaas."""
+
+from __future__ import annotations
+
+import copy
+import os
+import tempfile
+import unittest
+
+from eaas.config import Config
+import numpy as np
+import sacrebleu
+
+from explainaboard.metrics.eaas import (
+    CachedEaaSClient,
+    ChunkedEaaSClient,
+    create_remote_eaas_client,
+    DeferredEaaSRequest,
+    EaaSMetricConfig,
+    EaaSMetricStats,
+)
+from explainaboard.metrics.local_eaas import LocalEaaSClient, LocalEaaSRequest
+from explainaboard.utils.eaas_stats_cache import EaaSStatsCache
+
+
+def _make_inputs(num_inputs: int) -> list[dict]:
+    return [
+        {
+            "source": "",
+            "references": [f"the cat sat on the mat {i}"],
+            "hypothesis": "the cat " + "sat " * (i % 5) + "on a mat",
+        }
+        for i in range(num_inputs)
+    ]
+
+
+class ChunkedEaaSClientTest(unittest.TestCase):
+    def test_merge_chunks(self) -> None:
+        inputs = _make_inputs(10)
+        metrics = ["bleu", "rouge1", "length_ratio"]
+        calculate = ["corpus", "sample", "stats"]
+        expected = LocalEaaSClient().async_score(inputs, metrics, calculate)
+        request = ChunkedEaaSClient(LocalEaaSClient(), chunk_size=3).async_score(
+            inputs, metrics, calculate
+        )
+        result = request.get_result()
+        for score, expected_score in zip(
+            result["scores"], expected.get_result()["scores"]
+        ):
+            self.assertEqual(score["stats"], expected_score["stats"])
+            self.assertEqual(score["sample"], expected_score["sample"])
+            self.assertAlmostEqual(score["corpus"], expected_score["corpus"])
+
+    def test_corpus_without_stats(self) -> None:
+        inputs = _make_inputs(10)
+        expected = LocalEaaSClient().async_score(inputs, ["bleu"], ["corpus"])
+        result = (
+            ChunkedEaaSClient(LocalEaaSClient(), chunk_size=4)
+            .async_score(inputs, ["bleu"], ["corpus"])
+            .get_result()
+        )
+        self.assertEqual(list(result["scores"][0]), ["corpus"])
+        self.assertAlmostEqual(
+            result["scores"][0]["corpus"],
+            expected.get_result()["scores"][0]["corpus"],
+        )
+
+    def test_metric_stats(self) -> None:
+        inputs = _make_inputs(7)
+        request = ChunkedEaaSClient(LocalEaaSClient(), chunk_size=2).async_score(
+            inputs, ["rouge2", "length"], ["stats"]
+        )
+        stats = EaaSMetricStats(name="length", pos=1, eaas_request=request)
+        self.assertEqual(len(stats), 7)
+        self.assertEqual(stats.get_data()[:, 0].tolist(), [5, 6, 7, 8, 9, 5, 6])
+
+    def test_invalid_chunk_size(self) -> None:
+        with self.assertRaises(ValueError):
+            ChunkedEaaSClient(LocalEaaSClient(), chunk_size=0)
+
+
+class _CountingClient:
+    """A client that records the requests to LocalEaaSClient."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[int, list[str]]] = []
+        self._client = LocalEaaSClient()
+
+    def async_score(
+        self, inputs: list[dict], metrics: list[str], calculate: list[str]
+    ) -> LocalEaaSRequest:
+        self.requests.append((len(inputs), metrics))
+        return self._client.async_score(inputs, metrics, calculate)
+
+
+class CachedEaaSClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tempdir.cleanup)
+        self._cache_path = os.path.join(self._tempdir.name, "stats.sqlite3")
+
+    def test_reuse_stats(self) -> None:
+        inputs = _make_inputs(6)
+        metrics = ["bleu", "rouge1"]
+        calculate = ["corpus", "stats"]
+        expected = LocalEaaSClient().async_score(inputs, metrics, calculate)
+
+        client = _CountingClient()
+        cache = EaaSStatsCache(self._cache_path)
+        cached_client = CachedEaaSClient(client, cache)
+        result = cached_client.async_score(inputs, metrics, calculate).get_result()
+        self.assertEqual(client.requests, [(6, ["bleu", "rouge1"])])
+        self.assertEqual(cache.misses, 12)
+
+        # Only the changed sample and the new metric are requested.
+        changed_inputs = copy.deepcopy(inputs)
+        changed_inputs[2]["hypothesis"] = "a dog"
+        cached_client.async_score(
+            changed_inputs, ["bleu", "rouge1", "chrf"], calculate
+        ).get_result()
+        self.assertEqual(client.requests[1:], [(1, ["bleu", "rouge1"]), (6, ["chrf"])])
+
+        # A new client reads the statistics stored on disk.
+        new_client = _CountingClient()
+        new_result = (
+            CachedEaaSClient(new_client, EaaSStatsCache(self._cache_path))
+            .async_score(inputs, metrics, calculate)
+            .get_result()
+        )
+        self.assertEqual(new_client.requests, [])
+        for new_score, score, expected_score in zip(
+            new_result["scores"], result["scores"], expected.get_result()["scores"]
+        ):
+            self.assertEqual(new_score["stats"], expected_score["stats"])
+            self.assertEqual(score["stats"], expected_score["stats"])
+            self.assertAlmostEqual(new_score["corpus"], expected_score["corpus"])
+            self.assertAlmostEqual(score["corpus"], expected_score["corpus"])
+
+    def test_sample_scores(self) -> None:
+        inputs = _make_inputs(6)
+        metrics = ["bleu", "chrf", "rouge1", "length_ratio"]
+        calculate = ["corpus", "sample"]
+        expected = LocalEaaSClient().async_score(inputs, metrics, calculate)
+        result = (
+            CachedEaaSClient(LocalEaaSClient(), EaaSStatsCache(self._cache_path))
+            .async_score(inputs, metrics, calculate)
+            .get_result()
+        )
+        for score, expected_score in zip(
+            result["scores"], expected.get_result()["scores"]
+        ):
+            np.testing.assert_allclose(score["sample"], expected_score["sample"])
+        # BLEU of each sample is sentence-level BLEU without the effective order.
+        bleu = sacrebleu.BLEU()
+        np.testing.assert_allclose(
+            result["scores"][0]["sample"],
+            [
+                bleu.sentence_score(x["hypothesis"], x["references"]).score / 100
+                for x in inputs
+            ],
+        )
+
+    def test_unsupported_sample_scores(self) -> None:
+        config = Config()
+        config.bleu.set_property("use_effective_order", True)
+        client = CachedEaaSClient(
+            LocalEaaSClient(), EaaSStatsCache(self._cache_path), config
+        )
+        with self.assertRaisesRegex(ValueError, r"use_effective_order=True"):
+            client.async_score(_make_inputs(2), ["bleu"], ["sample"])
+        # Scores which don't depend on the option are still available.
+        client.async_score(_make_inputs(2), ["bleu"], ["corpus"])
+
+
+class CreateRemoteEaaSClientTest(unittest.TestCase):
+    def test_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as tempdir:
+            client = create_remote_eaas_client(os.path.join(tempdir, "stats.sqlite3"))
+            self.assertIsInstance(client, CachedEaaSClient)
+
+
+class DeferredEaaSRequestTest(unittest.TestCase):
+    def test_queue_on_first_result(self) -> None:
+        inputs = _make_inputs(3)
+        client = _CountingClient()
+        request = DeferredEaaSRequest(
+            lambda: client.async_score(inputs, ["bleu"], ["stats"])
+        )
+        self.assertEqual(client.requests, [])
+        result = request.get_result()
+        self.assertEqual(request.get_result(), result)
+        self.assertEqual(client.requests, [(3, ["bleu"])])
+
+
+class EaaSMetricTest(unittest.TestCase):
+    def test_bleu_from_aggregate(self) -> None:
+        rng = np.random.default_rng(0)
+        total = rng.integers(0, 30, (500, 4))
+        correct = np.minimum(total, rng.integers(0, 30, (500, 4)))
+        correct *= rng.random((500, 4)) > 0.2
+        lengths = rng.integers(0, 40, (500, 2))
+        agg_stats = np.concatenate([lengths, correct, total], axis=1).astype(float)
+
+        metric = EaaSMetricConfig(name="bleu").to_metric()
+        expected = [
+            sacrebleu.BLEU()._compute_score_from_stats(list(x)).score / 100.0
+            for x in agg_stats
+        ]
+        np.testing.assert_allclose(
+            metric.calc_metric_from_aggregate(agg_stats), expected, atol=1e-12
+        )
+        self.assertAlmostEqual(
+            float(metric.calc_metric_from_aggregate(agg_stats[3])), expected[3]
+        )
+
+    def test_chrf_from_aggregate(self) -> None:
+        rng = np.random.default_rng(0)
+        n_hyp = rng.integers(0, 20, (500, 6)) * (rng.random((500, 6)) > 0.1)
+        n_ref = rng.integers(0, 20, (500, 6)) * (rng.random((500, 6)) > 0.1)
+        n_match = np.minimum(np.minimum(n_hyp, n_ref), rng.integers(0, 20, (500, 6)))
+        agg_stats = np.stack([n_hyp, n_ref, n_match], axis=2).reshape(500, 18)
+
+        metric = EaaSMetricConfig(name="chrf").to_metric()
+        expected = [
+            sacrebleu.CHRF()._compute_score_from_stats(list(x)).score / 100.0
+            for x in agg_stats
+        ]
+        np.testing.assert_allclose(
+            metric.calc_metric_from_aggregate(agg_stats.astype(float)),
+            expected,
+            atol=1e-12,
+        )
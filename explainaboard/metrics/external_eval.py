@@ -8,12 +8,14 @@ from typing import cast, Optional
 import numpy as np
 
 from explainaboard.metrics.metric import (
+    AggregateType,
     ConfidenceInterval,
     Metric,
     MetricConfig,
     MetricResult,
     MetricStats,
     MetricValue,
+    ResamplePlan,
     Score,
     SimpleMetricStats,
 )
@@ -130,6 +132,10 @@ class ExternalEval(Metric):
         # self.config.agreement = fleiss_kappa(mat_kappa)
         return fleiss_kappa(mat_kappa)
 
+    def aggregate_type(self) -> AggregateType:
+        """See Metric.aggregate_type."""
+        return AggregateType.CUSTOM
+
     def _aggregate_stats(self, stats: MetricStats) -> np.ndarray:
         """See Metric.aggregate_stats."""
         data = stats.get_batch_data() if stats.is_batched() else stats.get_data()
@@ -145,6 +151,7 @@ class ExternalEval(Metric):
         stats: MetricStats,
         confidence_alpha: Optional[float] = None,
         auxiliary_stats: Optional[MetricStats] = None,
+        resample_plan: Optional[ResamplePlan] = None,
     ) -> MetricResult:
         """Return an evaluation result over stats.
 
@@ -152,6 +159,7 @@ class ExternalEval(Metric):
             stats: pre-computed metric stats
             confidence_alpha: if set to not None, must be a number between 0 and 1,
                 indicating the inverse confidence level of the confidence interval
+            resample_plan: resamples shared with other metrics for bootstrapping
             config: a configuration to over-ride the default for this object
 
         Returns:
@@ -164,7 +172,9 @@ class ExternalEval(Metric):
             "agreement": Score(self.calc_agreement(stats)),
         }
         if confidence_alpha is not None:
-            ci = self.calc_confidence_interval(stats, confidence_alpha)
+            ci = self.calc_confidence_interval(
+                stats, confidence_alpha, resample_plan=resample_plan
+            )
             if ci is not None:
                 metric_values["score_ci"] = ConfidenceInterval(
                     ci[0], ci[1], confidence_alpha
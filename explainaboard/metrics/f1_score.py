@@ -240,13 +240,13 @@ class SeqF1Score(F1Score):
         ]
 
         # 2. Get tag space
-        all_classes = set(
-            [
-                span[0]
-                for span in list(itertools.chain.from_iterable(true_spans_list))
-                + list(itertools.chain.from_iterable(pred_spans_list))
-            ]
-        )
+        all_classes = {
+            span[0]
+            for span in itertools.chain(
+                itertools.chain.from_iterable(true_spans_list),
+                itertools.chain.from_iterable(pred_spans_list),
+            )
+        }
         tag_ids = {k: v for v, k in enumerate([x for x in all_classes])}
 
         # 3. Create the sufficient statistics
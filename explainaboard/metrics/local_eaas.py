@@ -0,0 +1,326 @@
+"""A local implementation of the EaaS client.
+
+`LocalEaaSClient` calculates the sufficient statistics of the EaaS metrics that do
+not need neural models in the current machine instead of sending the texts to the
+EaaS server. It returns results in the same format as the EaaS server, so they can
+be used by `EaaSMetricStats`.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Sequence
+import functools
+import math
+import re
+from typing import Any, final
+
+from eaas.config import Config
+from nltk.stem import porter
+import numpy as np
+import sacrebleu
+
+from explainaboard.utils.parallel import fork_imap
+
+# The maximum number of samples that a worker process calculates at once.
+_CHUNK_SIZE = 1000
+
+_ROUGE_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_stemmer() -> porter.PorterStemmer:
+    """Returns the stemmer used by ROUGE."""
+    return porter.PorterStemmer()
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _stem(token: str) -> str:
+    """Stems a token in the same way as the `rouge_score` package."""
+    return _get_stemmer().stem(token) if len(token) > 3 else token
+
+
+def _rouge_tokenize(text: str) -> list[str]:
+    """Tokenizes a text in the same way as the `rouge_score` package."""
+    return [
+        _stem(token) for token in _ROUGE_NON_ALPHANUMERIC.sub(" ", text.lower()).split()
+    ]
+
+
+def _f_measure(num_matches: int, num_predicted: int, num_true: int) -> float:
+    """Calculates the F1 score from the number of matches."""
+    if num_matches == 0:
+        return 0.0
+    precision = num_matches / num_predicted
+    recall = num_matches / num_true
+    return 2 * precision * recall / (precision + recall)
+
+
+def _rouge_n(n: int, hypothesis: list[str], reference: list[str]) -> float:
+    """Calculates the ROUGE-N F1 score between tokenized texts."""
+    hyp_ngrams = Counter(zip(*(hypothesis[i:] for i in range(n))))
+    ref_ngrams = Counter(zip(*(reference[i:] for i in range(n))))
+    num_matches = sum((hyp_ngrams & ref_ngrams).values())
+    return _f_measure(num_matches, sum(hyp_ngrams.values()), sum(ref_ngrams.values()))
+
+
+def _lcs_length(x: list[str], y: list[str]) -> int:
+    """Calculates the length of the longest common subsequence."""
+    if len(x) < len(y):
+        x, y = y, x
+    previous = [0] * (len(y) + 1)
+    for x_token in x:
+        current = [0]
+        for j, y_token in enumerate(y):
+            current.append(
+                previous[j] + 1
+                if x_token == y_token
+                else max(previous[j + 1], current[j])
+            )
+        previous = current
+    return previous[-1]
+
+
+def _rouge_l(hypothesis: list[str], reference: list[str]) -> float:
+    """Calculates the ROUGE-L F1 score between tokenized texts."""
+    return _f_measure(
+        _lcs_length(hypothesis, reference), len(hypothesis), len(reference)
+    )
+
+
+def _calc_rouge_stats(
+    n: int | None, hypotheses: Sequence[str], references: Sequence[Sequence[str]]
+) -> list[float]:
+    """Calculates ROUGE F1 scores, taking the maximum over references.
+
+    Args:
+        n: The order of n-grams for ROUGE-N, or None for ROUGE-L.
+        hypotheses: The hypotheses.
+        references: The references for each hypothesis.
+
+    Returns:
+        The F1 score of each hypothesis.
+    """
+    stats = []
+    for hyp, refs in zip(hypotheses, references):
+        hyp_tokens = _rouge_tokenize(hyp)
+        scores = [
+            _rouge_l(hyp_tokens, ref_tokens)
+            if n is None
+            else _rouge_n(n, hyp_tokens, ref_tokens)
+            for ref_tokens in map(_rouge_tokenize, refs)
+        ]
+        stats.append(max(scores, default=0.0))
+    return stats
+
+
+def _calc_sacrebleu_stats(
+    metric: sacrebleu.metrics.base.Metric,
+    hypotheses: Sequence[str],
+    references: Sequence[Sequence[str]],
+) -> list[list[float]]:
+    """Calculates the sentence statistics of a sacrebleu metric.
+
+    Args:
+        metric: The sacrebleu metric.
+        hypotheses: The hypotheses.
+        references: The references for each hypothesis.
+
+    Returns:
+        The statistics of each hypothesis.
+    """
+    # sacrebleu takes reference streams, in which None stands for a missing
+    # reference.
+    num_refs = max((len(refs) for refs in references), default=0)
+    ref_streams = [
+        [refs[i] if i < len(refs) else None for refs in references]
+        for i in range(num_refs)
+    ]
+    return metric._extract_corpus_statistics(hypotheses, ref_streams)
+
+
+def _calc_length_stats(
+    with_reference: bool,
+    hypotheses: Sequence[str],
+    references: Sequence[Sequence[str]],
+) -> list[list[float]]:
+    """Calculates the number of whitespace-separated tokens.
+
+    Args:
+        with_reference: Whether to calculate the length of the first reference as
+            well as the hypothesis.
+        hypotheses: The hypotheses.
+        references: The references for each hypothesis.
+
+    Returns:
+        The statistics of each hypothesis.
+    """
+    if not with_reference:
+        return [[len(hyp.split())] for hyp in hypotheses]
+    return [
+        [len(hyp.split()), len(refs[0].split()) if refs else 0]
+        for hyp, refs in zip(hypotheses, references)
+    ]
+
+
+def _calc_sacrebleu_score(
+    metric: sacrebleu.metrics.base.Metric, stats: np.ndarray
+) -> float:
+    """Calculates a sacrebleu score in [0, 1] from the sum of statistics."""
+    return metric._compute_score_from_stats(list(stats)).score / 100.0
+
+
+@final
+class LocalEaaSRequest:
+    """A request to `LocalEaaSClient`.
+
+    The scores are calculated when the result is requested first, in the same way
+    as `EaaSMetricStats` defers obtaining the result from the EaaS server.
+    """
+
+    def __init__(self, calculate_result: Callable[[], dict[str, Any]]) -> None:
+        """Initializes LocalEaaSRequest.
+
+        Args:
+            calculate_result: The function to calculate the result.
+        """
+        self._calculate_result = calculate_result
+        self._result: dict[str, Any] | None = None
+
+    def get_result(self) -> dict[str, Any]:
+        """Returns the result in the same format as the EaaS server."""
+        if self._result is None:
+            self._result = self._calculate_result()
+        return self._result
+
+
+@final
+class LocalEaaSClient:
+    """A client that calculates EaaS metrics locally.
+
+    Only the metrics in `SUPPORTED_METRICS` are available, which are calculated in
+    the same way as the EaaS server:
+
+    * bleu, chrf: sentence statistics of sacrebleu.
+    * rouge1, rouge2, rougeL: F1 scores over stemmed tokens like the `rouge_score`
+      package, taking the best reference.
+    * length: the number of tokens in the hypothesis.
+    * length_ratio: the number of tokens in the hypothesis and the first reference.
+    """
+
+    SUPPORTED_METRICS = frozenset(
+        {"bleu", "chrf", "rouge1", "rouge2", "rougeL", "length", "length_ratio"}
+    )
+
+    def __init__(self, config: Config | None = None, num_workers: int = 1) -> None:
+        """Initializes LocalEaaSClient.
+
+        Args:
+            config: The configuration of the metrics. The default configuration of
+                EaaS is used if not given.
+            num_workers: The number of processes to calculate the statistics with.
+        """
+        config_dict = (config or Config()).to_dict()
+        # The configuration follows the arguments of sacrebleu 1.x, some of which
+        # were renamed in sacrebleu 2.
+        bleu_config = dict(config_dict["bleu"])
+        bleu_config["effective_order"] = bleu_config.pop("use_effective_order", False)
+        chrf_config = dict(config_dict["chrf"])
+        chrf_config["whitespace"] = not chrf_config.pop("remove_whitespace", True)
+        self._sacrebleu_metrics: dict[str, sacrebleu.metrics.base.Metric] = {
+            "bleu": sacrebleu.BLEU(**bleu_config),
+            "chrf": sacrebleu.CHRF(**chrf_config),
+        }
+        self._num_workers = num_workers
+
+    def _get_stats_func(
+        self, metric: str
+    ) -> Callable[[Sequence[str], Sequence[Sequence[str]]], list]:
+        """Returns the function to calculate the statistics of a metric."""
+        if metric in self._sacrebleu_metrics:
+            return functools.partial(
+                _calc_sacrebleu_stats, self._sacrebleu_metrics[metric]
+            )
+        elif metric in ("rouge1", "rouge2"):
+            return functools.partial(_calc_rouge_stats, int(metric[-1]))
+        elif metric == "rougeL":
+            return functools.partial(_calc_rouge_stats, None)
+        elif metric in ("length", "length_ratio"):
+            return functools.partial(_calc_length_stats, metric == "length_ratio")
+        raise ValueError(
+            f"{metric} is not supported by LocalEaaSClient. Supported metrics: "
+            f"{sorted(self.SUPPORTED_METRICS)}"
+        )
+
+    def _calc_score(self, metric: str, stats: np.ndarray) -> float:
+        """Calculates the score of a metric from the statistics of samples."""
+        if len(stats) == 0:
+            return 0.0
+        if metric in self._sacrebleu_metrics:
+            return _calc_sacrebleu_score(
+                self._sacrebleu_metrics[metric], np.sum(stats, axis=0)
+            )
+        elif metric == "length_ratio":
+            total = np.sum(stats, axis=0)
+            return float(total[0] / total[1]) if total[1] else math.inf
+        else:
+            return float(np.mean(stats))
+
+    def _calc_result(
+        self, inputs: list[dict], metrics: list[str], calculate: list[str]
+    ) -> dict[str, Any]:
+        """Calculates the result of a request."""
+        stats_funcs = [self._get_stats_func(metric) for metric in metrics]
+        hypotheses = [x["hypothesis"] for x in inputs]
+        references = [x["references"] for x in inputs]
+
+        def calc_chunk(begin: int) -> list[list]:
+            end = begin + _CHUNK_SIZE
+            return [
+                func(hypotheses[begin:end], references[begin:end])
+                for func in stats_funcs
+            ]
+
+        stats_lists: list[list] = [[] for _ in metrics]
+        for chunk_stats in fork_imap(
+            calc_chunk, range(0, len(inputs), _CHUNK_SIZE), self._num_workers
+        ):
+            for stats, chunk in zip(stats_lists, chunk_stats):
+                stats.extend(chunk)
+
+        scores = []
+        for metric, stats in zip(metrics, stats_lists):
+            stats_array = np.array(stats, dtype=float)
+            score: dict[str, Any] = {}
+            if "corpus" in calculate:
+                score["corpus"] = self._calc_score(metric, stats_array)
+            if "sample" in calculate:
+                score["sample"] = [
+                    self._calc_score(metric, stats_array[i : i + 1])
+                    for i in range(len(stats_array))
+                ]
+            if "stats" in calculate:
+                score["stats"] = stats
+            scores.append(score)
+        return {"scores": scores}
+
+    def async_score(
+        self, inputs: list[dict], metrics: list[str], calculate: list[str]
+    ) -> LocalEaaSRequest:
+        """Scores generated texts.
+
+        Args:
+            inputs: The texts to score in the dictionary form
+              {"source": ..., "hypothesis": ..., "references": [..., ...]}
+            metrics: The metrics to be used in scoring
+            calculate: Whether to calculate on the "corpus", "stats", "sample" level
+
+        Returns:
+            A request to obtain the result from.
+        """
+        for metric in metrics:
+            # Fails early on unsupported metrics.
+            self._get_stats_func(metric)
+        return LocalEaaSRequest(
+            functools.partial(self._calc_result, inputs, list(metrics), calculate)
+        )
@@ -0,0 +1,119 @@
+"""Tests for explainaboard.metrics.local_eaas."""
+
+from __future__ import annotations
+
+import unittest
+
+import sacrebleu
+
+from explainaboard.metrics.eaas import EaaSMetricConfig, EaaSMetricStats
+from explainaboard.metrics.local_eaas import LocalEaaSClient
+from explainaboard.metrics.metric import Score
+from explainaboard.utils.parallel import is_fork_available
+
+_HYPOTHESES = [
+    "the cat sat on the mat",
+    "a dog is running in the park",
+    "hello world",
+    "",
+]
+_REFERENCES = [
+    ["the cat is sitting on the mat", "a cat sat on the mat"],
+    ["the dog runs in a park"],
+    ["hello there world"],
+    ["nothing here"],
+]
+
+
+def _make_inputs() -> list[dict]:
+    return [
+        {"source": "", "references": refs, "hypothesis": hyp}
+        for hyp, refs in zip(_HYPOTHESES, _REFERENCES)
+    ]
+
+
+class LocalEaaSClientTest(unittest.TestCase):
+    def test_sacrebleu(self) -> None:
+        client = LocalEaaSClient()
+        result = client.async_score(
+            _make_inputs(), metrics=["bleu", "chrf"], calculate=["corpus", "stats"]
+        ).get_result()
+        # sacrebleu takes reference streams.
+        ref_streams = [
+            [refs[0] for refs in _REFERENCES],
+            [refs[1] if len(refs) > 1 else None for refs in _REFERENCES],
+        ]
+        for score, metric in zip(
+            result["scores"], [sacrebleu.BLEU(), sacrebleu.CHRF()]
+        ):
+            self.assertEqual(len(score["stats"]), len(_HYPOTHESES))
+            self.assertAlmostEqual(
+                score["corpus"],
+                metric.corpus_score(_HYPOTHESES, ref_streams).score / 100.0,
+            )
+
+    def test_rouge(self) -> None:
+        client = LocalEaaSClient()
+        result = client.async_score(
+            [
+                {
+                    "source": "",
+                    "references": ["The cats sat on the mat.", "no match"],
+                    "hypothesis": "the cat sat",
+                }
+            ],
+            metrics=["rouge1", "rouge2", "rougeL"],
+            calculate=["stats"],
+        ).get_result()
+        # "cats" is stemmed into "cat".
+        self.assertAlmostEqual(result["scores"][0]["stats"][0], 2 / 3)
+        self.assertAlmostEqual(result["scores"][1]["stats"][0], 4 / 7)
+        self.assertAlmostEqual(result["scores"][2]["stats"][0], 2 / 3)
+
+    def test_length(self) -> None:
+        client = LocalEaaSClient()
+        result = client.async_score(
+            _make_inputs(),
+            metrics=["length", "length_ratio"],
+            calculate=["corpus", "sample", "stats"],
+        ).get_result()
+        length, length_ratio = result["scores"]
+        self.assertEqual(length["stats"], [[6], [7], [2], [0]])
+        self.assertAlmostEqual(length["corpus"], 15 / 4)
+        self.assertEqual(length_ratio["stats"], [[6, 7], [7, 6], [2, 3], [0, 2]])
+        self.assertAlmostEqual(length_ratio["corpus"], 15 / 18)
+        self.assertEqual(length_ratio["sample"], [6 / 7, 7 / 6, 2 / 3, 0.0])
+
+    def test_unsupported_metric(self) -> None:
+        with self.assertRaisesRegex(ValueError, "bert_score_f is not supported"):
+            LocalEaaSClient().async_score(
+                _make_inputs(), metrics=["bert_score_f"], calculate=["stats"]
+            )
+
+    @unittest.skipUnless(is_fork_available(), "fork is not available")
+    def test_num_workers(self) -> None:
+        inputs = _make_inputs() * 700
+        metrics = ["bleu", "rouge1", "rougeL", "length_ratio"]
+        serial = LocalEaaSClient().async_score(
+            inputs, metrics=metrics, calculate=["corpus", "stats"]
+        )
+        parallel = LocalEaaSClient(num_workers=2).async_score(
+            inputs, metrics=metrics, calculate=["corpus", "stats"]
+        )
+        self.assertEqual(serial.get_result(), parallel.get_result())
+
+    def test_eaas_metric_stats(self) -> None:
+        request = LocalEaaSClient().async_score(
+            _make_inputs(),
+            metrics=["bleu", "rouge2", "length_ratio"],
+            calculate=["corpus", "stats"],
+        )
+        for i, name in enumerate(["bleu", "rouge2", "length_ratio"]):
+            with self.subTest(name=name):
+                metric = EaaSMetricConfig(name=name).to_metric()
+                stats = EaaSMetricStats(name=name, pos=i, eaas_request=request)
+                self.assertEqual(len(stats), len(_HYPOTHESES))
+                self.assertAlmostEqual(
+                    metric.evaluate_from_stats(stats).get_value(Score, "score").value,
+                    request.get_result()["scores"][i]["corpus"],
+                )
@@ -9,6 +9,7 @@ import numpy as np
 from scipy import stats
 
 from explainaboard.metrics.metric import (
+    AggregateType,
     Metric,
     MetricConfig,
     MetricStats,
@@ -65,6 +66,10 @@ class CorrelationNLG(Metric):
         """See Metric.uses_customized_aggregate."""
         return True
 
+    def aggregate_type(self) -> AggregateType:
+        """See Metric.aggregate_type."""
+        return AggregateType.CUSTOM
+
     def calc_stats_from_data(
         self,
         true_data: list[Any],
@@ -183,6 +188,10 @@ class CorrelationWMTDAMetric(Metric):
         """See Metric.uses_customized_aggregate."""
         return True
 
+    def aggregate_type(self) -> AggregateType:
+        """See Metric.aggregate_type."""
+        return AggregateType.CUSTOM
+
     def calc_stats_from_data(
         self,
         true_data: list[Union[str, list[str]]],
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import abc
+from collections.abc import Iterator
 import copy
 from dataclasses import dataclass
+from enum import Enum
 from typing import Any, final, Optional, TypeVar
 
 import numpy as np
@@ -21,6 +23,27 @@ from explainaboard.utils.typing_utils import narrow
 # Minimum sample size the central limit theorem can be applied to.
 _MIN_SAMPLE_SIZE = 30
 
+# Upper bound of the number of resampled indices held in memory at once by the
+# weighted bootstrap.
+_BOOTSTRAP_CHUNK_ELEMENTS = 1 << 22
+
+# Upper bound of the number of resampled indices cached by each ResamplePlan.
+_RESAMPLE_PLAN_CACHE_ELEMENTS = 1 << 24
+
+
+@final
+class AggregateType(Enum):
+    """Reductions that `Metric._aggregate_stats` applies over the sample axis.
+
+    MEAN and SUM are linear in the statistics of each sample, so aggregates over a
+    bootstrap resample can be computed as count-weighted sums of the original
+    statistics. CUSTOM denotes any other reduction.
+    """
+
+    MEAN = "mean"
+    SUM = "sum"
+    CUSTOM = "custom"
+
 
 # TODO(odashi): See mypy/issues/4717
 @dataclass(frozen=True)  # type: ignore
@@ -409,6 +432,137 @@ class SimpleMetricStats(MetricStats):
         return self._data
 
 
+@final
+class ResamplePlan:
+    """Bootstrap resamples shared by every metric evaluated over the same samples.
+
+    The resampled indices depend only on the seed, the number of iterations and the
+    sample size, so every metric and every bucket of an analysis level that shares a
+    plan is evaluated on exactly the same resamples. This amortizes the generation of
+    resamples and makes paired bootstrap comparisons between metrics possible.
+
+    Small index matrices are cached after the first use. Larger ones are regenerated
+    chunk by chunk from the seed to keep the memory usage bounded.
+    """
+
+    def __init__(
+        self, seed: np.random.SeedSequence | None = None, num_iterations: int = 1000
+    ) -> None:
+        """Initializes ResamplePlan.
+
+        Args:
+            seed: A seed to draw resamples. If None, the default seed is used.
+            num_iterations: The number of resamples.
+        """
+        if num_iterations <= 0:
+            raise ValueError(f"Invalid num_iterations: {num_iterations}")
+
+        self._seed = seed if seed is not None else np.random.SeedSequence()
+        self._num_iterations = num_iterations
+        self._cache: dict[int, np.ndarray[tuple[int, int], Any]] = {}
+        self._num_cached_elements = 0
+
+    @property
+    def num_iterations(self) -> int:
+        """Returns the number of resamples."""
+        return self._num_iterations
+
+    def iter_indices(
+        self, sample_size: int
+    ) -> Iterator[np.ndarray[tuple[int, int], Any]]:
+        """Generates resampled indices in chunks of iterations.
+
+        Concatenating the chunks over the first axis gives the same matrix as
+        `rng.choice(sample_size, size=(num_iterations, sample_size))`, where `rng` is
+        a random generator freshly initialized with the seed. Yielded arrays must not be
+        modified in-place.
+
+        Args:
+            sample_size: The number of samples to draw from, and to draw in each
+                resample.
+
+        Yields:
+            Indices with shape `[chunk_size, sample_size]`.
+        """
+        cached = self._cache.get(sample_size)
+        if cached is not None:
+            yield cached
+            return
+
+        num_elements = self._num_iterations * sample_size
+        cacheable = (
+            num_elements <= _BOOTSTRAP_CHUNK_ELEMENTS
+            and self._num_cached_elements + num_elements
+            <= _RESAMPLE_PLAN_CACHE_ELEMENTS
+        )
+        chunk_size = max(1, _BOOTSTRAP_CHUNK_ELEMENTS // sample_size)
+        rng = np.random.default_rng(self._seed)
+
+        for begin in range(0, self._num_iterations, chunk_size):
+            size = min(chunk_size, self._num_iterations - begin)
+            indices = rng.choice(sample_size, size=(size, sample_size), replace=True)
+            if cacheable:
+                # The whole matrix fits into a single chunk.
+                self._cache[sample_size] = indices
+                self._num_cached_elements += num_elements
+            yield indices
+
+    def get_indices(self, sample_size: int) -> np.ndarray[tuple[int, int], Any]:
+        """Returns the whole matrix of resampled indices.
+
+        Args:
+            sample_size: See `iter_indices`.
+
+        Returns:
+            Indices with shape `[num_iterations, sample_size]`.
+        """
+        return np.concatenate(list(self.iter_indices(sample_size)))
+
+
+def _weighted_bootstrap_aggregates(
+    data: np.ndarray[tuple[int, int], Any],
+    plan: ResamplePlan,
+    aggregate_type: AggregateType,
+) -> np.ndarray[tuple[int, int], Any]:
+    """Aggregates bootstrap resamples of linearly-aggregated statistics.
+
+    Each resample is represented by the number of times every sample is drawn, and
+    its aggregate is obtained by multiplying these counts with `data`. Resamples are
+    processed in chunks so that neither the full index matrix nor the gathered
+    statistics are materialized. The results match the gather-based bootstrap over the
+    same plan.
+
+    Args:
+        data: Non-batched statistics with shape `[sample_size, num_statistics]`.
+        plan: Resamples to aggregate.
+        aggregate_type: Either `AggregateType.MEAN` or `AggregateType.SUM`.
+
+    Returns:
+        Aggregated statistics with shape `[num_iterations, num_statistics]`.
+    """
+    if aggregate_type == AggregateType.CUSTOM:
+        raise ValueError("Custom aggregates can't be computed with weights.")
+
+    sample_size = data.shape[0]
+    values = np.asarray(data, dtype=np.float64)
+    result = np.empty((plan.num_iterations, data.shape[1]), dtype=np.float64)
+
+    begin = 0
+    for indices in plan.iter_indices(sample_size):
+        size = indices.shape[0]
+        # Offsets each row so that a single bincount yields per-resample counts.
+        offsets = indices + np.arange(size).reshape(size, 1) * sample_size
+        counts = np.bincount(offsets.ravel(), minlength=size * sample_size)
+        result[begin : begin + size] = (
+            counts.reshape(size, sample_size).astype(np.float64) @ values
+        )
+        begin += size
+
+    if aggregate_type == AggregateType.MEAN:
+        result /= sample_size
+    return result
+
+
 class Metric(metaclass=abc.ABCMeta):
     """A class representing an evaluation metric.
 
@@ -544,6 +698,64 @@ class Metric(metaclass=abc.ABCMeta):
         else:
             return np.mean(data, axis=-2)
 
+    @final
+    def aggregate_stats_by_group(
+        self,
+        stats: MetricStats,
+        group_ids: np.ndarray[tuple[int], Any],
+        num_groups: int,
+    ) -> np.ndarray[tuple[int, int], Any]:
+        """Aggregate sufficient statistics of every group with a single reduction.
+
+        This function requires that the metric aggregates linearly, i.e.,
+        `aggregate_type()` is not `AggregateType.CUSTOM` and the metric does not use
+        customized aggregates.
+
+        Args:
+            stats: Non-batched stats for every example.
+            group_ids: Integer array with shape `[len(stats)]`, assigning every example
+                to a group in `[0, num_groups)`. Examples with negative IDs belong to
+                no group.
+            num_groups: The number of groups.
+
+        Returns:
+            Aggregated stats with shape `[num_groups, num_aggregate_stats]`. The `i`-th
+            row is equal to the aggregate of the examples with `group_ids == i`.
+
+        Raises:
+            ValueError: Attempted unsupported operation.
+        """
+        aggregate_type = self.aggregate_type()
+        if aggregate_type == AggregateType.CUSTOM or self.uses_customized_aggregate():
+            raise ValueError(
+                f"{type(self).__name__} does not support grouped aggregation."
+            )
+        if stats.is_batched():
+            raise ValueError("Batched stats can't be aggregated by groups.")
+
+        data = stats.get_data()
+        if group_ids.shape != (data.shape[0],):
+            raise ValueError(f"Invalid shape of group_ids: {group_ids.shape}")
+        if group_ids.size > 0 and group_ids.max() >= num_groups:
+            raise ValueError(f"Group ID out of range: {group_ids.max()}")
+
+        in_group = group_ids >= 0
+        if not in_group.all():
+            data = data[in_group]
+            group_ids = group_ids[in_group]
+
+        result = np.empty((num_groups, data.shape[1]), dtype=np.float64)
+        for i in range(data.shape[1]):
+            result[:, i] = np.bincount(
+                group_ids, weights=data[:, i], minlength=num_groups
+            )
+
+        if aggregate_type == AggregateType.MEAN:
+            counts = np.bincount(group_ids, minlength=num_groups)
+            # Empty groups are aggregated to zeros, as `_aggregate_stats` does.
+            result /= np.maximum(counts, 1).reshape(num_groups, 1)
+        return result
+
     @final
     def calc_metric_from_aggregate(
         self,
@@ -611,11 +823,22 @@ class Metric(metaclass=abc.ABCMeta):
         """The number of dimensions in the sufficient statistics."""
         return 1
 
+    def aggregate_type(self) -> AggregateType:
+        """The reduction that `_aggregate_stats` applies over the sample axis.
+
+        This also selects the bootstrap engine of `calc_confidence_interval`: MEAN and
+        SUM metrics aggregate resamples with count weights, while CUSTOM metrics gather
+        the resampled statistics explicitly. Subclasses that override
+        `_aggregate_stats` must override this function accordingly.
+        """
+        return AggregateType.MEAN
+
     def calc_confidence_interval(
         self,
         stats: MetricStats,
         confidence_alpha: float,
         num_iterations: int = 1000,
+        resample_plan: ResamplePlan | None = None,
     ) -> tuple[float, float] | None:
         """Calculate the confidence interval of a statistics function.
 
@@ -623,6 +846,8 @@ class Metric(metaclass=abc.ABCMeta):
             stats: sufficient statistics as calculated by calc_stats_from_data
             confidence_alpha: the inverse confidence level of the confidence interval
             num_iterations: the number of iterations to perform resampling
+            resample_plan: resamples used for bootstrapping. If given, this overrides
+                `num_iterations` and the seed of this metric.
 
         Returns:
             A confidence interval or `None` if one cannot be calculated.
@@ -662,13 +887,20 @@ class Metric(metaclass=abc.ABCMeta):
             )
         # Do bootstrapping otherwise
         else:
-            all_indices = np.array(range(sample_size))
-            rng = np.random.default_rng(self.get_seed())
-            all_indices = rng.choice(
-                all_indices, size=(num_iterations, sample_size), replace=True
-            )
-            filt_stats = stats.filter(all_indices)
-            agg_stats = self.aggregate_stats(filt_stats)
+            if resample_plan is None:
+                resample_plan = ResamplePlan(self.get_seed(), num_iterations)
+            num_iterations = resample_plan.num_iterations
+            aggregate_type = self.aggregate_type()
+            if (
+                aggregate_type != AggregateType.CUSTOM
+                and not self.uses_customized_aggregate()
+            ):
+                agg_stats = _weighted_bootstrap_aggregates(
+                    stats_data, resample_plan, aggregate_type
+                )
+            else:
+                filt_stats = stats.filter(resample_plan.get_indices(sample_size))
+                agg_stats = self.aggregate_stats(filt_stats)
             samp_results = self.calc_metric_from_aggregate(agg_stats)
 
             if samp_results.ndim != 1:
@@ -692,6 +924,7 @@ class Metric(metaclass=abc.ABCMeta):
         stats: MetricStats,
         confidence_alpha: Optional[float] = None,
         auxiliary_stats: Optional[MetricStats] = None,
+        resample_plan: Optional[ResamplePlan] = None,
     ) -> MetricResult:
         """Return an evaluation result over stats.
 
@@ -700,6 +933,7 @@ class Metric(metaclass=abc.ABCMeta):
             confidence_alpha: if set to not None, must be a number between 0 and 1,
                 indicating the inverse confidence level of confidence intervals
             auxiliary_stats: metric stats used to calculate auxiliary metric result
+            resample_plan: resamples shared with other metrics for bootstrapping
 
         Returns:
             a resulting metric value
@@ -717,7 +951,9 @@ class Metric(metaclass=abc.ABCMeta):
         }
 
         if confidence_alpha is not None:
-            ci = self.calc_confidence_interval(stats, confidence_alpha)
+            ci = self.calc_confidence_interval(
+                stats, confidence_alpha, resample_plan=resample_plan
+            )
             if ci is not None:
                 metric_values["score_ci"] = ConfidenceInterval(
                     ci[0], ci[1], confidence_alpha
@@ -725,6 +961,89 @@ class Metric(metaclass=abc.ABCMeta):
 
         return MetricResult(metric_values)
 
+    def evaluate_groups_from_stats(
+        self,
+        stats: MetricStats,
+        group_ids: np.ndarray[tuple[int], Any],
+        num_groups: int,
+        confidence_alpha: Optional[float] = None,
+        resample_plan: Optional[ResamplePlan] = None,
+    ) -> list[MetricResult]:
+        """Return evaluation results over every group of stats.
+
+        The results are the same as calling `evaluate_from_stats` over the stats of
+        each group. Metrics that aggregate linearly calculate the scores of all groups
+        with a single grouped reduction, and the stats are reordered once so that
+        confidence intervals are calculated over contiguous views rather than
+        per-group copies. Subclasses that override `evaluate_from_stats` must override
+        this function accordingly.
+
+        Args:
+            stats: pre-computed metric stats for every example
+            group_ids: Integer array with shape `[len(stats)]`, assigning every example
+                to a group in `[0, num_groups)`. Examples with negative IDs belong to
+                no group.
+            num_groups: the number of groups
+            confidence_alpha: if set to not None, must be a number between 0 and 1,
+                indicating the inverse confidence level of confidence intervals
+            resample_plan: resamples shared with other metrics for bootstrapping
+
+        Returns:
+            a list of resulting metric values, one for each group
+        """
+        if stats.is_batched():
+            raise ValueError("Batched stats can't be evaluated.")
+        if group_ids.shape != (len(stats),):
+            raise ValueError(f"Invalid shape of group_ids: {group_ids.shape}")
+
+        # Examples of each group are placed contiguously, keeping the original order.
+        order = np.argsort(group_ids, kind="stable")
+        bounds = np.searchsorted(group_ids[order], np.arange(num_groups + 1))
+
+        if (
+            self.aggregate_type() == AggregateType.CUSTOM
+            or self.uses_customized_aggregate()
+        ):
+            return [
+                self.evaluate_from_stats(
+                    stats.filter(order[bounds[i] : bounds[i + 1]]),
+                    confidence_alpha=confidence_alpha,
+                    resample_plan=resample_plan,
+                )
+                for i in range(num_groups)
+            ]
+
+        scores = self.calc_metric_from_aggregate(
+            self.aggregate_stats_by_group(stats, group_ids, num_groups)
+        )
+        grouped_data = (
+            stats.filter(order[bounds[0] :]).get_data()
+            if confidence_alpha is not None
+            else None
+        )
+
+        results: list[MetricResult] = []
+        for i in range(num_groups):
+            metric_values: dict[str, MetricValue] = {
+                "score": Score(float(scores[i])),
+            }
+
+            if grouped_data is not None and confidence_alpha is not None:
+                group_stats = SimpleMetricStats(
+                    grouped_data[bounds[i] - bounds[0] : bounds[i + 1] - bounds[0]]
+                )
+                ci = self.calc_confidence_interval(
+                    group_stats, confidence_alpha, resample_plan=resample_plan
+                )
+                if ci is not None:
+                    metric_values["score_ci"] = ConfidenceInterval(
+                        ci[0], ci[1], confidence_alpha
+                    )
+
+            results.append(MetricResult(metric_values))
+
+        return results
+
     def evaluate(
         self,
         true_data: list,
@@ -6,15 +6,18 @@ from collections.abc import Callable
 import dataclasses
 from typing import Any
 import unittest
+import unittest.mock
 
 import numpy as np
 
 from explainaboard.metrics.metric import (
+    AggregateType,
     ConfidenceInterval,
     Metric,
     MetricConfig,
     MetricResult,
     MetricStats,
+    ResamplePlan,
     Score,
     SimpleMetricStats,
 )
@@ -27,6 +30,7 @@ class _DummyMetricConfig(MetricConfig):
     is_simple_average: bool = True
     uses_customized_aggregate: bool = False
     aggregate_stats_fn: Callable[[MetricStats], np.ndarray[Any, Any]] | None = None
+    aggregate_type: AggregateType = AggregateType.MEAN
 
     def to_metric(self) -> Metric:
         return _DummyMetric(self)
@@ -39,6 +43,9 @@ class _DummyMetric(Metric):
     def uses_customized_aggregate(self) -> bool:
         return narrow(_DummyMetricConfig, self.config).uses_customized_aggregate
 
+    def aggregate_type(self) -> AggregateType:
+        return narrow(_DummyMetricConfig, self.config).aggregate_type
+
     def _aggregate_stats(
         self, stats: MetricStats
     ) -> np.ndarray[tuple[int], Any] | np.ndarray[tuple[int, int], Any]:
@@ -55,6 +62,11 @@ class _DummyMetric(Metric):
         raise NotImplementedError
 
 
+def _sum_stats(stats: MetricStats) -> np.ndarray[Any, Any]:
+    data = stats.get_batch_data() if stats.is_batched() else stats.get_data()
+    return np.sum(data, axis=-2)
+
+
 class ScoreTest(unittest.TestCase):
     def test_serialize(self) -> None:
         value = Score(42.0)
@@ -204,6 +216,49 @@ class MetricConfigTest(unittest.TestCase):
         self.assertEqual(new_config.target_language, "bb")
 
 
+class ResamplePlanTest(unittest.TestCase):
+    def test_invalid_num_iterations(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"^Invalid num_iterations: 0$"):
+            ResamplePlan(num_iterations=0)
+
+    def test_get_indices(self) -> None:
+        plan = ResamplePlan(np.random.SeedSequence(12345), num_iterations=10)
+        indices = plan.get_indices(6)
+        expected = np.random.default_rng(np.random.SeedSequence(12345)).choice(
+            6, size=(10, 6), replace=True
+        )
+        np.testing.assert_array_equal(indices, expected)
+        np.testing.assert_array_equal(plan.get_indices(6), expected)
+
+    @unittest.mock.patch("explainaboard.metrics.metric._BOOTSTRAP_CHUNK_ELEMENTS", 7)
+    def test_get_indices_chunked(self) -> None:
+        plan = ResamplePlan(np.random.SeedSequence(12345), num_iterations=10)
+        chunks = list(plan.iter_indices(6))
+        self.assertEqual(len(chunks), 10)
+        expected = np.random.default_rng(np.random.SeedSequence(12345)).choice(
+            6, size=(10, 6), replace=True
+        )
+        np.testing.assert_array_equal(np.concatenate(chunks), expected)
+        np.testing.assert_array_equal(plan.get_indices(6), expected)
+
+    def test_shared_across_metrics(self) -> None:
+        plan = ResamplePlan(np.random.SeedSequence(12345))
+        stats = SimpleMetricStats(np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]))
+        for aggregate_type in AggregateType:
+            metric = _DummyMetric(
+                _DummyMetricConfig(
+                    "test", is_simple_average=False, aggregate_type=aggregate_type
+                )
+            )
+            ci = unwrap(
+                metric.calc_confidence_interval(stats, 0.05, resample_plan=plan)
+            )
+            if aggregate_type == AggregateType.SUM:
+                ci = (ci[0] / 6, ci[1] / 6)
+            self.assertAlmostEqual(ci[0], 2.166666666666666)
+            self.assertAlmostEqual(ci[1], 4.833333333333333)
+
+
 class MetricTest(unittest.TestCase):
     def test_aggregate_stats_1dim(self) -> None:
         metric = _DummyMetric(_DummyMetricConfig("test"))
@@ -289,6 +344,39 @@ class MetricTest(unittest.TestCase):
         ):
             metric.aggregate_stats(stats)
 
+    def test_aggregate_stats_by_group_mean(self) -> None:
+        metric = _DummyMetric(_DummyMetricConfig("test"))
+        stats = SimpleMetricStats(
+            np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0], [9.0, 10.0]])
+        )
+        group_ids = np.array([1, 0, 1, -1, 0])
+        aggregate = metric.aggregate_stats_by_group(stats, group_ids, 3)
+        np.testing.assert_allclose(
+            aggregate, np.array([[6.0, 7.0], [3.0, 4.0], [0.0, 0.0]])
+        )
+
+    def test_aggregate_stats_by_group_sum(self) -> None:
+        metric = _DummyMetric(
+            _DummyMetricConfig("test", aggregate_type=AggregateType.SUM)
+        )
+        stats = SimpleMetricStats(np.array([1.0, 2.0, 3.0, 4.0, 5.0]))
+        group_ids = np.array([1, 0, 1, -1, 0])
+        aggregate = metric.aggregate_stats_by_group(stats, group_ids, 2)
+        np.testing.assert_allclose(aggregate, np.array([[7.0], [4.0]]))
+
+    def test_aggregate_stats_by_group_invalid(self) -> None:
+        metric = _DummyMetric(
+            _DummyMetricConfig("test", aggregate_type=AggregateType.CUSTOM)
+        )
+        stats = SimpleMetricStats(np.array([1.0, 2.0, 3.0]))
+        with self.assertRaisesRegex(ValueError, r"grouped aggregation"):
+            metric.aggregate_stats_by_group(stats, np.array([0, 0, 1]), 2)
+        metric = _DummyMetric(_DummyMetricConfig("test"))
+        with self.assertRaisesRegex(ValueError, r"^Invalid shape of group_ids"):
+            metric.aggregate_stats_by_group(stats, np.array([0, 1]), 2)
+        with self.assertRaisesRegex(ValueError, r"^Group ID out of range: 2$"):
+            metric.aggregate_stats_by_group(stats, np.array([0, 1, 2]), 2)
+
     def test_calc_metric_from_aggregate_0dim(self) -> None:
         metric = _DummyMetric(_DummyMetricConfig("test"))
         aggregate = np.array(3.0)
@@ -351,6 +439,45 @@ class MetricTest(unittest.TestCase):
         self.assertAlmostEqual(ci[0], 2.166666666666666)
         self.assertAlmostEqual(ci[1], 4.833333333333333)
 
+    def test_calc_confidence_interval_bootstrap_weighted_matches_gather(self) -> None:
+        def sum_fn(stats: MetricStats) -> np.ndarray[Any, Any]:
+            data = stats.get_batch_data() if stats.is_batched() else stats.get_data()
+            return np.sum(data, axis=-2)
+
+        data = np.random.default_rng(0).random((100, 1))
+        for aggregate_type, agg_fn in (
+            (AggregateType.MEAN, None),
+            (AggregateType.SUM, sum_fn),
+        ):
+            weighted, gather = (
+                _DummyMetric(
+                    _DummyMetricConfig(
+                        "test",
+                        is_simple_average=False,
+                        aggregate_stats_fn=agg_fn,
+                        aggregate_type=t,
+                    ),
+                    seed=np.random.SeedSequence(12345),
+                )
+                for t in (aggregate_type, AggregateType.CUSTOM)
+            )
+            stats = SimpleMetricStats(data)
+            ci_weighted = unwrap(weighted.calc_confidence_interval(stats, 0.05))
+            ci_gather = unwrap(gather.calc_confidence_interval(stats, 0.05))
+            self.assertAlmostEqual(ci_weighted[0], ci_gather[0])
+            self.assertAlmostEqual(ci_weighted[1], ci_gather[1])
+
+    @unittest.mock.patch("explainaboard.metrics.metric._BOOTSTRAP_CHUNK_ELEMENTS", 7)
+    def test_calc_confidence_interval_bootstrap_weighted_chunked(self) -> None:
+        metric = _DummyMetric(
+            _DummyMetricConfig("test", is_simple_average=False),
+            seed=np.random.SeedSequence(12345),
+        )
+        stats = SimpleMetricStats(np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]))
+        ci = unwrap(metric.calc_confidence_interval(stats, 0.05))
+        self.assertAlmostEqual(ci[0], 2.166666666666666)
+        self.assertAlmostEqual(ci[1], 4.833333333333333)
+
     def test_calc_confidence_interval_bootstrap_multi_agg(self) -> None:
         metric = _DummyMetric(
             _DummyMetricConfig("test", is_simple_average=False),
@@ -424,6 +551,55 @@ class MetricTest(unittest.TestCase):
         self.assertAlmostEqual(ci.low, 1.8)
         self.assertAlmostEqual(ci.high, 4.2)
 
+    def test_evaluate_groups_from_stats(self) -> None:
+        stats = SimpleMetricStats(
+            np.array([float(x % 7) for x in range(50)] + [4.0, 2.0, 8.0])
+        )
+        group_ids = np.array([x % 3 for x in range(50)] + [3, -1, 3])
+        for is_simple_average in (True, False):
+            for aggregate_type in AggregateType:
+                metric = _DummyMetric(
+                    _DummyMetricConfig(
+                        "test",
+                        is_simple_average=is_simple_average,
+                        aggregate_stats_fn=(
+                            _sum_stats if aggregate_type == AggregateType.SUM else None
+                        ),
+                        aggregate_type=aggregate_type,
+                    )
+                )
+                plan = ResamplePlan(np.random.SeedSequence(12345))
+                results = metric.evaluate_groups_from_stats(
+                    stats, group_ids, 5, confidence_alpha=0.05, resample_plan=plan
+                )
+                self.assertEqual(len(results), 5)
+                for i, result in enumerate(results):
+                    expected = metric.evaluate_from_stats(
+                        stats.filter(np.flatnonzero(group_ids == i)),
+                        confidence_alpha=0.05,
+                        resample_plan=plan,
+                    )
+                    self.assertAlmostEqual(
+                        result.get_value(Score, "score").value,
+                        expected.get_value(Score, "score").value,
+                    )
+                    ci = result.get_value_or_none(ConfidenceInterval, "score_ci")
+                    expected_ci = expected.get_value_or_none(
+                        ConfidenceInterval, "score_ci"
+                    )
+                    if expected_ci is None:
+                        self.assertIsNone(ci)
+                    else:
+                        self.assertAlmostEqual(unwrap(ci).low, expected_ci.low)
+                        self.assertAlmostEqual(unwrap(ci).high, expected_ci.high)
+
+    def test_evaluate_groups_from_stats_without_ci(self) -> None:
+        metric = _DummyMetric(_DummyMetricConfig("test"))
+        stats = SimpleMetricStats(np.array([1.0, 2.0, 3.0, 4.0]))
+        results = metric.evaluate_groups_from_stats(stats, np.array([0, 1, 0, 1]), 2)
+        self.assertEqual(results[0], MetricResult({"score": Score(2.0)}))
+        self.assertEqual(results[1], MetricResult({"score": Score(3.0)}))
+
     def test_evaluate_from_stats_bootstrap_single_data(self) -> None:
         metric = _DummyMetric(_DummyMetricConfig("test", is_simple_average=False))
         stats = SimpleMetricStats(np.array([3.0]))
@@ -20,6 +20,7 @@ from explainaboard.serialization import common_registry
 from explainaboard.third_party.text_to_sql_test_suit_eval.evaluation import (
     evaluate as sql_evaluate,
 )
+from explainaboard.third_party.text_to_sql_test_suit_eval.exec_eval import TIMEOUT
 
 
 @dataclass
@@ -80,11 +81,14 @@ class SQLExecutionConfig(MetricConfig):
     Args:
         db_dir: the path to database folder.
         table_path: the path to table schema file.
-        etype: the evaluation type, "match" or "exec".
+        timeout: the time limit in seconds for executing each query.
+        num_workers: the number of processes to execute the queries.
     """
 
     db_dir: str = ""
     table_path: str = ""
+    timeout: float = TIMEOUT
+    num_workers: int = 1
 
     def to_metric(self):
         """See MetricConfig.to_metric."""
@@ -114,6 +118,8 @@ class SQLExecution(Metric):
             "db_dir": config.db_dir,
             "table_path": config.table_path,
             "etype": "exec",
+            "timeout": config.timeout,
+            "num_workers": config.num_workers,
         }
 
         ex_list = sql_evaluate(true_data, pred_data, config_dict)
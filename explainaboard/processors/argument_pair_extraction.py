@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import Any, cast
 
 from explainaboard import TaskType
 from explainaboard.analysis import feature
 from explainaboard.analysis.analyses import Analysis, AnalysisLevel
-from explainaboard.analysis.case import AnalysisCase, AnalysisCaseLabeledArgumentPair
+from explainaboard.analysis.case import (
+    AnalysisCaseLabeledArgumentPair,
+    AnalysisCaseTable,
+)
 from explainaboard.analysis.feature import FeatureType
 from explainaboard.analysis.feature_funcs import accumulate_vocab_from_samples
 from explainaboard.info import SysOutputInfo
 from explainaboard.metrics.f1_score import APEF1ScoreConfig, F1ScoreConfig
 from explainaboard.metrics.metric import MetricConfig, MetricStats
 from explainaboard.processors.processor import Processor
-from explainaboard.utils.logging import progress
 from explainaboard.utils.span_utils import ArgumentPair, ArgumentPairOps
 from explainaboard.utils.typing_utils import unwrap
 
@@ -154,6 +156,7 @@ class ArgumentPairExtractionProcessor(Processor):
             samples,
             lambda x: " ".join(x["sentences"]),
             unwrap(sys_info.source_tokenizer),
+            num_workers=self._num_workers,
         )
 
         return {"vocab": vocab, "vocab_rank": vocab_rank}
@@ -161,74 +164,83 @@ class ArgumentPairExtractionProcessor(Processor):
     def _gen_cases_and_stats(
         self,
         sys_info: SysOutputInfo,
-        sys_output: list[dict],
+        sys_output: Sequence[dict],
         statistics: Any,
         analysis_level: AnalysisLevel,
-    ) -> tuple[list[AnalysisCase], dict[str, MetricStats]]:
+    ) -> tuple[AnalysisCaseTable, dict[str, MetricStats]]:
         if analysis_level.name == "example":
             return super()._gen_cases_and_stats(
                 sys_info, sys_output, statistics, analysis_level
             )
         elif analysis_level.name != "block":
             raise ValueError(f"{analysis_level.name}-level analysis not supported")
+
         # Do block-level analysis. `AnalysisCaseLabeledBlock` typing is necessary
         # otherwise an error will happen later when using `x.true_label`
-        cases: list[AnalysisCaseLabeledArgumentPair] = []
         # Calculate features
-        for i, output in progress(
-            enumerate(sys_output), desc="calculating span-level features"
-        ):
-            # get the spans from each sentence
-            sentences = output["sentences"]
-            true_spans, pred_spans = self._argument_pair_ops.get_argument_pairs(
-                output["true_tags"], output["pred_tags"], sentences
-            )
-            true_spans = cast(list[ArgumentPair], true_spans)
-            pred_spans = cast(list[ArgumentPair], pred_spans)
-            # merge the spans together
-            merged_spans: dict[tuple[int, int, int, int], ArgumentPair] = {}
-            for span in true_spans:
-                span.block_tag = f"{span.block_tag} {self._DEFAULT_TAG}"
-                merged_spans[unwrap(span.block_pos)] = span
-            for span in pred_spans:
-                merged_span = merged_spans.get(unwrap(span.block_pos))
-                if not merged_span:
-                    span.block_tag = f"{self._DEFAULT_TAG} {span.block_tag}"
-                    merged_spans[unwrap(span.block_pos)] = span
-                else:
-                    true_tag, _ = unwrap(merged_span.block_tag).split(" ")
-                    merged_span.block_tag = f"{true_tag} {span.block_tag}"
-            # analysis cases
-            for ms in merged_spans.values():
-                true_tag, pred_tag = unwrap(ms.block_tag).split(" ")
-                case = AnalysisCaseLabeledArgumentPair(
-                    sample_id=i,
-                    features={},
-                    text=unwrap(ms.block_text),
-                    true_label=true_tag,
-                    predicted_label=pred_tag,
-                    block_review_sentences=unwrap(ms.block_review_sentences),
-                    block_review_tokens=unwrap(ms.block_review_tokens),
-                    block_review_position=unwrap(ms.block_review_position),
-                    block_reply_sentences=unwrap(ms.block_reply_sentences),
-                    block_reply_tokens=unwrap(ms.block_reply_tokens),
-                    block_reply_position=unwrap(ms.block_reply_position),
-                    orig_str="source",
+        def gen_chunk_cases(
+            begin: int, outputs: list[dict]
+        ) -> list[AnalysisCaseLabeledArgumentPair]:
+            chunk_cases: list[AnalysisCaseLabeledArgumentPair] = []
+            for i, output in enumerate(outputs, begin):
+                # get the spans from each sentence
+                sentences = output["sentences"]
+                true_spans, pred_spans = self._argument_pair_ops.get_argument_pairs(
+                    output["true_tags"], output["pred_tags"], sentences
                 )
-                for feat_name, feat_spec in analysis_level.features.items():
-                    if feat_spec.func is None:
-                        raise ValueError(
-                            f"could not find feature function for {feat_name}"
-                        )
-                    elif not feat_spec.require_training_set:
-                        case.features[feat_name] = feat_spec.func(
-                            sys_info, output, case
-                        )
-                    elif statistics is not None:
-                        case.features[feat_name] = feat_spec.func(
-                            sys_info, output, case, statistics
-                        )
-                cases.append(case)
+                true_spans = cast(list[ArgumentPair], true_spans)
+                pred_spans = cast(list[ArgumentPair], pred_spans)
+                # merge the spans together
+                merged_spans: dict[tuple[int, int, int, int], ArgumentPair] = {}
+                for span in true_spans:
+                    span.block_tag = f"{span.block_tag} {self._DEFAULT_TAG}"
+                    merged_spans[unwrap(span.block_pos)] = span
+                for span in pred_spans:
+                    merged_span = merged_spans.get(unwrap(span.block_pos))
+                    if not merged_span:
+                        span.block_tag = f"{self._DEFAULT_TAG} {span.block_tag}"
+                        merged_spans[unwrap(span.block_pos)] = span
+                    else:
+                        true_tag, _ = unwrap(merged_span.block_tag).split(" ")
+                        merged_span.block_tag = f"{true_tag} {span.block_tag}"
+                # analysis cases
+                for ms in merged_spans.values():
+                    true_tag, pred_tag = unwrap(ms.block_tag).split(" ")
+                    case = AnalysisCaseLabeledArgumentPair(
+                        sample_id=i,
+                        features={},
+                        text=unwrap(ms.block_text),
+                        true_label=true_tag,
+                        predicted_label=pred_tag,
+                        block_review_sentences=unwrap(ms.block_review_sentences),
+                        block_review_tokens=unwrap(ms.block_review_tokens),
+                        block_review_position=unwrap(ms.block_review_position),
+                        block_reply_sentences=unwrap(ms.block_reply_sentences),
+                        block_reply_tokens=unwrap(ms.block_reply_tokens),
+                        block_reply_position=unwrap(ms.block_reply_position),
+                        orig_str="source",
+                    )
+                    for feat_name, feat_spec in analysis_level.features.items():
+                        if feat_spec.func is None:
+                            raise ValueError(
+                                f"could not find feature function for {feat_name}"
+                            )
+                        elif not feat_spec.require_training_set:
+                            case.features[feat_name] = feat_spec.func(
+                                sys_info, output, case
+                            )
+                        elif statistics is not None:
+                            case.features[feat_name] = feat_spec.func(
+                                sys_info, output, case, statistics
+                            )
+                    chunk_cases.append(case)
+            return chunk_cases
+
+        cases: list[AnalysisCaseLabeledArgumentPair] = list(
+            self._map_output_chunks(
+                gen_chunk_cases, sys_output, "calculating block-level features"
+            )
+        )
 
         # calculate metric stats
         true_data = [x.true_label for x in cases]
@@ -238,4 +250,4 @@ class ArgumentPairExtractionProcessor(Processor):
             for name, config in analysis_level.metric_configs.items()
         }
 
-        return cast(list[AnalysisCase], cases), metric_stats
+        return AnalysisCaseTable.from_cases(cases), metric_stats
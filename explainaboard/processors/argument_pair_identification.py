@@ -21,6 +21,7 @@ from explainaboard.metrics.accuracy import AccuracyConfig
 from explainaboard.metrics.metric import MetricConfig
 from explainaboard.processors.processor import Processor
 from explainaboard.utils.logging import progress
+from explainaboard.utils.tokenizer import tokenize_stream
 from explainaboard.utils.typing_utils import unwrap
 
 
@@ -114,10 +115,10 @@ class ArgumentPairIdentificationProcessor(Processor):
         length_counts: Counter = Counter()
 
         total_samps = 0
-        tokenizer = unwrap(sys_info.source_tokenizer)
-        for sample in progress(samples):
-            text = sample["context"]
-            tokens = tokenizer(text)
+        texts = (sample["context"] for sample in progress(samples))
+        for tokens in tokenize_stream(
+            unwrap(sys_info.source_tokenizer), texts, num_workers=self._num_workers
+        ):
             length = len(tokens)
 
             length_counts[length] += 1
@@ -129,7 +129,10 @@ class ClozeGenerativeProcessor(Processor):
 
     def _statistics_func(self, samples: Iterable[Any], sys_info: SysOutputInfo):
         source_vocab, source_vocab_rank = accumulate_vocab_from_samples(
-            samples, lambda x: x["context"], unwrap(sys_info.source_tokenizer)
+            samples,
+            lambda x: x["context"],
+            unwrap(sys_info.source_tokenizer),
+            num_workers=self._num_workers,
         )
 
         return {"source_vocab": source_vocab, "source_vocab_rank": source_vocab_rank}
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Any, cast
 
 import numpy as np
@@ -15,6 +15,7 @@ from explainaboard.analysis.case import (
     AnalysisCase,
     AnalysisCaseMultiSpan,
     AnalysisCaseSpan,
+    AnalysisCaseTable,
 )
 from explainaboard.analysis.feature import FeatureType
 from explainaboard.analysis.feature_funcs import (
@@ -26,8 +27,10 @@ from explainaboard.analysis.feature_funcs import (
 )
 from explainaboard.info import SysOutputInfo
 from explainaboard.metrics.eaas import (
+    DeferredEaaSRequest,
     EaaSMetricConfig,
     EaaSMetricStats,
+    EaaSRequest,
     get_eaas_client,
 )
 from explainaboard.metrics.external_eval import ExternalEvalConfig
@@ -38,7 +41,6 @@ from explainaboard.utils.language_utils import (
     is_chinese_lang_code,
     is_japanese_lang_code,
 )
-from explainaboard.utils.logging import progress
 from explainaboard.utils.tokenizer import SacreBleuTokenizer, Tokenizer, TokenSeq
 from explainaboard.utils.typing_utils import unwrap
 
@@ -298,11 +300,10 @@ class ConditionalGenerationProcessor(Processor):
     def _gen_cases_and_stats(
         self,
         sys_info: SysOutputInfo,
-        sys_output: list[dict],
+        sys_output: Sequence[dict],
         statistics: Any,
         analysis_level: AnalysisLevel,
-    ) -> tuple[list[AnalysisCase], dict[str, MetricStats]]:
-        cases: list[AnalysisCase] = []
+    ) -> tuple[AnalysisCaseTable, dict[str, MetricStats]]:
         if analysis_level.name == "example":
             # Note that this is over-ridden to accommodate efficient calculation of
             # EaaS-style metrics
@@ -329,10 +330,20 @@ class ConditionalGenerationProcessor(Processor):
                 else:
                     metric_configs_noneaas[metric_name] = metric_config
 
-            async_request = get_eaas_client().async_score(
-                inputs,
-                metrics=metric_names_eaas,
-                calculate=["corpus", "stats"],
+            def queue_request() -> EaaSRequest:
+                return get_eaas_client().async_score(
+                    inputs,
+                    metrics=metric_names_eaas,
+                    calculate=["corpus", "stats"],
+                )
+
+            # The threads sending the request must not be running while features
+            # are calculated by forked processes, so the request is then deferred
+            # until the statistics are used, after the features of all levels.
+            async_request: EaaSRequest = (
+                DeferredEaaSRequest(queue_request)
+                if self._num_workers > 1
+                else queue_request()
             )
 
             metric_stats: dict[str, MetricStats] = {
@@ -347,13 +358,19 @@ class ConditionalGenerationProcessor(Processor):
                 ] = metric_config.to_metric().calc_stats_from_data(true_data, pred_data)
 
             # Calculate features
-            for i, output in progress(
-                enumerate(sys_output), desc="calculating example-level features"
-            ):
-                case = AnalysisCase(sample_id=i, features={})
+            cases = self._gen_example_cases(
+                sys_info, sys_output, statistics, analysis_level
+            )
+        elif analysis_level.name == "token":
+            stats_list: list[list[float]] = []
+
+            def add_features(case: AnalysisCase) -> AnalysisCase:
+                output = sys_output[case.sample_id]
                 for feat_name, feat_spec in analysis_level.features.items():
                     if feat_spec.func is None:
-                        case.features[feat_name] = output[feat_name]
+                        raise ValueError(
+                            f"could not find feature function for {feat_name}"
+                        )
                     elif not feat_spec.require_training_set:
                         case.features[feat_name] = feat_spec.func(
                             sys_info, output, case
@@ -362,78 +379,74 @@ class ConditionalGenerationProcessor(Processor):
                         case.features[feat_name] = feat_spec.func(
                             sys_info, output, case, statistics
                         )
-                cases.append(case)
-        elif analysis_level.name == "token":
+                return case
+
             # Calculate features
-            for i, output in progress(
-                enumerate(sys_output), desc="calculating token-level features"
-            ):
-                # span features for true and predicted spans
-                ref_toks = unwrap(sys_info.target_tokenizer)(output["reference"])
-                hyp_toks = unwrap(sys_info.target_tokenizer)(output["hypothesis"])
-                ref_feats = self._match_toks(ref_toks, hyp_toks)
-                hyp_feats = self._match_toks(hyp_toks, ref_toks)
-                # Get reference-only, hypothesis-only, and matched spans
-                for ref_id, ref_info in enumerate(ref_feats):
-                    ref_span = AnalysisCaseSpan(
-                        sample_id=i,
-                        token_span=ref_info["tok_pos"],
-                        char_span=ref_info["tok_char_pos"],
-                        orig_str="reference",
-                        text=ref_info["tok_text"],
-                        features={},
-                    )
-                    if ref_info["tok_matched"] < 0:
-                        cases.append(ref_span)
-                    else:
-                        hyp_info = hyp_feats[ref_info["tok_matched"]]
-                        hyp_span = AnalysisCaseSpan(
-                            sample_id=i,
-                            token_span=hyp_info["tok_pos"],
-                            char_span=hyp_info["tok_char_pos"],
-                            orig_str="hypothesis",
-                            text=hyp_info["tok_text"],
-                            features={},
-                        )
-                        both_span = AnalysisCaseMultiSpan(
+            def gen_chunk_cases(begin: int, outputs: list[dict]) -> list[AnalysisCase]:
+                chunk_cases: list[AnalysisCase] = []
+                for i, output in enumerate(outputs, begin):
+                    # span features for true and predicted spans
+                    tokenizer = unwrap(sys_info.target_tokenizer)
+                    cache = sys_info.tokenization_cache
+                    ref_toks = cache.tokenize(tokenizer, output["reference"])
+                    hyp_toks = cache.tokenize(tokenizer, output["hypothesis"])
+                    ref_feats = self._match_toks(ref_toks, hyp_toks)
+                    hyp_feats = self._match_toks(hyp_toks, ref_toks)
+                    # Get reference-only, hypothesis-only, and matched spans
+                    for ref_id, ref_info in enumerate(ref_feats):
+                        ref_span = AnalysisCaseSpan(
                             sample_id=i,
-                            spans=[ref_span, hyp_span],
-                            features={},
-                        )
-                        cases.append(both_span)
-                for hyp_id, hyp_info in enumerate(hyp_feats):
-                    if hyp_info["tok_matched"] < 0:
-                        hyp_span = AnalysisCaseSpan(
-                            sample_id=i,
-                            token_span=hyp_info["tok_pos"],
-                            char_span=hyp_info["tok_char_pos"],
+                            token_span=ref_info["tok_pos"],
+                            char_span=ref_info["tok_char_pos"],
                             orig_str="reference",
-                            text=hyp_info["tok_text"],
+                            text=ref_info["tok_text"],
                             features={},
                         )
-                        cases.append(hyp_span)
-            stats_list = []
-            for case in cases:
-                for feat_name, feat_spec in analysis_level.features.items():
-                    if feat_spec.func is None:
-                        raise ValueError(
-                            f"could not find feature function for {feat_name}"
-                        )
-                    elif not feat_spec.require_training_set:
-                        case.features[feat_name] = feat_spec.func(
-                            sys_info, sys_output[case.sample_id], case
-                        )
-                    elif statistics is not None:
-                        case.features[feat_name] = feat_spec.func(
-                            sys_info, sys_output[case.sample_id], case, statistics
-                        )
-                # Both ref and hyp exist, so matched
-                if isinstance(case, AnalysisCaseMultiSpan):
-                    stats_list.append([1.0, 1.0, 1.0])
-                elif cast(AnalysisCaseSpan, case).orig_str == "reference":
-                    stats_list.append([1.0, 0.0, 0.0])
-                else:
-                    stats_list.append([0.0, 1.0, 0.0])
+                        if ref_info["tok_matched"] < 0:
+                            chunk_cases.append(add_features(ref_span))
+                        else:
+                            hyp_info = hyp_feats[ref_info["tok_matched"]]
+                            hyp_span = AnalysisCaseSpan(
+                                sample_id=i,
+                                token_span=hyp_info["tok_pos"],
+                                char_span=hyp_info["tok_char_pos"],
+                                orig_str="hypothesis",
+                                text=hyp_info["tok_text"],
+                                features={},
+                            )
+                            both_span = AnalysisCaseMultiSpan(
+                                sample_id=i,
+                                spans=[ref_span, hyp_span],
+                                features={},
+                            )
+                            chunk_cases.append(add_features(both_span))
+                    for hyp_id, hyp_info in enumerate(hyp_feats):
+                        if hyp_info["tok_matched"] < 0:
+                            hyp_span = AnalysisCaseSpan(
+                                sample_id=i,
+                                token_span=hyp_info["tok_pos"],
+                                char_span=hyp_info["tok_char_pos"],
+                                orig_str="reference",
+                                text=hyp_info["tok_text"],
+                                features={},
+                            )
+                            chunk_cases.append(add_features(hyp_span))
+                return chunk_cases
+
+            def gen_token_cases() -> Iterator[AnalysisCase]:
+                for case in self._map_output_chunks(
+                    gen_chunk_cases, sys_output, "calculating token-level features"
+                ):
+                    # Both ref and hyp exist, so matched
+                    if isinstance(case, AnalysisCaseMultiSpan):
+                        stats_list.append([1.0, 1.0, 1.0])
+                    elif cast(AnalysisCaseSpan, case).orig_str == "reference":
+                        stats_list.append([1.0, 0.0, 0.0])
+                    else:
+                        stats_list.append([0.0, 1.0, 0.0])
+                    yield case
+
+            cases = AnalysisCaseTable.from_cases(gen_token_cases())
             metric_stats = {"F1": SimpleMetricStats(np.array(stats_list))}
         else:
             raise ValueError(f"{analysis_level.name}-level analysis not supported")
@@ -468,11 +481,17 @@ class ConditionalGenerationProcessor(Processor):
     def _statistics_func(self, samples: Iterable[Any], sys_info: SysOutputInfo):
         samples_list = list(samples)
         source_vocab, source_vocab_rank = accumulate_vocab_from_samples(
-            samples_list, lambda x: x["source"], unwrap(sys_info.source_tokenizer)
+            samples_list,
+            lambda x: x["source"],
+            unwrap(sys_info.source_tokenizer),
+            num_workers=self._num_workers,
         )
 
         target_vocab, target_vocab_rank = accumulate_vocab_from_samples(
-            samples_list, lambda x: x["reference"], unwrap(sys_info.target_tokenizer)
+            samples_list,
+            lambda x: x["reference"],
+            unwrap(sys_info.target_tokenizer),
+            num_workers=self._num_workers,
         )
         return {
             "source_vocab": source_vocab,
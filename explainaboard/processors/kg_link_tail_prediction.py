@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 import json
 from typing import Any
 
 from explainaboard import TaskType
 from explainaboard.analysis import feature
 from explainaboard.analysis.analyses import Analysis, AnalysisLevel, BucketAnalysis
-from explainaboard.analysis.case import AnalysisCase
+from explainaboard.analysis.case import AnalysisCaseTable
 from explainaboard.analysis.feature_funcs import count_tokens
 from explainaboard.info import SysOutputInfo
 from explainaboard.metrics.metric import MetricConfig, MetricStats
@@ -192,12 +192,11 @@ class KGLinkTailPredictionProcessor(Processor):
     def _gen_cases_and_stats(
         self,
         sys_info: SysOutputInfo,
-        sys_output: list[dict],
+        sys_output: Sequence[dict],
         statistics: Any,
         analysis_level: AnalysisLevel,
-    ) -> tuple[list[AnalysisCase], dict[str, MetricStats]]:
+    ) -> tuple[AnalysisCaseTable, dict[str, MetricStats]]:
         # Note that this is overridden to calculate stats from rank
-        cases = []
         true_data = [self._get_true_label(x) for x in sys_output]
         pred_data = [self._get_predicted_label(x) for x in sys_output]
         rank_data = [narrow(int, x.get("true_rank")) for x in sys_output]
@@ -215,20 +214,9 @@ class KGLinkTailPredictionProcessor(Processor):
                 metric_stats[name] = metric.calc_stats_from_data(true_data, pred_data)
 
         # Calculate features
-        for i, output in progress(
-            enumerate(sys_output), desc="calculating example-level features"
-        ):
-            case = AnalysisCase(sample_id=i, features={})
-            for feat_name, feat_spec in analysis_level.features.items():
-                if feat_spec.func is None:
-                    case.features[feat_name] = output[feat_name]
-                elif not feat_spec.require_training_set:
-                    case.features[feat_name] = feat_spec.func(sys_info, output, case)
-                elif statistics is not None:
-                    case.features[feat_name] = feat_spec.func(
-                        sys_info, output, case, statistics
-                    )
-            cases.append(case)
+        cases = self._gen_example_cases(
+            sys_info, sys_output, statistics, analysis_level
+        )
         return cases, metric_stats
 
     # --- Feature functions accessible by ExplainaboardBuilder._get_feature_func()
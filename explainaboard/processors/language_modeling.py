@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 import numpy as np
@@ -10,7 +10,11 @@ import numpy as np
 from explainaboard import TaskType
 from explainaboard.analysis import feature
 from explainaboard.analysis.analyses import Analysis, AnalysisLevel, BucketAnalysis
-from explainaboard.analysis.case import AnalysisCase, AnalysisCaseSpan
+from explainaboard.analysis.case import (
+    AnalysisCase,
+    AnalysisCaseSpan,
+    AnalysisCaseTable,
+)
 from explainaboard.analysis.feature import DataType, FeatureType, Value
 from explainaboard.analysis.feature_funcs import (
     cap_feature,
@@ -24,6 +28,7 @@ from explainaboard.metrics.log_prob import LogProbConfig
 from explainaboard.metrics.metric import MetricConfig, MetricStats, SimpleMetricStats
 from explainaboard.processors.processor import Processor
 from explainaboard.utils.logging import progress
+from explainaboard.utils.tokenizer import tokenize_stream
 from explainaboard.utils.typing_utils import unwrap
 
 
@@ -156,50 +161,57 @@ class LanguageModelingProcessor(Processor):
     def _gen_cases_and_stats(
         self,
         sys_info: SysOutputInfo,
-        sys_output: list[dict],
+        sys_output: Sequence[dict],
         statistics: Any,
         analysis_level: AnalysisLevel,
-    ) -> tuple[list[AnalysisCase], dict[str, MetricStats]]:
+    ) -> tuple[AnalysisCaseTable, dict[str, MetricStats]]:
         if analysis_level.name == "example":
             return super()._gen_cases_and_stats(
                 sys_info, sys_output, statistics, analysis_level
             )
         elif analysis_level.name != "token":
             raise ValueError(f"{analysis_level.name}-level analysis not supported")
+
         # Do tok-level analysis
-        cases: list[AnalysisCase] = []
         # Calculate features
-        for i, output in progress(
-            enumerate(sys_output), desc="calculating tok-level features"
-        ):
-            # get the tokens and scores from each sentence
-            toks = output["text"].split(" ")
-            probs = [float(x) for x in output["log_probs"].split(" ")]
-            # analysis cases
-            curr_char = 0
-            for j, (tok, prob) in enumerate(zip(toks, probs)):
-                next_char = curr_char + len(tok)
-                case = AnalysisCaseSpan(
-                    sample_id=i,
-                    features={"tok_log_prob": prob},
-                    token_span=(j, j + 1),
-                    char_span=(curr_char, next_char),
-                    text=tok,
-                    orig_str="source",
-                )
-                curr_char = next_char + 1
-                for feat_name, feat_spec in analysis_level.features.items():
-                    if feat_spec.func is None:
-                        pass
-                    elif not feat_spec.require_training_set:
-                        case.features[feat_name] = feat_spec.func(
-                            sys_info, output, case
-                        )
-                    elif statistics is not None:
-                        case.features[feat_name] = feat_spec.func(
-                            sys_info, output, case, statistics
-                        )
-                cases.append(case)
+        def gen_chunk_cases(begin: int, outputs: list[dict]) -> list[AnalysisCase]:
+            chunk_cases: list[AnalysisCase] = []
+            for i, output in enumerate(outputs, begin):
+                # get the tokens and scores from each sentence
+                toks = output["text"].split(" ")
+                probs = [float(x) for x in output["log_probs"].split(" ")]
+                # analysis cases
+                curr_char = 0
+                for j, (tok, prob) in enumerate(zip(toks, probs)):
+                    next_char = curr_char + len(tok)
+                    case = AnalysisCaseSpan(
+                        sample_id=i,
+                        features={"tok_log_prob": prob},
+                        token_span=(j, j + 1),
+                        char_span=(curr_char, next_char),
+                        text=tok,
+                        orig_str="source",
+                    )
+                    curr_char = next_char + 1
+                    for feat_name, feat_spec in analysis_level.features.items():
+                        if feat_spec.func is None:
+                            pass
+                        elif not feat_spec.require_training_set:
+                            case.features[feat_name] = feat_spec.func(
+                                sys_info, output, case
+                            )
+                        elif statistics is not None:
+                            case.features[feat_name] = feat_spec.func(
+                                sys_info, output, case, statistics
+                            )
+                    chunk_cases.append(case)
+            return chunk_cases
+
+        cases: list[AnalysisCase] = list(
+            self._map_output_chunks(
+                gen_chunk_cases, sys_output, "calculating tok-level features"
+            )
+        )
         metric_stats: dict[str, MetricStats] = {
             "Perplexity": SimpleMetricStats(
                 np.array([x.features["tok_log_prob"] for x in cases])
@@ -208,7 +220,7 @@ class LanguageModelingProcessor(Processor):
                 np.array([x.features["tok_log_prob"] for x in cases])
             ),
         }
-        return cases, metric_stats
+        return AnalysisCaseTable.from_cases(cases), metric_stats
 
     @classmethod
     def default_metrics(
@@ -235,10 +247,10 @@ class LanguageModelingProcessor(Processor):
         vocab: dict[str, float] = {}
         length_fre: dict[int, float] = {}
         total_samps = 0
-        tokenizer = unwrap(sys_info.source_tokenizer)
-        for sample in progress(samples):
-            text = sample["text"]
-            tokens = tokenizer(text)
+        texts = (sample["text"] for sample in progress(samples))
+        for tokens in tokenize_stream(
+            unwrap(sys_info.source_tokenizer), texts, num_workers=self._num_workers
+        ):
             length = len(tokens)
 
             length_fre[length] = length_fre.get(length, 0.0) + 1.0
@@ -52,12 +52,14 @@ class MachineTranslationProcessor(ConditionalGenerationProcessor):
             samples_list,
             lambda x: x["source"],
             unwrap(sys_info.source_tokenizer),
+            num_workers=self._num_workers,
         )
 
         target_vocab, target_vocab_rank = accumulate_vocab_from_samples(
             samples_list,
             lambda x: x["reference"],
             unwrap(sys_info.target_tokenizer),
+            num_workers=self._num_workers,
         )
         return {
             "source_vocab": source_vocab,
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import abc
-from collections.abc import Iterable
-from typing import Any, cast, final, Optional
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+import math
+from typing import Any, cast, final, Optional, TypeVar
 
+import datalabs
 from eaas.async_client import AsyncClient
 from eaas.config import Config
+import numpy as np
 
 from explainaboard import TaskType
 from explainaboard.analysis.analyses import (
@@ -18,21 +21,147 @@ from explainaboard.analysis.analyses import (
     BucketAnalysisDetails,
     CalibrationAnalysis,
 )
-from explainaboard.analysis.case import AnalysisCase
+from explainaboard.analysis.case import AnalysisCase, AnalysisCaseTable
 from explainaboard.analysis.feature import DataType, FeatureType, Value
 from explainaboard.analysis.result import Result
-from explainaboard.info import OverallStatistics, SysOutputInfo
+from explainaboard.info import DatasetFeatures, OverallStatistics, SysOutputInfo
 from explainaboard.loaders import DatalabLoaderOption, get_loader_class
-from explainaboard.metrics.metric import MetricConfig, MetricResult, MetricStats, Score
+from explainaboard.loaders.columnar import ColumnarSamples
+from explainaboard.metrics.metric import (
+    MetricConfig,
+    MetricResult,
+    MetricStats,
+    ResamplePlan,
+    Score,
+)
 from explainaboard.serialization.serializers import PrimitiveSerializer
 from explainaboard.utils.cache_api import (
+    lock_statistics_cache,
     read_statistics_from_cache,
     write_statistics_to_cache,
 )
 from explainaboard.utils.logging import get_logger, progress
+from explainaboard.utils.parallel import fork_imap
 from explainaboard.utils.tokenizer import get_default_tokenizer, Tokenizer
 from explainaboard.utils.typing_utils import narrow, unwrap
 
+# The number of system outputs whose features are calculated at once.
+_FEATURE_BATCH_SIZE = 4096
+
+T = TypeVar("T")
+
+
+def _get_complete_column(sys_output: ColumnarSamples, name: str) -> list | None:
+    """Get the values of a field if every system output has it.
+
+    Args:
+        sys_output: The system output stored column by column.
+        name: The name of the field.
+
+    Returns:
+        The values of the field, or None if some outputs don't have it, which are
+        then reported in the same way as other system outputs.
+    """
+    column = sys_output.columns.get(name)
+    if column is None or any(x is None for x in column):
+        return None
+    return column
+
+
+def _get_feature_columns(
+    sys_output: ColumnarSamples, features: dict[str, FeatureType]
+) -> dict[str, list] | None:
+    """Get the values of features which are just copied from the system output.
+
+    Args:
+        sys_output: The system output stored column by column.
+        features: Specifications of the features.
+
+    Returns:
+        Mapping from the feature name to its values, None for outputs not having
+        optional features. None if some of the features need to be calculated, or
+        some outputs don't have a required feature.
+    """
+    columns: dict[str, list] = {}
+    for name, spec in features.items():
+        if spec.func is not None or spec.func_batch is not None:
+            return None
+        if spec.optional:
+            columns[name] = sys_output.get_column(name)
+        else:
+            column = _get_complete_column(sys_output, name)
+            if column is None:
+                return None
+            columns[name] = column
+    return columns
+
+
+class _OutputDependentError(Exception):
+    """Raised when a feature calculated from a dataset reads the system output."""
+
+
+class _DatasetView(dict):
+    """A dict whose given keys can't be read.
+
+    It detects features depending on the system output, by hiding the fields of the
+    output from the features calculated only from a dataset. Since any key may be
+    read by iterating over the dict, iteration is not allowed either.
+    """
+
+    def __init__(
+        self,
+        data: dict,
+        hidden_keys: Collection[str],
+        read_keys: set[str] | None = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            data: The visible items.
+            hidden_keys: The keys whose access raises `_OutputDependentError`.
+            read_keys: If given, the keys accessed through the dict are added to it.
+        """
+        super().__init__(data)
+        self._hidden_keys = hidden_keys
+        self._read_keys = read_keys
+
+    def _check(self, key: Any) -> None:
+        if key in self._hidden_keys:
+            raise _OutputDependentError(f"{key} depends on the system output.")
+        if self._read_keys is not None:
+            self._read_keys.add(key)
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get the item unless it is hidden."""
+        self._check(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key: Any) -> bool:
+        """Check the existence of the key unless it is hidden."""
+        self._check(key)
+        return super().__contains__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get the item unless it is hidden."""
+        self._check(key)
+        return super().get(key, default)
+
+    def __iter__(self) -> Iterator:
+        """Not allowed, as it would reveal the hidden keys."""
+        raise _OutputDependentError("Iteration may depend on the system output.")
+
+    def keys(self) -> Any:
+        """Not allowed, as it would reveal the hidden keys."""
+        raise _OutputDependentError("Iteration may depend on the system output.")
+
+    def values(self) -> Any:
+        """Not allowed, as it would reveal the hidden keys."""
+        raise _OutputDependentError("Iteration may depend on the system output.")
+
+    def items(self) -> Any:
+        """Not allowed, as it would reveal the hidden keys."""
+        raise _OutputDependentError("Iteration may depend on the system output.")
+
 
 class Processor(metaclass=abc.ABCMeta):
     """Base case for task-based processor."""
@@ -139,6 +268,15 @@ class Processor(metaclass=abc.ABCMeta):
         """Checks if a particular metric is valid for a particular task."""
         return True
 
+    @classmethod
+    def statistics_version(cls) -> int:
+        """Returns the version of `_statistics_func`.
+
+        Cached statistics calculated by other versions are not reused, so this must
+        be incremented whenever `_statistics_func` changes its results.
+        """
+        return 1
+
     def __init__(self) -> None:
         """Constructor."""
         # Things to use only if necessary
@@ -148,6 +286,10 @@ class Processor(metaclass=abc.ABCMeta):
         self._preprocessor = None
         # A limit on the number of samples stored for each bucket. Hard-coded for now
         self._bucket_sample_limit = 50
+        # The number of processes to calculate features with. Set by the metadata.
+        self._num_workers = 1
+        # Features shared with other systems evaluated on the same dataset.
+        self._dataset_features: DatasetFeatures | None = None
 
     def _get_statistics_resources(self, sys_info: SysOutputInfo) -> dict[str, Any]:
         """From a DataLab dataset split, get resources to calculate statistics."""
@@ -179,41 +321,73 @@ class Processor(metaclass=abc.ABCMeta):
                 if sys_info.sub_dataset_name == "default"
                 else sys_info.sub_dataset_name
             )
-            # read statistics from cache
-            if use_cache:
-                statistics = read_statistics_from_cache(
-                    sys_info.dataset_name, sub_dataset
-                )
-            if statistics is None:
-                dataset = None
-                try:
-                    loader = get_loader_class(self.task_type()).from_datalab(
-                        DatalabLoaderOption(
-                            sys_info.dataset_name, sub_dataset, split=split_name
-                        ),
-                        output_data=None,
-                    )
-                    dataset = loader.load()
-                except FileNotFoundError as e:
-                    get_logger().warning(
-                        f"{sys_info.dataset_name} could not be loaded by DataLab so"
-                        " no training set dependent features will be supported by"
-                        f" ExplainaBoard. Error: {e}"
-                    )
-                except ValueError as e:
-                    get_logger().warning(
-                        f"Data split `{split_name}` couldn't been found. Error: {e}"
-                    )
-                if dataset is not None:
-                    statistics = self._statistics_func(dataset.samples, sys_info)
-                    get_logger().info(
-                        f"caching stats for {sys_info.dataset_name} {sub_dataset}"
+            # Statistics depend on the task, the tokenizers and the dataset. DataLab
+            # loads the dataset scripts of its own version, which stands for the
+            # revision of the dataset.
+            serializer = PrimitiveSerializer()
+            stats_info = {
+                "task_name": self.task_type().value,
+                "statistics_version": self.statistics_version(),
+                "source_tokenizer": serializer.serialize(sys_info.source_tokenizer),
+                "target_tokenizer": serializer.serialize(sys_info.target_tokenizer),
+                "split": split_name,
+                "dataset_revision": datalabs.__version__,
+            }
+            # Other processes sharing the cache wait for the statistics calculated
+            # here instead of calculating them again.
+            with lock_statistics_cache(sys_info.dataset_name, sub_dataset, stats_info):
+                # read statistics from cache
+                if use_cache:
+                    statistics = read_statistics_from_cache(
+                        sys_info.dataset_name, sub_dataset, stats_info
                     )
-                    write_statistics_to_cache(
-                        statistics, sys_info.dataset_name, sub_dataset
+                if statistics is None:
+                    statistics = self._calculate_external_stats(
+                        sys_info, sub_dataset, split_name
                     )
+                    if statistics is not None:
+                        get_logger().info(
+                            f"caching stats for {sys_info.dataset_name} {sub_dataset}"
+                        )
+                        write_statistics_to_cache(
+                            statistics, sys_info.dataset_name, sub_dataset, stats_info
+                        )
         return statistics
 
+    def _calculate_external_stats(
+        self, sys_info: SysOutputInfo, sub_dataset: str | None, split_name: str
+    ) -> Any:
+        """Calculate statistics from a dataset split loaded from DataLab.
+
+        Args:
+            sys_info: Information about the system outputs
+            sub_dataset: The name of the sub-dataset.
+            split_name: The name of the split.
+
+        Returns:
+            The statistics, or None if the split could not be loaded.
+        """
+        dataset_name = unwrap(sys_info.dataset_name)
+        try:
+            loader = get_loader_class(self.task_type()).from_datalab(
+                DatalabLoaderOption(dataset_name, sub_dataset, split=split_name),
+                output_data=None,
+            )
+            dataset = loader.load()
+        except FileNotFoundError as e:
+            get_logger().warning(
+                f"{dataset_name} could not be loaded by DataLab so"
+                " no training set dependent features will be supported by"
+                f" ExplainaBoard. Error: {e}"
+            )
+            return None
+        except ValueError as e:
+            get_logger().warning(
+                f"Data split `{split_name}` couldn't been found. Error: {e}"
+            )
+            return None
+        return self._statistics_func(dataset.samples, sys_info)
+
     def _get_true_label(self, data_point: dict):
         """Get the true label from a data point.
 
@@ -240,6 +414,25 @@ class Processor(metaclass=abc.ABCMeta):
         """
         return data_point["predicted_label"]
 
+    @classmethod
+    def _label_field_names(cls) -> tuple[str, str] | None:
+        """Get the names of the fields holding the true and predicted labels.
+
+        If `_get_true_label` and `_get_predicted_label` just look up a field of a
+        data point, the labels of columnar system outputs are read from the columns
+        of these fields without creating any data point.
+
+        Returns:
+            The names of the fields of the true and predicted labels, or None if the
+            labels are obtained in other ways.
+        """
+        if (
+            cls._get_true_label is Processor._get_true_label
+            and cls._get_predicted_label is Processor._get_predicted_label
+        ):
+            return "true_label", "predicted_label"
+        return None
+
     def _customize_analyses(
         self,
         sys_info: SysOutputInfo,
@@ -302,9 +495,10 @@ class Processor(metaclass=abc.ABCMeta):
     def perform_analyses(
         self,
         sys_info: SysOutputInfo,
-        analysis_cases: list[list[AnalysisCase]],
+        analysis_cases: list[AnalysisCaseTable],
         metric_stats: list[dict[str, MetricStats]],
         skip_failed_analyses: bool = False,
+        resample_plans: list[ResamplePlan] | None = None,
     ) -> list[AnalysisResult]:
         """Perform fine-grained analyses.
 
@@ -314,6 +508,8 @@ class Processor(metaclass=abc.ABCMeta):
             metric_stats: The stats from which to calculate performance
             skip_failed_analyses: Whether to skip analyses when they encountered some
                 errors.
+            resample_plans: The bootstrap resamples shared within each analysis
+                level. If None, new plans are generated.
 
         Returns:
             a dictionary of feature name -> list of performances by bucket
@@ -324,13 +520,14 @@ class Processor(metaclass=abc.ABCMeta):
             {name: config.to_metric() for name, config in level.metric_configs.items()}
             for level in sys_info.analysis_levels
         ]
+        if resample_plans is None:
+            resample_plans = [ResamplePlan() for _ in sys_info.analysis_levels]
         for my_analysis in progress(sys_info.analyses):
             level_id = level_map[my_analysis.level]
             try:
-                if (
-                    isinstance(my_analysis, CalibrationAnalysis)
-                    and my_analysis.feature not in analysis_cases[level_id][0].features
-                ):
+                if isinstance(my_analysis, CalibrationAnalysis) and not analysis_cases[
+                    level_id
+                ].has_feature(my_analysis.feature):
                     continue
 
                 all_results.append(
@@ -339,6 +536,7 @@ class Processor(metaclass=abc.ABCMeta):
                         metrics=metrics[level_id],
                         stats=metric_stats[level_id],
                         confidence_alpha=sys_info.confidence_alpha,
+                        resample_plan=resample_plans[level_id],
                     )
                 )
             except Exception as ex:
@@ -348,13 +546,196 @@ class Processor(metaclass=abc.ABCMeta):
 
         return all_results
 
+    @final
+    def _calc_features(
+        self,
+        sys_info: SysOutputInfo,
+        outputs: list[dict],
+        cases: list[AnalysisCase],
+        features: dict[str, FeatureType],
+        statistics: Any,
+        dataset_features: DatasetFeatures | None = None,
+    ) -> None:
+        """Calculates features of analysis cases in-place.
+
+        Features are calculated in the order of `features`, so that each feature can
+        refer to the features listed before it. Features with `func_batch` are
+        calculated over all cases at once. Consecutive features without it are
+        calculated case by case, which keeps the per-text caches of the functions
+        effective.
+
+        Args:
+            sys_info: Information about the system output.
+            outputs: The system output corresponding to each case.
+            cases: The cases to which the features are added.
+            features: Specifications of the features to calculate.
+            statistics: Statistics of the training set, or None if unavailable.
+            dataset_features: Example-level features calculated beforehand from the
+                dataset, which are copied to the cases by their `sample_id`.
+        """
+        per_case_features: list[tuple[str, FeatureType]] = []
+        shared_names: Collection[str] = (
+            dataset_features.example_feature_names
+            if dataset_features is not None
+            else ()
+        )
+
+        def calc_per_case_features() -> None:
+            for output, case in zip(outputs, cases):
+                for feat_name, feat_spec in per_case_features:
+                    if feat_name in shared_names:
+                        shared = unwrap(dataset_features).example_features[
+                            case.sample_id
+                        ]
+                        if feat_name in shared:
+                            case.features[feat_name] = shared[feat_name]
+                        continue
+                    if feat_name not in output and feat_spec.optional:
+                        continue
+                    if feat_spec.func is None:
+                        case.features[feat_name] = output[feat_name]
+                    elif not feat_spec.require_training_set:
+                        case.features[feat_name] = feat_spec.func(
+                            sys_info, output, case
+                        )
+                    elif statistics is not None:
+                        case.features[feat_name] = feat_spec.func(
+                            sys_info, output, case, statistics
+                        )
+            per_case_features.clear()
+
+        for feat_name, feat_spec in features.items():
+            func_batch = feat_spec.func_batch
+            if func_batch is None or feat_name in shared_names:
+                per_case_features.append((feat_name, feat_spec))
+                continue
+
+            calc_per_case_features()
+            if feat_spec.require_training_set and statistics is None:
+                continue
+
+            if feat_spec.optional:
+                ids = [i for i, output in enumerate(outputs) if feat_name in output]
+                my_outputs = [outputs[i] for i in ids]
+                my_cases = [cases[i] for i in ids]
+            else:
+                my_outputs, my_cases = outputs, cases
+
+            args = (statistics,) if feat_spec.require_training_set else ()
+            values = func_batch(sys_info, my_outputs, my_cases, *args)
+            if len(values) != len(my_cases):
+                raise ValueError(
+                    f"func_batch of feature {feat_name} returned {len(values)} "
+                    f"values for {len(my_cases)} cases."
+                )
+            if isinstance(values, np.ndarray):
+                # Converts numpy scalars to Python built-in types.
+                values = values.tolist()
+            for case, value in zip(my_cases, values):
+                case.features[feat_name] = value
+
+        calc_per_case_features()
+
+    @final
+    def _map_output_chunks(
+        self,
+        func: Callable[[int, list[dict]], list[T]],
+        sys_output: Sequence[dict],
+        desc: str,
+    ) -> Iterator[T]:
+        """Applies a function to consecutive chunks of the system output.
+
+        If `num_workers` is specified in the metadata, the chunks are processed by a
+        pool of forked processes, which share `func` and everything it refers to
+        (e.g., the feature functions and the statistics of the training set) with
+        this process. Otherwise they are processed sequentially.
+
+        Args:
+            func: The function taking the index of the first output in the chunk and
+                the outputs in the chunk, and returning the list of results, e.g.,
+                the analysis cases generated from the chunk.
+            sys_output: The system output.
+            desc: The description on the progress bar.
+
+        Returns:
+            An iterator over the results of all chunks, in the order of the outputs.
+        """
+        chunk_size = _FEATURE_BATCH_SIZE
+        if self._num_workers > 1:
+            # Smaller chunks balance the load among the workers.
+            chunk_size = min(
+                chunk_size,
+                max(1, math.ceil(len(sys_output) / (self._num_workers * 4))),
+            )
+        chunk_results = fork_imap(
+            lambda begin: func(begin, sys_output[begin : begin + chunk_size]),
+            range(0, len(sys_output), chunk_size),
+            self._num_workers,
+        )
+        for results in progress(chunk_results, desc=desc):
+            yield from results
+
+    @final
+    def _gen_example_cases(
+        self,
+        sys_info: SysOutputInfo,
+        sys_output: Sequence[dict],
+        statistics: Any,
+        analysis_level: AnalysisLevel,
+    ) -> AnalysisCaseTable:
+        """Generates an example-level analysis case with features for each output.
+
+        If the system output is stored column by column and every feature is just
+        copied from it, the table is built from the columns without creating cases.
+        Features shared by systems evaluated on the same dataset are copied rather
+        than calculated.
+
+        Args:
+            sys_info: Information about the system output.
+            sys_output: The system output.
+            statistics: Statistics of the training set, or None if unavailable.
+            analysis_level: Analysis level specifying the features.
+
+        Returns:
+            Table of analysis cases.
+        """
+        if isinstance(sys_output, ColumnarSamples):
+            columns = _get_feature_columns(sys_output, analysis_level.features)
+            if columns is not None:
+                return AnalysisCaseTable.from_columns(len(sys_output), columns)
+
+        dataset_features = (
+            self._dataset_features if analysis_level.name == "example" else None
+        )
+
+        def gen_chunk_cases(begin: int, outputs: list[dict]) -> list[AnalysisCase]:
+            cases = [
+                AnalysisCase(sample_id=begin + i, features={})
+                for i in range(len(outputs))
+            ]
+            self._calc_features(
+                sys_info,
+                outputs,
+                cases,
+                analysis_level.features,
+                statistics,
+                dataset_features,
+            )
+            return cases
+
+        return AnalysisCaseTable.from_cases(
+            self._map_output_chunks(
+                gen_chunk_cases, sys_output, "calculating example-level features"
+            )
+        )
+
     def _gen_cases_and_stats(
         self,
         sys_info: SysOutputInfo,
-        sys_output: list[dict],
+        sys_output: Sequence[dict],
         statistics: Any,
         analysis_level: AnalysisLevel,
-    ) -> tuple[list[AnalysisCase], dict[str, MetricStats]]:
+    ) -> tuple[AnalysisCaseTable, dict[str, MetricStats]]:
         """Generates analysis cases and stats.
 
         Args:
@@ -365,7 +746,7 @@ class Processor(metaclass=abc.ABCMeta):
 
         Returns:
             Tuple of following values:
-                - List of analysis levels.
+                - Table of analysis cases.
                 - Mapping from metric name to stats.
         """
         if analysis_level.name != "example":
@@ -373,38 +754,33 @@ class Processor(metaclass=abc.ABCMeta):
                 f"Does not support analysis level {analysis_level.name} by default"
             )
 
+        # Calculate features. This comes first because metrics may start threads
+        # sending requests (e.g., EaaS), which must not run while `fork_imap` forks.
+        cases = self._gen_example_cases(
+            sys_info, sys_output, statistics, analysis_level
+        )
+
         # Calculate metrics
-        true_data = [self._get_true_label(x) for x in sys_output]
-        pred_data = [self._get_predicted_label(x) for x in sys_output]
+        true_data: list | None = None
+        pred_data: list | None = None
+        label_field_names = self._label_field_names()
+        if isinstance(sys_output, ColumnarSamples) and label_field_names is not None:
+            true_data = _get_complete_column(sys_output, label_field_names[0])
+            pred_data = _get_complete_column(sys_output, label_field_names[1])
+        if true_data is None or pred_data is None:
+            true_data = [self._get_true_label(x) for x in sys_output]
+            pred_data = [self._get_predicted_label(x) for x in sys_output]
         metric_stats = {
             name: config.to_metric().calc_stats_from_data(true_data, pred_data)
             for name, config in analysis_level.metric_configs.items()
         }
-
-        # Calculate features
-        cases: list[AnalysisCase] = []
-        for i, output in progress(
-            enumerate(sys_output), desc="calculating example-level features"
-        ):
-            case = AnalysisCase(sample_id=i, features={})
-            for feat_name, feat_spec in analysis_level.features.items():
-                if feat_name not in output and feat_spec.optional:
-                    continue
-                if feat_spec.func is None:
-                    case.features[feat_name] = output[feat_name]
-                elif not feat_spec.require_training_set:
-                    case.features[feat_name] = feat_spec.func(sys_info, output, case)
-                elif statistics is not None:
-                    case.features[feat_name] = feat_spec.func(
-                        sys_info, output, case, statistics
-                    )
-            cases.append(case)
         return cases, metric_stats
 
     def get_overall_performance(
         self,
         sys_info: SysOutputInfo,
         metric_stats: list[dict[str, MetricStats]],
+        resample_plans: list[ResamplePlan] | None = None,
     ) -> dict[str, dict[str, MetricResult]]:
         """Get the overall performance according to metrics.
 
@@ -412,13 +788,20 @@ class Processor(metaclass=abc.ABCMeta):
             sys_info: Information about the system output
             analysis_cases: The cases to analyze
             metric_stats: any statistics useful to performing scoring
+            resample_plans: The bootstrap resamples shared within each analysis
+                level. If None, new plans are generated.
 
         Returns:
             a dictionary of metrics to overall performance numbers
         """
         overall_results: dict[str, dict[str, MetricResult]] = {}
 
-        for my_level, my_stats in zip(sys_info.analysis_levels, metric_stats):
+        if resample_plans is None:
+            resample_plans = [ResamplePlan() for _ in sys_info.analysis_levels]
+
+        for my_level, my_stats, my_plan in zip(
+            sys_info.analysis_levels, metric_stats, resample_plans
+        ):
             my_results: dict[str, MetricResult] = {}
 
             for metric_name, metric_cfg in my_level.metric_configs.items():
@@ -426,6 +809,7 @@ class Processor(metaclass=abc.ABCMeta):
                 my_results[metric_name] = metric_cfg.to_metric().evaluate_from_stats(
                     metric_stat,
                     confidence_alpha=sys_info.confidence_alpha,
+                    resample_plan=my_plan,
                 )
 
             overall_results[my_level.name] = my_results
@@ -497,18 +881,14 @@ class Processor(metaclass=abc.ABCMeta):
             else:
                 raise ValueError(f"Invalid sort_by: {sort_by}")
 
-    def get_overall_statistics(
-        self,
-        metadata: dict,
-        sys_output: list[dict],
-        use_cache: bool = True,
-    ) -> OverallStatistics:
-        """Get the overall statistics information of the system output.
+    def _build_sys_info(self, metadata: dict) -> SysOutputInfo:
+        """Build the information about the system output from the metadata.
 
         Args:
-            metadata: The metadata of the system
-            sys_output: The system output itself
-            use_cache: whether to reload the statistics from cache or not.
+            metadata: The metadata of the system.
+
+        Returns:
+            The system info with the tokenizers and the analyses to perform.
         """
         if metadata is None:
             metadata = {}
@@ -516,6 +896,7 @@ class Processor(metaclass=abc.ABCMeta):
             metadata["task_name"] = self.task_type().value
 
         sys_info = SysOutputInfo.from_any_dict(metadata)
+        self._num_workers = metadata.get("num_workers") or 1
 
         if sys_info.target_tokenizer is None:
             sys_info.target_tokenizer = self.get_tokenizer(sys_info.target_language)
@@ -545,12 +926,131 @@ class Processor(metaclass=abc.ABCMeta):
         sys_info.analysis_levels, sys_info.analyses = self._customize_analyses(
             sys_info, custom_features, metric_configs_dict, custom_analyses
         )
+        return sys_info
+
+    @final
+    def precompute_dataset_features(
+        self,
+        metadata: dict,
+        dataset: Sequence[dict],
+        output_fields: Collection[str],
+        use_cache: bool = True,
+    ) -> DatasetFeatures:
+        """Calculate the features which only depend on a dataset.
+
+        Systems evaluated on the same dataset share the returned features by passing
+        them to `process`, which then calculates only the features depending on
+        each system output. Such features are detected by calculating every
+        example-level feature from the dataset alone: the ones reading any of
+        `output_fields`, or any feature detected earlier, are left to each system.
+
+        Args:
+            metadata: The metadata shared by the systems.
+            dataset: The dataset, without the system outputs.
+            output_fields: The names of the fields in the system outputs, including
+                the ones which override the fields of the dataset.
+            use_cache: whether to reload the statistics from cache or not.
+
+        Returns:
+            The statistics of the training set and the example-level features.
+        """
+        sys_info = self._build_sys_info(metadata)
+        statistics = self._gen_external_stats(sys_info, use_cache)
+
+        hidden_fields = frozenset(output_fields)
+        features = {
+            name: spec
+            for analysis_level in sys_info.analysis_levels
+            if analysis_level.name == "example"
+            for name, spec in analysis_level.features.items()
+        }
+
+        def calc_chunk(
+            begin: int, samples: list[dict]
+        ) -> list[tuple[list[dict[str, Any]], set[str], dict[str, set[str]]]]:
+            # Features are calculated one by one, recording the features read by
+            # each of them. The ones failed in this chunk are hidden from the rest.
+            failed_names: set[str] = set()
+            read_names: set[str] = set()
+            dependencies: dict[str, set[str]] = {}
+            outputs = [_DatasetView(x, hidden_fields) for x in samples]
+            cases = [
+                AnalysisCase(
+                    sample_id=begin + i,
+                    features=_DatasetView({}, failed_names, read_names),
+                )
+                for i in range(len(samples))
+            ]
+            for name, spec in features.items():
+                read_names.clear()
+                try:
+                    self._calc_features(
+                        sys_info, outputs, cases, {name: spec}, statistics
+                    )
+                except _OutputDependentError as ex:
+                    get_logger().debug(f"feature {name} is not shared: {ex}")
+                    failed_names.add(name)
+                    for case in cases:
+                        dict.pop(case.features, name, None)
+                dependencies[name] = set(read_names)
+            rows = [dict(dict.items(x.features)) for x in cases]
+            return [(rows, failed_names, dependencies)]
+
+        rows: list[dict[str, Any]] = []
+        unshared_names: set[str] = set()
+        dependencies: dict[str, set[str]] = {name: set() for name in features}
+        for chunk_rows, failed_names, chunk_dependencies in self._map_output_chunks(
+            calc_chunk, dataset, "calculating dataset features"
+        ):
+            rows.extend(chunk_rows)
+            unshared_names.update(failed_names)
+            for name, names in chunk_dependencies.items():
+                dependencies[name].update(names)
+        # Features are listed after the ones they read, so a single pass finds every
+        # feature depending on the system output through the others.
+        for name in features:
+            if not dependencies[name].isdisjoint(unshared_names):
+                unshared_names.add(name)
+        for row in rows:
+            for name in unshared_names.intersection(row):
+                del row[name]
+
+        sys_info.tokenization_cache.clear()
+        return DatasetFeatures(statistics, frozenset(features) - unshared_names, rows)
+
+    def get_overall_statistics(
+        self,
+        metadata: dict,
+        sys_output: Sequence[dict],
+        use_cache: bool = True,
+        dataset_features: DatasetFeatures | None = None,
+    ) -> OverallStatistics:
+        """Get the overall statistics information of the system output.
+
+        Args:
+            metadata: The metadata of the system
+            sys_output: The system output itself
+            use_cache: whether to reload the statistics from cache or not.
+            dataset_features: Features calculated beforehand by
+                `precompute_dataset_features` on the dataset of the system output.
+        """
+        sys_info = self._build_sys_info(metadata)
 
         # get scoring statistics
-        external_stats = self._gen_external_stats(sys_info, use_cache)
+        if dataset_features is None:
+            external_stats = self._gen_external_stats(sys_info, use_cache)
+        else:
+            if len(dataset_features.example_features) != len(sys_output):
+                raise ValueError(
+                    "The dataset features are calculated for "
+                    f"{len(dataset_features.example_features)} examples, but the "
+                    f"system output has {len(sys_output)} examples."
+                )
+            external_stats = dataset_features.statistics
+        self._dataset_features = dataset_features
 
         # generate cases for each level
-        analysis_cases: list[list[AnalysisCase]] = []
+        analysis_cases: list[AnalysisCaseTable] = []
         metric_stats: list[dict[str, MetricStats]] = []
         for analysis_level in sys_info.analysis_levels:
             my_cases, my_stats = self._gen_cases_and_stats(
@@ -559,18 +1059,30 @@ class Processor(metaclass=abc.ABCMeta):
             analysis_cases.append(my_cases)
             metric_stats.append(my_stats)
 
+        # Tokens are not used after calculating features.
+        cache = sys_info.tokenization_cache
+        get_logger().debug(
+            f"tokenization cache: {cache.hits} hits, {cache.misses} misses"
+        )
+        cache.clear()
+
         # calculate overall results
-        overall_results = self.get_overall_performance(sys_info, metric_stats)
+        # One plan per level lets every metric and bucket reuse the same resamples.
+        resample_plans = [ResamplePlan() for _ in sys_info.analysis_levels]
+        overall_results = self.get_overall_performance(
+            sys_info, metric_stats, resample_plans
+        )
         sys_info.results = Result(overall=overall_results, analyses=[])
-        return OverallStatistics(sys_info, analysis_cases, metric_stats)
+        return OverallStatistics(sys_info, analysis_cases, metric_stats, resample_plans)
 
     @final
     def process(
         self,
         metadata: dict,
-        sys_output: list[dict],
+        sys_output: Sequence[dict],
         skip_failed_analyses: bool = False,
         use_cache: bool = True,
+        dataset_features: DatasetFeatures | None = None,
     ) -> SysOutputInfo:
         """Run the whole process of processing the output.
 
@@ -579,6 +1091,8 @@ class Processor(metaclass=abc.ABCMeta):
             sys_output: They list of system outputs.
             skip_failed_analyses: Whether to skip failed analyses.
             use_cache: whether to reload the statistics or not.
+            dataset_features: Features shared by the systems evaluated on the same
+                dataset, calculated by `precompute_dataset_features`.
 
         Returns:
             Information about the processed system output.
@@ -587,6 +1101,7 @@ class Processor(metaclass=abc.ABCMeta):
             metadata,
             sys_output,
             use_cache,
+            dataset_features,
         )
         sys_info = unwrap(overall_statistics.sys_info)
         analyses = self.perform_analyses(
@@ -594,6 +1109,7 @@ class Processor(metaclass=abc.ABCMeta):
             overall_statistics.analysis_cases,
             metric_stats=overall_statistics.metric_stats,
             skip_failed_analyses=skip_failed_analyses,
+            resample_plans=overall_statistics.resample_plans,
         )
 
         self.sort_bucket_info(
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import abc
-from collections.abc import Iterable
+from collections import Counter
+from collections.abc import Iterable, Sequence
 import copy
-from typing import Any, cast
+from typing import Any
 
 from explainaboard.analysis import feature
 from explainaboard.analysis.analyses import (
@@ -14,7 +15,7 @@ from explainaboard.analysis.analyses import (
     BucketAnalysis,
     ComboCountAnalysis,
 )
-from explainaboard.analysis.case import AnalysisCase, AnalysisCaseLabeledSpan
+from explainaboard.analysis.case import AnalysisCaseLabeledSpan, AnalysisCaseTable
 from explainaboard.analysis.feature import FeatureType
 from explainaboard.analysis.feature_funcs import feat_freq_rank, feat_num_oov
 from explainaboard.info import SysOutputInfo
@@ -227,66 +228,88 @@ class SeqLabProcessor(Processor):
     def _gen_cases_and_stats(
         self,
         sys_info: SysOutputInfo,
-        sys_output: list[dict],
+        sys_output: Sequence[dict],
         statistics: Any,
         analysis_level: AnalysisLevel,
-    ) -> tuple[list[AnalysisCase], dict[str, MetricStats]]:
+    ) -> tuple[AnalysisCaseTable, dict[str, MetricStats]]:
         if analysis_level.name == "example":
             return super()._gen_cases_and_stats(
                 sys_info, sys_output, statistics, analysis_level
             )
         elif analysis_level.name != "span":
             raise ValueError(f"{analysis_level.name}-level analysis not supported")
+
         # Do span-level analysis
-        cases: list[AnalysisCaseLabeledSpan] = []
         # Calculate features
-        for i, output in progress(
-            enumerate(sys_output), desc="calculating span-level features"
-        ):
-            # get the spans from each sentence
-            tokens = output["tokens"]
-            true_spans = self._span_ops.get_spans(toks=tokens, tags=output["true_tags"])
-            pred_spans = self._span_ops.get_spans(toks=tokens, tags=output["pred_tags"])
-            # merge the spans together
-            merged_spans: dict[tuple[int, int], Span] = {}
-            for span in true_spans:
-                span.span_tag = f"{span.span_tag} {self._DEFAULT_TAG}"
-                merged_spans[unwrap(span.span_pos)] = span
-            for span in pred_spans:
-                merged_span = merged_spans.get(unwrap(span.span_pos))
-                if not merged_span:
-                    span.span_tag = f"{self._DEFAULT_TAG} {span.span_tag}"
-                    merged_spans[unwrap(span.span_pos)] = span
-                else:
-                    true_tag, _ = unwrap(merged_span.span_tag).split(" ")
-                    merged_span.span_tag = f"{true_tag} {span.span_tag}"
-            # analysis cases
-            for ms in merged_spans.values():
-                true_tag, pred_tag = unwrap(ms.span_tag).split(" ")
-                case = AnalysisCaseLabeledSpan(
-                    sample_id=i,
-                    features={},
-                    token_span=unwrap(ms.span_pos),
-                    char_span=unwrap(ms.span_char_pos),
-                    text=unwrap(ms.span_text),
-                    true_label=true_tag,
-                    predicted_label=pred_tag,
-                    orig_str="source",
+        def gen_chunk_cases(
+            begin: int, outputs: list[dict]
+        ) -> list[AnalysisCaseLabeledSpan]:
+            chunk_cases: list[AnalysisCaseLabeledSpan] = []
+            for i, output in enumerate(outputs, begin):
+                # get the spans from each sentence
+                tokens = output["tokens"]
+                true_spans = self._span_ops.get_spans(
+                    toks=tokens, tags=output["true_tags"]
                 )
-                for feat_name, feat_spec in analysis_level.features.items():
-                    if feat_spec.func is None:
-                        raise ValueError(
-                            f"could not find feature function for {feat_name}"
-                        )
-                    elif not feat_spec.require_training_set:
-                        case.features[feat_name] = feat_spec.func(
-                            sys_info, output, case
+                pred_spans = self._span_ops.get_spans(
+                    toks=tokens, tags=output["pred_tags"]
+                )
+                # merge the spans together, keeping the true and predicted tags
+                merged_spans: dict[tuple[int, int], tuple[Span, str, str]] = {}
+                for span in true_spans:
+                    merged_spans[unwrap(span.span_pos)] = (
+                        span,
+                        unwrap(span.span_tag),
+                        self._DEFAULT_TAG,
+                    )
+                for span in pred_spans:
+                    pos = unwrap(span.span_pos)
+                    merged = merged_spans.get(pos)
+                    if merged is None:
+                        merged_spans[pos] = (
+                            span,
+                            self._DEFAULT_TAG,
+                            unwrap(span.span_tag),
                         )
-                    elif statistics is not None:
-                        case.features[feat_name] = feat_spec.func(
-                            sys_info, output, case, statistics
+                    else:
+                        merged_spans[pos] = (
+                            merged[0],
+                            merged[1],
+                            unwrap(span.span_tag),
                         )
-                cases.append(case)
+                # analysis cases
+                for ms, true_tag, pred_tag in merged_spans.values():
+                    case = AnalysisCaseLabeledSpan(
+                        sample_id=i,
+                        features={},
+                        token_span=unwrap(ms.span_pos),
+                        char_span=unwrap(ms.span_char_pos),
+                        text=unwrap(ms.span_text),
+                        true_label=true_tag,
+                        predicted_label=pred_tag,
+                        orig_str="source",
+                    )
+                    for feat_name, feat_spec in analysis_level.features.items():
+                        if feat_spec.func is None:
+                            raise ValueError(
+                                f"could not find feature function for {feat_name}"
+                            )
+                        elif not feat_spec.require_training_set:
+                            case.features[feat_name] = feat_spec.func(
+                                sys_info, output, case
+                            )
+                        elif statistics is not None:
+                            case.features[feat_name] = feat_spec.func(
+                                sys_info, output, case, statistics
+                            )
+                    chunk_cases.append(case)
+            return chunk_cases
+
+        cases: list[AnalysisCaseLabeledSpan] = list(
+            self._map_output_chunks(
+                gen_chunk_cases, sys_output, "calculating span-level features"
+            )
+        )
         # calculate metric stats
         true_data = [x.true_label for x in cases]
         pred_data = [x.predicted_label for x in cases]
@@ -294,7 +317,7 @@ class SeqLabProcessor(Processor):
             name: config.to_metric().calc_stats_from_data(true_data, pred_data)
             for name, config in analysis_level.metric_configs.items()
         }
-        return cast(list[AnalysisCase], cases), metric_stats
+        return AnalysisCaseTable.from_cases(cases), metric_stats
 
     def get_econ_efre_dic(
         self, words: list[str], bio_tags: list[str]
@@ -304,6 +327,9 @@ class SeqLabProcessor(Processor):
         Reference this paper:
         https://aclanthology.org/2020.emnlp-main.489.pdf
 
+        Entities are matched as sequences of word IDs rather than strings, so the
+        corpus is scanned once without building the strings of its spans.
+
         Args:
             words: a list of all words in the corpus
             bio_tags: a list of all tags in the corpus
@@ -314,45 +340,74 @@ class SeqLabProcessor(Processor):
         """
         chunks_train = self._span_ops.get_spans_simple(bio_tags)
 
-        # Create pseudo-trie
-        prefixes: set[str] = set()
-        chunk_to_tag: dict[tuple[int, int], str] = {}
-        entity_to_tagcnt: dict[str, dict[str, int]] = {}
+        # Words are compared by IDs, which are shared by the words equal in lower case.
+        lower_ids: dict[str, int] = {}
+        word_ids = {
+            w: lower_ids.setdefault(w.lower(), len(lower_ids))
+            for w in dict.fromkeys(words)
+        }
+        corpus = list(map(word_ids.__getitem__, words))
+
+        # Each chunk is an occurrence of its entity labeled with its own tag.
+        entity_ids: dict[tuple[int, ...], int] = {}
+        entity_strs: list[str] = []
+        entity_tagcnts: list[dict[str, int]] = []
         efre_dic: dict[str, int] = {}
-        for true_chunk in progress(chunks_train):
-            idx_start = true_chunk[1]
-            idx_end = true_chunk[2]
-            chunk_to_tag[(idx_start, idx_end)] = true_chunk[0]
-            span_str = ""
-            for i in range(0, idx_end - idx_start):
-                w = words[idx_start + i].lower()
-                span_str += w if i == 0 else f" {w}"
-                prefixes.add(span_str)
-            entity_to_tagcnt[span_str] = {}
+        for tag, idx_start, idx_end in progress(chunks_train):
+            key = tuple(corpus[idx_start:idx_end])
+            entity = entity_ids.get(key)
+            if entity is None:
+                entity = entity_ids[key] = len(entity_strs)
+                entity_strs.append(
+                    " ".join(w.lower() for w in words[idx_start:idx_end])
+                )
+                entity_tagcnts.append({})
+            span_str = entity_strs[entity]
             efre_dic[span_str] = efre_dic.get(span_str, 0) + 1
+            if key:
+                tagcnt = entity_tagcnts[entity]
+                tagcnt[tag] = tagcnt.get(tag, 0) + 1
 
-        # Actually calculate stats
-        ltws = len(words)
-        for idx_start in range(ltws):
-            span_str = ""
-            for i in range(0, ltws - idx_start):
-                w = words[idx_start + i].lower()
-                span_str += w if i == 0 else f" {w}"
-                if span_str not in prefixes:
+        # Count every occurrence of the entities. Single words are counted at once,
+        # and longer entities are found by walking down a trie over word IDs from
+        # each word starting any of them. The None key of a node holds the entity
+        # ending at it.
+        word_counts = Counter(corpus)
+        occurrences = [0] * len(entity_strs)
+        trie: dict[int | None, Any] = {}
+        for key, entity in entity_ids.items():
+            if len(key) == 1:
+                occurrences[entity] = word_counts[key[0]]
+            elif len(key) > 1:
+                node = trie
+                for word_id in key:
+                    node = node.setdefault(word_id, {})
+                node[None] = entity
+        num_words = len(corpus)
+        for idx_start in [i for i, word_id in enumerate(corpus) if word_id in trie]:
+            node = trie[corpus[idx_start]]
+            idx_end = idx_start + 1
+            while idx_end < num_words:
+                node = node.get(corpus[idx_end])
+                if node is None:
                     break
-                if span_str in entity_to_tagcnt:
-                    my_tag = chunk_to_tag.get(
-                        (idx_start, idx_start + i + 1), self._DEFAULT_TAG
-                    )
-                    entity_to_tagcnt[span_str][my_tag] = (
-                        entity_to_tagcnt[span_str].get(my_tag, 0) + 1
-                    )
+                idx_end += 1
+                entity = node.get(None)
+                if entity is not None:
+                    occurrences[entity] += 1
 
+        # Occurrences other than the chunks are labeled with the default tag.
         econ_dic: dict[str, float] = {}
-        for span_str, cnt_dic in entity_to_tagcnt.items():
-            cnt_sum = float(sum(cnt_dic.values()))
-            for tag, cnt in cnt_dic.items():
-                econ_dic[f"{span_str}|||{tag}"] = cnt / cnt_sum
+        for span_str, tagcnt, occurrence in zip(
+            entity_strs, entity_tagcnts, occurrences
+        ):
+            num_others = occurrence - sum(tagcnt.values())
+            if num_others > 0:
+                tagcnt[self._DEFAULT_TAG] = (
+                    tagcnt.get(self._DEFAULT_TAG, 0) + num_others
+                )
+            for tag, cnt in tagcnt.items():
+                econ_dic[f"{span_str}|||{tag}"] = cnt / float(occurrence)
         return econ_dic, efre_dic
 
     def deserialize_system_output(self, output: dict) -> dict:
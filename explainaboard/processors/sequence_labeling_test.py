@@ -4,8 +4,28 @@ from __future__ import annotations
 
 import unittest
 
+from explainaboard.processors.named_entity_recognition import NERProcessor
+
 
 class SeqLabProcessorTest(unittest.TestCase):
     def test_get_processor_class(self) -> None:
         # SeqLabProcessor is not used in any at this point.
         pass
+
+    def test_get_econ_efre_dic(self) -> None:
+        words = ["New", "York", "is", "in", "new", "york", "state", "York"]
+        tags = ["B-LOC", "I-LOC", "O", "O", "B-ORG", "I-ORG", "O", "B-LOC"]
+        econ_dic, efre_dic = NERProcessor().get_econ_efre_dic(words, tags)
+        self.assertEqual(efre_dic, {"new york": 2, "york": 1})
+        self.assertEqual(
+            econ_dic,
+            {
+                "new york|||LOC": 0.5,
+                "new york|||ORG": 0.5,
+                "york|||LOC": 1 / 3,
+                "york|||O": 2 / 3,
+            },
+        )
+
+    def test_get_econ_efre_dic_empty(self) -> None:
+        self.assertEqual(NERProcessor().get_econ_efre_dic([], []), ({}, {}))
@@ -5,14 +5,11 @@ from __future__ import annotations
 from collections.abc import Iterable
 from typing import Any
 
-from datalabs.operations.featurize.plugins.summarization.sum_attribute import (
-    SUMAttribute,
-)
-
 from explainaboard import TaskType
 from explainaboard.analysis import feature
 from explainaboard.analysis.analyses import AnalysisLevel
 from explainaboard.analysis.feature_funcs import accumulate_vocab_from_samples
+from explainaboard.analysis.sum_attribute import SUMAttribute
 from explainaboard.info import SysOutputInfo
 from explainaboard.processors.conditional_generation import (
     ConditionalGenerationProcessor,
@@ -48,6 +45,9 @@ class SummarizationProcessor(ConditionalGenerationProcessor):
                 func=lambda info, x, c: sum_attr.cal_attributes_each(
                     x["source"], x["reference"]
                 ),
+                func_batch=lambda info, xs, cs: sum_attr(
+                    [x["source"] for x in xs], [x["reference"] for x in xs]
+                ),
             ),
             "attr_compression": feature.Value(
                 dtype=feature.DataType.FLOAT,
@@ -82,11 +82,17 @@ class SummarizationProcessor(ConditionalGenerationProcessor):
     def _statistics_func(self, samples: Iterable[Any], sys_info: SysOutputInfo):
         samples_list = list(samples)
         source_vocab, source_vocab_rank = accumulate_vocab_from_samples(
-            samples_list, lambda x: x["source"], unwrap(sys_info.source_tokenizer)
+            samples_list,
+            lambda x: x["source"],
+            unwrap(sys_info.source_tokenizer),
+            num_workers=self._num_workers,
         )
 
         target_vocab, target_vocab_rank = accumulate_vocab_from_samples(
-            samples_list, lambda x: x["reference"], unwrap(sys_info.target_tokenizer)
+            samples_list,
+            lambda x: x["reference"],
+            unwrap(sys_info.target_tokenizer),
+            num_workers=self._num_workers,
         )
         return {
             "source_vocab": source_vocab,
@@ -75,3 +75,8 @@ class TabularRegressionProcessor(Processor):
     def _get_predicted_label(self, data_point):
         """See processor._get_predicted_label."""
         return data_point["predicted_value"]
+
+    @classmethod
+    def _label_field_names(cls) -> tuple[str, str] | None:
+        """See Processor._label_field_names."""
+        return "true_value", "predicted_value"
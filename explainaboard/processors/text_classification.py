@@ -17,10 +17,15 @@ from explainaboard.analysis.analyses import (
 from explainaboard.analysis.feature import FeatureType
 from explainaboard.analysis.feature_funcs import (
     count_tokens,
+    count_tokens_batch,
     feat_freq_rank,
+    feat_freq_rank_batch,
     feat_length_freq,
+    feat_length_freq_batch,
     feat_num_oov,
+    feat_num_oov_batch,
     get_basic_words,
+    get_basic_words_batch,
     get_lexical_richness,
 )
 from explainaboard.info import SysOutputInfo
@@ -28,6 +33,7 @@ from explainaboard.metrics.accuracy import AccuracyConfig
 from explainaboard.metrics.metric import MetricConfig
 from explainaboard.processors.processor import Processor
 from explainaboard.utils.logging import progress
+from explainaboard.utils.tokenizer import tokenize_stream
 from explainaboard.utils.typing_utils import unwrap
 
 
@@ -65,6 +71,9 @@ class TextClassificationProcessor(Processor):
                 dtype=feature.DataType.FLOAT,
                 description="text length in tokens",
                 func=lambda info, x, c: count_tokens(info, x["text"]),
+                func_batch=lambda info, xs, cs: count_tokens_batch(
+                    info, [x["text"] for x in xs]
+                ),
             ),
             "text_chars": feature.Value(
                 dtype=feature.DataType.FLOAT,
@@ -75,6 +84,9 @@ class TextClassificationProcessor(Processor):
                 dtype=feature.DataType.FLOAT,
                 description="the ratio of basic words",
                 func=lambda info, x, c: get_basic_words(x["text"]),
+                func_batch=lambda info, xs, cs: get_basic_words_batch(
+                    [x["text"] for x in xs]
+                ),
             ),
             "lexical_richness": feature.Value(
                 dtype=feature.DataType.FLOAT,
@@ -88,6 +100,9 @@ class TextClassificationProcessor(Processor):
                 func=lambda info, x, c, stat: feat_num_oov(
                     info, x["text"], stat["vocab"]
                 ),
+                func_batch=lambda info, xs, cs, stat: feat_num_oov_batch(
+                    info, [x["text"] for x in xs], stat["vocab"]
+                ),
             ),
             "fre_rank": feature.Value(
                 dtype=feature.DataType.FLOAT,
@@ -99,6 +114,9 @@ class TextClassificationProcessor(Processor):
                 func=lambda info, x, c, stat: feat_freq_rank(
                     info, x["text"], stat["vocab_rank"]
                 ),
+                func_batch=lambda info, xs, cs, stat: feat_freq_rank_batch(
+                    info, [x["text"] for x in xs], stat["vocab_rank"]
+                ),
             ),
             "length_fre": feature.Value(
                 dtype=feature.DataType.FLOAT,
@@ -107,6 +125,9 @@ class TextClassificationProcessor(Processor):
                 func=lambda info, x, c, stat: feat_length_freq(
                     info, x["text"], stat["length_fre"]
                 ),
+                func_batch=lambda info, xs, cs, stat: feat_length_freq_batch(
+                    info, [x["text"] for x in xs], stat["length_fre"]
+                ),
             ),
         }
 
@@ -159,10 +180,10 @@ class TextClassificationProcessor(Processor):
         vocab: dict[str, float] = {}
         length_fre: dict[int, float] = {}
         total_samps = 0
-        tokenizer = unwrap(sys_info.source_tokenizer)
-        for sample in progress(samples):
-            text = sample["text"]
-            tokens = tokenizer(text)
+        texts = (sample["text"] for sample in progress(samples))
+        for tokens in tokenize_stream(
+            unwrap(sys_info.source_tokenizer), texts, num_workers=self._num_workers
+        ):
             length = len(tokens)
 
             length_fre[length] = length_fre.get(length, 0.0) + 1.0
@@ -2,16 +2,128 @@
 
 from __future__ import annotations
 
+import random
 import unittest
 
+from explainaboard.analysis import feature
+from explainaboard.analysis.analyses import AnalysisLevel
 from explainaboard.constants import TaskType
 from explainaboard.processors.processor_factory import get_processor_class
 from explainaboard.processors.text_classification import TextClassificationProcessor
 
 
+class _ProcessorWithOutputFeatures(TextClassificationProcessor):
+    def default_analysis_levels(self) -> list[AnalysisLevel]:
+        level = super().default_analysis_levels()[0]
+        features = dict(level.features)
+        features["pred_chars"] = feature.Value(
+            dtype=feature.DataType.FLOAT,
+            func=lambda info, x, c: len(x["predicted_label"]),
+        )
+        features["pred_chars_ratio"] = feature.Value(
+            dtype=feature.DataType.FLOAT,
+            func=lambda info, x, c: c.features["pred_chars"] / c.features["text_chars"],
+        )
+        features["text_chars_double"] = feature.Value(
+            dtype=feature.DataType.FLOAT,
+            func=lambda info, x, c: c.features["text_chars"] * 2,
+        )
+        return [AnalysisLevel("example", features, level.metric_configs)]
+
+
 class TextClassificationProcessorTest(unittest.TestCase):
     def test_get_processor_class(self) -> None:
         self.assertIs(
             get_processor_class(TaskType.text_classification),
             TextClassificationProcessor,
         )
+
+    def test_precompute_dataset_features(self) -> None:
+        dataset = [
+            {"text": "I love it .", "true_label": "positive", "id": "0"},
+            {"text": "I hate it .", "true_label": "negative", "id": "1"},
+            {"text": "It is good .", "true_label": "positive", "id": "2"},
+        ]
+        outputs = [
+            [{"predicted_label": x, "id": str(i)} for i, x in enumerate(labels)]
+            for labels in [
+                ["positive", "negative", "negative"],
+                ["negative", "negative", "positive"],
+            ]
+        ]
+
+        def get_metadata() -> dict:
+            # Confidence intervals are bootstrapped with an unseeded generator.
+            return {
+                "task_name": TaskType.text_classification,
+                "metric_names": ["F1"],
+                "confidence_alpha": None,
+            }
+
+        processor = _ProcessorWithOutputFeatures()
+        dataset_features = processor.precompute_dataset_features(
+            get_metadata(), dataset, {"predicted_label", "id"}
+        )
+        self.assertEqual(
+            dataset_features.example_feature_names,
+            {
+                "text",
+                "true_label",
+                "confidence",
+                "text_length",
+                "text_chars",
+                "basic_words",
+                "lexical_richness",
+                "num_oov",
+                "fre_rank",
+                "length_fre",
+                "text_chars_double",
+            },
+        )
+        self.assertIsNone(dataset_features.statistics)
+        self.assertEqual(dataset_features.example_features[1]["text_chars_double"], 22)
+
+        for output in outputs:
+            sys_output = [{**x, **y} for x, y in zip(dataset, output)]
+            results = []
+            for shared in [None, dataset_features]:
+                # Bucket samples are chosen randomly.
+                random.seed(12345)
+                sys_info = _ProcessorWithOutputFeatures().process(
+                    get_metadata(),
+                    sys_output,
+                    skip_failed_analyses=True,
+                    dataset_features=shared,
+                )
+                results.append(sys_info.results)
+            self.assertEqual(results[0], results[1])
+
+    def test_precompute_dataset_features_error(self) -> None:
+        class _ProcessorWithBrokenFeature(TextClassificationProcessor):
+            def default_analysis_levels(self) -> list[AnalysisLevel]:
+                level = super().default_analysis_levels()[0]
+                features = dict(level.features)
+                features["broken"] = feature.Value(
+                    dtype=feature.DataType.FLOAT,
+                    func=lambda info, x, c: int(x["text"]),
+                )
+                return [AnalysisLevel("example", features, level.metric_configs)]
+
+        dataset = [{"text": "I love it .", "true_label": "positive"}]
+        with self.assertRaisesRegex(ValueError, r"invalid literal"):
+            _ProcessorWithBrokenFeature().precompute_dataset_features(
+                {"task_name": TaskType.text_classification},
+                dataset,
+                {"predicted_label"},
+            )
+
+    def test_precompute_dataset_features_mismatched_output(self) -> None:
+        metadata = {"task_name": TaskType.text_classification}
+        dataset = [{"text": "I love it .", "true_label": "positive"}]
+        dataset_features = TextClassificationProcessor().precompute_dataset_features(
+            dict(metadata), dataset, {"predicted_label"}
+        )
+        with self.assertRaisesRegex(ValueError, r"calculated for 1 examples"):
+            TextClassificationProcessor().process(
+                dict(metadata), dataset * 2, dataset_features=dataset_features
+            )
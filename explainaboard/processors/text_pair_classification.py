@@ -163,12 +163,14 @@ class TextPairClassificationProcessor(Processor):
             samples_list,
             lambda x: x["text1"],
             unwrap(sys_info.source_tokenizer),
+            num_workers=self._num_workers,
         )
 
         target_vocab, target_vocab_rank = accumulate_vocab_from_samples(
             samples_list,
             lambda x: x["text2"],
             unwrap(sys_info.target_tokenizer),
+            num_workers=self._num_workers,
         )
 
         return {
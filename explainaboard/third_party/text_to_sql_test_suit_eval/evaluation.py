@@ -6,7 +6,8 @@ import os
 import sqlite3
 
 from explainaboard.third_party.text_to_sql_test_suit_eval.exec_eval import (
-    eval_exec_match,
+    eval_exec_matches,
+    TIMEOUT,
 )
 from explainaboard.third_party.text_to_sql_test_suit_eval.process_sql import (
     get_schema,
@@ -625,12 +626,37 @@ def print_scores(scores, etype, include_turn_acc=True):
             print_formated_s("exact match", exact_scores, "{:<20.3f}")
 
 
+def normalize_pred_sql(p_str):
+    if p_str == "":
+        p_str = "Select *"
+    # p_str = p_str.replace("\"", "\'")
+    return p_str.replace("value", "1")
+
+
+# sqlite has error for some illegal sqls. add a trick to avoid it
+def is_illegal_sql(p_str):
+    return (
+        "players.player_id = players.player_id" in p_str
+        or "rankings.player_id = rankings.player_id" in p_str
+        or ("JOIN" in p_str and "ON" not in p_str)
+    )
+
+
+def get_db_path(db_dir, db):
+    return cache_api.cache_online_file(
+        os.path.join(db_dir, db, db + ".sqlite"),
+        os.path.join("resources/spider/", db, db + ".sqlite"),
+    )
+
+
 def evaluate(glist, plist, config):
     """
     input:
         glist: a gold sql list containing N (gold_sql, db_id)
         plist: a pred sql list containing N (pred_sql,db_id)
-        config: a dictionary containing db_dir, table_path and etype
+        config: a dictionary containing db_dir, table_path and etype,
+            and optionally timeout (seconds per query) and num_workers
+            (processes to execute the queries)
     outpout:
         score_exec: a list of N 0/1 scores (execution accuracy)
         score_match: a list of N 0/1 scores (exact match accuracy)
@@ -640,7 +666,6 @@ def evaluate(glist, plist, config):
     table_path = config["table_path"]
     plug_value = False
     keep_distinct = False
-    progress_bar_for_each_datapoint = False
     # show_altered = False
     etype = "all"  # Fix it
 
@@ -697,6 +722,27 @@ def evaluate(glist, plist, config):
     score_exec = []
     score_match = []
 
+    # execute the queries of all examples before scoring them,
+    # so that they can be executed in parallel
+    exec_scores = iter([])
+    if etype in ["all", "exec"]:
+        exec_examples = []
+        for p_turns, g_turns in zip(plist, glist):
+            for p, g in zip(p_turns, g_turns):
+                p_str = normalize_pred_sql(p[0])
+                if not is_illegal_sql(p_str):
+                    g_str, db = g
+                    exec_examples.append((get_db_path(db_dir, db), p_str, g_str))
+        exec_scores = iter(
+            eval_exec_matches(
+                exec_examples,
+                plug_value=plug_value,
+                keep_distinct=keep_distinct,
+                timeout=config.get("timeout", TIMEOUT),
+                num_workers=config.get("num_workers", 1),
+            )
+        )
+
     for i, (p, g) in enumerate(zip(plist, glist)):
         if (i + 1) % 10 == 0:
             print("Evaluating %dth prediction" % (i + 1))
@@ -705,17 +751,10 @@ def evaluate(glist, plist, config):
         for idx, pg in enumerate(zip(p, g)):
             q_id = idx
             p, g = pg
-            p_str = p[0]
-            if p_str == "":
-                p_str = "Select *"
-            # p_str = p_str.replace("\"", "\'")
-            p_str = p_str.replace("value", "1")
+            p_str = normalize_pred_sql(p[0])
             g_str, db = g
             db_name = db
-            db = cache_api.cache_online_file(
-                os.path.join(db_dir, db, db + ".sqlite"),
-                os.path.join("resources/spider/", db, db + ".sqlite"),
-            )
+            db = get_db_path(db_dir, db)
             schema = Schema(get_schema(db))
             g_sql = get_sql(schema, g_str)
             hardness = evaluator.eval_hardness(g_sql)
@@ -808,28 +847,10 @@ def evaluate(glist, plist, config):
                 )
 
             if etype in ["all", "exec"]:
-
-                # sqlite has error for some illegal sqls. add a trick to avoid it
-                if (
-                    "players.player_id = players.player_id" in p_str
-                    or "rankings.player_id = rankings.player_id" in p_str
-                    or ("JOIN" in p_str and "ON" not in p_str)
-                ):
+                if is_illegal_sql(p_str):
                     exec_score = 0
                 else:
-                    try:
-                        # print(p_str, g_str)
-                        tmp = progress_bar_for_each_datapoint
-                        exec_score = eval_exec_match(
-                            db=db,
-                            p_str=p_str,
-                            g_str=g_str,
-                            plug_value=plug_value,
-                            keep_distinct=keep_distinct,
-                            progress_bar_for_each_datapoint=tmp,
-                        )
-                    except Exception:
-                        exec_score = 0
+                    exec_score = next(exec_scores)
                 score_match.append(int(exact_score))
                 score_exec.append(int(exec_score))
                 entry = {
@@ -1,12 +1,13 @@
-import asyncio  # built-in library in Python
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from itertools import chain, product
 import os
 import random
 import re
 import sqlite3
 import threading
+import time
 from typing import Any
+from urllib.request import pathname2url
 
 import tqdm
 
@@ -14,10 +15,20 @@ from explainaboard.third_party.text_to_sql_test_suit_eval.parse import (
     get_all_preds_for_execution,
     remove_distinct,
 )
+from explainaboard.utils.parallel import fork_imap
 
 threadLock = threading.Lock()
 TIMEOUT = 60
 EXEC_TMP_DIR = "tmp/"
+# the number of sqlite virtual machine instructions between checks of the timeout
+PROGRESS_INTERVAL = 1000
+# the number of connections kept open by each process
+MAX_CONNECTIONS = 64
+
+# read-only connections opened by each process, keyed by process id and then by
+# sqlite path in the order of their last use
+# connections inherited through fork are neither used nor closed by the child process
+_connections: dict[int, OrderedDict[str, sqlite3.Connection]] = {}
 
 
 def permute_tuple(element: tuple, perm: tuple) -> tuple:
@@ -131,44 +142,59 @@ def replace_cur_year(query: str) -> str:
     )
 
 
-# get the database cursor for a sqlite database path
-def get_cursor_from_path(sqlite_path: str):
-    try:
-        if not os.path.exists(sqlite_path):
-            print("Openning a new connection %s" % sqlite_path)
-        connection = sqlite3.connect(sqlite_path)
-    except Exception as e:
-        print(sqlite_path)
-        raise e
+# get a read-only connection to a sqlite database path
+# the connection is reused by the current process until MAX_CONNECTIONS others are
+# used after it, when it is closed
+def get_connection_from_path(sqlite_path: str) -> sqlite3.Connection:
+    connections = _connections.setdefault(os.getpid(), OrderedDict())
+    connection = connections.get(sqlite_path)
+    if connection is not None:
+        connections.move_to_end(sqlite_path)
+        return connection
+    connection = sqlite3.connect(
+        "file:%s?mode=ro" % pathname2url(os.path.abspath(sqlite_path)),
+        uri=True,
+        check_same_thread=False,
+    )
     connection.text_factory = lambda b: b.decode(errors="ignore")
-    cursor = connection.cursor()
-    return cursor
-
-
-async def exec_on_db_(sqlite_path: str, query: str) -> tuple[str, Any]:
-    query = replace_cur_year(query)
-    cursor = get_cursor_from_path(sqlite_path)
-    try:
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
-        cursor.connection.close()
-        return "result", result
-    except Exception as e:
-        cursor.close()
-        cursor.connection.close()
-        return "exception", e
-
-
-async def exec_on_db(
-    sqlite_path: str, query: str, process_id: str = "", timeout: int = TIMEOUT
+    connections[sqlite_path] = connection
+    while len(connections) > MAX_CONNECTIONS:
+        _, evicted = connections.popitem(last=False)
+        evicted.close()
+    return connection
+
+
+# execute a query and fetch all the results
+# the query is interrupted by sqlite if it runs longer than `timeout` seconds
+# errors opening the database are raised rather than returned, since they say
+# nothing about the query
+def exec_on_db(
+    sqlite_path: str, query: str, timeout: float = TIMEOUT
 ) -> tuple[str, Any]:
-    try:
-        return await asyncio.wait_for(exec_on_db_(sqlite_path, query), timeout)
-    except asyncio.TimeoutError:
-        return ("exception", TimeoutError)
-    except Exception as e:
-        return ("exception", e)
+    query = replace_cur_year(query)
+    deadline = time.monotonic() + timeout
+    timed_out = False
+
+    def interrupt() -> bool:
+        nonlocal timed_out
+        timed_out = time.monotonic() > deadline
+        return timed_out
+
+    with threadLock:
+        connection = get_connection_from_path(sqlite_path)
+        connection.set_progress_handler(interrupt, PROGRESS_INTERVAL)
+        cursor = connection.cursor()
+        try:
+            cursor.execute(query)
+            return "result", cursor.fetchall()
+        except Exception as e:
+            return "exception", TimeoutError if timed_out else e
+        finally:
+            cursor.close()
+            # do not leave a transaction begun by the query to the next query
+            if connection.in_transaction:
+                connection.rollback()
+            connection.set_progress_handler(None, 0)
 
 
 # postprocess the model predictions to avoid execution errors
@@ -184,6 +210,8 @@ def postprocess(query: str) -> str:
 # that are in the same directory as db
 # 0 if denotationally equivalent
 # 1 otherwise
+# errors opening the databases are raised, so that they are not taken for errors of
+# the gold query
 # the meaning of each auxillary argument can
 # be seen in the parser definition in evaluation.py
 def eval_exec_match(
@@ -193,6 +221,7 @@ def eval_exec_match(
     plug_value: bool,
     keep_distinct: bool,
     progress_bar_for_each_datapoint: bool,
+    timeout: float = TIMEOUT,
 ) -> int:
     # post-process the prediction.
     # e.g. removing spaces between ">" and "="
@@ -239,8 +268,8 @@ def eval_exec_match(
             ranger = db_paths
 
         for db_path in ranger:
-            g_flag, g_denotation = asyncio.run(exec_on_db(db_path, g_str))
-            p_flag, p_denotation = asyncio.run(exec_on_db(db_path, pred))
+            g_flag, g_denotation = exec_on_db(db_path, g_str, timeout=timeout)
+            p_flag, p_denotation = exec_on_db(db_path, pred, timeout=timeout)
 
             # we should expect the gold to be succesfully executed on the database
             if g_flag == "exception":
@@ -265,3 +294,34 @@ def eval_exec_match(
 
     # none of the predictions passed
     return 0
+
+
+# evaluate eval_exec_match for many (db, p_str, g_str) examples
+# examples are distributed over `num_workers` processes, each of which
+# reuses its connections to the databases
+# all databases of an example are compared in the same process,
+# so that the comparison stops at the first database the prediction fails on
+# 0 is returned for the examples whose evaluation raises an exception
+def eval_exec_matches(
+    examples: list[tuple[str, str, str]],
+    plug_value: bool,
+    keep_distinct: bool,
+    timeout: float = TIMEOUT,
+    num_workers: int = 1,
+) -> list[int]:
+    def eval_example(example: tuple[str, str, str]) -> int:
+        db, p_str, g_str = example
+        try:
+            return eval_exec_match(
+                db=db,
+                p_str=p_str,
+                g_str=g_str,
+                plug_value=plug_value,
+                keep_distinct=keep_distinct,
+                progress_bar_for_each_datapoint=False,
+                timeout=timeout,
+            )
+        except Exception:
+            return 0
+
+    return list(fork_imap(eval_example, examples, num_workers))
@@ -0,0 +1,160 @@
+"""Tests for explainaboard.third_party.text_to_sql_test_suit_eval.exec_eval."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from explainaboard.third_party.text_to_sql_test_suit_eval import exec_eval
+from explainaboard.third_party.text_to_sql_test_suit_eval.exec_eval import (
+    eval_exec_match,
+    eval_exec_matches,
+    exec_on_db,
+    get_connection_from_path,
+)
+from explainaboard.utils.parallel import is_fork_available
+
+_INFINITE_QUERY = (
+    "with recursive c(x) as (select 1 union all select x + 1 from c) "
+    "select count(*) from c"
+)
+
+
+class ExecEvalTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tempdir = tempfile.TemporaryDirectory()
+        self._db = os.path.join(self._tempdir.name, "concert_singer.sqlite")
+        connection = sqlite3.connect(self._db)
+        connection.executescript(
+            "create table singer (name text, country text, age int);"
+            "insert into singer values ('a', 'France', 25), ('b', 'Japan', 21),"
+            " ('c', 'France', 30), ('d', 'Peru', 18);"
+        )
+        connection.close()
+
+    def tearDown(self) -> None:
+        self._tempdir.cleanup()
+
+    def test_exec_on_db(self) -> None:
+        self.assertEqual(
+            exec_on_db(self._db, "select name from singer where age > 24"),
+            ("result", [("a",), ("c",)]),
+        )
+        flag, error = exec_on_db(self._db, "select nothing from singer")
+        self.assertEqual(flag, "exception")
+        self.assertIsInstance(error, sqlite3.OperationalError)
+
+    def test_exec_on_db_read_only(self) -> None:
+        flag, _ = exec_on_db(self._db, "drop table singer")
+        self.assertEqual(flag, "exception")
+        self.assertEqual(
+            exec_on_db(self._db, "select count(*) from singer"), ("result", [(4,)])
+        )
+
+    def test_exec_on_db_timeout(self) -> None:
+        start = time.monotonic()
+        self.assertEqual(
+            exec_on_db(self._db, _INFINITE_QUERY, timeout=0.1),
+            ("exception", TimeoutError),
+        )
+        self.assertLess(time.monotonic() - start, 10.0)
+        # The connection is usable after the interruption.
+        self.assertEqual(
+            exec_on_db(self._db, "select count(*) from singer"), ("result", [(4,)])
+        )
+
+    def test_get_connection_from_path_evicts(self) -> None:
+        paths = [os.path.join(self._tempdir.name, f"{i}.sqlite") for i in range(3)]
+        for path in paths:
+            sqlite3.connect(path).close()
+        with mock.patch.object(exec_eval, "MAX_CONNECTIONS", 2):
+            first = get_connection_from_path(paths[0])
+            get_connection_from_path(paths[1])
+            # The use of the first connection makes the second one the oldest.
+            self.assertIs(get_connection_from_path(paths[0]), first)
+            second = exec_eval._connections[os.getpid()][paths[1]]
+            get_connection_from_path(paths[2])
+        self.assertEqual(
+            list(exec_eval._connections[os.getpid()])[-2:], [paths[0], paths[2]]
+        )
+        with self.assertRaises(sqlite3.ProgrammingError):
+            second.execute("select 1")
+        first.execute("select 1")
+
+    def test_eval_exec_match_connection_error(self) -> None:
+        # A path not connected to by the other tests, so that it is not cached.
+        db = os.path.join(self._tempdir.name, "new", "concert_singer.sqlite")
+        os.mkdir(os.path.dirname(db))
+        os.rename(self._db, db)
+        query = "select name from singer"
+        with mock.patch.object(
+            exec_eval.sqlite3,
+            "connect",
+            side_effect=sqlite3.OperationalError("unable to open database file"),
+        ):
+            with self.assertRaises(sqlite3.OperationalError):
+                eval_exec_match(
+                    db,
+                    query,
+                    query,
+                    plug_value=False,
+                    keep_distinct=False,
+                    progress_bar_for_each_datapoint=False,
+                )
+            self.assertEqual(
+                eval_exec_matches(
+                    [(db, query, query)], plug_value=False, keep_distinct=False
+                ),
+                [0],
+            )
+
+    def test_eval_exec_match(self) -> None:
+        gold = "select distinct country from singer where age > 20"
+        for pred, expected in [
+            ("select distinct country from singer where age > 20", 1),
+            ("select distinct country from singer where age >= 21", 1),
+            ("select distinct country from singer where age > 25", 0),
+            (_INFINITE_QUERY, 0),
+        ]:
+            with self.subTest(pred=pred):
+                self.assertEqual(
+                    eval_exec_match(
+                        self._db,
+                        pred,
+                        gold,
+                        plug_value=False,
+                        keep_distinct=False,
+                        progress_bar_for_each_datapoint=False,
+                        timeout=0.1,
+                    ),
+                    expected,
+                )
+
+    @unittest.skipUnless(is_fork_available(), "requires fork")
+    def test_eval_exec_matches(self) -> None:
+        gold = "select distinct country from singer where age > 20"
+        examples = [
+            (self._db, pred, gold)
+            for pred in [
+                "select distinct country from singer where age > 20",
+                _INFINITE_QUERY,
+                "select distinct country from singer where age > 25",
+                "select distinct country from singer where age >= 21",
+            ]
+        ]
+        for num_workers in [1, 2]:
+            with self.subTest(num_workers=num_workers):
+                self.assertEqual(
+                    eval_exec_matches(
+                        examples,
+                        plug_value=False,
+                        keep_distinct=False,
+                        timeout=0.1,
+                        num_workers=num_workers,
+                    ),
+                    [1, 0, 0, 1],
+                )
@@ -2,105 +2,142 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from threading import Thread
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
+import time
 from typing import Any
-import uuid
 
 from eaas import Client, Config
+from eaas.endpoint import EndpointConfig
+import requests
+import requests.adapters
+
+from explainaboard.utils.logging import get_logger
+from explainaboard.utils.typing_utils import unwrap
 
 
 class AsyncEaaSRequest:
     """An asynchronous request to EaaS."""
 
-    def __init__(self, eaas_client: AsyncEaaSClient, request_id: str):
+    def __init__(self, future: Future[dict]):
         """Constructor.
 
         Args:
-            eaas_client: The client that was used in making the request.
-            request_id: The ID of the request.
+            future: The future of the result of the request.
         """
-        self._eaas_client: AsyncEaaSClient = eaas_client
-        self._request_id: str = request_id
-        self._result: dict | None = None
+        self._future = future
 
-    def get_result(self) -> dict | None:
+    def get_result(self) -> dict:
         """Fetch the result from a request that was made previously.
 
         Returns:
             A dictionary containing the result.
         """
-        if self._result is None:
-            self._result = self._eaas_client.wait_and_get_result(self._request_id)
-        return self._result
+        return self._future.result()
 
 
-# TODO(odashi): Use async concurrency to implement this functionaliry.
 class AsyncEaaSClient(Client):
     """A wrapper class to support async requests for EaaS.
 
-    It uses threads so there is a
-    limit to the maximum number of parallel requests it can make.
+    Requests are sent from a fixed number of threads sharing a pool of connections,
+    so at most `max_in_flight` requests are in flight and the others wait in a
+    queue. Requests that fail with connection errors, timeouts or server errors are
+    retried with exponential backoff.
+
     Example usage:
-      1. `request_id = client.score([])` to start a new thread and make a request
-      2. `client.wait_and_get_result(request_id)` to join the thread and get the result,
-         this method can be called only once for each request_id
+      1. `request = client.async_score([], ...)` to queue a new request
+      2. `request.get_result()` to wait for the request and get the result
     """
 
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        endpoint_config: EndpointConfig | None = None,
+        max_in_flight: int = 4,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        timeout_seconds: float = 600.0,
+    ):
         """Constructor.
 
         Args:
             config: The configuration for the EaaS server.
+            endpoint_config: The endpoints of the EaaS server.
+            max_in_flight: The maximum number of requests sent concurrently.
+            max_retries: The maximum number of retries of each request.
+            backoff_seconds: The time to wait before the first retry, which is
+              doubled for each subsequent retry.
+            timeout_seconds: The timeout of each HTTP request.
         """
-        super().__init__(config)
-        self._threads: dict[str, Thread] = {}
-        self._results: dict[str, Any] = {}
+        super().__init__(config, endpoint_config or EndpointConfig())
+        self._max_retries = max_retries
+        self._backoff_seconds = backoff_seconds
+        self._timeout_seconds = timeout_seconds
+        self._session = requests.Session()
+        self._session.mount(
+            "http://", requests.adapters.HTTPAdapter(pool_maxsize=max_in_flight)
+        )
+        self._session.mount(
+            "https://", requests.adapters.HTTPAdapter(pool_maxsize=max_in_flight)
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="eaas"
+        )
 
-    def _run_thread(self, original_fn: Callable[[], Any]) -> AsyncEaaSRequest:
-        request_id = str(uuid.uuid1())
+    def _post_with_retries(self, data: dict[str, Any]) -> dict:
+        """Sends a request to the EaaS server, retrying on transient errors.
 
-        def fn():
-            self._results[request_id] = original_fn()
+        Args:
+            data: The content of the request.
 
-        self._threads[request_id] = Thread(target=fn)
-        self._threads[request_id].start()
-        return AsyncEaaSRequest(self, request_id)
+        Returns:
+            A dictionary of results from the request.
+        """
+        error: Exception | None = None
+        for attempt in range(self._max_retries + 1):
+            try:
+                response = self._session.post(
+                    url=self._endpoint_config.score_end_point,
+                    json=json.dumps(data),
+                    timeout=self._timeout_seconds,
+                )
+                if response.status_code == 200:
+                    return response.json()
+                error = ConnectionError(
+                    f"[Error {response.status_code}: {response.text}]"
+                )
+                # Client errors except rate limiting won't be fixed by retrying.
+                if response.status_code < 500 and response.status_code != 429:
+                    raise error
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            if attempt < self._max_retries:
+                wait_seconds = self._backoff_seconds * 2**attempt
+                get_logger().warning(
+                    f"EaaS request failed, retrying in {wait_seconds} seconds: {error}"
+                )
+                time.sleep(wait_seconds)
+        raise unwrap(error)
 
     def async_score(
         self,
         inputs: list[dict],
         metrics: list[str | dict],
         calculate: list[str],
-    ):
+    ) -> AsyncEaaSRequest:
         """Score generated text asynchronously.
 
         Args:
             inputs: The texts to score in the dictionary form
               {"source": ..., "hypothesis": ..., "references": [..., ...]}
             metrics: The metrics to be used in scoring
-            calculate: Whether to calculate on the "corpus", "stats", "sentence" level
-
-        Returns:
-            A thread ID corresponding to the thread doing the calculation
-        """
-        return self._run_thread(
-            lambda: super(AsyncEaaSClient, self).score(inputs, metrics, calculate)
-        )
-
-    def wait_and_get_result(self, request_id: str) -> dict:
-        """Wait for the request to complete and get the result.
-
-        Args:
-            request_id: The ID of the request
+            calculate: Whether to calculate on the "corpus", "stats", "sample" level
 
         Returns:
-            A dictionary of results from the request.
+            A request to obtain the result from.
         """
-        if request_id not in self._threads:
-            raise Exception(f"thread_id {request_id} doesn't exist")
-        self._threads[request_id].join()
-        result = self._results[request_id]
-        self._results.pop(request_id)
-        self._threads.pop(request_id)
-        return result
+        for metric in metrics:
+            if not self.validate_metric(metric):
+                raise ValueError(f"Invalid metric specification: {metric}")
+        data = {"inputs": inputs, "metrics": metrics, "calculate": calculate}
+        return AsyncEaaSRequest(self._executor.submit(self._post_with_retries, data))
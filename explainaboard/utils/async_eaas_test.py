@@ -0,0 +1,155 @@
+"""Tests for explainaboard.utils.async_eaas."""
+
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+import unittest
+
+from eaas import Config
+from eaas.endpoint import EndpointConfig
+
+from explainaboard.utils.async_eaas import AsyncEaaSClient
+
+
+class _StubEaaSServer(ThreadingHTTPServer):
+    """A server that scores hypotheses by their number of tokens."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StubEaaSHandler)
+        self.lock = threading.Lock()
+        self.num_failures = 0
+        self.status_on_failure = 503
+        self.num_requests = 0
+        self.num_in_flight = 0
+        self.max_in_flight = 0
+
+
+class _StubEaaSHandler(BaseHTTPRequestHandler):
+    server: _StubEaaSServer
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        # The client sends the request as a JSON-encoded string.
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        data = json.loads(json.loads(body))
+        with self.server.lock:
+            self.server.num_requests += 1
+            fail = self.server.num_failures > 0
+            if fail:
+                self.server.num_failures -= 1
+            self.server.num_in_flight += 1
+            self.server.max_in_flight = max(
+                self.server.max_in_flight, self.server.num_in_flight
+            )
+        time.sleep(0.05)
+        with self.server.lock:
+            self.server.num_in_flight -= 1
+
+        if fail:
+            status = self.server.status_on_failure
+            content = {"error": "unavailable"}
+        else:
+            status = 200
+            stats = [[len(x["hypothesis"].split())] for x in data["inputs"]]
+            content = {
+                "scores": [
+                    {"corpus": sum(x[0] for x in stats), "stats": stats}
+                    for _ in data["metrics"]
+                ]
+            }
+        encoded = json.dumps(content).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+class AsyncEaaSClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._server = _StubEaaSServer()
+        thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self._server.server_close)
+        self.addCleanup(self._server.shutdown)
+        host, port = self._server.server_address[:2]
+        self._endpoint_config = EndpointConfig(
+            score_end_point=f"http://{host}:{port}/score"
+        )
+
+    def _make_client(self, **kwargs) -> AsyncEaaSClient:
+        return AsyncEaaSClient(
+            Config(), self._endpoint_config, backoff_seconds=0.01, **kwargs
+        )
+
+    def test_score(self) -> None:
+        client = self._make_client()
+        request = client.async_score(
+            [{"source": "", "references": ["a"], "hypothesis": "a b c"}],
+            metrics=["length"],
+            calculate=["corpus", "stats"],
+        )
+        self.assertEqual(
+            request.get_result(), {"scores": [{"corpus": 3, "stats": [[3]]}]}
+        )
+
+    def test_max_in_flight(self) -> None:
+        client = self._make_client(max_in_flight=2)
+        requests = [
+            client.async_score(
+                [{"source": "", "references": ["a"], "hypothesis": "a " * i}],
+                metrics=["length"],
+                calculate=["stats"],
+            )
+            for i in range(6)
+        ]
+        self.assertEqual(
+            [r.get_result()["scores"][0]["stats"] for r in requests],
+            [[[i]] for i in range(6)],
+        )
+        self.assertEqual(self._server.max_in_flight, 2)
+
+    def test_retry(self) -> None:
+        self._server.num_failures = 2
+        client = self._make_client(max_retries=2)
+        request = client.async_score(
+            [{"source": "", "references": ["a"], "hypothesis": "a"}],
+            metrics=["length"],
+            calculate=["stats"],
+        )
+        self.assertEqual(request.get_result()["scores"][0]["stats"], [[1]])
+        self.assertEqual(self._server.num_requests, 3)
+
+    def test_too_many_failures(self) -> None:
+        self._server.num_failures = 3
+        client = self._make_client(max_retries=2)
+        request = client.async_score(
+            [{"source": "", "references": ["a"], "hypothesis": "a"}],
+            metrics=["length"],
+            calculate=["stats"],
+        )
+        with self.assertRaisesRegex(ConnectionError, "503"):
+            request.get_result()
+        self.assertEqual(self._server.num_requests, 3)
+
+    def test_no_retry_on_client_error(self) -> None:
+        self._server.num_failures = 1
+        self._server.status_on_failure = 400
+        client = self._make_client(max_retries=2)
+        request = client.async_score(
+            [{"source": "", "references": ["a"], "hypothesis": "a"}],
+            metrics=["length"],
+            calculate=["stats"],
+        )
+        with self.assertRaisesRegex(ConnectionError, "400"):
+            request.get_result()
+        self.assertEqual(self._server.num_requests, 1)
+
+    def test_invalid_metric(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Invalid metric"):
+            self._make_client().async_score([], metrics=["foo"], calculate=["stats"])
@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+import contextlib
 import datetime
+import hashlib
 import json
 import os
 from pathlib import Path
+import shutil
+import tempfile
 import urllib.request
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+
+from explainaboard.serialization.types import SerializableData
+from explainaboard.utils import statistics_store
 from explainaboard.utils.logging import get_logger
 
 
@@ -41,15 +53,22 @@ def get_cache_dir() -> str:
     return cache_dir
 
 
-def get_statistics_path(dataset_name: str, subset_name: str | None = None) -> str:
+def get_statistics_path(
+    dataset_name: str,
+    subset_name: str | None = None,
+    info: dict[str, SerializableData] | None = None,
+) -> str:
     """Get the path to statistics for a particular dataset.
 
     Args:
         dataset_name: The dataset.
         subset_name: The sub dataset.
+        info: Information about how the statistics were calculated, e.g., the task,
+            the tokenizers and the split. Statistics with different information are
+            stored in different directories.
 
     Returns:
-        The path to the statistics.
+        The path to the directory storing the statistics.
     """
     # Sanitize file path
     if "/" in dataset_name or (subset_name is not None and "/" in subset_name):
@@ -57,49 +76,113 @@ def get_statistics_path(dataset_name: str, subset_name: str | None = None) -> st
             "dataset names cannot contain slashes:"
             f"dataset_name={dataset_name}, subset_name={subset_name}"
         )
-    file_name = "stats.json" if subset_name is None else f"stats-{subset_name}.json"
-    return os.path.join(get_cache_dir(), "stats", dataset_name, file_name)
+    info_hash = hashlib.sha256(
+        json.dumps(info or {}, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+    return os.path.join(
+        get_cache_dir(),
+        "stats",
+        dataset_name,
+        subset_name if subset_name is not None else "default",
+        info_hash,
+    )
+
+
+@contextlib.contextmanager
+def lock_statistics_cache(
+    dataset_name: str,
+    subset_name: str | None = None,
+    info: dict[str, SerializableData] | None = None,
+) -> Iterator[None]:
+    """Locks cached statistics across processes.
+
+    Processes that read statistics, calculate them if they are not cached, and
+    write them within this context calculate the same statistics only once.
+
+    This is an advisory lock that relies on `fcntl`. On platforms without it, this
+    function does nothing, but statistics are still written atomically.
+
+    Args:
+        dataset_name: The name of the dataset.
+        subset_name: The name of the sub-dataset.
+        info: Information about how the statistics were calculated.
+    """
+    stats_path = get_statistics_path(dataset_name, subset_name, info)
+    os.makedirs(os.path.dirname(stats_path), exist_ok=True)
+    if fcntl is None:
+        yield
+        return
+    with open(f"{stats_path}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 
 def read_statistics_from_cache(
     dataset_name: str,
     subset_name: str | None = None,
+    info: dict[str, SerializableData] | None = None,
 ) -> dict | None:
     """Return statistics from the cache.
 
+    Large mappings in the statistics are memory-mapped read-only mappings instead of
+    dicts.
+
     Args:
         dataset_name: The name of the dataset.
         subset_name: The name of the sub-dataset.
+        info: Information about how the statistics were calculated, e.g., the
+            tokenizers. Statistics calculated differently are not returned.
 
     Returns:
         A dictionary of statistics or None if they don't exist
     """
-    stats_path = get_statistics_path(dataset_name, subset_name)
-    if os.path.exists(stats_path):
-        with open(stats_path, "r") as stats_in:
-            return json.load(stats_in)
-    else:
-        return None
+    stats_path = get_statistics_path(dataset_name, subset_name, info)
+    return statistics_store.read_statistics(stats_path, info or {})
 
 
 def write_statistics_to_cache(
     content: dict,
     dataset_name: str,
     subset_name: str | None = None,
+    info: dict[str, SerializableData] | None = None,
 ) -> None:
     """Write statistics to the cache.
 
+    The statistics are written to a temporary directory, which is then renamed, so
+    that readers never observe partially written statistics. If other process has
+    already written the same statistics, they are kept.
+
     Args:
         content: The content to be written.
         dataset_name: The name of the dataset.
         subset_name: The name of the sub-dataset.
+        info: Information about how the statistics were calculated, e.g., the
+            tokenizers.
     """
-    stats_path = get_statistics_path(dataset_name, subset_name)
-    path_dir = Path(stats_path).parent.absolute()
-    if not os.path.exists(path_dir):
-        os.makedirs(path_dir)
-    with open(stats_path, "w") as stats_out:
-        json.dump(content, stats_out)
+    stats_path = get_statistics_path(dataset_name, subset_name, info)
+    parent_dir = os.path.dirname(stats_path)
+    os.makedirs(parent_dir, exist_ok=True)
+    temp_path = tempfile.mkdtemp(
+        prefix=f".{os.path.basename(stats_path)}-", dir=parent_dir
+    )
+    try:
+        statistics_store.write_statistics(temp_path, content, info or {})
+        if os.path.exists(stats_path):
+            # Statistics without a manifest were left by an old or failed writer.
+            if statistics_store.read_statistics(stats_path, info or {}) is not None:
+                return
+            shutil.rmtree(stats_path)
+        os.rename(temp_path, stats_path)
+    except OSError:
+        # Other process renamed its directory first.
+        if statistics_store.read_statistics(stats_path, info or {}) is None:
+            raise
+    finally:
+        if os.path.exists(temp_path):
+            shutil.rmtree(temp_path)
 
 
 def cache_online_file(
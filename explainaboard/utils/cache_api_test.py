@@ -0,0 +1,91 @@
+"""Tests for explainaboard.utils.cache_api."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from explainaboard.utils.cache_api import (
+    get_statistics_path,
+    lock_statistics_cache,
+    read_statistics_from_cache,
+    write_statistics_to_cache,
+)
+from explainaboard.utils.parallel import fork_imap, is_fork_available
+
+
+class StatisticsCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tempdir = tempfile.TemporaryDirectory()
+        self._env = mock.patch.dict(
+            os.environ, {"EXPLAINABOARD_CACHE": self._tempdir.name}
+        )
+        self._env.start()
+
+    def tearDown(self) -> None:
+        self._env.stop()
+        self._tempdir.cleanup()
+
+    def test_path_depends_on_info(self) -> None:
+        path1 = get_statistics_path("dataset", None, {"tokenizer": "a"})
+        path2 = get_statistics_path("dataset", None, {"tokenizer": "b"})
+        self.assertNotEqual(path1, path2)
+        self.assertEqual(os.path.dirname(path1), os.path.dirname(path2))
+        self.assertEqual(
+            path1, get_statistics_path("dataset", None, {"tokenizer": "a"})
+        )
+        self.assertNotEqual(
+            os.path.dirname(path1),
+            os.path.dirname(get_statistics_path("dataset", "sub", {})),
+        )
+
+    def test_invalid_name(self) -> None:
+        with self.assertRaises(ValueError):
+            get_statistics_path("data/set")
+
+    def test_write_and_read(self) -> None:
+        info = {"tokenizer": "a"}
+        self.assertIsNone(read_statistics_from_cache("dataset", None, info))
+        write_statistics_to_cache({"vocab": {"x": 1}}, "dataset", None, info)
+        stats = read_statistics_from_cache("dataset", None, info)
+        self.assertEqual(dict(stats["vocab"]), {"x": 1})
+        self.assertIsNone(
+            read_statistics_from_cache("dataset", None, {"tokenizer": "b"})
+        )
+        # No temporary directories are left.
+        parent_dir = os.path.dirname(get_statistics_path("dataset", None, info))
+        self.assertEqual(
+            [name for name in os.listdir(parent_dir) if name.startswith(".")], []
+        )
+
+    def test_write_keeps_existing(self) -> None:
+        write_statistics_to_cache({"vocab": {"x": 1}}, "dataset")
+        write_statistics_to_cache({"vocab": {"x": 2}}, "dataset")
+        stats = read_statistics_from_cache("dataset")
+        self.assertEqual(dict(stats["vocab"]), {"x": 1})
+
+    def test_write_replaces_incomplete(self) -> None:
+        os.makedirs(get_statistics_path("dataset"))
+        write_statistics_to_cache({"vocab": {"x": 1}}, "dataset")
+        stats = read_statistics_from_cache("dataset")
+        self.assertEqual(dict(stats["vocab"]), {"x": 1})
+
+    @unittest.skipUnless(is_fork_available(), "fork is not available")
+    def test_concurrent_writers(self) -> None:
+        counter_path = os.path.join(self._tempdir.name, "counter")
+
+        def calculate_once(_: int) -> int:
+            with lock_statistics_cache("dataset"):
+                stats = read_statistics_from_cache("dataset")
+                if stats is None:
+                    with open(counter_path, "a") as f:
+                        f.write("x")
+                    stats = {"vocab": {"x": 1}}
+                    write_statistics_to_cache(stats, "dataset")
+            return stats["vocab"]["x"]
+
+        self.assertEqual(list(fork_imap(calculate_once, range(8), 4)), [1] * 8)
+        with open(counter_path) as f:
+            self.assertEqual(f.read(), "x")
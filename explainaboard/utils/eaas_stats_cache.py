@@ -0,0 +1,213 @@
+"""A persistent cache of per-sample statistics of EaaS metrics."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, final
+
+from explainaboard.serialization.types import SerializableData
+from explainaboard.utils.cache_api import get_cache_dir
+
+# The maximum number of keys in a single SQL statement.
+_MAX_KEYS_PER_QUERY = 500
+# The number of statistics evicted by a single SQL statement.
+_EVICTION_BATCH_SIZE = 1000
+
+
+@final
+class EaaSStatsCache:
+    """A persistent cache of per-sample statistics of EaaS metrics.
+
+    Statistics are stored in an SQLite database keyed by a hash of the metric, its
+    configuration and the texts of the sample, so they are reused by any system
+    output containing the same sample. Processes can share the same database.
+    When the total size of the statistics exceeds `max_bytes`, the least recently
+    used statistics are evicted. The total size is kept in a one-row table, which is
+    updated in the same transaction as the statistics.
+
+    Attributes:
+        hits: The number of statistics found in the cache.
+        misses: The number of statistics not found in the cache.
+    """
+
+    DEFAULT_MAX_BYTES = 1 << 30
+
+    def __init__(
+        self, path: str | None = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """Initializes EaaSStatsCache.
+
+        Args:
+            path: The path to the database. If not given, it is created in the
+                cache directory.
+            max_bytes: The maximum total size of the stored statistics.
+        """
+        if path is None:
+            path = os.path.join(get_cache_dir(), "eaas_stats.sqlite3")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._path = path
+        self._max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS stats ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS stats_last_access ON stats (last_access)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta ("
+                "id INTEGER PRIMARY KEY CHECK (id = 0), total_bytes INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (id, total_bytes) "
+                "SELECT 0, COALESCE(SUM(size), 0) FROM stats"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Opens a connection, and commits the changes when exiting."""
+        conn = sqlite3.connect(self._path, timeout=60.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(
+        metric_name: str,
+        metric_config: dict[str, SerializableData],
+        source: str | None,
+        references: Sequence[str],
+        hypothesis: str,
+    ) -> str:
+        """Makes the key of the statistics of a sample.
+
+        Args:
+            metric_name: The name of the metric.
+            metric_config: The configuration of the metric.
+            source: The source text.
+            references: The reference texts.
+            hypothesis: The hypothesis text.
+
+        Returns:
+            The key.
+        """
+        content = json.dumps(
+            [metric_name, metric_config, source, list(references), hypothesis],
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Looks up statistics.
+
+        Args:
+            keys: The keys of the statistics.
+
+        Returns:
+            The statistics found in the cache, keyed by their keys.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, Any] = {}
+        with self._connect() as conn:
+            now = time.time()
+            for begin in range(0, len(unique_keys), _MAX_KEYS_PER_QUERY):
+                chunk = unique_keys[begin : begin + _MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, value FROM stats WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, value in rows:
+                    found[key] = json.loads(value)
+                conn.execute(
+                    f"UPDATE stats SET last_access = ? WHERE key IN ({placeholders})",
+                    [now, *chunk],
+                )
+        num_hits = sum(1 for key in keys if key in found)
+        self.hits += num_hits
+        self.misses += len(keys) - num_hits
+        return found
+
+    def put_many(self, items: dict[str, Any]) -> None:
+        """Stores statistics, evicting old ones if the cache is full.
+
+        Args:
+            items: The statistics to store, keyed by their keys.
+        """
+        now = time.time()
+        rows = []
+        for key, value in items.items():
+            encoded = json.dumps(value)
+            rows.append((key, encoded, len(key) + len(encoded), now))
+        with self._connect() as conn:
+            # Takes the write lock first, so that the replaced sizes stay valid.
+            conn.execute("BEGIN IMMEDIATE")
+            keys = list(items.keys())
+            replaced_bytes = 0
+            for begin in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                chunk = keys[begin : begin + _MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" * len(chunk))
+                replaced_bytes += conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM stats "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchone()[0]
+            conn.executemany(
+                "INSERT OR REPLACE INTO stats (key, value, size, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._add_total_bytes(conn, sum(row[2] for row in rows) - replaced_bytes)
+            self._evict(conn)
+
+    @staticmethod
+    def _add_total_bytes(conn: sqlite3.Connection, delta: int) -> None:
+        """Adds to the total size of the stored statistics."""
+        conn.execute(
+            "UPDATE meta SET total_bytes = total_bytes + ? WHERE id = 0", [delta]
+        )
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Deletes the least recently used statistics exceeding the maximum size."""
+        (total_bytes,) = conn.execute(
+            "SELECT total_bytes FROM meta WHERE id = 0"
+        ).fetchone()
+        oldest = "SELECT {} FROM stats ORDER BY last_access, rowid LIMIT ?"
+        while total_bytes > self._max_bytes:
+            # Only the sizes of the oldest statistics are read through the index.
+            sizes = conn.execute(
+                oldest.format("size"), [_EVICTION_BATCH_SIZE]
+            ).fetchall()
+            if not sizes:
+                break
+            num_evicted = 0
+            evicted_bytes = 0
+            for (size,) in sizes:
+                if total_bytes - evicted_bytes <= self._max_bytes:
+                    break
+                num_evicted += 1
+                evicted_bytes += size
+            conn.execute(
+                f"DELETE FROM stats WHERE key IN ({oldest.format('key')})",
+                [num_evicted],
+            )
+            self._add_total_bytes(conn, -evicted_bytes)
+            total_bytes -= evicted_bytes
+
+    def __len__(self) -> int:
+        """Returns the number of stored statistics."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM stats").fetchone()[0]
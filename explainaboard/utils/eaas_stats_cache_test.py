@@ -0,0 +1,108 @@
+"""Tests for explainaboard.utils.eaas_stats_cache."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from explainaboard.utils import eaas_stats_cache
+from explainaboard.utils.eaas_stats_cache import EaaSStatsCache
+
+
+def _total_bytes(path: str) -> tuple[int, int]:
+    """Returns the running total and the actual total of the sizes."""
+    conn = sqlite3.connect(path)
+    try:
+        return (
+            conn.execute("SELECT total_bytes FROM meta").fetchone()[0],
+            conn.execute("SELECT COALESCE(SUM(size), 0) FROM stats").fetchone()[0],
+        )
+    finally:
+        conn.close()
+
+
+class EaaSStatsCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tempdir.cleanup)
+        self._path = os.path.join(self._tempdir.name, "stats.sqlite3")
+
+    def test_make_key(self) -> None:
+        key = EaaSStatsCache.make_key("bleu", {}, "src", ["ref"], "hyp")
+        self.assertEqual(
+            key, EaaSStatsCache.make_key("bleu", {}, "src", ["ref"], "hyp")
+        )
+        for other in [
+            EaaSStatsCache.make_key("chrf", {}, "src", ["ref"], "hyp"),
+            EaaSStatsCache.make_key("bleu", {"lowercase": True}, "src", ["ref"], "hyp"),
+            EaaSStatsCache.make_key("bleu", {}, "src2", ["ref"], "hyp"),
+            EaaSStatsCache.make_key("bleu", {}, "src", ["ref", "ref2"], "hyp"),
+            EaaSStatsCache.make_key("bleu", {}, "src", ["ref"], "hyp2"),
+        ]:
+            self.assertNotEqual(key, other)
+
+    def test_get_and_put(self) -> None:
+        cache = EaaSStatsCache(self._path)
+        self.assertEqual(cache.get_many(["a", "b"]), {})
+        cache.put_many({"a": [1, 2], "b": 0.5})
+        self.assertEqual(cache.get_many(["a", "b", "c", "a"]), {"a": [1, 2], "b": 0.5})
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(cache.misses, 3)
+        # The statistics persist.
+        self.assertEqual(EaaSStatsCache(self._path).get_many(["a"]), {"a": [1, 2]})
+        self.assertEqual(len(cache), 2)
+
+    def test_many_keys(self) -> None:
+        cache = EaaSStatsCache(self._path)
+        items = {str(i): i for i in range(1234)}
+        cache.put_many(items)
+        self.assertEqual(cache.get_many(list(items)), items)
+
+    def test_evict_least_recently_used(self) -> None:
+        # Each item takes 2 bytes.
+        cache = EaaSStatsCache(self._path, max_bytes=6)
+        cache.put_many({"a": 1})
+        cache.put_many({"b": 2})
+        cache.put_many({"c": 3})
+        cache.get_many(["a"])
+        cache.put_many({"d": 4})
+        self.assertEqual(cache.get_many(["a", "b", "c", "d"]), {"a": 1, "c": 3, "d": 4})
+
+    def test_total_bytes(self) -> None:
+        cache = EaaSStatsCache(self._path)
+        cache.put_many({"a": 1, "b": 22})
+        self.assertEqual(_total_bytes(self._path), (5, 5))
+        # Replaced statistics are not counted twice.
+        cache.put_many({"a": 333, "c": 4})
+        self.assertEqual(_total_bytes(self._path), (9, 9))
+
+    def test_evict_in_batches(self) -> None:
+        cache = EaaSStatsCache(self._path, max_bytes=10)
+        # Only the last 5 items of 2 bytes are kept.
+        for i in range(10):
+            cache.put_many({str(i): i})
+        # Evicting 4 of them for the new item of 8 bytes takes 2 batches.
+        with mock.patch.object(eaas_stats_cache, "_EVICTION_BATCH_SIZE", 2):
+            cache.put_many({"xx": 123456})
+        self.assertEqual(
+            cache.get_many([str(i) for i in range(10)] + ["xx"]),
+            {"9": 9, "xx": 123456},
+        )
+        self.assertEqual(_total_bytes(self._path), (10, 10))
+
+    def test_existing_database(self) -> None:
+        conn = sqlite3.connect(self._path)
+        conn.execute(
+            "CREATE TABLE stats (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+        )
+        conn.execute("INSERT INTO stats VALUES ('a', '1', 2, 0.0)")
+        conn.commit()
+        conn.close()
+        cache = EaaSStatsCache(self._path, max_bytes=4)
+        self.assertEqual(_total_bytes(self._path), (2, 2))
+        cache.put_many({"b": 2, "c": 3})
+        self.assertEqual(cache.get_many(["a", "b", "c"]), {"b": 2, "c": 3})
@@ -0,0 +1,139 @@
+"""A pluggable JSON backend for reading system outputs and reading/writing reports.
+
+orjson is used when it is installed, and the standard `json` module otherwise. The
+backend can be chosen with the environment variable `EXPLAINABOARD_JSON_BACKEND`
+("orjson" or "json") or `set_json_backend`. Both backends read and write the same
+documents: inputs that orjson rejects (e.g. `NaN`) and outputs that it can't
+represent faithfully are handled by the standard module.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from typing import Any, IO
+
+from explainaboard.utils.typing_utils import unwrap
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+_BACKENDS = ("orjson", "json")
+
+_backend: str | None = None
+
+
+def get_json_backend() -> str:
+    """Get the name of the JSON backend in use.
+
+    Returns:
+        "orjson" or "json".
+    """
+    if _backend is None:
+        default = "orjson" if orjson is not None else "json"
+        set_json_backend(os.environ.get("EXPLAINABOARD_JSON_BACKEND", default))
+    return unwrap(_backend)
+
+
+def set_json_backend(name: str | None) -> None:
+    """Set the JSON backend.
+
+    Args:
+        name: "orjson" or "json", or None to choose it by `get_json_backend` again.
+
+    Raises:
+        ValueError: if the backend is unknown or not installed.
+    """
+    global _backend
+    if name not in _BACKENDS and name is not None:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    if name == "orjson" and orjson is None:
+        raise ValueError("The JSON backend orjson is not installed")
+    _backend = name
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: The JSON document.
+
+    Returns:
+        The deserialized object.
+    """
+    if get_json_backend() == "orjson":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The standard module also accepts NaN and Infinity, or reports the
+            # error in its usual format.
+            pass
+    return json.loads(data)
+
+
+def load(fp: IO) -> Any:
+    """Deserialize a JSON document from a file.
+
+    Args:
+        fp: The file object opened in either text or binary mode.
+
+    Returns:
+        The deserialized object.
+    """
+    return loads(fp.read())
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """Check if an object contains NaN or infinity, which orjson writes as null."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(x) for x in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(x) for x in obj)
+    return False
+
+
+def dumps(obj: Any, compact: bool = False) -> str:
+    """Serialize an object to a JSON document.
+
+    Args:
+        obj: The object to serialize.
+        compact: Whether to omit indentation and line breaks. Otherwise, the
+          document is indented by 2 spaces.
+
+    Returns:
+        The JSON document.
+    """
+    if get_json_backend() == "orjson":
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        try:
+            encoded = orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers larger than 64 bits.
+            encoded = None
+        # orjson writes NaN and infinity as null, which needs to be checked only if
+        # there is a null in the output.
+        if encoded is not None and not (
+            b"null" in encoded and _has_non_finite_float(obj)
+        ):
+            return encoded.decode("utf-8")
+    if compact:
+        return json.dumps(obj, separators=(",", ":"))
+    return json.dumps(obj, indent=2)
+
+
+def dump(obj: Any, fp: IO[str], compact: bool = False) -> None:
+    """Serialize an object to a JSON document in a file.
+
+    Args:
+        obj: The object to serialize.
+        fp: The file object opened in text mode.
+        compact: Whether to omit indentation and line breaks.
+    """
+    fp.write(dumps(obj, compact=compact))
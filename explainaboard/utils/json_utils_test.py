@@ -0,0 +1,84 @@
+"""Tests for explainaboard.utils.json_utils."""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+import unittest
+
+from explainaboard.utils import json_utils
+
+_DATA = {
+    "name": "système",
+    "values": [1, 2.5, -3, None, True],
+    "nested": {"a": [], "b": {}, "c": [{"d": "e"}]},
+}
+
+
+class JSONUtilsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(json_utils.set_json_backend, None)
+
+    def _backends(self) -> list[str]:
+        backends = ["json"]
+        if json_utils.orjson is not None:
+            backends.append("orjson")
+        return backends
+
+    def test_round_trip(self) -> None:
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                json_utils.set_json_backend(backend)
+                for compact in [False, True]:
+                    encoded = json_utils.dumps(_DATA, compact=compact)
+                    self.assertEqual(json.loads(encoded), _DATA)
+                    self.assertEqual(json_utils.loads(encoded), _DATA)
+                    self.assertEqual(json_utils.loads(encoded.encode()), _DATA)
+
+    def test_indent(self) -> None:
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                json_utils.set_json_backend(backend)
+                self.assertEqual(
+                    json_utils.dumps({"a": [1, {"b": 2}]}),
+                    '{\n  "a": [\n    1,\n    {\n      "b": 2\n    }\n  ]\n}',
+                )
+                self.assertEqual(
+                    json_utils.dumps({"a": [1, {"b": 2}]}, compact=True),
+                    '{"a":[1,{"b":2}]}',
+                )
+
+    def test_non_finite(self) -> None:
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                json_utils.set_json_backend(backend)
+                encoded = json_utils.dumps({"a": [1.0, math.nan], "b": math.inf})
+                decoded = json_utils.loads(encoded)
+                self.assertTrue(math.isnan(decoded["a"][1]))
+                self.assertEqual(decoded["b"], math.inf)
+
+    def test_non_str_keys(self) -> None:
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                json_utils.set_json_backend(backend)
+                self.assertEqual(
+                    json_utils.loads(json_utils.dumps({1: "a"})), {"1": "a"}
+                )
+
+    def test_invalid_document(self) -> None:
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                json_utils.set_json_backend(backend)
+                with self.assertRaises(json.JSONDecodeError):
+                    json_utils.loads('{"a": ')
+
+    def test_file(self) -> None:
+        buffer = io.StringIO()
+        json_utils.dump(_DATA, buffer)
+        buffer.seek(0)
+        self.assertEqual(json_utils.load(buffer), _DATA)
+
+    def test_unknown_backend(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Unknown JSON backend"):
+            json_utils.set_json_backend("simplejson")
@@ -0,0 +1,113 @@
+"""Utilities to run functions over multiple processes."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+import multiprocessing
+from multiprocessing.pool import AsyncResult
+from typing import Any, Optional, TypeVar
+
+from explainaboard.utils.logging import get_logger
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+# The function applied by the worker processes of `fork_imap`. Workers inherit it
+# through fork, so it does not need to be picklable.
+_forked_func: Optional[Callable[[Any], Any]] = None
+
+# Whether this process is a worker of `fork_imap`. Workers can't start processes of
+# their own, so `fork_imap` called inside them runs sequentially.
+_in_worker = False
+
+
+def _init_worker() -> None:
+    """Mark the current process as a worker of `fork_imap`."""
+    global _in_worker
+    _in_worker = True
+
+
+def _call_forked_func(arg: Any) -> Any:
+    """Apply the function inherited from the parent process to `arg`."""
+    if _forked_func is None:
+        raise RuntimeError("No function was given to the forked process.")
+    return _forked_func(arg)
+
+
+def is_fork_available() -> bool:
+    """Check whether the platform can start processes with fork."""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def fork_imap(
+    func: Callable[[T], U],
+    args: Iterable[T],
+    num_workers: int,
+    max_pending: int | None = None,
+) -> Iterator[U]:
+    """Apply a function to each argument using a pool of forked processes.
+
+    Unlike `multiprocessing.Pool.imap`, `func` is inherited by the workers through
+    fork rather than pickled, so it can be a lambda or a closure referring to large
+    objects, which are shared with the parent process without being copied upfront.
+    Only the arguments and the return values are sent between the processes.
+
+    If `num_workers` is less than 2, fork is not available on the platform, or the
+    current process is itself a worker of `fork_imap` (e.g., when the systems
+    evaluated in parallel calculate their features), `func` is applied sequentially
+    in the current process.
+
+    The workers are forked from the current process with only the calling thread.
+    If other threads are running at that time, e.g., threads sending requests to
+    the EaaS server, locks they hold (of logging, connection pools, etc.) stay
+    locked forever in the workers, which may deadlock them. Don't call this while
+    such threads may be running.
+
+    By default, `args` is read by a thread of the pool as fast as the arguments can
+    be queued. If `max_pending` is given, `args` is read in the calling thread and
+    only `max_pending` arguments are sent ahead of the returned values, so a lazily
+    generated stream of large arguments is processed by a single pool without
+    being held in memory at once.
+
+    Args:
+        func: The function to apply. Its return values must be picklable.
+        args: The arguments to apply `func` to. They must be picklable.
+        num_workers: The number of worker processes.
+        max_pending: The maximum number of arguments sent to the workers whose
+            return values are not yet consumed.
+
+    Returns:
+        An iterator over the return values of `func`, in the order of `args`.
+    """
+    global _forked_func
+
+    if num_workers < 2 or _in_worker:
+        yield from map(func, args)
+        return
+    if not is_fork_available():
+        get_logger().warning(
+            "Fork is not available on this platform. Running in a single process."
+        )
+        yield from map(func, args)
+        return
+    if _forked_func is not None:
+        raise RuntimeError("fork_imap can not be nested.")
+
+    _forked_func = func
+    try:
+        with multiprocessing.get_context("fork").Pool(
+            num_workers, initializer=_init_worker
+        ) as pool:
+            if max_pending is None:
+                yield from pool.imap(_call_forked_func, args)
+                return
+            pending: deque[AsyncResult] = deque()
+            for arg in args:
+                pending.append(pool.apply_async(_call_forked_func, (arg,)))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+    finally:
+        _forked_func = None
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+import os
+import unittest
+
+from explainaboard.utils.parallel import fork_imap, is_fork_available
+
+
+class ForkImapTest(unittest.TestCase):
+    def test_sequential(self) -> None:
+        self.assertEqual(list(fork_imap(lambda x: x * 2, range(5), 1)), [0, 2, 4, 6, 8])
+
+    @unittest.skipUnless(is_fork_available(), "fork is not available")
+    def test_parallel_with_closure(self) -> None:
+        offset = {"value": 10}
+        results = list(
+            fork_imap(lambda x: (x + offset["value"], os.getpid()), range(100), 3)
+        )
+        self.assertEqual([x for x, _ in results], list(range(10, 110)))
+        self.assertNotIn(os.getpid(), {pid for _, pid in results})
+
+    @unittest.skipUnless(is_fork_available(), "fork is not available")
+    def test_parallel_error(self) -> None:
+        def func(x: int) -> int:
+            if x == 3:
+                raise ValueError("error in worker")
+            return x
+
+        with self.assertRaisesRegex(ValueError, "error in worker"):
+            list(fork_imap(func, range(5), 2))
+        # The function is released after the error.
+        self.assertEqual(list(fork_imap(lambda x: x, range(3), 2)), [0, 1, 2])
+
+    @unittest.skipUnless(is_fork_available(), "fork is not available")
+    def test_nested_in_worker(self) -> None:
+        def func(x: int) -> tuple[int, set[int]]:
+            pids = {pid for _, pid in fork_imap(lambda y: (y, os.getpid()), [x], 2)}
+            return x, pids | {os.getpid()}
+
+        results = list(fork_imap(func, range(4), 2))
+        self.assertEqual([x for x, _ in results], list(range(4)))
+        # The nested calls run in the worker itself.
+        self.assertTrue(all(len(pids) == 1 for _, pids in results))
+
+    @unittest.skipUnless(is_fork_available(), "fork is not available")
+    def test_max_pending(self) -> None:
+        num_read = 0
+
+        def generate() -> Iterator[int]:
+            nonlocal num_read
+            for x in range(20):
+                num_read += 1
+                yield x
+
+        results = []
+        for x in fork_imap(lambda x: x * 2, generate(), 2, max_pending=3):
+            # Only 3 arguments are read ahead of the consumed values.
+            self.assertLessEqual(num_read, len(results) + 3)
+            results.append(x)
+        self.assertEqual(results, [x * 2 for x in range(20)])
+
+    @unittest.skipUnless(is_fork_available(), "fork is not available")
+    def test_max_pending_error(self) -> None:
+        def func(x: int) -> int:
+            if x == 3:
+                raise ValueError("error in worker")
+            return x
+
+        with self.assertRaisesRegex(ValueError, "error in worker"):
+            list(fork_imap(func, range(10), 2, max_pending=2))
+        self.assertEqual(list(fork_imap(lambda x: x, range(3), 2)), [0, 1, 2])
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import abc
+from collections import defaultdict
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass
 from typing import Any, cast, Optional
 
@@ -394,6 +396,24 @@ class SpanOps:
             "position_tag": span_position_tag_match,
         }
 
+    def _get_match_keys(self) -> dict[str, Callable[[Span], Hashable]]:
+        """Get the functions returning what is compared by each type of matching.
+
+        Spans in the same sample match if and only if their keys are equal, so they
+        can be matched by looking up the keys in a hash table.
+
+        Returns:
+            A mapping from the match type to the function returning the key of a
+            span.
+        """
+        return {
+            "tag": lambda span: span.span_tag,
+            "text": lambda span: span.span_text,
+            "text_tag": lambda span: (span.span_tag, span.span_text),
+            "position": lambda span: span.span_pos,
+            "position_tag": lambda span: (span.span_tag, span.span_pos),
+        }
+
     def _create_span(
         self,
         tags: list[str],
@@ -521,6 +541,9 @@ class SpanOps:
     ) -> tuple[list[int], list[int], list[Span], list[Span]]:
         """Get the spans that match between two lists of spans.
 
+        Spans are compared only within the same sample. The pairs of matched spans
+        are found through a hash table, which takes linear time in expectation.
+
         Args:
             spans_a: One list.
             spans_b: The other list.
@@ -537,17 +560,32 @@ class SpanOps:
         matched_spans_a = []
         matched_spans_b = []
 
-        # return matched_a_index, matched_b_index, matched_spans_a, matched_spans_b
-        # TODO(Pengfei): this part is not very efficient
+        match_key = self._get_match_keys().get(self.match_type)
+        if match_key is None:
+            # Match types without keys, e.g., added by subclasses, compare every pair.
+            for idx, span_dic_a in enumerate(spans_a):
+                for idy, span_dic_b in enumerate(spans_b):
+                    if span_dic_a.sample_id != span_dic_b.sample_id:
+                        continue
+                    if self.match_func(span_dic_a, span_dic_b):
+                        matched_a_index.append(idx)
+                        matched_b_index.append(idy)
+                        matched_spans_a.append(span_dic_a)
+                        matched_spans_b.append(span_dic_b)
+            return matched_a_index, matched_b_index, matched_spans_a, matched_spans_b
+
+        # Index "b" by the sample ID and the key, then look up each span in "a". The
+        # indices of "b" are kept in order, so the pairs are listed in the same
+        # order as comparing every pair of spans.
+        b_indices: defaultdict[tuple[Any, Hashable], list[int]] = defaultdict(list)
+        for idy, span_dic_b in enumerate(spans_b):
+            b_indices[span_dic_b.sample_id, match_key(span_dic_b)].append(idy)
         for idx, span_dic_a in enumerate(spans_a):
-            for idy, span_dic_b in enumerate(spans_b):
-                if span_dic_a.sample_id != span_dic_b.sample_id:
-                    continue
-                if self.match_func(span_dic_a, span_dic_b):
-                    matched_a_index.append(idx)
-                    matched_b_index.append(idy)
-                    matched_spans_a.append(span_dic_a)
-                    matched_spans_b.append(span_dic_b)
+            for idy in b_indices.get((span_dic_a.sample_id, match_key(span_dic_a)), ()):
+                matched_a_index.append(idx)
+                matched_b_index.append(idy)
+                matched_spans_a.append(span_dic_a)
+                matched_spans_b.append(spans_b[idy])
         return matched_a_index, matched_b_index, matched_spans_a, matched_spans_b
 
 
@@ -574,6 +612,13 @@ class BIOSpanOps(SpanOps):
 
     _DEFAULT = "O"
 
+    def __init__(
+        self, resources: dict[str, Any] | None = None, match_type: Optional[str] = None
+    ):
+        """See SpanOps.__init__."""
+        super().__init__(resources, match_type)
+        self._span_types: dict[str, str] = {}
+
     @classmethod
     def default_match_type(cls) -> str:
         """See SpanOps.default_match_type."""
@@ -589,4 +634,10 @@ class BIOSpanOps(SpanOps):
         )
 
     def _span_type(self, tags: list[str], pos: tuple[int, int]) -> str:
-        return tags[pos[0]].split("-")[1]
+        # The type of each tag is computed once, so spans of the same type share a
+        # single string.
+        tag = tags[pos[0]]
+        span_type = self._span_types.get(tag)
+        if span_type is None:
+            span_type = self._span_types[tag] = tag.split("-")[1]
+        return span_type
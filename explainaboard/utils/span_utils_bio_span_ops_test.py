@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import random
 import unittest
 
-from explainaboard.utils.span_utils import BIOSpanOps
+from explainaboard.utils.span_utils import BIOSpanOps, Span
 
 
 class BIOSpanOpsTest(unittest.TestCase):
@@ -20,6 +21,12 @@ class BIOSpanOpsTest(unittest.TestCase):
         self.assertEqual(span_text_list, ["New York", "Beijing"])
         self.assertEqual(span_tag_list, ["LOC", "LOC"])
 
+    def test_get_spans_simple_shares_tags(self):
+        bio_span_ops = BIOSpanOps()
+        spans = bio_span_ops.get_spans_simple(["B-LOC", "I-LOC", "O", "B-LOC"])
+        self.assertEqual(spans, [("LOC", 0, 2), ("LOC", 3, 4)])
+        self.assertIs(spans[0][0], spans[1][0])
+
     def test_get_matched_spans(self):
 
         # Span a
@@ -75,3 +82,36 @@ class BIOSpanOpsTest(unittest.TestCase):
             spans_b, spans_c
         )
         self.assertEqual([span.get_span_text for span in b_matched], [])
+
+    def test_get_matched_spans_same_as_all_pairs(self):
+        rng = random.Random(0)
+        spans_a, spans_b = [
+            [
+                Span(
+                    span_text=rng.choice(["a", "b", "c"]),
+                    span_tag=rng.choice(["LOC", "ORG"]),
+                    span_pos=(pos, pos + rng.randint(1, 2)),
+                    sample_id=rng.randint(0, 3),
+                )
+                for pos in rng.choices(range(5), k=200)
+            ]
+            for _ in range(2)
+        ]
+        bio_span_ops = BIOSpanOps()
+        for match_type in ["tag", "text", "text_tag", "position", "position_tag"]:
+            bio_span_ops.set_match_type(match_type)
+            pairs = [
+                (idx, idy)
+                for idx, a in enumerate(spans_a)
+                for idy, b in enumerate(spans_b)
+                if a.sample_id == b.sample_id and bio_span_ops.match_func(a, b)
+            ]
+            self.assertEqual(
+                bio_span_ops.get_matched_spans(spans_a, spans_b),
+                (
+                    [idx for idx, _ in pairs],
+                    [idy for _, idy in pairs],
+                    [spans_a[idx] for idx, _ in pairs],
+                    [spans_b[idy] for _, idy in pairs],
+                ),
+            )
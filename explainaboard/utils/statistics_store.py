@@ -0,0 +1,281 @@
+"""A binary, memory-mapped store of training set statistics.
+
+Statistics calculated by `Processor._statistics_func` are mostly large mappings from
+strings (e.g., words or spans) to numbers. Each of them is stored as a sorted array
+of UTF-8 encoded keys, padded to the longest key, and an array of the values in the
+same order. These arrays are memory-mapped on read, so loading is almost
+instantaneous and processes reading the same statistics share one copy in the page
+cache. Keys are looked up in bulk by binary search with `MappedStrDict.find`. A
+plain dict is built only when the mapping is used like a dict, e.g., by the feature
+functions looking up one token at a time. The other statistics are stored in the
+JSON manifest, which also records the schema version and information about how the
+statistics were calculated, e.g., the tokenizers.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+import json
+import os
+from typing import Any, final
+
+import numpy as np
+
+from explainaboard.serialization.types import SerializableData
+
+# Version of the file layout. Stores with a different version are not read.
+SCHEMA_VERSION = 3
+
+MANIFEST_FILENAME = "manifest.json"
+
+# Mappings whose padded keys would take more than this times the bytes of the keys
+# themselves are stored in the manifest instead.
+_MAX_PADDING_RATIO = 4
+
+
+def _is_number(value: Any) -> bool:
+    """Returns whether the value can be stored in a numeric array."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_mappable(value: Any) -> bool:
+    """Returns whether the value can be stored as a memory-mapped mapping."""
+    if not (
+        isinstance(value, dict)
+        and len(value) > 0
+        and all(isinstance(k, str) for k in value.keys())
+        and all(_is_number(v) for v in value.values())
+    ):
+        return False
+    # NumPy strips trailing NUL bytes from fixed-width strings.
+    lengths = [len(k.encode("utf-8")) for k in value.keys() if not k.endswith("\0")]
+    if len(lengths) < len(value):
+        return False
+    return max(lengths) * len(lengths) <= _MAX_PADDING_RATIO * max(sum(lengths), 1024)
+
+
+def _is_int_mapping(value: Any) -> bool:
+    """Returns whether the value is a mapping from integers to numbers."""
+    return (
+        isinstance(value, dict)
+        and len(value) > 0
+        and all(isinstance(k, int) and not isinstance(k, bool) for k in value.keys())
+        and all(_is_number(v) for v in value.values())
+    )
+
+
+@final
+class MappedStrDict(Mapping[str, Any]):
+    """A read-only mapping from strings to numbers backed by memory-mapped arrays.
+
+    Values are returned as Python `int` or `float`. Iteration follows the order of
+    the UTF-8 encoded keys.
+    """
+
+    def __init__(self, keys: np.ndarray, values: np.ndarray) -> None:
+        """Initializes MappedStrDict.
+
+        Args:
+            keys: The sorted and unique UTF-8 encoded keys.
+            values: The value of each key.
+        """
+        self._keys = keys
+        self._values = values
+        self._dict: dict[str, Any] | None = None
+
+    @property
+    def values_array(self) -> np.ndarray:
+        """Returns the values in the order of the keys."""
+        return self._values
+
+    def find(self, keys: Sequence[str]) -> np.ndarray:
+        """Finds multiple keys at once.
+
+        Args:
+            keys: The keys to find.
+
+        Returns:
+            The index of each key in `values_array`, or -1 if the key is missing.
+        """
+        if len(keys) == 0:
+            return np.zeros(0, dtype=np.int64)
+        encoded = np.array([k.encode("utf-8") for k in keys], dtype=np.bytes_)
+        # Searching each distinct key once, in sorted order, visits fewer pages.
+        unique_keys, inverse = np.unique(encoded, return_inverse=True)
+        indices = np.searchsorted(self._keys, unique_keys)
+        found = self._keys[np.minimum(indices, len(self._keys) - 1)] == unique_keys
+        return np.where(found, indices, -1)[inverse]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the mapping as a plain dict, which is built on the first call."""
+        if self._dict is None:
+            self._dict = {
+                k.decode("utf-8"): v
+                for k, v in zip(self._keys.tolist(), self._values.tolist())
+            }
+        return self._dict
+
+    def __getitem__(self, key: str) -> Any:
+        """Returns the value of the key."""
+        return self.to_dict()[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Returns whether the key exists."""
+        return key in self.to_dict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the value of the key, or `default` if the key is missing."""
+        return self.to_dict().get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the keys."""
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        """Returns the number of keys."""
+        return len(self._keys)
+
+
+def as_dict(mapping: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Returns a mapping for looking up one key at a time as fast as a dict.
+
+    Args:
+        mapping: A mapping, which may be a `MappedStrDict`.
+
+    Returns:
+        The plain dict of a `MappedStrDict`, or the mapping itself otherwise.
+    """
+    if isinstance(mapping, MappedStrDict):
+        return mapping.to_dict()
+    return mapping
+
+
+def write_str_mapping(path_prefix: str, content: dict[str, int | float]) -> dict:
+    """Writes a mapping from strings to numbers to files.
+
+    Args:
+        path_prefix: The common prefix of the files storing the mapping.
+        content: The mapping to write.
+
+    Returns:
+        Information required to read the mapping, to be stored in the manifest.
+    """
+    value_type = "int" if all(isinstance(v, int) for v in content.values()) else "float"
+    keys = np.array([k.encode("utf-8") for k in content.keys()], dtype=np.bytes_)
+    values = np.fromiter(
+        content.values(),
+        dtype=np.int64 if value_type == "int" else np.float64,
+        count=len(content),
+    )
+    order = np.argsort(keys)
+    np.save(f"{path_prefix}.keys.npy", keys[order], allow_pickle=False)
+    np.save(f"{path_prefix}.values.npy", values[order], allow_pickle=False)
+    return {"num_keys": len(content), "value_type": value_type}
+
+
+def read_str_mapping(path_prefix: str, num_keys: int, value_type: str) -> MappedStrDict:
+    """Reads a mapping written by `write_str_mapping`.
+
+    Args:
+        path_prefix: The common prefix of the files storing the mapping.
+        num_keys: The number of keys in the mapping.
+        value_type: "int" or "float", the type of the values.
+
+    Returns:
+        The memory-mapped mapping.
+    """
+    if value_type not in ("int", "float"):
+        raise ValueError(f"Invalid value_type: {value_type}")
+
+    keys = np.load(f"{path_prefix}.keys.npy", mmap_mode="r", allow_pickle=False)
+    values = np.load(f"{path_prefix}.values.npy", mmap_mode="r", allow_pickle=False)
+    if (
+        keys.shape != (num_keys,)
+        or keys.dtype.kind != "S"
+        or values.shape != (num_keys,)
+        or values.dtype != (np.int64 if value_type == "int" else np.float64)
+    ):
+        raise ValueError(f"Broken statistics files: {path_prefix}")
+    return MappedStrDict(keys, values)
+
+
+def write_statistics(
+    path: str, content: dict[str, Any], info: dict[str, SerializableData]
+) -> None:
+    """Writes statistics to a directory.
+
+    The manifest is written last, so the directory is not read as statistics until
+    every file is written.
+
+    Args:
+        path: The directory to write to. It is created if it does not exist.
+        content: The statistics. Mappings from strings to numbers are stored in
+            binary files. The other values must be JSON serializable.
+        info: Information about the statistics, e.g., the tokenizers used to
+            calculate them. `read_statistics` checks it against the expected one.
+    """
+    os.makedirs(path, exist_ok=True)
+    manifest_path = os.path.join(path, MANIFEST_FILENAME)
+    if os.path.exists(manifest_path):
+        # Invalidates the existing statistics before overwriting their files.
+        os.remove(manifest_path)
+
+    entries: dict[str, Any] = {}
+    for i, (name, value) in enumerate(content.items()):
+        if _is_mappable(value):
+            file_name = f"entry{i}"
+            entries[name] = {
+                "kind": "str_mapping",
+                "file_name": file_name,
+                **write_str_mapping(os.path.join(path, file_name), value),
+            }
+        elif _is_int_mapping(value):
+            # JSON can not have integer keys.
+            entries[name] = {"kind": "int_mapping", "items": list(value.items())}
+        else:
+            entries[name] = {"kind": "json", "value": value}
+
+    manifest = {"schema_version": SCHEMA_VERSION, "info": info, "entries": entries}
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+
+
+def read_statistics(
+    path: str, info: dict[str, SerializableData]
+) -> dict[str, Any] | None:
+    """Reads statistics written by `write_statistics`.
+
+    Args:
+        path: The directory to read from.
+        info: The expected information about the statistics.
+
+    Returns:
+        The statistics, or None if the directory does not contain statistics with the
+        current schema version and the expected information.
+    """
+    manifest_path = os.path.join(path, MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    if manifest.get("schema_version") != SCHEMA_VERSION or manifest.get(
+        "info"
+    ) != json.loads(json.dumps(info)):
+        return None
+
+    statistics: dict[str, Any] = {}
+    for name, entry in manifest["entries"].items():
+        kind = entry["kind"]
+        if kind == "str_mapping":
+            statistics[name] = read_str_mapping(
+                os.path.join(path, entry["file_name"]),
+                entry["num_keys"],
+                entry["value_type"],
+            )
+        elif kind == "int_mapping":
+            statistics[name] = {k: v for k, v in entry["items"]}
+        elif kind == "json":
+            statistics[name] = entry["value"]
+        else:
+            raise ValueError(f"Unknown kind of statistics: {kind}")
+    return statistics
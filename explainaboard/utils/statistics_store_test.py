@@ -0,0 +1,120 @@
+"""Tests for explainaboard.utils.statistics_store."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from explainaboard.utils.statistics_store import (
+    as_dict,
+    MANIFEST_FILENAME,
+    MappedStrDict,
+    read_statistics,
+    read_str_mapping,
+    write_statistics,
+    write_str_mapping,
+)
+
+
+class StrMappingTest(unittest.TestCase):
+    def test_mapping(self) -> None:
+        for content in [
+            {"foo": 3, "bar": 1, "": 2, "日本語": 5},
+            {"foo": 3, "bar": 1, "": 2},
+        ]:
+            with self.subTest(content=content), tempfile.TemporaryDirectory() as d:
+                prefix = os.path.join(d, "vocab")
+                info = write_str_mapping(prefix, content)
+                self.assertEqual(info, {"num_keys": len(content), "value_type": "int"})
+                mapping = read_str_mapping(prefix, **info)
+                self.assertEqual(mapping, content)
+                self.assertEqual(list(mapping), sorted(content, key=str.encode))
+                self.assertIsInstance(mapping["foo"], int)
+                self.assertIs(as_dict(mapping), as_dict(mapping))
+                self.assertEqual(as_dict(mapping), content)
+
+    def test_find(self) -> None:
+        content = {"foo": 3, "bar": 1, "": 2, "日本語": 5, "foobar": 4}
+        with tempfile.TemporaryDirectory() as tempdir:
+            prefix = os.path.join(tempdir, "vocab")
+            mapping = read_str_mapping(prefix, **write_str_mapping(prefix, content))
+            self.assertIsInstance(mapping.values_array, np.memmap)
+            keys = ["foo", "fo", "foob", "", "日本", "日本語", "zzz", "bar", "foobarbaz"]
+            indices = mapping.find(keys)
+            self.assertEqual(
+                [mapping.values_array[i] if i >= 0 else None for i in indices.tolist()],
+                [content.get(k) for k in keys],
+            )
+            self.assertEqual(mapping.find([]).tolist(), [])
+
+    def test_float_values(self) -> None:
+        content = {f"w{i}": i / 7 for i in range(1000)}
+        with tempfile.TemporaryDirectory() as tempdir:
+            prefix = os.path.join(tempdir, "vocab")
+            info = write_str_mapping(prefix, content)
+            self.assertEqual(info["value_type"], "float")
+            self.assertEqual(read_str_mapping(prefix, **info), content)
+
+    def test_invalid_value_type(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"^Invalid value_type"):
+            read_str_mapping("foo", 0, "str")
+
+    def test_broken_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tempdir:
+            prefix = os.path.join(tempdir, "vocab")
+            info = write_str_mapping(prefix, {"a": 1, "b": 2})
+            with self.assertRaisesRegex(ValueError, r"^Broken statistics files"):
+                read_str_mapping(prefix, 3, info["value_type"])
+
+
+class StatisticsTest(unittest.TestCase):
+    def test_write_and_read(self) -> None:
+        statistics = {
+            "vocab": {"a": 2, "b": 1},
+            "vocab_rank": {"a": 1, "b": 2},
+            "length_fre": {1: 0.25, 3: 0.75},
+            "empty": {},
+            "other": [1, "x"],
+        }
+        info = {"source_tokenizer": {"cls_name": "SingleSpaceTokenizer"}}
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "stats")
+            self.assertIsNone(read_statistics(path, info))
+            write_statistics(path, statistics, info)
+
+            loaded = read_statistics(path, info)
+            assert loaded is not None
+            self.assertIsInstance(loaded["vocab"], MappedStrDict)
+            self.assertIs(type(loaded["length_fre"]), dict)
+            self.assertEqual(loaded, statistics)
+
+            self.assertIsNone(read_statistics(path, {}))
+
+    def test_long_key(self) -> None:
+        # Padding every key to the longest one would take too much space.
+        statistics = {"vocab": {"x" * 10000: 1, **{str(i): i for i in range(100)}}}
+        with tempfile.TemporaryDirectory() as tempdir:
+            write_statistics(tempdir, statistics, {})
+            loaded = read_statistics(tempdir, {})
+            assert loaded is not None
+            self.assertIs(type(loaded["vocab"]), dict)
+            self.assertEqual(loaded, statistics)
+
+    def test_overwrite(self) -> None:
+        with tempfile.TemporaryDirectory() as tempdir:
+            write_statistics(tempdir, {"vocab": {"a": 1}}, {})
+            write_statistics(tempdir, {"vocab": {"b": 2, "c": 3}}, {})
+            loaded = read_statistics(tempdir, {})
+            assert loaded is not None
+            self.assertEqual(loaded["vocab"], {"b": 2, "c": 3})
+
+    def test_schema_version(self) -> None:
+        with tempfile.TemporaryDirectory() as tempdir:
+            write_statistics(tempdir, {"vocab": {"a": 1}}, {})
+            manifest_path = os.path.join(tempdir, MANIFEST_FILENAME)
+            with open(manifest_path, "w") as f:
+                f.write('{"schema_version": 0, "info": {}, "entries": {}}')
+            self.assertIsNone(read_statistics(tempdir, {}))
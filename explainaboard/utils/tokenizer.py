@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import abc
-from collections.abc import Callable, Sequence
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
-from functools import lru_cache
+import functools
+import itertools
+import math
 import re
 import string
 import sys
@@ -23,8 +26,12 @@ from explainaboard.utils.language_utils import (
     is_chinese_lang_code,
     is_japanese_lang_code,
 )
+from explainaboard.utils.parallel import fork_imap
 from explainaboard.utils.typing_utils import narrow
 
+# The number of texts processed together by `tokenize_stream`.
+_TOKENIZE_BATCH_SIZE = 4096
+
 
 def get_default_tokenizer(lang: str | None) -> Tokenizer:
     """Get the default tokenizer by language.
@@ -122,6 +129,30 @@ class Tokenizer(Serializable, metaclass=abc.ABCMeta):
         """
         ...
 
+    def batch(self, texts: Sequence[str], num_workers: int = 1) -> list[TokenSeq]:
+        """Tokenize multiple strings.
+
+        Tokenizers may override this to tokenize the strings more efficiently than
+        one by one.
+
+        Args:
+            texts: The strings to tokenize
+            num_workers: The number of processes that the tokenizer may use if it is
+                expensive enough to benefit from them
+
+        Returns:
+            The list of tokens of each string
+        """
+        return [self(text) for text in texts]
+
+    def uses_workers(self) -> bool:
+        """Return whether `batch` distributes the strings over `num_workers` processes.
+
+        Returns:
+            False by default.
+        """
+        return False
+
     @abc.abstractmethod
     def detokenize(self, tokens: list[str]) -> str:
         """Detokenize a list of tokens into a string.
@@ -149,7 +180,6 @@ class Tokenizer(Serializable, metaclass=abc.ABCMeta):
 class SingleSpaceTokenizer(Tokenizer):
     """Split a string on a single ascii space."""
 
-    @lru_cache(maxsize=20)
     def __call__(self, text: str) -> TokenSeq:
         """Perform tokenization.
 
@@ -189,6 +219,10 @@ class TokenizerConala(BaseTokenizer):
     Originally from Wang Ling et al., Latent Predictor Networks for Code Generation
     """
 
+    _SYMBOL_PATTERN = re.compile(r"([^A-Za-z0-9_])")
+    _CAMEL_CASE_PATTERN = re.compile(r"([a-z])([A-Z])")
+    _SPACE_PATTERN = re.compile(r"\s+")
+
     def __call__(self, text: str) -> str:
         """The tokenizer that we use for BLEU score over code.
 
@@ -201,9 +235,9 @@ class TokenizerConala(BaseTokenizer):
         Returns:
             space-separated tokens
         """
-        text = re.sub(r"([^A-Za-z0-9_])", r" \1 ", text)
-        text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
-        text = re.sub(r"\s+", " ", text)
+        text = self._SYMBOL_PATTERN.sub(r" \1 ", text)
+        text = self._CAMEL_CASE_PATTERN.sub(r"\1 \2", text)
+        text = self._SPACE_PATTERN.sub(" ", text)
         text = text.replace('"', "`")
         text = text.replace("'", "`")
         text = text.strip(" ")
@@ -216,6 +250,9 @@ class TokenizerConala(BaseTokenizer):
 class SacreBleuTokenizer(Tokenizer):
     """Split a string based on the strategy in SacreBLEU."""
 
+    # Varieties whose batches are tokenized with multiple processes if requested.
+    _MULTIPROCESS_VARIETIES = ("zh", "ja-mecab")
+
     @staticmethod
     def _get_normalizer(variety: str) -> Callable[[str], str]:
         """Helper to obtain a normalizer function associated to the variety.
@@ -263,7 +300,6 @@ class SacreBleuTokenizer(Tokenizer):
         self._normalizer = self._get_normalizer(self._variety)
         self._tokenizer = self._get_tokenizer(self._variety)
 
-    @lru_cache(maxsize=20)
     def __call__(self, text: str) -> TokenSeq:
         """Perform tokenization.
 
@@ -277,6 +313,35 @@ class SacreBleuTokenizer(Tokenizer):
             self._normalizer(text), self._tokenizer(text).split(" ")
         )
 
+    def batch(self, texts: Sequence[str], num_workers: int = 1) -> list[TokenSeq]:
+        """Tokenize multiple strings.
+
+        The "zh" and "ja-mecab" varieties are slow enough to benefit from
+        distributing the strings over multiple processes.
+
+        Args:
+            texts: The strings to tokenize
+            num_workers: The number of processes to use for the "zh" and "ja-mecab"
+                varieties
+
+        Returns:
+            The list of tokens of each string
+        """
+        if num_workers < 2 or not self.uses_workers():
+            return super().batch(texts)
+
+        chunk_size = max(1, math.ceil(len(texts) / (num_workers * 4)))
+        chunks = fork_imap(
+            lambda begin: [self(x) for x in texts[begin : begin + chunk_size]],
+            range(0, len(texts), chunk_size),
+            num_workers,
+        )
+        return list(itertools.chain.from_iterable(chunks))
+
+    def uses_workers(self) -> bool:
+        """See Tokenizer.uses_workers."""
+        return self._variety in self._MULTIPROCESS_VARIETIES
+
     def detokenize(self, tokens: list[str]) -> str:
         """Detokenization (not implemented for this tokenizer)."""
         raise NotImplementedError
@@ -291,6 +356,22 @@ class SacreBleuTokenizer(Tokenizer):
         return cls(variety=narrow(str, data["variety"]))
 
 
+@functools.lru_cache(maxsize=None)
+def _get_mlqa_separator_pattern() -> re.Pattern[str]:
+    """Helper to obtain the pattern of characters that MLQAMixTokenizer separates.
+
+    Returns:
+        A compiled pattern matching a CJK unified ideograph or a punctuation.
+    """
+    punct = {
+        chr(i)
+        for i in range(sys.maxunicode)
+        if unicodedata.category(chr(i)).startswith("P")
+    }.union(string.punctuation)
+    chars = "".join(re.escape(c) for c in sorted(punct))
+    return re.compile(f"([\u4e00-\u9fa5{chars}])")
+
+
 @final
 @common_registry.register("MLQAMixTokenizer")
 class MLQAMixTokenizer(Tokenizer):
@@ -298,14 +379,8 @@ class MLQAMixTokenizer(Tokenizer):
 
     def __init__(self) -> None:
         """Constructor."""
-        self._ss_tokenizer = SingleSpaceTokenizer()
-        self._punct = {
-            chr(i)
-            for i in range(sys.maxunicode)
-            if unicodedata.category(chr(i)).startswith("P")
-        }.union(string.punctuation)
-
-    @lru_cache(maxsize=20)
+        self._separator_pattern = _get_mlqa_separator_pattern()
+
     def __call__(self, text: str) -> TokenSeq:
         """Perform tokenization.
 
@@ -316,23 +391,149 @@ class MLQAMixTokenizer(Tokenizer):
             The tokenized sequence
         """
         segs_out: list[str] = []
-        temp_str = ""
-        for char in text:
-            if re.search(r"[\u4e00-\u9fa5]", char) or char in self._punct:
-                if temp_str != "":
-                    ss = self._ss_tokenizer(temp_str)
-                    segs_out.extend(ss)
-                    temp_str = ""
-                segs_out.append(char)
-            else:
-                temp_str += char
-
-        if temp_str != "":
-            ss = self._ss_tokenizer(temp_str)
-            segs_out.extend(ss)
+        # Splitting by a pattern with a group alternates the text between separators
+        # and the separators themselves.
+        for i, seg in enumerate(self._separator_pattern.split(text)):
+            if i % 2 == 1:
+                segs_out.append(seg)
+            elif seg != "":
+                segs_out.extend(seg.split(" "))
 
         return TokenSeq.from_orig_and_tokens(text, segs_out)
 
     def detokenize(self, tokens: list[str]) -> str:
         """Detokenization (not implemented for this Tokenizer)."""
         raise NotImplementedError
+
+
+@final
+class TokenizationCache:
+    """Cache of tokenization results shared by the features of an analysis.
+
+    Results are keyed by the tokenizer object and the text, so each text is tokenized
+    only once by each tokenizer. When the estimated size of the cached results
+    exceeds `max_bytes`, the least recently used results are discarded.
+
+    Attributes:
+        max_bytes: The upper bound of the estimated size of the cached results.
+        num_bytes: The estimated size of the cached results.
+        hits: The number of lookups answered by the cache.
+        misses: The number of lookups that required tokenization.
+    """
+
+    DEFAULT_MAX_BYTES = 1 << 28
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Constructor.
+
+        Args:
+            max_bytes: The upper bound of the estimated size of the cached results.
+        """
+        self.max_bytes = max_bytes
+        self.num_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[
+            tuple[Tokenizer, str], tuple[TokenSeq, int]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of cached results."""
+        return len(self._entries)
+
+    @staticmethod
+    def _estimate_bytes(text: str, tokens: TokenSeq) -> int:
+        """Estimates the memory consumed by a cache entry.
+
+        Args:
+            text: The tokenized text.
+            tokens: The tokenization result.
+
+        Returns:
+            The estimated number of bytes, counting the text, the token strings and
+            pointers to the tokens and the positions.
+        """
+        return (
+            sys.getsizeof(text)
+            + sum(sys.getsizeof(x) for x in tokens.strs)
+            + 16 * len(tokens)
+        )
+
+    def tokenize(self, tokenizer: Tokenizer, text: str) -> TokenSeq:
+        """Tokenizes a text, reusing the cached result if available.
+
+        The returned object may be shared with other callers, and must not be
+        modified.
+
+        Args:
+            tokenizer: The tokenizer to use.
+            text: The text to tokenize.
+
+        Returns:
+            The tokenized sequence.
+        """
+        key = (tokenizer, text)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        tokens = tokenizer(text)
+        size = self._estimate_bytes(text, tokens)
+        if size > self.max_bytes:
+            return tokens
+
+        self._entries[key] = (tokens, size)
+        self.num_bytes += size
+        while self.num_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.num_bytes -= evicted_size
+        return tokens
+
+    def clear(self) -> None:
+        """Discards all cached results. The counters are kept."""
+        self._entries.clear()
+        self.num_bytes = 0
+
+
+def tokenize_stream(
+    tokenizer: Tokenizer,
+    texts: Iterable[str],
+    num_workers: int = 1,
+    batch_size: int = _TOKENIZE_BATCH_SIZE,
+) -> Iterator[TokenSeq]:
+    """Tokenize a stream of strings batch by batch.
+
+    Only about `batch_size` strings are kept in memory at once, so the strings can
+    be generated lazily from a large corpus. If the tokenizer uses multiple
+    processes, a single pool of `num_workers` processes tokenizes the whole stream,
+    instead of a pool for each batch.
+
+    Args:
+        tokenizer: The tokenizer to use
+        texts: The strings to tokenize
+        num_workers: The number of processes that the tokenizer may use
+        batch_size: The number of strings passed to `Tokenizer.batch` at once
+
+    Yields:
+        The tokens of each string
+    """
+    it = iter(texts)
+    if num_workers < 2 or not tokenizer.uses_workers():
+        while True:
+            batch = list(itertools.islice(it, batch_size))
+            if not batch:
+                return
+            yield from tokenizer.batch(batch, num_workers=num_workers)
+
+    # The stream is split into chunks as `SacreBleuTokenizer.batch` splits a batch,
+    # and only about `batch_size` strings are sent ahead of the consumed tokens.
+    max_pending = num_workers * 4
+    chunk_size = max(1, math.ceil(batch_size / max_pending))
+    chunks = iter(lambda: list(itertools.islice(it, chunk_size)), [])
+    for tokens in fork_imap(
+        tokenizer.batch, chunks, num_workers, max_pending=max_pending
+    ):
+        yield from tokens
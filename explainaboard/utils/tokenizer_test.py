@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import unittest
+from unittest import mock
 
 from explainaboard.serialization.serializers import PrimitiveSerializer
+from explainaboard.utils import parallel
+from explainaboard.utils.parallel import is_fork_available
 from explainaboard.utils.tokenizer import (
     MLQAMixTokenizer,
     SacreBleuTokenizer,
     SingleSpaceTokenizer,
+    TokenizationCache,
+    tokenize_stream,
     TokenSeq,
 )
 
@@ -141,3 +146,111 @@ class TokenizersTest(unittest.TestCase):
         out_tokseq = tokenizer(src)
         self.assertEqual(gold_toks, out_tokseq.strs)
         self.assertEqual(gold_poss, out_tokseq.positions)
+
+    def test_mlqa_mix_tokenizer(self):
+        src = "这是 a,  test。"
+        tokenizer = MLQAMixTokenizer()
+        out_tokseq = tokenizer(src)
+        self.assertEqual(
+            ["这", "是", "", "a", ",", "", "", "test", "。"], out_tokseq.strs
+        )
+        self.assertEqual([0, 1, 1, 3, 4, 4, 4, 7, 11], out_tokseq.positions)
+
+    def test_conala_tokenizer(self):
+        tokenizer = SacreBleuTokenizer(variety="conala")
+        out_tokseq = tokenizer("x = fooBar('a')")
+        self.assertEqual(
+            ["x", "=", "foo", "Bar", "(", "`", "a", "`", ")"], out_tokseq.strs
+        )
+
+    def test_batch(self):
+        texts = ["this is", "", "an example ."]
+        for tokenizer in [
+            SingleSpaceTokenizer(),
+            SacreBleuTokenizer(),
+            MLQAMixTokenizer(),
+        ]:
+            self.assertEqual(tokenizer.batch(texts), [tokenizer(x) for x in texts])
+
+    @unittest.skipUnless(is_fork_available(), "fork is not available")
+    def test_sacrebleu_zh_tokenizer_batch_multiprocess(self):
+        texts = [f"这是第{i}个例子, example {i}." for i in range(50)]
+        tokenizer = SacreBleuTokenizer(variety="zh")
+        self.assertEqual(
+            tokenizer.batch(texts, num_workers=3), [tokenizer(x) for x in texts]
+        )
+
+    def test_tokenize_stream(self):
+        texts = [f"text {i}" for i in range(10)]
+        tokenizer = SingleSpaceTokenizer()
+        self.assertEqual(
+            list(tokenize_stream(tokenizer, iter(texts), batch_size=3)),
+            [tokenizer(x) for x in texts],
+        )
+
+    @unittest.skipUnless(is_fork_available(), "fork is not available")
+    def test_tokenize_stream_multiprocess(self):
+        texts = [f"这是第{i}个例子, example {i}." for i in range(50)]
+        tokenizer = SacreBleuTokenizer(variety="zh")
+        get_context = parallel.multiprocessing.get_context
+        with mock.patch.object(
+            parallel.multiprocessing, "get_context", side_effect=get_context
+        ) as mock_get_context:
+            tokens = list(
+                tokenize_stream(tokenizer, iter(texts), batch_size=8, num_workers=2)
+            )
+        self.assertEqual(tokens, [tokenizer(x) for x in texts])
+        # A single pool tokenizes all batches of the stream.
+        self.assertEqual(mock_get_context.call_count, 1)
+
+    def test_uses_workers(self):
+        self.assertTrue(SacreBleuTokenizer(variety="zh").uses_workers())
+        self.assertFalse(SacreBleuTokenizer(variety="intl").uses_workers())
+        self.assertFalse(SingleSpaceTokenizer().uses_workers())
+
+
+class TokenizationCacheTest(unittest.TestCase):
+    def test_hits_and_misses(self) -> None:
+        cache = TokenizationCache()
+        tokenizer = SingleSpaceTokenizer()
+        other_tokenizer = SingleSpaceTokenizer()
+
+        tokens = cache.tokenize(tokenizer, "foo bar")
+        self.assertEqual(tokens.strs, ["foo", "bar"])
+        self.assertIs(cache.tokenize(tokenizer, "foo bar"), tokens)
+        self.assertIsNot(cache.tokenize(other_tokenizer, "foo bar"), tokens)
+        self.assertEqual(cache.tokenize(tokenizer, "baz").strs, ["baz"])
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        self.assertEqual(len(cache), 3)
+        self.assertGreater(cache.num_bytes, 0)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.num_bytes, 0)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_eviction(self) -> None:
+        tokenizer = SingleSpaceTokenizer()
+        texts = ["a b", "c d", "e f"]
+        entry_bytes = TokenizationCache._estimate_bytes(texts[0], tokenizer(texts[0]))
+        cache = TokenizationCache(max_bytes=2 * entry_bytes)
+
+        for text in texts[:2]:
+            cache.tokenize(tokenizer, text)
+        # Refreshes the first text so that the second one becomes the oldest.
+        cache.tokenize(tokenizer, texts[0])
+        cache.tokenize(tokenizer, texts[2])
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.num_bytes, cache.max_bytes)
+
+        cache.tokenize(tokenizer, texts[0])
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+        cache.tokenize(tokenizer, texts[1])
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_too_large_text(self) -> None:
+        cache = TokenizationCache(max_bytes=10)
+        tokens = cache.tokenize(SingleSpaceTokenizer(), "foo bar")
+        self.assertEqual(tokens.strs, ["foo", "bar"])
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.num_bytes, 0)
@@ -18,7 +18,6 @@ The output will be written to the `figures/` directory.
 from __future__ import annotations
 
 import argparse
-import json
 import os
 
 from matplotlib import pyplot as plt
@@ -32,6 +31,7 @@ from explainaboard.analysis.analyses import (
 from explainaboard.info import SysOutputInfo
 from explainaboard.metrics.metric import ConfidenceInterval, MetricResult, Score
 from explainaboard.serialization.serializers import PrimitiveSerializer
+from explainaboard.utils import json_utils
 from explainaboard.utils.logging import progress
 from explainaboard.utils.typing_utils import narrow, unwrap
 from explainaboard.visualizers.bar_chart import make_bar_chart
@@ -223,9 +223,12 @@ def draw_charts_from_reports(
 
     report_info: list[SysOutputInfo] = []
     for report in reports:
-        with open(report) as fin:
+        with open(report, "rb") as fin:
             report_info.append(
-                narrow(SysOutputInfo, PrimitiveSerializer().deserialize(json.load(fin)))
+                narrow(
+                    SysOutputInfo,
+                    PrimitiveSerializer().deserialize(json_utils.load(fin)),
+                )
             )
 
     # --- Overall results
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+import random
 import tempfile
 import unittest
 from unittest import TestCase
@@ -11,6 +12,8 @@ from datalabs import set_progress_bar_enabled
 from integration_tests.utils import OPTIONAL_TEST_SUITES, top_path
 
 import explainaboard.explainaboard_main
+from explainaboard.metrics.eaas import set_eaas_client
+from explainaboard.utils import json_utils
 from explainaboard.utils.cache_api import cache_online_file
 from explainaboard.utils.logging import get_logger
 import explainaboard.visualizers.draw_charts
@@ -106,6 +109,77 @@ class CLITest(TestCase):
         with patch("sys.argv", args):
             explainaboard.explainaboard_main.main()
 
+    def test_textclass_custom_compact_report(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            report_path = Path(tempdir) / "report.json"
+            args = [
+                "explainaboard.explainaboard_main",
+                "--task",
+                "text-classification",
+                "--system-outputs",
+                f"{top_path}/data/system_outputs/sst2/sst2-lstm-output.txt",
+                "--custom-dataset-paths",
+                f"{top_path}/data/system_outputs/sst2/sst2-dataset.tsv",
+                "--report-json",
+                str(report_path),
+                "--skip-failed-analyses",
+                "--compact-report",
+                "--json-backend",
+                "json",
+            ]
+            with patch("sys.argv", args):
+                explainaboard.explainaboard_main.main()
+            self.addCleanup(json_utils.set_json_backend, None)
+            report = report_path.read_text()
+            self.assertNotIn("\n", report)
+            self.assertEqual(
+                json_utils.loads(report)["task_name"], "text-classification"
+            )
+
+    def test_textclass_custom_parallel_systems(self):
+        dataset = f"{top_path}/data/system_outputs/sst2/sst2-dataset.tsv"
+        with tempfile.TemporaryDirectory() as tempdir:
+            results = []
+            for parallel_systems in [None, 1, 2]:
+                output_dir = Path(tempdir) / f"output-{parallel_systems}"
+                args = [
+                    "explainaboard.explainaboard_main",
+                    "--task",
+                    "text-classification",
+                    "--system-outputs",
+                    f"{top_path}/data/system_outputs/sst2/sst2-lstm-output.txt",
+                    f"{top_path}/data/system_outputs/sst2/sst2-cnn-output.txt",
+                    "--custom-dataset-paths",
+                    dataset,
+                    dataset,
+                    "--output-dir",
+                    str(output_dir),
+                    "--report-json",
+                    "/dev/null",
+                    "--skip-failed-analyses",
+                ]
+                if parallel_systems is not None:
+                    args += ["--parallel-systems", str(parallel_systems)]
+                # Bucket samples are chosen randomly.
+                random.seed(12345)
+                with patch("sys.argv", args):
+                    explainaboard.explainaboard_main.main()
+                results.append(
+                    [
+                        json_utils.loads(
+                            (
+                                output_dir / "reports" / f"sst2-{name}-output.json"
+                            ).read_text()
+                        )["results"]
+                        for name in ["lstm", "cnn"]
+                    ]
+                )
+            self.assertEqual(results[0], results[1])
+            # Workers choose bucket samples with the same random state.
+            self.assertEqual(
+                [x["overall"] for x in results[0]], [x["overall"] for x in results[2]]
+            )
+
     def test_tabreg_custom(self):
         args = [
             "explainaboard.explainaboard_main",
@@ -121,6 +195,31 @@ class CLITest(TestCase):
         with patch("sys.argv", args):
             explainaboard.explainaboard_main.main()
 
+    def test_tabreg_custom_columnar(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            reports = []
+            for columnar in [False, True]:
+                report_path = Path(tempdir) / f"report-{columnar}.json"
+                args = [
+                    "explainaboard.explainaboard_main",
+                    "--task",
+                    "tabular-regression",
+                    "--system-outputs",
+                    f"{top_path}/data/system_outputs/sst2_tabreg/"
+                    "sst2-tabreg-lstm-output.txt",
+                    "--custom-dataset-paths",
+                    f"{top_path}/data/system_outputs/sst2_tabreg/"
+                    "sst2-tabreg-dataset.json",
+                    "--report-json",
+                    str(report_path),
+                ] + (["--columnar"] if columnar else [])
+                # Bucket samples are chosen randomly.
+                random.seed(12345)
+                with patch("sys.argv", args):
+                    explainaboard.explainaboard_main.main()
+                reports.append(json_utils.loads(report_path.read_text()))
+            self.assertEqual(reports[0]["results"], reports[1]["results"])
+
     def test_tabclass_custom(self):
         args = [
             "explainaboard.explainaboard_main",
@@ -228,6 +327,28 @@ class CLITest(TestCase):
         with patch("sys.argv", args):
             explainaboard.explainaboard_main.main()
 
+    def test_mt_custom_local_eaas(self):
+        args = [
+            "explainaboard.explainaboard_main",
+            "--task",
+            "machine-translation",
+            "--custom-dataset-paths",
+            f"{top_path}/data/system_outputs/ted_multi/ted_multi_slk_eng-dataset.tsv",
+            "--system-outputs",
+            f"{top_path}/data/system_outputs/ted_multi/ted_multi_slk_eng-nmt-output.txt",  # noqa
+            "--metrics",
+            "bleu",
+            "chrf",
+            "--eaas-backend",
+            "local",
+            "--report-json",
+            "/dev/null",
+            "--skip-failed-analyses",
+        ]
+        self.addCleanup(set_eaas_client, None)
+        with patch("sys.argv", args):
+            explainaboard.explainaboard_main.main()
+
     def test_codegen_custom(self):
         args = [
             "explainaboard.explainaboard_main",
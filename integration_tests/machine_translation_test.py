@@ -8,6 +8,9 @@ from integration_tests.utils import test_artifacts_path
 
 from explainaboard import FileType, get_processor_class, Source, TaskType
 from explainaboard.loaders.loader_factory import get_loader_class
+from explainaboard.metrics.eaas import set_eaas_client
+from explainaboard.metrics.local_eaas import LocalEaaSClient
+from explainaboard.metrics.metric import Score
 
 
 class MachineTranslationTest(unittest.TestCase):
@@ -62,6 +65,38 @@ class MachineTranslationTest(unittest.TestCase):
         self.assertGreater(len(sys_info.results.analyses), 0)
         self.assertGreater(len(sys_info.results.overall), 0)
 
+    def test_generate_system_analysis_with_local_eaas(self):
+        loader = get_loader_class(TaskType.machine_translation)(
+            self.tsv_dataset,
+            self.txt_output,
+            Source.local_filesystem,
+            Source.local_filesystem,
+            FileType.tsv,
+            FileType.text,
+        )
+        data = loader.load()
+
+        metadata = {
+            "task_name": TaskType.machine_translation.value,
+            "metric_names": ["bleu"],
+        }
+
+        set_eaas_client(LocalEaaSClient())
+        self.addCleanup(set_eaas_client, None)
+        processor = get_processor_class(TaskType.machine_translation)()
+
+        sys_info = processor.process(metadata, data, skip_failed_analyses=True)
+
+        self.assertGreater(len(sys_info.results.analyses), 0)
+        overall = sys_info.results.overall["example"]
+        self.assertAlmostEqual(
+            overall["length_ratio"].get_value(Score, "score").value, 37 / 42
+        )
+        for name in ["rouge1", "rouge2", "rougeL", "bleu"]:
+            score = overall[name].get_value(Score, "score").value
+            self.assertGreater(score, 0.0)
+            self.assertLess(score, 1.0)
+
     def test_default_features_dont_modify_condgen(self):
 
         condgen_processor = get_processor_class(TaskType.conditional_generation)()
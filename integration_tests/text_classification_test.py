@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 import os
+import random
 import unittest
 
 from integration_tests.utils import load_file_as_str, test_artifacts_path
@@ -100,6 +101,30 @@ class TextClassificationTest(unittest.TestCase):
         self.assertGreater(len(sys_info.results.analyses), 0)
         self.assertGreater(len(sys_info.results.overall), 0)
 
+    def test_process_columnar(self):
+        metadata = {
+            "task_name": TaskType.text_classification,
+            "metric_names": ["Accuracy", "F1Score"],
+        }
+        loader = get_loader_class(TaskType.text_classification)(
+            self.tsv_dataset,
+            self.txt_output,
+            Source.local_filesystem,
+            Source.local_filesystem,
+            FileType.tsv,
+            FileType.text,
+        )
+        results = []
+        for data in [loader.load(), loader.load_columns()]:
+            # Bucket samples are chosen randomly.
+            random.seed(12345)
+            processor = get_processor_class(TaskType.text_classification)()
+            sys_info = processor.process(
+                dict(metadata), data.samples, skip_failed_analyses=True
+            )
+            results.append(sys_info.results)
+        self.assertEqual(results[0], results[1])
+
     def test_process_training_set_dependent_features(self):
         metadata = {
             "task_name": TaskType.text_classification.value,
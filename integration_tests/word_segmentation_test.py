@@ -6,7 +6,9 @@ import unittest
 from integration_tests.utils import test_artifacts_path
 
 from explainaboard import FileType, get_processor_class, Source, TaskType
+from explainaboard.info import OverallStatistics
 from explainaboard.loaders.loader_factory import get_loader_class
+from explainaboard.utils.typing_utils import unwrap
 
 
 class WordSegmentationTest(unittest.TestCase):
@@ -38,3 +40,38 @@ class WordSegmentationTest(unittest.TestCase):
 
         self.assertGreater(len(sys_info.results.analyses), 0)
         self.assertGreater(len(sys_info.results.overall), 0)
+
+    def test_num_workers(self):
+        loader = get_loader_class(TaskType.word_segmentation)(
+            self.conll_dataset,
+            self.conll_output,
+            Source.local_filesystem,
+            Source.local_filesystem,
+            FileType.conll,
+            FileType.conll,
+        )
+        data = loader.load().samples
+
+        def get_statistics(num_workers: int) -> OverallStatistics:
+            metadata = {
+                "task_name": TaskType.word_segmentation.value,
+                "metric_names": ["F1Score"],
+                # Confidence intervals are random.
+                "confidence_alpha": None,
+                "num_workers": num_workers,
+            }
+            processor = get_processor_class(TaskType.word_segmentation)()
+            return processor.get_overall_statistics(metadata, data)
+
+        serial = get_statistics(1)
+        parallel = get_statistics(3)
+        self.assertEqual(len(serial.analysis_cases), len(parallel.analysis_cases))
+        for serial_cases, parallel_cases in zip(
+            serial.analysis_cases, parallel.analysis_cases
+        ):
+            self.assertGreater(len(serial_cases), 0)
+            self.assertEqual(list(serial_cases), list(parallel_cases))
+        self.assertEqual(
+            unwrap(serial.sys_info).results.overall,
+            unwrap(parallel.sys_info).results.overall,
+        )